@@ -0,0 +1,91 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+This file compares the time to compute DC powerflows with the `PandaPowerBackend` (`runpf(is_dc=True)`) and
+with the `DCBackend` (that caches the DC model of each topology).
+
+It reports the time of a powerflow with the same topology (as in `obs.simulate` or in an episode without
+topological actions), the time of a powerflow after a change of topology (the DC model needs to be built)
+and the time of a full "N-1" analysis screened with the LODF (`backend.run_contingencies`).
+"""
+
+import time
+import warnings
+import numpy as np
+
+import grid2op
+from grid2op.Backend import PandaPowerBackend, DCBackend
+from grid2op.Parameters import Parameters
+
+ENV_NAME = "l2rpn_wcci_2022"
+NB_PF = 100
+NB_RUN = 5
+
+
+def make_env(backend):
+    param = Parameters()
+    param.ENV_DC = True
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = grid2op.make(ENV_NAME, test=True, param=param, backend=backend)
+    env.seed(0)
+    env.set_id(0)
+    env.reset()
+    return env
+
+
+def same_topo(backend):
+    for _ in range(NB_PF):
+        backend.runpf(is_dc=True)
+
+
+def new_topo(backend):
+    for l_id in range(NB_PF):
+        backend._disconnect_line(l_id % type(backend).n_line)
+        backend.runpf(is_dc=True)
+        backend._reconnect_line(l_id % type(backend).n_line)
+
+
+def contingencies(backend):
+    return backend.run_contingencies(screen_threshold=np.inf)
+
+
+def timeit(fun, backend):
+    times = []
+    for _ in range(NB_RUN):
+        if isinstance(backend, DCBackend):
+            backend.clear_cache()
+            backend.runpf(is_dc=True)
+        beg_ = time.perf_counter()
+        fun(backend)
+        times.append(time.perf_counter() - beg_)
+    return 1e3 * np.median(times)
+
+
+def main():
+    env_pp = make_env(PandaPowerBackend())
+    env_dc = make_env(DCBackend())
+    assert np.allclose(env_pp.backend.p_or, env_dc.backend.p_or, atol=1e-3)
+
+    print(f"Environment {ENV_NAME} ({env_pp.n_line} powerlines, {env_pp.n_sub} substations)")
+    for fun, msg in [(same_topo, f"{NB_PF} dc powerflows, same topology"),
+                     (new_topo, f"{NB_PF} dc powerflows, different topologies"),
+                     (contingencies, "N-1 analysis screened with the lodf")]:
+        time_pp = timeit(fun, env_pp.backend.copy())
+        time_dc = timeit(fun, env_dc.backend.copy())
+        print(f"{msg}:")
+        print(f"\t PandaPowerBackend: {time_pp:.1f} ms")
+        print(f"\t DCBackend        : {time_dc:.1f} ms")
+    env_pp.close()
+    env_dc.close()
+
+
+if __name__ == "__main__":
+    main()
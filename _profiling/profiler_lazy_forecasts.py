@@ -0,0 +1,68 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+This file measures the time spent in `env.step` when the forecasts are not used by the agent
+(they are then never read from the time series since grid2op 1.9.5) and when they are
+read at each step (as it was always the case before grid2op 1.9.5), by calling `obs.get_forecasted_inj()`
+after each step.
+
+The time to read the forecasts (done outside of `env.step` here) is also reported.
+"""
+
+import time
+import warnings
+import numpy as np
+
+import grid2op
+from grid2op.Parameters import Parameters
+
+NB_TS = 1000
+ENV_NAMES = ["l2rpn_case14_sandbox", "l2rpn_neurips_2020_track1", "l2rpn_wcci_2022_dev"]
+
+
+def run_env(env, nb_ts, read_forecasts):
+    env.set_id(0)
+    env.seed(0)
+    obs = env.reset()
+    time_step = 0.
+    time_read = 0.
+    nb_step = 0
+    for _ in range(nb_ts):
+        beg_ = time.perf_counter()
+        obs, reward, done, info = env.step(env.action_space())
+        time_step += time.perf_counter() - beg_
+        if read_forecasts:
+            beg_ = time.perf_counter()
+            obs.get_forecasted_inj()
+            time_read += time.perf_counter() - beg_
+        if done:
+            break
+        nb_step += 1
+    return time_step, time_read, nb_step
+
+
+def main(env_name):
+    param = Parameters()
+    param.NO_OVERFLOW_DISCONNECTION = True
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = grid2op.make(env_name, test=True, param=param)
+    time_lazy, _, nb_lazy = run_env(env, NB_TS, read_forecasts=False)
+    time_eager, time_read, nb_eager = run_env(env, NB_TS, read_forecasts=True)
+    env.close()
+    print(f"{env_name}:")
+    print(f"\t forecasts not used: {nb_lazy} steps, {1e3 * time_lazy / max(nb_lazy, 1):.3f} ms / step")
+    print(f"\t forecasts used    : {nb_eager} steps, {1e3 * time_eager / max(nb_eager, 1):.3f} ms / step "
+          f"(+ {1e3 * time_read / max(nb_eager, 1):.3f} ms / step to read the forecasts)")
+
+
+if __name__ == "__main__":
+    for env_name in ENV_NAMES:
+        main(env_name)
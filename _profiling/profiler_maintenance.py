@@ -0,0 +1,113 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+This file measures the time needed to process the maintenance (and hazards) of a full year at a 5 minutes
+resolution on a grid with 186 powerlines (size of the grid of the l2rpn_wcci_2022 environment).
+
+It compares the time to compute the "time of the next maintenance", the "duration of the next maintenance"
+and the "duration of the hazards" line by line (as it was done before grid2op 1.9.5) with the time to compute
+them for all the powerlines at once (`GridValue.get_xxx_2d`). The time to generate the maintenance
+(as done by `GridStateFromFileWithForecastsWithMaintenance`) is also reported.
+"""
+
+import time
+import numpy as np
+from datetime import datetime, timedelta
+
+from grid2op.Chronics import GridValue, GridStateFromFileWithForecastsWithMaintenance
+
+NB_TS = 365 * 288  # one year, 5 minutes resolution
+N_LINE = 186
+NB_RUN = 5
+SEED = 0
+
+
+def _legacy_1d(arr, kind):
+    """computation for one powerline, with a loop on the maintenance (before grid2op 1.9.5)"""
+    res = np.full(arr.shape, fill_value=GridValue.NAN_BUT_IN_INT, dtype=int)
+    a = np.diff(np.concatenate((arr, (0, 0))))
+    start = np.where(a == 1)[0] + 1
+    end = np.where(a == -1)[0] + 1
+    prev_ = 0
+    for beg_, end_ in zip(start, end):
+        if kind == "time":
+            res[prev_:beg_] = list(range(beg_ - prev_, 0, -1))
+            res[beg_:end_] = 0
+        else:
+            res[prev_:beg_] = end_ - beg_ if kind == "duration" else 0
+            res[beg_:end_] = list(range(end_ - beg_, 0, -1))
+        prev_ = end_
+    res[prev_:] = -1 if kind == "time" else 0
+    return res
+
+
+def legacy(maintenance, hazards):
+    maintenance_time = np.zeros(maintenance.shape, dtype=int)
+    maintenance_duration = np.zeros(maintenance.shape, dtype=int)
+    hazard_duration = np.zeros(hazards.shape, dtype=int)
+    for line_id in range(maintenance.shape[1]):
+        maintenance_time[:, line_id] = _legacy_1d(maintenance[:, line_id], "time")
+        maintenance_duration[:, line_id] = _legacy_1d(maintenance[:, line_id], "duration")
+        hazard_duration[:, line_id] = _legacy_1d(hazards[:, line_id], "hazard")
+    return maintenance_time, maintenance_duration, hazard_duration
+
+
+def vectorized(maintenance, hazards):
+    return (GridValue.get_maintenance_time_2d(maintenance),
+            GridValue.get_maintenance_duration_2d(maintenance),
+            GridValue.get_hazard_duration_2d(hazards))
+
+
+def generate(space_prng):
+    name_line = [f"line_{i}" for i in range(N_LINE)]
+    return GridStateFromFileWithForecastsWithMaintenance._generate_matenance_static(
+        name_line,
+        NB_TS,
+        set(name_line[::3]),
+        timedelta(minutes=5),
+        datetime(2019, 1, 1),
+        9,
+        17,
+        [0.01] * 12,
+        [3] * 12,
+        space_prng
+    )
+
+
+def timeit(fun, *args):
+    times = []
+    for _ in range(NB_RUN):
+        beg_ = time.perf_counter()
+        res = fun(*args)
+        times.append(time.perf_counter() - beg_)
+    return res, 1e3 * np.median(times)
+
+
+def main():
+    maintenance, time_generate = timeit(generate, np.random.RandomState(SEED))
+    prng = np.random.RandomState(SEED)
+    hazards = np.zeros(maintenance.shape)
+    for line_id in prng.choice(N_LINE, size=10, replace=False):
+        beg_ = prng.randint(1, NB_TS - 100)
+        hazards[beg_:(beg_ + prng.randint(1, 100)), line_id] = 1.
+
+    res_legacy, time_legacy = timeit(legacy, maintenance, hazards)
+    res_vect, time_vect = timeit(vectorized, maintenance, hazards)
+    for arr_legacy, arr_vect in zip(res_legacy, res_vect):
+        assert np.array_equal(arr_legacy, arr_vect)
+
+    print(f"{NB_TS} steps, {N_LINE} powerlines, {int(maintenance.sum() / 96)} maintenance")
+    print(f"\t maintenance generation          : {time_generate:.1f} ms")
+    print(f"\t time / duration (line by line)  : {time_legacy:.1f} ms")
+    print(f"\t time / duration (2d, vectorized): {time_vect:.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,80 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+This file compares the time spent to compute the redispatching (`env._time_redisp`) when
+the dedicated solver is used (default since grid2op 1.9.5) and when scipy "SLSQP" is used (as before).
+
+The same (random) redispatching actions are performed in both cases.
+"""
+
+import time
+import warnings
+import numpy as np
+
+import grid2op
+from grid2op.Parameters import Parameters
+
+NB_TS = 200
+ENV_NAMES = ["rte_case14_redisp", "rte_case14_realistic", "l2rpn_case14_sandbox"]
+
+
+def get_actions(env, nb_ts, seed=0):
+    """random redispatching on one generator at each step"""
+    rng = np.random.default_rng(seed)
+    gen_redisp = np.where(env.gen_redispatchable)[0]
+    res = []
+    for _ in range(nb_ts):
+        gen_id = rng.choice(gen_redisp)
+        amount = rng.uniform(-env.gen_max_ramp_down[gen_id], env.gen_max_ramp_up[gen_id])
+        res.append(env.action_space({"redispatch": [(gen_id, amount)]}))
+    return res
+
+
+def run_env(env, actions, use_fast):
+    env._use_fast_dispatch_solver = use_fast
+    env.set_id(0)
+    env.seed(0)
+    env.reset()
+    all_disp = []
+    nb_ts = 0
+    beg_ = time.perf_counter()
+    for act in actions:
+        obs, reward, done, info = env.step(act)
+        if done:
+            break
+        all_disp.append(1.0 * obs.actual_dispatch)
+        nb_ts += 1
+    end_ = time.perf_counter()
+    return env._time_redisp, end_ - beg_, nb_ts, np.array(all_disp)
+
+
+def main(env_name):
+    param = Parameters()
+    param.NO_OVERFLOW_DISCONNECTION = True
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = grid2op.make(env_name, test=True, param=param)
+    actions = get_actions(env, NB_TS)
+    time_scipy, total_scipy, nb_scipy, disp_scipy = run_env(env, actions, use_fast=False)
+    time_fast, total_fast, nb_fast, disp_fast = run_env(env, actions, use_fast=True)
+    env.close()
+    nb_ts = min(nb_scipy, nb_fast)
+    max_diff = np.abs(disp_scipy[:nb_ts] - disp_fast[:nb_ts]).max() if nb_ts else 0.
+    print(f"{env_name}:")
+    print(f"\t scipy : {nb_scipy} steps, {1e3 * time_scipy:.2f} ms in the redispatching "
+          f"({1e3 * total_scipy:.2f} ms in total)")
+    print(f"\t fast  : {nb_fast} steps, {1e3 * time_fast:.2f} ms in the redispatching "
+          f"({1e3 * total_fast:.2f} ms in total)")
+    print(f"\t speed up: {time_scipy / time_fast:.1f}x, max difference in the dispatch: {max_diff:.2e} MW")
+
+
+if __name__ == "__main__":
+    for env_name in ENV_NAMES:
+        main(env_name)
@@ -25,6 +25,7 @@ except ImportError:
     print("PandaPowerBackend used")
 
 import os
+import time
 import cProfile
 import pdb
 
@@ -73,6 +74,31 @@ def simulate(obs, action_space, nb_simu=NB_SIMULATE, cp=None):
         raise exc_
 
 
+def compare_obs_pool(env, nb_step=100, nb_simu=NB_SIMULATE, pool_size=1):
+    """compare the time spent in `obs.simulate` with and without the pool of observations
+    (see `env.observation_space.set_simulate_pool_size`)"""
+    res = {}
+    for pool_size_ in [0, pool_size]:
+        env.observation_space.set_simulate_pool_size(pool_size_)
+        env.seed(0)
+        obs = env.reset()
+        acts = [env.action_space.sample() for _ in range(nb_simu)]
+        total_time = 0.
+        for _ in range(nb_step):
+            beg_ = time.perf_counter()
+            for act in acts:
+                sim_obs, sim_r, sim_d, sim_info = obs.simulate(act)
+            total_time += time.perf_counter() - beg_
+            obs, reward, done, info = env.step(env.action_space())
+            if done:
+                break
+        res[pool_size_] = total_time
+    env.observation_space.set_simulate_pool_size(0)
+    print(f"Time spent in simulate: {res[0]:.2f}s without pool, {res[pool_size]:.2f}s with "
+          f"a pool of size {pool_size} ({100. * (res[0] - res[pool_size]) / res[0]:.1f}% reduction)")
+    return res
+
+
 if __name__ == "__main__":
     env = make_env()
     cp_simu = cProfile.Profile()
@@ -85,5 +111,6 @@ if __name__ == "__main__":
     cp_env.dump_stats(nm_out_env)
     print("You can view profiling results with:\n\tsnakeviz {}".format(nm_out_env))
     print("You can view profiling results with:\n\tsnakeviz {}".format(nm_out_simu))
+    compare_obs_pool(make_env())
 # base: 66.7 s
 # sans copy dans simulate: 65.2
@@ -0,0 +1,109 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+This file measures the "startup" time of grid2op: the wall time of `python -c "import grid2op"` and of
+`python -c "import grid2op; grid2op.make('l2rpn_case14_sandbox', test=True)"`
+(each command is run in a fresh python interpreter).
+
+It also lists the heavy dependencies loaded by `import grid2op` (they should only be imported when used,
+since grid2op 1.9.5) and, with `--importtime`, the modules that take the most time to be imported.
+
+Results can be saved (in json) with `--output` to track them over time.
+"""
+
+import re
+import sys
+import json
+import time
+import argparse
+import subprocess
+import numpy as np
+
+NB_RUN = 10
+ENV_NAME = "l2rpn_case14_sandbox"
+HEAVY_MODULES = ["pandapower", "networkx", "scipy", "scipy.optimize", "scipy.sparse",
+                 "matplotlib", "plotly", "numba", "pandas", "requests", "pkg_resources"]
+
+CMD_IMPORT = "import grid2op"
+CMD_MAKE = ("import warnings\n"
+            "import grid2op\n"
+            "with warnings.catch_warnings():\n"
+            "    warnings.filterwarnings('ignore')\n"
+            "    env = grid2op.make('{}', test=True)\n"
+            "env.close()\n")
+CMD_MODULES = ("import sys, json\n"
+               "import grid2op\n"
+               "print(json.dumps({{el: el in sys.modules for el in {}}}))\n")
+
+
+def time_cmd(cmd, nb_run):
+    """wall time (in s) of `python -c cmd` (run `nb_run` times)"""
+    res = []
+    for _ in range(nb_run):
+        beg_ = time.perf_counter()
+        subprocess.run([sys.executable, "-W", "ignore", "-c", cmd], check=True,
+                       stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+        res.append(time.perf_counter() - beg_)
+    return np.array(res)
+
+
+def loaded_modules():
+    """which of the HEAVY_MODULES are imported by `import grid2op`"""
+    out = subprocess.run([sys.executable, "-W", "ignore", "-c", CMD_MODULES.format(HEAVY_MODULES)],
+                         check=True, capture_output=True, text=True)
+    return json.loads(out.stdout.strip().split("\n")[-1])
+
+
+def slowest_imports(nb_module=15):
+    """the modules with the highest cumulative import time (given by `python -X importtime`)"""
+    out = subprocess.run([sys.executable, "-W", "ignore", "-X", "importtime", "-c", CMD_IMPORT],
+                         check=True, capture_output=True, text=True)
+    res = []
+    for line in out.stderr.split("\n"):
+        match_ = re.match(r"import time:\s+(\d+) \|\s+(\d+) \|(\s+)(\S+)", line)
+        if match_ is not None:
+            res.append((int(match_.group(2)) * 1e-6, match_.group(4)))
+    return sorted(res, reverse=True)[:nb_module]
+
+
+def main(nb_run=NB_RUN, env_name=ENV_NAME, importtime=False, output=None):
+    time_import = time_cmd(CMD_IMPORT, nb_run)
+    time_make = time_cmd(CMD_MAKE.format(env_name), nb_run)
+    modules = loaded_modules()
+    print(f"import grid2op: median {np.median(time_import):.3f}s (min {time_import.min():.3f}s)")
+    print(f"make(\"{env_name}\", test=True): median {np.median(time_make):.3f}s "
+          f"(min {time_make.min():.3f}s)")
+    print("heavy modules imported by `import grid2op`: "
+          f"{[el for el, is_loaded in modules.items() if is_loaded]}")
+    if importtime:
+        print("slowest imports (cumulative time):")
+        for duration, module_nm in slowest_imports():
+            print(f"\t{duration:.3f}s\t{module_nm}")
+    if output is not None:
+        res = {"import": [float(el) for el in time_import],
+               "make": [float(el) for el in time_make],
+               "env_name": env_name,
+               "modules": modules}
+        with open(output, "w", encoding="utf-8") as f:
+            json.dump(res, fp=f, indent=4)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Startup time of grid2op")
+    parser.add_argument("--nb_run", default=NB_RUN, type=int,
+                        help="Number of times each command is run")
+    parser.add_argument("--env_name", default=ENV_NAME, type=str,
+                        help="Name of the (test) environment created")
+    parser.add_argument("--importtime", action="store_true",
+                        help="Print the modules that take the most time to be imported")
+    parser.add_argument("--output", default=None, type=str,
+                        help="Path of a json file where the timings are stored")
+    args = parser.parse_args()
+    main(nb_run=args.nb_run, env_name=args.env_name, importtime=args.importtime, output=args.output)
@@ -0,0 +1,70 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+This file compares the time of the AC powerflows of the `PandaPowerBackend` with and without the cache
+of the pandapower model of the last topologies (see `PandaPowerBackend.set_topo_cache_size`).
+
+The agent alternates between "do nothing" and a few actions that modify the topology (and come back
+to the reference topology), as most agents do.
+"""
+
+import time
+import warnings
+import numpy as np
+
+import grid2op
+from grid2op.Backend import PandaPowerBackend
+
+ENV_NAME = "l2rpn_wcci_2022"
+NB_STEP = 100
+SEED = 0
+
+
+def make_env(topo_cache_size):
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = grid2op.make(ENV_NAME, test=True, backend=PandaPowerBackend())
+    env.backend.set_topo_cache_size(topo_cache_size)
+    env.seed(SEED)
+    env.set_id(0)
+    env.reset()
+    env.backend.clear_topo_cache()
+    return env
+
+
+def run_env(env, actions):
+    rng = np.random.default_rng(SEED)
+    beg_ = time.perf_counter()
+    for step in range(NB_STEP):
+        act = actions[rng.integers(len(actions))] if step % 2 else env.action_space()
+        obs, reward, done, info = env.step(act)
+        if done:
+            env.reset()
+    return time.perf_counter() - beg_
+
+
+def main():
+    env_no_cache = make_env(0)
+    env_cache = make_env(PandaPowerBackend.TOPO_CACHE_SIZE)
+    actions = [env_cache.action_space({"set_line_status": [(l_id, -1)]}) for l_id in range(3)]
+    actions += [env_cache.action_space({"set_line_status": [(l_id, +1)]}) for l_id in range(3)]
+
+    print(f"Environment {ENV_NAME} ({env_cache.n_line} powerlines, {env_cache.n_sub} substations), "
+          f"{NB_STEP} steps")
+    for env, msg in [(env_no_cache, "without cache"), (env_cache, "with cache   ")]:
+        total_time = run_env(env, actions)
+        print(f"\t {msg}: {total_time:.2f} s ({env.backend.topo_cache_hits} models reused, "
+              f"{env.backend.topo_cache_misses} built)")
+    env_no_cache.close()
+    env_cache.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2019-2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+"""
+This file compares the time spent to compute the topology vector in the PandaPowerBackend
+between the "loop based" implementation (used before grid2op 1.9.5) and the vectorized one.
+"""
+
+import time
+import warnings
+import numpy as np
+from tqdm import tqdm
+
+import grid2op
+from grid2op.dtypes import dt_int
+from grid2op.Backend import PandaPowerBackend
+
+NB_TS = 100
+ENV_NAMES = ["l2rpn_case14_sandbox", "l2rpn_neurips_2020_track2", "l2rpn_wcci_2022_dev"]
+
+
+def get_topo_vect_loop(self):
+    """former implementation of `PandaPowerBackend._get_topo_vect`"""
+    res = np.full(self.dim_topo, fill_value=np.iinfo(dt_int).max, dtype=dt_int)
+    line_status = self.get_line_status()
+    i = 0
+    for row in self._grid.line[["from_bus", "to_bus"]].values:
+        if line_status[i]:
+            res[self.line_or_pos_topo_vect[i]] = 1 if row[0] == self.line_or_to_subid[i] else 2
+            res[self.line_ex_pos_topo_vect[i]] = 1 if row[1] == self.line_ex_to_subid[i] else 2
+        else:
+            res[self.line_or_pos_topo_vect[i]] = -1
+            res[self.line_ex_pos_topo_vect[i]] = -1
+        i += 1
+    nb = self._number_true_line
+    i = 0
+    for row in self._grid.trafo[["hv_bus", "lv_bus"]].values:
+        j = i + nb
+        if line_status[j]:
+            res[self.line_or_pos_topo_vect[j]] = 1 if row[0] == self.line_or_to_subid[j] else 2
+            res[self.line_ex_pos_topo_vect[j]] = 1 if row[1] == self.line_ex_to_subid[j] else 2
+        else:
+            res[self.line_or_pos_topo_vect[j]] = -1
+            res[self.line_ex_pos_topo_vect[j]] = -1
+        i += 1
+    i = 0
+    for bus_id in self._grid.gen["bus"].values:
+        res[self.gen_pos_topo_vect[i]] = 1 if bus_id == self.gen_to_subid[i] else 2
+        i += 1
+    i = 0
+    for bus_id in self._grid.load["bus"].values:
+        res[self.load_pos_topo_vect[i]] = 1 if bus_id == self.load_to_subid[i] else 2
+        i += 1
+    if self.n_storage:
+        i = 0
+        for bus_id in self._grid.storage["bus"].values:
+            if self._grid.storage["in_service"].values[i]:
+                res[self.storage_pos_topo_vect[i]] = 1 if bus_id == self.storage_to_subid[i] else 2
+            else:
+                res[self.storage_pos_topo_vect[i]] = -1
+            i += 1
+    return res
+
+
+def run_env(env_name):
+    with warnings.catch_warnings():
+        warnings.filterwarnings("ignore")
+        env = grid2op.make(env_name, test=True, backend=PandaPowerBackend())
+    env.seed(0)
+    env.reset()
+    bk = env.backend
+    time_loop = 0.
+    time_vect = 0.
+    nb_step = 0
+    for _ in tqdm(range(NB_TS)):
+        obs, reward, done, info = env.step(env.action_space.sample())
+        if done:
+            env.reset()
+            continue
+        beg_ = time.perf_counter()
+        res_loop = get_topo_vect_loop(bk)
+        time_loop += time.perf_counter() - beg_
+        beg_ = time.perf_counter()
+        res_vect = bk._get_topo_vect()
+        time_vect += time.perf_counter() - beg_
+        assert np.array_equal(res_loop, res_vect), "the two implementation do not match"
+        nb_step += 1
+    env.close()
+    return time_loop / nb_step, time_vect / nb_step
+
+
+if __name__ == "__main__":
+    for env_name in ENV_NAMES:
+        t_loop, t_vect = run_env(env_name)
+        print(f"{env_name}: loop: {1e6 * t_loop:.1f} us / step, "
+              f"vectorized: {1e6 * t_vect:.1f} us / step "
+              f"(speed up x{t_loop / t_vect:.1f})")
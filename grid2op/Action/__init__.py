@@ -4,6 +4,7 @@ __all__ = [
     "PlayableAction",
     "ActionSpace",
     "SerializableActionSpace",
+    "ActionBatch",
     # Usable
     "VoltageOnlyAction",
     "CompleteAction",
@@ -29,6 +30,7 @@ from grid2op.Action.voltageOnlyAction import VoltageOnlyAction
 from grid2op.Action.completeAction import CompleteAction
 from grid2op.Action.actionSpace import ActionSpace
 from grid2op.Action.serializableActionSpace import SerializableActionSpace
+from grid2op.Action.actionBatch import ActionBatch
 
 from grid2op.Action.dontAct import DontAct
 from grid2op.Action.powerlineSetAction import PowerlineSetAction
@@ -286,6 +286,44 @@ class _BackendAction(GridObjects):
         res = self.__deepcopy__()  # nothing less to do
         return res
 
+    def _get_state(self):
+        """
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        The state of this object, as numpy arrays, used by :func:`grid2op.Environment.BaseEnv.snapshot`
+        """
+        value_stores = ["last_topo_registered", "current_topo", "prod_p", "prod_v",
+                        "load_p", "load_q", "storage_power"]
+        if self.shunts_data_available:
+            value_stores += ["shunt_p", "shunt_q", "shunt_bus"]
+        res = {}
+        for attr_nm in value_stores:
+            tmp = getattr(self, attr_nm)
+            res[attr_nm] = (tmp.values.copy(), tmp.changed.copy(), tmp.last_index)
+        for attr_nm in ["activated_bus", "_status_or_before", "_status_ex_before", "_status_or", "_status_ex"]:
+            res[attr_nm] = getattr(self, attr_nm).copy()
+        return res
+
+    def _set_state(self, state):
+        """
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Copy (inplace) the state returned by :func:`_BackendAction._get_state`
+        """
+        for attr_nm, attr_state in state.items():
+            tmp = getattr(self, attr_nm)
+            if isinstance(tmp, ValueStore):
+                values, changed, last_index = attr_state
+                tmp.values[:] = values
+                tmp.changed[:] = changed
+                tmp.last_index = last_index
+            else:
+                tmp[:] = attr_state
+
     def reorder(self, no_load, no_gen, no_topo, no_storage, no_shunt):
         """
         .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
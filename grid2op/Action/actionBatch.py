@@ -0,0 +1,393 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import numpy as np
+from typing import List, Tuple, Optional
+
+from grid2op.dtypes import dt_float
+from grid2op.Exceptions import (
+    AmbiguousAction,
+    EnvError,
+    IncorrectNumberOfElements,
+    NonFiniteElement,
+)
+from grid2op.Action.baseAction import BaseAction
+
+
+class ActionBatch(object):
+    """
+    This class represents a batch of `N` actions (all of the same type) as a "struct of arrays": each
+    attribute of the action (for example `set_bus` or `redispatch`) is stored as a 2d numpy array with
+    `N` rows, the row `i` corresponding to the action `i`.
+
+    It is built with :func:`grid2op.Action.SerializableActionSpace.from_vect_batch`
+    (with `as_batch=True`) and allows to convert at once a matrix of shape `(N, action_space.size())`,
+    for example computed by a neural network, into grid2op actions. The conversion, the checks for
+    non finite values and the checks for ambiguity are performed for all the actions at the same time.
+
+    .. versionadded:: 1.9.5
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        import numpy as np
+        env = grid2op.make("l2rpn_case14_sandbox")
+
+        # 10 actions represented as vectors
+        actions_vect = np.zeros((10, env.action_space.size()))
+
+        # convert them all
+        act_batch = env.action_space.from_vect_batch(actions_vect, as_batch=True)
+        act_batch.set_bus  # a matrix of shape (10, env.dim_topo)
+        act_batch.redispatch  # a matrix of shape (10, env.n_gen)
+
+        # retrieve the grid2op action
+        act_3 = act_batch[3]
+        all_acts = act_batch.to_actions()
+
+        # and back to vectors
+        actions_vect2 = act_batch.to_vect()
+
+    Notes
+    -----
+    The attributes exposed as matrices are views on the data of the batch. Modifying them modifies
+    the batch, but not the actions already retrieved with :func:`ActionBatch.__getitem__` (these are copies).
+
+    """
+
+    def __init__(self, template_act: BaseAction, matrix: np.ndarray):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Use :func:`grid2op.Action.SerializableActionSpace.from_vect_batch` to build an instance of
+            this class.
+
+        Parameters
+        ----------
+        template_act: :class:`grid2op.Action.BaseAction`
+            An action (of the right type) used as a template, typically `action_space._template_obj`
+
+        matrix: ``numpy.ndarray``
+            The actions represented as vector, one action per row.
+        """
+        self._template_act = template_act
+        cls = type(template_act)
+        template_act._raise_error_attr_list_none()
+        try:
+            matrix = np.array(matrix).astype(dt_float)
+        except Exception as exc_:
+            raise EnvError(
+                "Impossible to convert the input matrix to a floating point numpy array "
+                "with error:\n"
+                '"{}".'.format(exc_)
+            )
+        if len(matrix.shape) == 1:
+            matrix = matrix.reshape(1, -1)
+        if len(matrix.shape) != 2 or matrix.shape[1] != template_act.size():
+            raise IncorrectNumberOfElements(
+                "Incorrect shape found while loading a batch of actions from a matrix. "
+                "Found a matrix of shape {} while it should be of shape (N, {})"
+                "".format(matrix.shape, template_act.size())
+            )
+        self._nb = matrix.shape[0]
+        self._data = {}
+
+        prev_ = 0
+        check_finite = np.zeros(matrix.shape[1], dtype=bool)
+        slices = []
+        for attr_nm, sh in zip(cls.attr_list_vect, template_act.shape()):
+            if attr_nm not in cls.attr_nan_list_set:
+                check_finite[prev_ : (prev_ + sh)] = True
+            slices.append((attr_nm, prev_, prev_ + sh))
+            prev_ += sh
+        if (~np.isfinite(matrix[:, check_finite])).any():
+            raise NonFiniteElement("None finite number in from_vect_batch detected")
+
+        for (attr_nm, beg_, end_), dt in zip(slices, template_act.dtype()):
+            try:
+                self._data[attr_nm] = matrix[:, beg_:end_].astype(dt)
+            except Exception as exc_:
+                raise EnvError(
+                    'Impossible to convert the input matrix to its type ({}) for attribute "{}" '
+                    "with error:\n"
+                    '"{}".'.format(dt, attr_nm, exc_)
+                )
+
+    def __len__(self) -> int:
+        return self._nb
+
+    def _get_attr(self, attr_nm: str) -> np.ndarray:
+        """get the attribute as a matrix, attributes not in the vector representation are set to their default value"""
+        if attr_nm not in self._data:
+            default_ = self._template_act._get_array_from_attr_name(attr_nm)
+            self._data[attr_nm] = np.tile(default_, (self._nb, 1))
+        return self._data[attr_nm]
+
+    @property
+    def set_bus(self) -> np.ndarray:
+        """the `set_bus` part of the actions, matrix of shape `(N, dim_topo)`"""
+        return self._get_attr("_set_topo_vect")
+
+    @property
+    def change_bus(self) -> np.ndarray:
+        """the `change_bus` part of the actions, matrix of shape `(N, dim_topo)`"""
+        return self._get_attr("_change_bus_vect")
+
+    @property
+    def set_line_status(self) -> np.ndarray:
+        """the `set_line_status` part of the actions, matrix of shape `(N, n_line)`"""
+        return self._get_attr("_set_line_status")
+
+    @property
+    def change_line_status(self) -> np.ndarray:
+        """the `change_line_status` part of the actions, matrix of shape `(N, n_line)`"""
+        return self._get_attr("_switch_line_status")
+
+    @property
+    def redispatch(self) -> np.ndarray:
+        """the `redispatch` part of the actions, matrix of shape `(N, n_gen)`"""
+        return self._get_attr("_redispatch")
+
+    @property
+    def storage_p(self) -> np.ndarray:
+        """the `set_storage` part of the actions, matrix of shape `(N, n_storage)`"""
+        return self._get_attr("_storage_power")
+
+    @property
+    def curtail(self) -> np.ndarray:
+        """the `curtail` part of the actions, matrix of shape `(N, n_gen)`"""
+        return self._get_attr("_curtail")
+
+    @property
+    def raise_alarm(self) -> np.ndarray:
+        """the `raise_alarm` part of the actions, matrix of shape `(N, dim_alarms)`"""
+        return self._get_attr("_raise_alarm")
+
+    @property
+    def raise_alert(self) -> np.ndarray:
+        """the `raise_alert` part of the actions, matrix of shape `(N, dim_alerts)`"""
+        return self._get_attr("_raise_alert")
+
+    def _build_action(self, row_id: int) -> BaseAction:
+        """build the grid2op action corresponding to the row `row_id`"""
+        res = self._template_act.copy()
+        for attr_nm, data in self._data.items():
+            vect = data[row_id]
+            if hasattr(res, attr_nm):
+                res_attr = getattr(res, attr_nm)
+                if res_attr is None:
+                    # attribute not in the vector representation (eg shunt not available)
+                    continue
+                res_attr[:] = vect
+            elif attr_nm in type(res).attr_list_set:
+                # injections, see BaseAction._assign_attr_from_name
+                if np.isfinite(vect).any() and (vect != 0.0).any():
+                    res._dict_inj[attr_nm] = vect.copy()
+        res._post_process_from_vect()
+        return res
+
+    def __getitem__(self, item):
+        if isinstance(item, slice):
+            return [self._build_action(i) for i in range(*item.indices(self._nb))]
+        if item < 0:
+            item += self._nb
+        if item < 0 or item >= self._nb:
+            raise IndexError(f"Index {item} out of range for a batch of {self._nb} actions")
+        return self._build_action(item)
+
+    def __iter__(self):
+        for row_id in range(self._nb):
+            yield self._build_action(row_id)
+
+    def to_actions(self) -> List[BaseAction]:
+        """
+        Convert this batch to a list of `N` grid2op actions.
+
+        Returns
+        -------
+        res: ``list``
+            The list of actions.
+        """
+        return [self._build_action(i) for i in range(self._nb)]
+
+    def to_vect(self) -> np.ndarray:
+        """
+        Convert this batch to a matrix of shape `(N, action_space.size())`, each row being the result
+        of :func:`grid2op.Action.BaseAction.to_vect` for the corresponding action.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``
+            The matrix representing the actions.
+        """
+        cls = type(self._template_act)
+        res = np.empty((self._nb, self._template_act.size()), dtype=dt_float)
+        prev_ = 0
+        for attr_nm, sh in zip(cls.attr_list_vect, self._template_act.shape()):
+            res[:, prev_ : (prev_ + sh)] = self._data[attr_nm]
+            prev_ += sh
+        return res
+
+    def _get_ambiguous_mask(self) -> np.ndarray:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Perform the checks of :func:`grid2op.Action.BaseAction._check_for_ambiguity` on all the
+        actions of the batch at once. The returned mask is `True` for all the actions that *might* be
+        ambiguous (it can be `True` for some non ambiguous actions, but it is always `True` for
+        ambiguous ones): these actions are then checked one by one.
+
+        If the type of action overloads the ambiguity checks, all the actions are flagged.
+        """
+        act = self._template_act
+        cls = type(act)
+        nb = self._nb
+        if (
+            cls._check_for_ambiguity is not BaseAction._check_for_ambiguity
+            or cls._is_storage_ambiguous is not BaseAction._is_storage_ambiguous
+            or cls._is_curtailment_ambiguous is not BaseAction._is_curtailment_ambiguous
+            or cls._check_for_correct_modif_flags is not BaseAction._check_for_correct_modif_flags
+        ):
+            return np.ones(nb, dtype=bool)
+
+        set_bus = self.set_bus
+        change_bus = self.change_bus
+        set_status = self.set_line_status
+        change_status = self.change_line_status
+        redisp = self.redispatch
+        storage_p = self.storage_p
+        curtail = self.curtail
+        keys = cls.authorized_keys
+
+        modif_set_bus = (set_bus != 0).any(axis=1)
+        modif_change_bus = change_bus.any(axis=1)
+        modif_redisp = (np.isfinite(redisp) & (redisp != 0.0)).any(axis=1)
+        modif_storage = (storage_p != 0.0).any(axis=1)
+        modif_curtail = (curtail != -1.0).any(axis=1)
+        has_inj = {}
+        for attr_nm in ["prod_p", "prod_v", "load_p", "load_q"]:
+            if attr_nm in self._data and attr_nm in cls.attr_list_set and not hasattr(act, attr_nm):
+                tmp = self._data[attr_nm]
+                has_inj[attr_nm] = np.isfinite(tmp).any(axis=1) & (tmp != 0.0).any(axis=1)
+
+        res = np.zeros(nb, dtype=bool)
+
+        # actions on things not supported by this type of action
+        if "injection" not in keys:
+            for inj_ in has_inj.values():
+                res |= inj_
+        if "set_bus" not in keys:
+            res |= modif_set_bus
+        if "change_bus" not in keys:
+            res |= modif_change_bus
+        if "set_line_status" not in keys:
+            res |= (set_status != 0).any(axis=1)
+        if "change_line_status" not in keys:
+            res |= change_status.any(axis=1)
+        if "redispatch" not in keys:
+            res |= (redisp != 0.0).any(axis=1)
+        if "set_storage" not in keys:
+            res |= modif_storage
+        if "curtail" not in keys:
+            res |= modif_curtail
+        if "raise_alarm" not in keys:
+            res |= self.raise_alarm.any(axis=1)
+        if "raise_alert" not in keys:
+            res |= self.raise_alert.any(axis=1)
+
+        # the rules are the ones of `BaseAction._check_for_ambiguity`, applied on all the rows at once
+        # powerline status both set and changed
+        res |= cls._aux_ambiguous_line_status_set_change(set_status, change_status).any(axis=1)
+
+        # redispatching (and curtailment)
+        if not cls.redispatching_unit_commitment_availble:
+            res |= modif_redisp | modif_curtail
+        res |= cls._aux_ambiguous_redisp_non_dispatchable(redisp).any(axis=1)
+        if act._single_act:
+            res |= cls._aux_ambiguous_redisp_ramp_up(redisp).any(axis=1)
+            res |= cls._aux_ambiguous_redisp_ramp_down(redisp).any(axis=1)
+            if "prod_p" in has_inj:
+                # checked one by one, this is rare
+                res |= modif_redisp & has_inj["prod_p"]
+
+        # storage units
+        if cls.n_storage == 0:
+            res |= modif_storage
+        else:
+            res |= cls._aux_ambiguous_storage_prod(storage_p).any(axis=1)
+            res |= cls._aux_ambiguous_storage_absorb(storage_p).any(axis=1)
+        if "_storage_power" not in cls.attr_list_set and cls.n_storage > 0:
+            res |= (set_bus[:, cls.storage_pos_topo_vect] > 0).any(axis=1)
+            res |= change_bus[:, cls.storage_pos_topo_vect].any(axis=1)
+
+        # curtailment
+        res |= cls._aux_ambiguous_curtail_negative(curtail).any(axis=1)
+        res |= cls._aux_ambiguous_curtail_above_one(curtail).any(axis=1)
+        res |= cls._aux_ambiguous_curtail_non_renewable(curtail).any(axis=1)
+
+        # topology
+        res |= cls._aux_ambiguous_bus_set_change(set_bus, change_bus).any(axis=1)
+        res |= cls._aux_ambiguous_bus_below_min(set_bus).any(axis=1)
+        res |= cls._aux_ambiguous_bus_above_max(set_bus).any(axis=1)
+        res |= cls._aux_ambiguous_line_disco_or_co_ex(set_bus).any(axis=1)
+        res |= cls._aux_ambiguous_line_disco_ex_co_or(set_bus).any(axis=1)
+        res |= cls._aux_ambiguous_line_disco_set_bus(set_status, set_bus).any(axis=1)
+        res |= cls._aux_ambiguous_line_reco_set_bus(set_status, set_bus).any(axis=1)
+        for status in [-1, 1]:
+            for side_pos_topo_vect in [cls.line_or_pos_topo_vect, cls.line_ex_pos_topo_vect]:
+                res |= cls._aux_ambiguous_line_status_change_bus(set_status, change_bus,
+                                                                 status, side_pos_topo_vect).any(axis=1)
+
+        # shunts
+        if cls.shunts_data_available and cls.n_shunt > 0 and "shunt_bus" in self._data:
+            res |= cls._aux_ambiguous_shunt_bus(self._data["shunt_bus"]).any(axis=1)
+        return res
+
+    def check_space_legit(self):
+        """
+        Check that none of the actions of the batch is ambiguous *per se*
+        (see :func:`grid2op.Action.BaseAction.check_space_legit`).
+
+        The checks are first performed for all actions at once, only the actions that might be
+        ambiguous are then checked individually.
+
+        Raises
+        -------
+        :class:`grid2op.Exceptions.AmbiguousAction`
+            Or any of its more precise subclasses, for the first ambiguous action found (the same error
+            as the one that would be raised by the action itself)
+
+        """
+        for row_id in np.where(self._get_ambiguous_mask())[0]:
+            self._build_action(row_id).check_space_legit()
+
+    def is_ambiguous(self) -> Tuple[np.ndarray, List[Optional[AmbiguousAction]]]:
+        """
+        Says, for each action of the batch, if it is ambiguous *per se* or not. This is the
+        batched version of :func:`grid2op.Action.BaseAction.is_ambiguous`.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``
+            A vector of `N` booleans, ``True`` if the corresponding action is ambiguous, ``False`` otherwise.
+
+        info: ``list``
+            More information about the errors: the exception for the ambiguous actions, ``None`` for the others.
+        """
+        res = np.zeros(self._nb, dtype=bool)
+        info = [None for _ in range(self._nb)]
+        for row_id in np.where(self._get_ambiguous_mask())[0]:
+            res[row_id], info[row_id] = self._build_action(row_id).is_ambiguous()
+        return res, info
@@ -2315,6 +2315,102 @@ class BaseAction(GridObjects):
             if "raise_alert" not in self.authorized_keys:
                 raise IllegalAction("You illegally send an alert.")
 
+    # The `_aux_ambiguous_xxx` class methods below implement the (numerical) rules
+    # of `_check_for_ambiguity`. They work on the attributes of a single action
+    # (1d arrays) or on the attributes of a batch of actions (2d arrays with one action per row,
+    # see `ActionBatch`) and return the element wise mask of the elements breaking the rule.
+    @classmethod
+    def _aux_ambiguous_line_status_set_change(cls, set_status, change_status):
+        """lines whose status is both set and changed"""
+        return (set_status != 0) & change_status
+
+    @classmethod
+    def _aux_ambiguous_redisp_non_dispatchable(cls, redisp):
+        """redispatching on non dispatchable generators"""
+        return redisp[..., ~cls.gen_redispatchable] != 0.0
+
+    @classmethod
+    def _aux_ambiguous_redisp_ramp_up(cls, redisp):
+        """redispatching above the maximum ramp up"""
+        return redisp > cls.gen_max_ramp_up
+
+    @classmethod
+    def _aux_ambiguous_redisp_ramp_down(cls, redisp):
+        """redispatching below the maximum ramp down"""
+        return -redisp > cls.gen_max_ramp_down
+
+    @classmethod
+    def _aux_ambiguous_storage_prod(cls, storage_p):
+        """storage units asked to produce more than what they can"""
+        return storage_p < -cls.storage_max_p_prod
+
+    @classmethod
+    def _aux_ambiguous_storage_absorb(cls, storage_p):
+        """storage units asked to absorb more than what they can"""
+        return storage_p > cls.storage_max_p_absorb
+
+    @classmethod
+    def _aux_ambiguous_curtail_negative(cls, curtail):
+        """negative curtailment (-1 meaning "no curtailment")"""
+        return (curtail < 0.0) & (curtail != -1.0)
+
+    @classmethod
+    def _aux_ambiguous_curtail_above_one(cls, curtail):
+        """curtailment above 1."""
+        return curtail > 1.0
+
+    @classmethod
+    def _aux_ambiguous_curtail_non_renewable(cls, curtail):
+        """curtailment of non renewable generators"""
+        return curtail[..., ~cls.gen_renewable] != -1.0
+
+    @classmethod
+    def _aux_ambiguous_bus_set_change(cls, set_bus, change_bus):
+        """elements whose bus is both set and changed"""
+        return (set_bus != 0) & change_bus
+
+    @classmethod
+    def _aux_ambiguous_bus_below_min(cls, set_bus):
+        """elements set to a bus < -1"""
+        return set_bus < -1
+
+    @classmethod
+    def _aux_ambiguous_bus_above_max(cls, set_bus):
+        """elements set to a bus > 2"""
+        return set_bus > 2
+
+    @classmethod
+    def _aux_ambiguous_line_disco_or_co_ex(cls, set_bus):
+        """lines disconnected at their origin side and connected at their extremity side"""
+        return (set_bus[..., cls.line_or_pos_topo_vect] == -1) & (set_bus[..., cls.line_ex_pos_topo_vect] > 0)
+
+    @classmethod
+    def _aux_ambiguous_line_disco_ex_co_or(cls, set_bus):
+        """lines disconnected at their extremity side and connected at their origin side"""
+        return (set_bus[..., cls.line_ex_pos_topo_vect] == -1) & (set_bus[..., cls.line_or_pos_topo_vect] > 0)
+
+    @classmethod
+    def _aux_ambiguous_line_disco_set_bus(cls, set_status, set_bus):
+        """lines disconnected (with set_status) but connected to a bus (with set_bus)"""
+        return (set_status == -1) & ((set_bus[..., cls.line_or_pos_topo_vect] > 0) |
+                                     (set_bus[..., cls.line_ex_pos_topo_vect] > 0))
+
+    @classmethod
+    def _aux_ambiguous_line_reco_set_bus(cls, set_status, set_bus):
+        """lines reconnected (with set_status) but disconnected (with set_bus)"""
+        return (set_status == 1) & ((set_bus[..., cls.line_or_pos_topo_vect] == -1) |
+                                    (set_bus[..., cls.line_ex_pos_topo_vect] == -1))
+
+    @classmethod
+    def _aux_ambiguous_line_status_change_bus(cls, set_status, change_bus, status, side_pos_topo_vect):
+        """lines whose status is set to `status` and whose bus is changed on the given side"""
+        return (set_status == status) & change_bus[..., side_pos_topo_vect]
+
+    @classmethod
+    def _aux_ambiguous_shunt_bus(cls, shunt_bus):
+        """shunts set to a bus > 2 or < -1"""
+        return (shunt_bus > 2) | (shunt_bus < -1)
+
     def _check_for_ambiguity(self):
         """
         This method checks if an action is ambiguous or not. If the instance is ambiguous, an
@@ -2373,7 +2469,7 @@ class BaseAction(GridObjects):
         if (
             self._modif_change_status
             and self._modif_set_status
-            and (self._set_line_status[self._switch_line_status] != 0).any()
+            and self._aux_ambiguous_line_status_set_change(self._set_line_status, self._switch_line_status).any()
         ):
             raise InvalidLineStatus(
                 "You asked to change the status (connected / disconnected) of a powerline by"
@@ -2445,17 +2541,17 @@ class BaseAction(GridObjects):
                     "environment. Please set up the proper costs for generator"
                 )
 
-            if (self._redispatch[~self.gen_redispatchable] != 0.0).any():
+            if self._aux_ambiguous_redisp_non_dispatchable(self._redispatch).any():
                 raise InvalidRedispatching(
                     "Trying to apply a redispatching action on a non redispatchable generator"
                 )
 
             if self._single_act:
-                if (self._redispatch > self.gen_max_ramp_up).any():
+                if self._aux_ambiguous_redisp_ramp_up(self._redispatch).any():
                     raise InvalidRedispatching(
                         "Some redispatching amount are above the maximum ramp up"
                     )
-                if (-self._redispatch > self.gen_max_ramp_down).any():
+                if self._aux_ambiguous_redisp_ramp_down(self._redispatch).any():
                     raise InvalidRedispatching(
                         "Some redispatching amount are bellow the maximum ramp down"
                     )
@@ -2485,20 +2581,20 @@ class BaseAction(GridObjects):
         if (
             self._modif_set_bus
             and self._modif_change_bus
-            and (self._set_topo_vect[self._change_bus_vect] != 0).any()
+            and self._aux_ambiguous_bus_set_change(self._set_topo_vect, self._change_bus_vect).any()
         ):
             raise InvalidBusStatus(
                 "You asked to change the bus of an object with"
                 ' using the keyword "change_bus" and set this same object state in "set_bus"'
                 ". This ambiguous behaviour is not supported"
             )
-        if self._modif_set_bus and (self._set_topo_vect < -1).any():
+        if self._modif_set_bus and self._aux_ambiguous_bus_below_min(self._set_topo_vect).any():
             raise InvalidBusStatus(
                 "Invalid set_bus. Buses should be either -1 (disconnect), 0 (change nothing),"
                 "1 (assign this object to bus one) or 2 (assign this object to bus"
                 "2). A negative number has been found."
             )
-        if self._modif_set_bus and (self._set_topo_vect > 2).any():
+        if self._modif_set_bus and self._aux_ambiguous_bus_above_max(self._set_topo_vect).any():
             raise InvalidBusStatus(
                 "Invalid set_bus. Buses should be either -1 (disconnect), 0 (change nothing),"
                 "1 (assign this object to bus one) or 2 (assign this object to bus"
@@ -2524,43 +2620,30 @@ class BaseAction(GridObjects):
                         )
 
         if self._modif_set_bus:
-            disco_or = self._set_topo_vect[self.line_or_pos_topo_vect] == -1
-            if (self._set_topo_vect[self.line_ex_pos_topo_vect][disco_or] > 0).any():
+            if self._aux_ambiguous_line_disco_or_co_ex(self._set_topo_vect).any():
                 raise InvalidLineStatus(
                     "A powerline is connected (set to a bus at extremity end) and "
                     "disconnected (set to bus -1 at origin end)"
                 )
-            disco_ex = self._set_topo_vect[self.line_ex_pos_topo_vect] == -1
-            if (self._set_topo_vect[self.line_or_pos_topo_vect][disco_ex] > 0).any():
+            if self._aux_ambiguous_line_disco_ex_co_or(self._set_topo_vect).any():
                 raise InvalidLineStatus(
                     "A powerline is connected (set to a bus at origin end) and "
                     "disconnected (set to bus -1 at extremity end)"
                 )
 
         # if i disconnected of a line, but i modify also the bus where it's connected
-        if self._modif_set_bus or self._modif_change_bus:
-            idx = self._set_line_status == -1
-            id_disc = np.where(idx)[0]
-            
-            idx2 = self._set_line_status == 1
-            id_reco = np.where(idx2)[0]
-
         if self._modif_set_bus:
             if "set_bus" not in self.authorized_keys:
                 raise AmbiguousAction(
                     'Action of type "set_bus" are not supported by this action type'
                 )
-            if (
-                self._set_topo_vect[self.line_or_pos_topo_vect[id_disc]] > 0
-            ).any() or (self._set_topo_vect[self.line_ex_pos_topo_vect[id_disc]] > 0).any():
+            if self._aux_ambiguous_line_disco_set_bus(self._set_line_status, self._set_topo_vect).any():
                 raise InvalidLineStatus(
                     "You ask to disconnect a powerline but also to connect it "
                     "to a certain bus."
                 )
                 
-            if (
-                self._set_topo_vect[self.line_or_pos_topo_vect[id_reco]] == -1
-            ).any() or (self._set_topo_vect[self.line_ex_pos_topo_vect[id_reco]] == -1).any():
+            if self._aux_ambiguous_line_reco_set_bus(self._set_line_status, self._set_topo_vect).any():
                 raise InvalidLineStatus(
                     "You ask to reconnect a powerline but also to disconnect it "
                     "from a certain bus."
@@ -2571,26 +2654,23 @@ class BaseAction(GridObjects):
                     'Action of type "change_bus" are not supported by this action type'
                 )
             if (
-                self._change_bus_vect[self.line_or_pos_topo_vect[id_disc]] > 0
-            ).any() or (self._change_bus_vect[self.line_ex_pos_topo_vect[id_disc]] > 0).any():
+                self._aux_ambiguous_line_status_change_bus(self._set_line_status, self._change_bus_vect,
+                                                           -1, self.line_or_pos_topo_vect).any()
+                or self._aux_ambiguous_line_status_change_bus(self._set_line_status, self._change_bus_vect,
+                                                              -1, self.line_ex_pos_topo_vect).any()
+            ):
                 raise InvalidLineStatus(
                     "You ask to disconnect a powerline but also to change its bus."
                 )
 
-            if (
-                self._change_bus_vect[
-                    self.line_or_pos_topo_vect[self._set_line_status == 1]
-                ]
-            ).any():
+            if self._aux_ambiguous_line_status_change_bus(self._set_line_status, self._change_bus_vect,
+                                                          1, self.line_or_pos_topo_vect).any():
                 raise InvalidLineStatus(
                     "You ask to connect an origin powerline but also to *change* the bus  to which "
                     "it  is connected. This is ambiguous. You must *set* this bus instead."
                 )
-            if (
-                self._change_bus_vect[
-                    self.line_ex_pos_topo_vect[self._set_line_status == 1]
-                ]
-            ).any():
+            if self._aux_ambiguous_line_status_change_bus(self._set_line_status, self._change_bus_vect,
+                                                          1, self.line_ex_pos_topo_vect).any():
                 raise InvalidLineStatus(
                     "You ask to connect an extremity powerline but also to *change* the bus  to "
                     "which it is connected. This is ambiguous. You must *set* this bus instead."
@@ -2609,12 +2689,12 @@ class BaseAction(GridObjects):
                 raise IncorrectNumberOfElements(
                     "Incorrect number of shunt (for shunt_bus) in your action."
                 )
-            if self.n_shunt > 0:
+            if self.n_shunt > 0 and self._aux_ambiguous_shunt_bus(self.shunt_bus).any():
                 if np.max(self.shunt_bus) > 2:
                     raise AmbiguousAction(
                         "Some shunt is connected to a bus greater than 2"
                     )
-                if np.min(self.shunt_bus) < -1:
+                else:
                     raise AmbiguousAction(
                         "Some shunt is connected to a bus smaller than -1"
                     )
@@ -2676,14 +2756,16 @@ class BaseAction(GridObjects):
                     "self._storage_power.shape[0] != self.n_storage: wrong number of storage "
                     "units affected"
                 )
-            if (self._storage_power < -self.storage_max_p_prod).any():
-                where_bug = np.where(self._storage_power < -self.storage_max_p_prod)[0]
+            mask_bug = self._aux_ambiguous_storage_prod(self._storage_power)
+            if mask_bug.any():
+                where_bug = np.where(mask_bug)[0]
                 raise InvalidStorage(
                     f"you asked a storage unit to absorb more than what it can: "
                     f"self._storage_power[{where_bug}] < -self.storage_max_p_prod[{where_bug}]."
                 )
-            if (self._storage_power > self.storage_max_p_absorb).any():
-                where_bug = np.where(self._storage_power > self.storage_max_p_absorb)[0]
+            mask_bug = self._aux_ambiguous_storage_absorb(self._storage_power)
+            if mask_bug.any():
+                where_bug = np.where(mask_bug)[0]
                 raise InvalidStorage(
                     f"you asked a storage unit to produce more than what it can: "
                     f"self._storage_power[{where_bug}] > self.storage_max_p_absorb[{where_bug}]."
@@ -2716,21 +2798,23 @@ class BaseAction(GridObjects):
                     "units affected"
                 )
 
-            if ((self._curtail < 0.0) & (self._curtail != -1.0)).any():
-                where_bug = np.where((self._curtail < 0.0) & (self._curtail != -1.0))[0]
+            mask_bug = self._aux_ambiguous_curtail_negative(self._curtail)
+            if mask_bug.any():
+                where_bug = np.where(mask_bug)[0]
                 raise InvalidCurtailment(
                     f"you asked to perform a negative curtailment: "
                     f"self._curtail[{where_bug}] < 0. "
                     f"Curtailment should be a real number between 0.0 and 1.0"
                 )
-            if (self._curtail > 1.0).any():
-                where_bug = np.where(self._curtail > 1.0)[0]
+            mask_bug = self._aux_ambiguous_curtail_above_one(self._curtail)
+            if mask_bug.any():
+                where_bug = np.where(mask_bug)[0]
                 raise InvalidCurtailment(
                     f"you asked a storage unit to produce more than what it can: "
                     f"self._curtail[{where_bug}] > 1. "
                     f"Curtailment should be a real number between 0.0 and 1.0"
                 )
-            if (self._curtail[~self.gen_renewable] != -1.0).any():
+            if self._aux_ambiguous_curtail_non_renewable(self._curtail).any():
                 raise InvalidCurtailment(
                     "Trying to apply a curtailment on a non renewable generator"
                 )
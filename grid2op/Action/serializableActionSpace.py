@@ -15,6 +15,7 @@ from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Exceptions import AmbiguousAction, Grid2OpException
 from grid2op.Space import SerializableSpace
 from grid2op.Action.baseAction import BaseAction
+from grid2op.Action.actionBatch import ActionBatch
 
 
 class SerializableActionSpace(SerializableSpace):
@@ -1589,3 +1590,77 @@ class SerializableActionSpace(SerializableSpace):
         self._aux_get_back_to_ref_state_curtail(res, obs)
 
         return res
+
+    def from_vect_batch(self, matrix, check_legit=True, as_batch=False):
+        """
+        Convert a batch of actions, represented as a matrix (one action per row) into grid2op actions.
+
+        It is equivalent to calling :func:`SerializableActionSpace.from_vect` on each row of the matrix, but
+        the conversion and the checks are performed for all the actions at once.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        matrix: ``numpy.ndarray``
+            The actions represented as vectors, of shape `(N, action_space.size())`
+
+        check_legit: ``bool``
+            Whether to check that the actions are not ambiguous (see :func:`grid2op.Action.BaseAction.check_space_legit`)
+
+        as_batch: ``bool``
+            If ``True`` a :class:`grid2op.Action.ActionBatch` is returned, otherwise
+            (default) a list of `N` grid2op actions.
+
+        Returns
+        -------
+        res: ``list`` or :class:`grid2op.Action.ActionBatch`
+            The corresponding actions.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            import numpy as np
+            env = grid2op.make("l2rpn_case14_sandbox")
+
+            actions_vect = np.zeros((10, env.action_space.size()))
+            list_act = env.action_space.from_vect_batch(actions_vect)
+            act_batch = env.action_space.from_vect_batch(actions_vect, as_batch=True)
+
+        """
+        res = ActionBatch(self._template_obj, matrix)
+        if check_legit:
+            res.check_space_legit()
+        if as_batch:
+            return res
+        return res.to_actions()
+
+    def to_vect_batch(self, actions):
+        """
+        Convert a list of actions into a matrix of shape `(N, action_space.size())`, the row `i` being
+        `actions[i].to_vect()`.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        actions: ``list`` or :class:`grid2op.Action.ActionBatch`
+            The actions to convert.
+
+        Returns
+        -------
+        res: ``numpy.ndarray``
+            The matrix representing the actions.
+
+        """
+        if isinstance(actions, ActionBatch):
+            return actions.to_vect()
+        res = np.empty((len(actions), self.size()), dtype=dt_float)
+        for row_id, act in enumerate(actions):
+            if not isinstance(act, self.actionClass):
+                raise AmbiguousAction(self.ERR_MSG_WRONG_TYPE.format(type(act), self.actionClass))
+            res[row_id] = act.to_vect()
+        return res
@@ -16,7 +16,8 @@ class GreedyAgent(BaseAgent):
     """
     This is a class of "Greedy BaseAgent". Greedy agents are all executing the same kind of algorithm to take action:
 
-      1. They :func:`grid2op.Observation.Observation.simulate` all actions in a given set
+      1. They :func:`grid2op.Observation.Observation.simulate` all actions in a given set (this is done
+         in one call to :func:`grid2op.Observation.BaseObservation.simulate_batch`)
       2. They take the action that maximise the simulated reward among all these actions
 
     This class is an abstract class (object of this class cannot be created). To create "GreedyAgent" one must
@@ -55,17 +56,9 @@ class GreedyAgent(BaseAgent):
         """
         self.tested_action = self._get_tested_action(observation)
         if len(self.tested_action) > 1:
-            self.resulting_rewards = np.full(
-                shape=len(self.tested_action), fill_value=np.NaN, dtype=dt_float
-            )
-            for i, action in enumerate(self.tested_action):
-                (
-                    simul_obs,
-                    simul_reward,
-                    simul_has_error,
-                    simul_info,
-                ) = observation.simulate(action)
-                self.resulting_rewards[i] = simul_reward
+            # all candidates are simulated at once (see `BaseObservation.simulate_batch`)
+            _, simul_rewards, *_ = observation.simulate_batch(self.tested_action)
+            self.resulting_rewards = simul_rewards.astype(dt_float)
             reward_idx = int(
                 np.argmax(self.resulting_rewards)
             )  # rewards.index(max(rewards))
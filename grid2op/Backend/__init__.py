@@ -1,4 +1,27 @@
-__all__ = ["Backend", "PandaPowerBackend"]
+__all__ = ["Backend", "PandaPowerBackend", "DCBackend"]
+
+import sys
+import warnings
+from importlib.util import find_spec
 
 from grid2op.Backend.backend import Backend
-from grid2op.Backend.pandaPowerBackend import PandaPowerBackend
+
+if find_spec("numba") is None:
+    # checked here (and not when the PandaPowerBackend is imported) to keep the warning
+    # at import time, without importing numba
+    warnings.warn(
+        "Numba cannot be loaded. You will gain possibly massive speed if installing it by "
+        "\n\t{} -m pip install numba\n".format(sys.executable)
+    )
+
+
+def __getattr__(name):
+    # pandapower (and its dependencies) take a long time to import: it is only
+    # imported when the PandaPowerBackend is used
+    if name == "PandaPowerBackend":
+        from grid2op.Backend.pandaPowerBackend import PandaPowerBackend
+        return PandaPowerBackend
+    if name == "DCBackend":
+        from grid2op.Backend.dcBackend import DCBackend
+        return DCBackend
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
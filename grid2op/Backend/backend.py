@@ -7,6 +7,7 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import copy
+import time
 import os
 import sys
 import warnings
@@ -84,6 +85,8 @@ class Backend(GridObjects, ABC):
       at the "origin" side and just return the "a_or" vector. You want to do something smarter here.
     - :func:`Backend._disconnect_line`: has a default slow implementation using "apply_action" that might
       can most likely be optimized in your backend.
+    - :func:`Backend._disconnect_lines`: disconnects multiple powerlines at once during the cascading failures.
+      By default it calls :func:`Backend._disconnect_line` for each of them.
     - :func:`Backend.reset`  will reload the powergrid from the hard drive by default. This is rather slow and we
       recommend to overload it.
 
@@ -847,6 +850,103 @@ class Backend(GridObjects, ABC):
         bk_act += action
         self.apply_action(bk_act)
 
+    def _disconnect_lines(self, mask):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using the action space to disconnect a powerline.
+
+        .. versionadded:: 1.9.5
+
+        Disconnect, in one call, all the powerlines for which `mask` is ``True``. This is used when computing
+        the cascading failures (see :func:`Backend.next_grid_state`).
+
+        The default implementation calls :func:`Backend._disconnect_line` for each of these powerlines. It can
+        most likely be optimized in your backend.
+
+        Parameters
+        ----------
+        mask: ``numpy.ndarray``, dtype:bool
+            For each powerline, whether it should be disconnected (``True``) or not (``False``)
+
+        """
+        for id_ in np.where(mask)[0]:
+            self._disconnect_line(id_)
+
+    def _cascading_failure_snapshot(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Lightweight representation of the state of the grid, stored at each stage of a cascading failure
+        when :attr:`Backend.detailed_infos_for_cascading_failures` is ``True``.
+
+        Returns
+        -------
+        res: ``dict``
+            The status of the powerlines ("line_status"), the topology ("topo_vect") and the flows
+            at both sides of the powerlines ("p_or", "q_or", "v_or", "a_or", "p_ex", "q_ex", "v_ex", "a_ex")
+        """
+        res = {"line_status": copy.deepcopy(self.get_line_status()),
+               "topo_vect": copy.deepcopy(self.get_topo_vect())}
+        for nm_side, infos in zip(["or", "ex"], [self.lines_or_info(), self.lines_ex_info()]):
+            for nm_, arr_ in zip(["p", "q", "v", "a"], infos):
+                res[f"{nm_}_{nm_side}"] = copy.deepcopy(arr_)
+        return res
+
+    def _get_state(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.snapshot`
+
+        .. versionadded:: 1.9.5
+
+        Returns the state of the backend (topology, injections and results of the last powerflow)
+        such that a call to `backend._set_state(state)` puts it back in the exact same state.
+
+        The default implementation relies on :func:`Backend.copy` which can be slow. It is advised to
+        overload this method (and :func:`Backend._set_state`) in your backend, for example to store only
+        a few vectors, see :func:`grid2op.Backend.PandaPowerBackend._get_state`.
+
+        Returns
+        -------
+        state:
+            The state of the backend, to be used by :func:`Backend._set_state`
+
+        """
+        return self.copy()
+
+    def _set_state(self, state):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.restore`
+
+        .. versionadded:: 1.9.5
+
+        Puts back the backend in the state returned by :func:`Backend._get_state`
+
+        Parameters
+        ----------
+        state:
+            The state of the backend, as returned by :func:`Backend._get_state`
+
+        """
+        # copy it again, the same state can be restored multiple times
+        is_loaded = self._is_loaded
+        self.__dict__.update(state.copy().__dict__)
+        self._is_loaded = is_loaded
+
     def _runpf_with_diverging_exception(self, is_dc):
         """
         INTERNAL
@@ -913,8 +1013,8 @@ class Backend(GridObjects, ABC):
 
         infos: ``list``
             If :attr:`Backend.detailed_infos_for_cascading_failures` is ``True`` then it returns the different
-            state computed by the powerflow (can drastically slow down this function, as it requires
-            deep copy of backend object). Otherwise the list is always empty.
+            state computed by the powerflow (see :func:`Backend._cascading_failure_snapshot`, only
+            the flows and the status of the powerlines are stored). Otherwise the list is always empty.
 
         """
         infos = []
@@ -925,17 +1025,18 @@ class Backend(GridObjects, ABC):
 
         # the environment disconnect some powerlines
         init_time_step_overflow = copy.deepcopy(env._timestep_overflow)
+        # thermal limits do not change during the cascading failure
+        thermal_limits = self.get_thermal_limit() * env._parameters.SOFT_OVERFLOW_THRESHOLD  # SOFT_OVERFLOW_THRESHOLD new in grid2op 1.9.3
+        hard_thermal_limits = env._hard_overflow_threshold * thermal_limits
+        # status is then updated with the powerlines disconnected at each stage
+        lines_status = copy.deepcopy(self.get_line_status())
         ts = 0
         while True:
             # simulate the cascading failure
             lines_flows = 1.0 * self.get_line_flow()
-            thermal_limits = self.get_thermal_limit() * env._parameters.SOFT_OVERFLOW_THRESHOLD  # SOFT_OVERFLOW_THRESHOLD new in grid2op 1.9.3
-            lines_status = self.get_line_status()
 
             # a) disconnect lines on hard overflow (that are still connected)
-            to_disc = (
-                lines_flows > env._hard_overflow_threshold * thermal_limits
-            ) & lines_status
+            to_disc = (lines_flows > hard_thermal_limits) & lines_status
 
             # b) deals with soft overflow (disconnect them if lines still connected)
             init_time_step_overflow[(lines_flows >= thermal_limits) & lines_status] += 1
@@ -948,22 +1049,187 @@ class Backend(GridObjects, ABC):
             if to_disc[lines_status].sum() == 0:
                 # no powerlines have been disconnected at this time step, i stop the computation there
                 break
+            beg_cf = time.perf_counter()
             disconnected_during_cf[to_disc] = ts
             # perform the disconnection action
-            for i, el in enumerate(to_disc):
-                if el:
-                    self._disconnect_line(i)
+            self._disconnect_lines(to_disc)
+            lines_status &= ~to_disc
 
             # start a powerflow on this new state
             conv_ = self._runpf_with_diverging_exception(is_dc)
+            env._tracer.record(env._TRACE_CATEGORY, "cascading_failure", beg_cf, time.perf_counter())
             if self.detailed_infos_for_cascading_failures:
-                infos.append(self.copy())
+                infos.append(self._cascading_failure_snapshot())
 
             if conv_ is not None:
                 break
             ts += 1
         return disconnected_during_cf, infos, conv_
 
+    def get_lodf(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Optional method that returns the "Line Outage Distribution Factors" (LODF) computed
+        with the DC approximation in the current state of the grid (*ie* the state of the last powerflow computed).
+
+        It is used by :func:`Backend.run_contingencies` to screen the contingencies that need to be computed
+        with a full AC powerflow. If it is not overloaded (it returns ``None``) then every contingencies
+        will be computed with a full AC powerflow.
+
+        Returns
+        -------
+        lodf: ``numpy.ndarray`` or ``None``
+            Matrix of shape (n_line, n_line). `lodf[l_id, k_id]` is the variation of the active flow on powerline
+            `l_id` when powerline `k_id` is disconnected (as a fraction of the flow on powerline `k_id`
+            before its disconnection). It is ``None`` if the backend does not support this feature.
+
+        """
+        return None
+
+    def run_contingencies(self,
+                          line_ids=None,
+                          dc_screen=True,
+                          screen_threshold=0.9,
+                          thermal_limit=None):
+        """
+        .. versionadded:: 1.9.5
+
+        Performs a "N-1" security analysis: for each powerline in `line_ids` it computes the flows on all the
+        powerlines of the grid if this powerline were disconnected, all the rest being equal.
+
+        This function should be called after a successful powerflow. It does not modify the state of the backend.
+
+        If `dc_screen` is ``True`` (default) and the backend supports it (see :func:`Backend.get_lodf`) then
+        the flows after each contingency are first estimated with the LODF computed in the current
+        state. Only the contingencies for which at least one powerline would have a relative flow above
+        `screen_threshold` (or for which the estimation is not possible, for example if the grid is split in two)
+        are then computed with a full AC powerflow. All the AC powerflows are computed on the same copy
+        of the backend.
+
+        Parameters
+        ----------
+        line_ids: ``list`` or ``numpy.ndarray``
+            Id of the powerlines to disconnect (one contingency per powerline). By default (``None``) all
+            powerlines are considered.
+
+        dc_screen: ``bool``
+            Whether to estimate the contingencies with the DC approximation before computing the "critical" ones
+            with an AC powerflow.
+
+        screen_threshold: ``float``
+            The relative flow (estimated with the DC approximation) above which a contingency is considered critical
+            and is computed with an AC powerflow.
+
+        thermal_limit: ``numpy.ndarray``
+            The thermal limit used to compute the relative flows. By default (``None``) it is
+            the result of :func:`Backend.get_thermal_limit`
+
+        Returns
+        -------
+        rho: ``numpy.ndarray``
+            Matrix of shape (n_contingency, n_line) giving the relative flows (flow / thermal limit) on each
+            powerline after each contingency. It is ``nan`` if the powerflow diverged.
+
+        flows: ``numpy.ndarray``
+            Matrix of shape (n_contingency, n_line) giving the flows (in A, on the same side as
+            :func:`Backend.get_line_flow`) on each powerline after each contingency. It is
+            ``nan`` if the powerflow diverged.
+
+        computed_ac: ``numpy.ndarray``
+            For each contingency, whether it has been computed with an AC powerflow (``True``) or
+            only estimated with the DC approximation (``False``)
+
+        converged: ``numpy.ndarray``
+            For each contingency, whether the powerflow converged
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            obs = env.reset()
+
+            rho, flows, computed_ac, converged = env.backend.run_contingencies()
+            print(f"Maximum relative flow after each contingency: {rho.max(axis=1)}")
+
+        """
+        cls = type(self)
+        if line_ids is None:
+            line_ids = np.arange(cls.n_line)
+        line_ids = np.array(line_ids, dtype=dt_int).reshape(-1)
+        if line_ids.size and ((line_ids < 0).any() or (line_ids >= cls.n_line).any()):
+            raise BackendError(
+                f"Contingencies should be given as powerline ids between 0 and {cls.n_line - 1}"
+            )
+        if thermal_limit is None:
+            thermal_limit = self.get_thermal_limit()
+        thermal_limit = np.array(thermal_limit, dtype=dt_float)
+
+        nb_cont = line_ids.shape[0]
+        flows = np.full((nb_cont, cls.n_line), fill_value=np.NaN, dtype=dt_float)
+        computed_ac = np.full(nb_cont, fill_value=True, dtype=dt_bool)
+        converged = np.full(nb_cont, fill_value=False, dtype=dt_bool)
+
+        base_flows = 1.0 * self.get_line_flow()
+        line_status = self.get_line_status()
+        # disconnecting an already disconnected powerline does not change anything
+        already_disc = ~line_status[line_ids]
+        flows[already_disc] = base_flows
+        computed_ac[already_disc] = False
+        converged[already_disc] = True
+
+        lodf = self.get_lodf() if dc_screen else None
+        if lodf is not None:
+            est_flows = self._aux_estimate_contingency_flows(lodf, line_ids)
+            with np.errstate(divide="ignore", invalid="ignore"):
+                est_rho = est_flows / thermal_limit
+            is_critical = ~np.isfinite(est_rho).all(axis=1)
+            is_critical |= (est_rho >= screen_threshold).any(axis=1)
+            screened = (~is_critical) & (~already_disc)
+            flows[screened] = est_flows[screened]
+            computed_ac[screened] = False
+            converged[screened] = True
+
+        to_compute = np.where(computed_ac)[0]
+        if to_compute.shape[0]:
+            backend = self.copy()
+            bk_act = cls.my_bk_act_class()
+            act = self.get_action_to_set()
+            for cont_id in to_compute:
+                # set the copy to the state of this backend and disconnect the powerline
+                bk_act.reset()
+                bk_act += act
+                backend.apply_action(bk_act)
+                backend._disconnect_line(line_ids[cont_id])
+                exc_ = backend._runpf_with_diverging_exception(is_dc=False)
+                if exc_ is None:
+                    flows[cont_id] = backend.get_line_flow()
+                    converged[cont_id] = True
+            backend.close()
+
+        with np.errstate(divide="ignore", invalid="ignore"):
+            rho = flows / thermal_limit
+        return rho, flows, computed_ac, converged
+
+    def _aux_estimate_contingency_flows(self, lodf, line_ids):
+        """estimates the flows (in A) after each contingency with the lodf, reactive power and
+        voltages are supposed to remain constant"""
+        p_or, q_or, v_or, a_or = self.lines_or_info()
+        p_after = p_or + lodf[:, line_ids].T * p_or[line_ids].reshape(-1, 1)
+        with np.errstate(divide="ignore", invalid="ignore"):
+            res = 1000. * np.sqrt(p_after**2 + q_or**2) / (3.0**0.5 * v_or)
+        res[:, v_or <= 0.] = 0.
+        res[np.arange(line_ids.shape[0]), line_ids] = 0.
+        return res.astype(dt_float)
+
     def storages_info(self):
         """
         INTERNAL
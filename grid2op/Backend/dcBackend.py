@@ -0,0 +1,584 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import copy
+import time
+import warnings
+from collections import OrderedDict
+
+import numpy as np
+import scipy.sparse
+from scipy.sparse.csgraph import connected_components
+from scipy.sparse.linalg import splu
+
+from grid2op.dtypes import dt_int, dt_float, dt_bool
+from grid2op.Exceptions import DivergingPowerFlow
+from grid2op.Backend.pandaPowerBackend import PandaPowerBackend, NUMBA_
+
+# columns of the pandapower / pypower "branch" matrix
+# see https://matpower.org/docs/ref/matpower5.0/idx_brch.html
+_BR_X = 3
+_TAP = 8
+_SHIFT = 9
+
+
+class _DCModel(object):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    .. versionadded:: 1.9.5
+
+    DC model of the powergrid for a given topology. Everything here depends only on the topology (and not
+    on the injections) and is never modified once built (except the ptdf, computed the first
+    time it is needed). It can then be shared between the copies of a :class:`DCBackend`.
+
+    Only the buses connected to the slack bus are modeled ("internal" buses).
+
+    The LU factorization cannot be pickled: it is computed again when the model is unpickled.
+    """
+    def __init__(self, lines, in_island, f_int, t_int, ref_int, branch_b, branch_shift):
+        nb_line = lines.shape[0]
+        self.lines = lines  # grid2op id of the modeled powerlines
+        self.in_island = in_island  # for each pandapower bus, whether it is modeled
+        self.bus_ids = np.flatnonzero(in_island)  # pandapower id of the modeled buses
+        self.f_int = f_int  # internal id of the origin bus of each modeled powerline
+        self.t_int = t_int  # internal id of the extremity bus of each modeled powerline
+        nb_bus = self.bus_ids.shape[0]
+        self.non_ref = np.concatenate((np.arange(ref_int), np.arange(ref_int + 1, nb_bus)))
+
+        rows = np.concatenate((np.arange(nb_line), np.arange(nb_line)))
+        cols = np.concatenate((f_int, t_int))
+        vals = np.concatenate((np.ones(nb_line), -np.ones(nb_line)))
+        self.Cft = scipy.sparse.csr_matrix((vals, (rows, cols)), shape=(nb_line, nb_bus))
+        self.Bf = (scipy.sparse.diags(branch_b) @ self.Cft).tocsr()
+        self.Pfinj = -branch_b * np.deg2rad(branch_shift)
+        self.Pbusinj = self.Cft.T @ self.Pfinj
+        self.ptdf = None
+        self._factorize()
+
+    def _factorize(self):
+        """sparse LU factorization of the susceptance matrix (without the slack bus)"""
+        self.lu = None
+        self.is_valid = True
+        if self.non_ref.shape[0]:
+            Bbus = (self.Cft.T @ self.Bf).tocsc()
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                try:
+                    self.lu = splu(Bbus[self.non_ref][:, self.non_ref].tocsc())
+                except RuntimeError:
+                    # the matrix is singular: no powerflow can be computed with this topology
+                    self.is_valid = False
+
+    def __getstate__(self):
+        res = self.__dict__.copy()
+        del res["lu"]
+        return res
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._factorize()
+
+    def solve(self, p_bus):
+        """computes the voltage angles (in rad) given the active power (per unit) injected at each modeled bus"""
+        theta = np.zeros(self.bus_ids.shape[0])
+        if self.non_ref.shape[0]:
+            theta[self.non_ref] = self.lu.solve(p_bus[self.non_ref] - self.Pbusinj[self.non_ref])
+        return theta
+
+    def get_ptdf(self):
+        """ptdf of the modeled powerlines with respect to the modeled buses (computed only once)"""
+        if self.ptdf is None:
+            ptdf = np.zeros((self.lines.shape[0], self.bus_ids.shape[0]))
+            if self.non_ref.shape[0] and self.lines.shape[0]:
+                # Bbus is symmetric: ptdf = Bf . Bbus^-1 = (Bbus^-1 . Bf^T)^T
+                ptdf[:, self.non_ref] = self.lu.solve(self.Bf[:, self.non_ref].T.toarray()).T
+            self.ptdf = ptdf
+        return self.ptdf
+
+
+class DCBackend(PandaPowerBackend):
+    """
+    .. versionadded:: 1.9.5
+
+    Backend that computes the powerflows with the DC approximation, directly with numpy and scipy.
+
+    The grid is read (and modified by the actions) exactly as in the :class:`PandaPowerBackend` but the
+    powerflows are not computed by pandapower: the DC model (susceptance matrix and its sparse LU factorization)
+    is built once per topology and kept in a cache (keyed by the topology). When a topology already
+    encountered is used again, the flows are obtained with a triangular solve and a sparse matrix vector product.
+
+    The "Power Transfer Distribution Factors" (PTDF, see :func:`DCBackend.get_ptdf`) and the "Line Outage
+    Distribution Factors" (LODF, see :func:`DCBackend.get_lodf`) are computed from the same cached model. This
+    makes :func:`grid2op.Backend.Backend.run_contingencies` (with `dc_screen=True`) much faster.
+
+    .. warning::
+        The powerflows are always computed in DC, whatever the `is_dc` argument of
+        :func:`DCBackend.runpf` (and thus the `ENV_DC` parameter). The reactive power (of the powerlines and the
+        generators) is always 0. and the voltage magnitudes are the setpoint of the generators
+        (1. pu at buses without generators).
+
+    Examples
+    ---------
+    It is mainly intended to be used as a fast (but approximated) backend for `obs.simulate`, `obs.get_simulator`
+    or the forecast environments:
+
+    .. code-block:: python
+
+        import grid2op
+        from grid2op.Backend import PandaPowerBackend, DCBackend
+
+        env_name = "l2rpn_case14_sandbox"
+        env = grid2op.make(env_name, backend=PandaPowerBackend(), observation_backend_class=DCBackend)
+        obs = env.reset()
+        sim_obs, sim_r, sim_d, sim_i = obs.simulate(env.action_space())  # computed in DC
+
+        # the simulator uses the same backend as obs.simulate
+        simulator = obs.get_simulator()
+
+    It can also be used as the backend of the environment:
+
+    .. code-block:: python
+
+        import grid2op
+        from grid2op.Backend import DCBackend
+
+        env_name = "l2rpn_case14_sandbox"
+        env = grid2op.make(env_name, backend=DCBackend())
+
+    """
+    # vectors computed after each powerflow (stored in the "states")
+    _STATE_VECTORS = PandaPowerBackend._STATE_VECTORS + ("_dc_bus_vm", "_dc_bus_va")
+
+    def __init__(
+        self,
+        detailed_infos_for_cascading_failures=False,
+        lightsim2grid=False,
+        dist_slack=False,
+        max_iter=10,
+        can_be_copied=True,
+        with_numba=NUMBA_,
+        max_cache_size=128,
+    ):
+        # the arguments of the PandaPowerBackend are accepted so that a DCBackend can be built
+        # with the arguments of the backend of the environment (eg for the `observation_backend_class`)
+        PandaPowerBackend.__init__(
+            self,
+            detailed_infos_for_cascading_failures=detailed_infos_for_cascading_failures,
+            lightsim2grid=lightsim2grid,
+            dist_slack=dist_slack,
+            max_iter=max_iter,
+            can_be_copied=can_be_copied,
+            with_numba=with_numba,
+        )
+        self._my_kwargs["max_cache_size"] = max_cache_size
+        self._max_cache_size = int(max_cache_size)
+
+        # parameters of the powerlines (never modified)
+        self._dc_branch_b = None  # susceptance (per unit)
+        self._dc_branch_shift = None  # phase shift (degree)
+        self._dc_base_mva = None
+        self._dc_nb_bus = -1
+
+        # cache of the models: topology -> _DCModel (shared between the copies of the backend)
+        self._dc_cache = OrderedDict()
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._dc_model = None  # model used for the last (successful) powerflow
+        self._dc_model_key = None  # key (in the cache) of this model
+
+        self._dc_bus_vm = None  # voltage magnitude (pu) at each pandapower bus
+        self._dc_bus_va = None  # voltage angle (degree) at each pandapower bus
+
+    def load_grid(self, path=None, filename=None):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        The grid is loaded as in the :class:`PandaPowerBackend`, the parameters of the powerlines used by the DC
+        model are then read from the internal pandapower model.
+        """
+        super().load_grid(path=path, filename=filename)
+        lookup = self._grid._pd2ppc_lookups["branch"]
+        branch_ids = [np.arange(*lookup[nm_]) for nm_ in ["line", "trafo"] if nm_ in lookup]
+        branch_ids = np.concatenate(branch_ids).astype(dt_int)
+        branch = self._grid._ppc["branch"][branch_ids]
+        x = branch[:, _BR_X].real
+        tap = branch[:, _TAP].real
+        tap[tap == 0.] = 1.
+        self._dc_branch_b = 1. / (x * tap)
+        self._dc_branch_shift = 1.0 * branch[:, _SHIFT].real
+        self._dc_base_mva = float(self._grid.sn_mva)
+        self._dc_nb_bus = self._grid.bus.shape[0]
+        self._dc_bus_vm = np.full(self._dc_nb_bus, fill_value=np.NaN, dtype=dt_float)
+        self._dc_bus_va = np.full(self._dc_nb_bus, fill_value=np.NaN, dtype=dt_float)
+        self._dc_cache.clear()
+
+    def _get_slack_gen(self):
+        if self.slack_id is not None:
+            return self.slack_id[0]
+        return self._id_bus_added
+
+    def _get_dc_model_key(self, line_status):
+        """key of the current topology in the cache: the buses of the connected powerlines and the slack bus"""
+        from_bus = np.concatenate((self._grid.line["from_bus"].values, self._grid.trafo["hv_bus"].values))
+        to_bus = np.concatenate((self._grid.line["to_bus"].values, self._grid.trafo["lv_bus"].values))
+        ref_bus = self._grid.gen["bus"].values[self._get_slack_gen()]
+        return np.concatenate((np.where(line_status, from_bus, -1),
+                               np.where(line_status, to_bus, -1),
+                               (ref_bus, ))).astype(np.int64).tobytes()
+
+    def _get_dc_model(self, key):
+        """retrieve the DC model of the topology `key` from the cache (or build it)"""
+        model = self._dc_cache.get(key)
+        if model is not None:
+            self._dc_cache.move_to_end(key)
+            self.cache_hits += 1
+            return model
+
+        self.cache_misses += 1
+        model = self._build_dc_model(key)
+        self._dc_cache[key] = model
+        while len(self._dc_cache) > self._max_cache_size:
+            self._dc_cache.popitem(last=False)
+        return model
+
+    def _build_dc_model(self, key):
+        """build the DC model of the topology `key` (see `_get_dc_model_key`)"""
+        key = np.frombuffer(key, dtype=np.int64)
+        from_bus = key[:self.n_line]
+        to_bus = key[self.n_line:(2 * self.n_line)]
+        ref_bus = key[-1]
+        lines = np.flatnonzero(from_bus != -1)
+        adj = scipy.sparse.csr_matrix((np.ones(lines.shape[0]), (from_bus[lines], to_bus[lines])),
+                                      shape=(self._dc_nb_bus, self._dc_nb_bus))
+        _, labels = connected_components(adj, directed=False)
+        in_island = labels == labels[ref_bus]
+        lines = lines[in_island[from_bus[lines]]]
+        bus_int = np.full(self._dc_nb_bus, fill_value=-1, dtype=dt_int)
+        bus_int[in_island] = np.arange(in_island.sum())
+        model = _DCModel(lines,
+                         in_island,
+                         bus_int[from_bus[lines]],
+                         bus_int[to_bus[lines]],
+                         bus_int[ref_bus],
+                         self._dc_branch_b[lines],
+                         self._dc_branch_shift[lines])
+        return model
+
+    def _get_last_dc_model(self):
+        """the model of the last (successful) powerflow, built again if it has been dropped (see `__getstate__`)"""
+        if self._dc_model is None and self._dc_model_key is not None:
+            self._dc_model = self._get_dc_model(self._dc_model_key)
+        return self._dc_model
+
+    def clear_cache(self):
+        """
+        .. versionadded:: 1.9.5
+
+        Removes all the DC models stored in the cache (it is shared with all the copies of this backend)
+        and reset the counters :attr:`DCBackend.cache_hits` and :attr:`DCBackend.cache_misses`.
+        """
+        self._dc_cache.clear()
+        self.cache_hits = 0
+        self.cache_misses = 0
+
+    def runpf(self, is_dc=False):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Computes a DC powerflow, whatever the value of `is_dc`.
+
+        The DC model of the current topology is retrieved from the cache (or built and added to it), only the
+        active power injected at each bus is computed at each call.
+        """
+        beg_ = time.perf_counter()
+        exc_ = self._aux_runpf_dc()
+        self.comp_time += time.perf_counter() - beg_
+        if exc_ is not None:
+            # if the powerflow has not converged, results are Nan
+            self._reset_all_nan()
+            self._dc_bus_vm[:] = np.NaN
+            self._dc_bus_va[:] = np.NaN
+            self._dc_model = None
+            self._dc_model_key = None
+            return False, exc_
+        return True, None
+
+    def _aux_runpf_dc(self):
+        grid = self._grid
+        if (~grid.load["in_service"].values).any():
+            return DivergingPowerFlow("Disconnected load: for now grid2op cannot handle properly"
+                                      " disconnected load. If you want to disconnect one, say it"
+                                      " consumes 0. instead. Please check loads: "
+                                      f"{np.where(~grid.load['in_service'].values)[0]}")
+        if (~grid.gen["in_service"].values).any():
+            return DivergingPowerFlow("Disconnected gen: for now grid2op cannot handle properly"
+                                      " disconnected generators. If you want to disconnect one, say it"
+                                      " produces 0. instead. Please check generators: "
+                                      f"{np.where(~grid.gen['in_service'].values)[0]}")
+        line_status = self._get_line_status()
+        self.line_status[:] = line_status
+        key = self._get_dc_model_key(line_status)
+        model = self._get_dc_model(key)
+        if not model.is_valid:
+            return DivergingPowerFlow("The DC model of the grid cannot be solved (singular matrix).")
+
+        in_island = model.in_island
+        load_bus = grid.load["bus"].values
+        gen_bus = grid.gen["bus"].values
+        if (~in_island[load_bus]).any():
+            return DivergingPowerFlow("Isolated load")
+        if (~in_island[gen_bus]).any():
+            return DivergingPowerFlow("Isolated gen")
+
+        storage_bus = grid.storage["bus"].values
+        storage_p = grid.storage["p_mw"].values * grid.storage["scaling"].values
+        storage_in = grid.storage["in_service"].values.astype(dt_bool)
+        storage_iso = storage_in.copy()
+        storage_iso[storage_in] = ~in_island[storage_bus[storage_in]]
+        if (np.abs(storage_p[storage_iso]) > self.tol).any():
+            return DivergingPowerFlow("Isolated storage set to absorb / produce something")
+        grid.storage["in_service"].values[storage_iso] = False
+        storage_in &= ~storage_iso
+
+        shunt_bus = grid.shunt["bus"].values
+        shunt_in = grid.shunt["in_service"].values.astype(dt_bool)
+        shunt_in[shunt_in] = in_island[shunt_bus[shunt_in]]
+
+        # active power injected at each bus (in MW)
+        nb_bus = self._dc_nb_bus
+        load_p = grid.load["p_mw"].values * grid.load["scaling"].values
+        gen_p = grid.gen["p_mw"].values * grid.gen["scaling"].values
+        shunt_p = grid.shunt["p_mw"].values * grid.shunt["step"].values
+        p_bus = np.bincount(gen_bus, weights=gen_p, minlength=nb_bus)
+        p_bus -= np.bincount(load_bus, weights=load_p, minlength=nb_bus)
+        p_bus -= np.bincount(storage_bus[storage_in], weights=storage_p[storage_in], minlength=nb_bus)
+        p_bus -= np.bincount(shunt_bus[shunt_in], weights=shunt_p[shunt_in], minlength=nb_bus)
+        p_bus = p_bus[model.bus_ids]
+
+        theta = model.solve(p_bus / self._dc_base_mva)
+        if not np.all(np.isfinite(theta)):
+            return DivergingPowerFlow("Divergence due to Nan values in the voltage angles.")
+
+        # the slack generator compensates the imbalance (there are no losses in DC)
+        gen_p = 1.0 * gen_p
+        gen_p[self._get_slack_gen()] -= p_bus.sum()
+
+        # voltages (pu and degree) at each bus
+        bus_vm = np.ones(nb_bus)
+        bus_vm[gen_bus] = grid.gen["vm_pu"].values
+        ext_grid_in = grid.ext_grid["in_service"].values.astype(dt_bool)
+        bus_vm[grid.ext_grid["bus"].values[ext_grid_in]] = grid.ext_grid["vm_pu"].values[ext_grid_in]
+        bus_vm[~in_island] = np.NaN
+        bus_va = np.full(nb_bus, fill_value=np.NaN)
+        bus_va[model.bus_ids] = np.rad2deg(theta)
+        self._dc_bus_vm[:] = bus_vm
+        self._dc_bus_va[:] = bus_va
+
+        self.prod_p[:] = gen_p
+        self.prod_q[:] = 0.
+        self.prod_v[:] = bus_vm[gen_bus] * self.prod_pu_to_kv
+        self.gen_theta[:] = bus_va[gen_bus]
+
+        self.load_p[:] = load_p
+        self.load_q[:] = grid.load["q_mvar"].values * grid.load["scaling"].values
+        self.load_v[:] = bus_vm[load_bus] * self.load_pu_to_kv
+        self.load_theta[:] = bus_va[load_bus]
+
+        # flows on the powerlines
+        p_or = np.zeros(self.n_line)
+        p_or[model.lines] = (model.Bf @ theta + model.Pfinj) * self._dc_base_mva
+        self.p_or[:] = p_or
+        self.p_ex[:] = -p_or
+        self.q_or[:] = 0.
+        self.q_ex[:] = 0.
+        from_bus = np.concatenate((grid.line["from_bus"].values, grid.trafo["hv_bus"].values))
+        to_bus = np.concatenate((grid.line["to_bus"].values, grid.trafo["lv_bus"].values))
+        for (bus_, v_, theta_, a_, pu_to_kv) in ((from_bus, self.v_or, self.theta_or, self.a_or, self.lines_or_pu_to_kv),
+                                                 (to_bus, self.v_ex, self.theta_ex, self.a_ex, self.lines_ex_pu_to_kv)):
+            v_[:] = 0.
+            a_[:] = 0.
+            lines = model.lines
+            v_[lines] = bus_vm[bus_[lines]] * pu_to_kv[lines]
+            a_[lines] = 1000. * np.abs(p_or[lines]) / (3.0**0.5 * v_[lines])
+            # as in pandapower, the angle of the bus is given even for disconnected powerlines
+            theta_[:] = bus_va[bus_]
+            theta_[~np.isfinite(theta_)] = 0.
+
+        # storage units
+        self.storage_p[:] = 0.
+        self.storage_q[:] = 0.
+        self.storage_v[:] = 0.
+        self.storage_theta[:] = 0.
+        if self.n_storage:
+            self.storage_p[storage_in] = storage_p[storage_in]
+            self.storage_v[storage_in] = bus_vm[storage_bus[storage_in]] * self.storage_pu_to_kv[storage_in]
+            self.storage_theta[storage_in] = bus_va[storage_bus[storage_in]]
+
+        self._dc_model = model
+        self._dc_model_key = key
+        self._topo_vect[:] = self._get_topo_vect()
+        return None
+
+    def shunt_info(self):
+        grid = self._grid
+        shunt_bus_pp = grid.shunt["bus"].values
+        shunt_in = grid.shunt["in_service"].values.astype(dt_bool)
+        shunt_p = (grid.shunt["p_mw"].values * grid.shunt["step"].values).astype(dt_float)
+        shunt_q = (grid.shunt["q_mvar"].values * grid.shunt["step"].values).astype(dt_float)
+        shunt_v = np.zeros(shunt_bus_pp.shape[0], dtype=dt_float)
+        shunt_v[shunt_in] = (self._dc_bus_vm[shunt_bus_pp[shunt_in]] *
+                             grid.bus["vn_kv"].values[shunt_bus_pp[shunt_in]])
+        shunt_bus = type(self).global_bus_to_local(shunt_bus_pp, self.shunt_to_subid)
+        # shunt disconnected or alone on a bus
+        off = (~shunt_in) | (~np.isfinite(shunt_v))
+        shunt_p[off] = 0.
+        shunt_q[off] = 0.
+        shunt_v[off] = 0.
+        shunt_bus[off] = -1
+        return shunt_p, shunt_q, shunt_v, shunt_bus
+
+    def get_ptdf(self):
+        """
+        .. versionadded:: 1.9.5
+
+        Returns the "Power Transfer Distribution Factors" (PTDF) of the topology of the last powerflow computed.
+        They are computed only once per topology (and cached with the DC model).
+
+        Returns
+        -------
+        ptdf: ``numpy.ndarray`` or ``None``
+            Matrix of shape (n_line, 2 * n_sub). `ptdf[l_id, bus_id]` is the variation of the active flow
+            on powerline `l_id` when 1MW is injected at bus `bus_id` (and withdrawn at the slack bus). The bus
+            `bus_id` is the bus 1 of substation `bus_id` if `bus_id < n_sub` or the bus 2 of substation
+            `bus_id - n_sub` otherwise. It is ``None`` if the last powerflow diverged.
+
+        """
+        model = self._get_last_dc_model()
+        if model is None:
+            return None
+        res = np.zeros((self.n_line, self._dc_nb_bus), dtype=dt_float)
+        res[np.ix_(model.lines, model.bus_ids)] = model.get_ptdf()
+        return res
+
+    def get_lodf(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Computes the LODF from the cached PTDF of the topology of the last powerflow computed, see
+        :func:`grid2op.Backend.Backend.get_lodf` for more information.
+
+        It returns ``None`` if the last powerflow diverged. The columns of the powerlines whose disconnection
+        would split the grid are ``nan``.
+        """
+        model = self._get_last_dc_model()
+        if model is None:
+            return None
+        ptdf = model.get_ptdf()
+        H = ptdf[:, model.f_int] - ptdf[:, model.t_int]
+        den = 1.0 - np.diag(H)
+        # disconnecting a "bridge" would split the grid: the lodf is not defined (numerically
+        # `den` is not exactly 0. in this case, so it is detected with a tolerance)
+        is_bridge = np.abs(den) <= 1e-8
+        den[is_bridge] = 1.0
+        lodf = H / den
+        lodf[np.arange(lodf.shape[0]), np.arange(lodf.shape[0])] = -1.0
+        lodf[:, is_bridge] = np.NaN
+        res = np.zeros((self.n_line, self.n_line), dtype=dt_float)
+        res[np.ix_(model.lines, model.lines)] = lodf
+        return res
+
+    def copy(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Performs a deep copy of the backend, see :func:`PandaPowerBackend.copy`. The cache of the DC models
+        is shared with the copy.
+        """
+        res = super().copy()
+        # never modified, can be shared
+        res._dc_branch_b = self._dc_branch_b
+        res._dc_branch_shift = self._dc_branch_shift
+        res._dc_base_mva = self._dc_base_mva
+        res._dc_nb_bus = self._dc_nb_bus
+        res._dc_cache = self._dc_cache
+        res._dc_model = self._dc_model
+        res._dc_model_key = self._dc_model_key
+
+        res._dc_bus_vm = copy.deepcopy(self._dc_bus_vm)
+        res._dc_bus_va = copy.deepcopy(self._dc_bus_va)
+        return res
+
+    def close(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        See :func:`PandaPowerBackend.close`. The cache of the DC models is not cleared as it can be shared
+        with other copies of this backend.
+        """
+        super().close()
+        self._dc_model = None
+        self._dc_model_key = None
+
+    def __getstate__(self):
+        # the LU factorizations cannot be pickled: the cache is not pickled and the model of the last powerflow
+        # is built again (from its key) when it is needed
+        res = self.__dict__.copy()
+        res["_dc_cache"] = OrderedDict()
+        res["_dc_model"] = None
+        return res
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+
+    def _get_state(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.snapshot`
+
+        .. versionadded:: 1.9.5
+
+        See :func:`PandaPowerBackend._get_state`, the DC model of the last powerflow (never modified) is also
+        stored.
+        """
+        columns, res_tables, vectors, other = super()._get_state()
+        other["_dc_model"] = self._dc_model
+        other["_dc_model_key"] = self._dc_model_key
+        return columns, res_tables, vectors, other
+
+    def _set_state(self, state):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.restore`
+
+        .. versionadded:: 1.9.5
+
+        See :func:`PandaPowerBackend._set_state`, the DC model of the last powerflow is restored as well.
+        """
+        super()._set_state(state)
+        other = state[3]
+        self._dc_model = other["_dc_model"]
+        self._dc_model_key = other["_dc_model_key"]
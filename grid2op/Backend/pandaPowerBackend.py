@@ -10,12 +10,16 @@ import os  # load the python os default module
 import sys  # laod the python sys default module
 import copy
 import warnings
+from collections import OrderedDict
 
 import numpy as np
 import pandas as pd
 
 import pandapower as pp
 import scipy
+from pandapower.pypower.makePTDF import makePTDF
+from pandapower.pypower.makeLODF import makeLODF
+from pandapower.pypower.idx_bus import VM, VA
 
 from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Backend.backend import Backend
@@ -26,11 +30,8 @@ try:
     import numba
     NUMBA_ = True
 except (ImportError, ModuleNotFoundError):
+    # a warning is issued when grid2op.Backend is imported
     NUMBA_ = False
-    warnings.warn(
-        "Numba cannot be loaded. You will gain possibly massive speed if installing it by "
-        "\n\t{} -m pip install numba\n".format(sys.executable)
-    )
 
 
 class PandaPowerBackend(Backend):
@@ -107,6 +108,35 @@ class PandaPowerBackend(Backend):
 
     """
 
+    # columns of the pandapower tables that can be modified by `apply_action` (stored in the "states")
+    _STATE_COLUMNS = {
+        "bus": ("in_service", ),
+        "load": ("p_mw", "q_mvar", "in_service", "bus"),
+        "gen": ("p_mw", "vm_pu", "in_service", "bus"),
+        "ext_grid": ("vm_pu", "bus"),
+        "line": ("in_service", "from_bus", "to_bus"),
+        "trafo": ("in_service", "hv_bus", "lv_bus"),
+        "storage": ("p_mw", "in_service", "bus"),
+        "shunt": ("p_mw", "q_mvar", "in_service", "bus"),
+    }
+    # tables of results of the powerflow (stored in the "states")
+    _STATE_RES_TABLES = ("res_bus", "res_line", "res_trafo", "res_gen", "res_load",
+                         "res_ext_grid", "res_storage", "res_shunt", "res_sgen")
+    # vectors computed after each powerflow (stored in the "states")
+    _STATE_VECTORS = ("p_or", "q_or", "v_or", "a_or", "theta_or",
+                      "p_ex", "q_ex", "v_ex", "a_ex", "theta_ex",
+                      "prod_p", "prod_q", "prod_v", "gen_theta",
+                      "load_p", "load_q", "load_v", "load_theta",
+                      "storage_p", "storage_q", "storage_v", "storage_theta",
+                      "line_status", "_topo_vect")
+    # attributes of the pandapower grid that define the internal model of a topology (stored in the "topology cache")
+    _TOPO_CACHE_ATTRS = ("_ppc", "_is_elements", "_pd2ppc_lookups", "_options", "_isolated_buses",
+                         "_gen_order", "_impedance_bb_switches", "_fused_bb_switches")
+    # what pandapower needs to update when the internal model of a topology is reused
+    _TOPO_CACHE_RECYCLE = {"bus_pq": True, "gen": True, "trafo": False}
+    # default number of topologies stored in the cache (see `set_topo_cache_size`)
+    TOPO_CACHE_SIZE = 16
+
     def __init__(
         self,
         detailed_infos_for_cascading_failures=False,
@@ -174,6 +204,11 @@ class PandaPowerBackend(Backend):
         self._topo_vect = None
         self.slack_id = None
 
+        # precomputed indexes to compute the topology vector without python loops
+        self._topo_vect_pos = None  # element -> position in topo_vect
+        self._topo_vect_subid = None  # element -> substation id (bus id of "bus 1")
+        self._topo_vect_line_pos = None  # position of both ends of each powerline in topo_vect
+
         # function to rstore some information
         self.__nb_bus_before = None  # number of substation in the powergrid
         self.__nb_powerline = (
@@ -213,6 +248,13 @@ class PandaPowerBackend(Backend):
         self._dist_slack = dist_slack
         self._max_iter = max_iter
 
+        # internal pandapower model (bus-branch model, admittance matrices etc.) of the last
+        # topologies encountered, see `_runpp_with_topo_cache`
+        self._topo_cache_size = type(self).TOPO_CACHE_SIZE
+        self._topo_cache = OrderedDict()
+        self.topo_cache_hits = 0
+        self.topo_cache_misses = 0
+
     def _check_for_non_modeled_elements(self):
         """This function check for elements in the pandapower grid that will have no impact on grid2op.
         See the full list of grid2op modeled elements in :ref:`modeled-elements-module`
@@ -767,6 +809,7 @@ class PandaPowerBackend(Backend):
         self.gen_theta = np.full(self.n_gen, fill_value=np.NaN, dtype=dt_float)
         self.storage_theta = np.full(self.n_storage, fill_value=np.NaN, dtype=dt_float)
 
+        self._init_topo_vect_mapping()
         self._topo_vect = self._get_topo_vect()
         self.tol = 1e-5  # this is NOT the pandapower tolerance !!!! this is used to check if a storage unit
         # produce / absorbs anything
@@ -780,6 +823,40 @@ class PandaPowerBackend(Backend):
                 self._grid
             )  # will be initialized in the "assert_grid_correct"
 
+    def _init_topo_vect_mapping(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Compute, once and for all, the indexes used by :func:`PandaPowerBackend._get_topo_vect`.
+
+        The elements are stored in the following order: origin side of powerlines (lines then trafos),
+        extremity side of powerlines, generators, loads and storage units. This is the order in
+        which the bus ids are read from the pandapower tables.
+        """
+        self._topo_vect_pos = np.concatenate(
+            (
+                self.line_or_pos_topo_vect,
+                self.line_ex_pos_topo_vect,
+                self.gen_pos_topo_vect,
+                self.load_pos_topo_vect,
+                self.storage_pos_topo_vect,
+            )
+        ).astype(dt_int)
+        self._topo_vect_subid = np.concatenate(
+            (
+                self.line_or_to_subid,
+                self.line_ex_to_subid,
+                self.gen_to_subid,
+                self.load_to_subid,
+                self.storage_to_subid,
+            )
+        ).astype(dt_int)
+        self._topo_vect_line_pos = np.concatenate(
+            (self.line_or_pos_topo_vect, self.line_ex_pos_topo_vect)
+        ).astype(dt_int)
+
     def storage_deact_for_backward_comaptibility(self):
         self._init_private_attrs()
 
@@ -1031,16 +1108,8 @@ class PandaPowerBackend(Backend):
                         None  # if dc i start normally next time i call an ac powerflow
                     )
                 else:
-                    pp.runpp(
-                        self._grid,
-                        check_connectivity=False,
-                        init=self._pf_init,
-                        numba=self.with_numba,
-                        lightsim2grid=self._lightsim2grid,
-                        max_iteration=self._max_iter,
-                        distributed_slack=self._dist_slack,
-                    )
-                    
+                    self._runpp_with_topo_cache()
+
                 # stores the computation time
                 if "_ppc" in self._grid:
                     if "et" in self._grid["_ppc"]:
@@ -1149,6 +1218,155 @@ class PandaPowerBackend(Backend):
             msg = exc_.__str__()
             return False, DivergingPowerFlow(f'powerflow diverged with error :"{msg}"')
 
+    def _get_topo_cache_key(self):
+        """key of the topology cache: the bus (and status) of each element of the grid. The shunts are
+        also part of the key because pandapower does not update them when it reuses the internal model."""
+        grid = self._grid
+        status = [grid.bus["in_service"].values,
+                  grid.line["in_service"].values,
+                  grid.trafo["in_service"].values,
+                  grid.storage["in_service"].values,
+                  grid.shunt["in_service"].values]
+        bus_ids = [grid.line["from_bus"].values,
+                   grid.line["to_bus"].values,
+                   grid.trafo["hv_bus"].values,
+                   grid.trafo["lv_bus"].values,
+                   grid.gen["bus"].values,
+                   grid.load["bus"].values,
+                   grid.storage["bus"].values,
+                   grid.shunt["bus"].values]
+        shunts = [grid.shunt["p_mw"].values,
+                  grid.shunt["q_mvar"].values,
+                  grid.shunt["step"].values]
+        return (np.concatenate(status).astype(dt_bool).tobytes() +
+                np.concatenate(bus_ids).astype(np.int64).tobytes() +
+                np.concatenate(shunts).astype(np.float64).tobytes())
+
+    def _runpp_with_topo_cache(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Runs the AC powerflow with pandapower.
+
+        The internal model built by pandapower (bus-branch model, admittance matrices etc.) for the last
+        `topo_cache_size` topologies encountered is kept in a cache. If the topology of the grid is in this cache,
+        its model is given back to pandapower that only updates the injections (it does not build the model
+        from the pandapower tables again).
+
+        When they can be used, the powerflow starts from the results of the last powerflow (`res_bus` table),
+        whether the model is reused or not, so that the results do not depend on the content of the cache (this
+        is required by :func:`grid2op.Environment.BaseEnv.restore`).
+        """
+        grid = self._grid
+        kwargs = dict(check_connectivity=False,
+                      init=self._pf_init,
+                      numba=self.with_numba,
+                      lightsim2grid=self._lightsim2grid,
+                      max_iteration=self._max_iter,
+                      distributed_slack=self._dist_slack)
+        if self._topo_cache_size <= 0:
+            pp.runpp(grid, **kwargs)
+            return
+
+        key = self._get_topo_cache_key()
+        model = self._topo_cache.get(key)
+        init_results = self._aux_get_init_results()
+        if model is not None and init_results is not None:
+            self.topo_cache_hits += 1
+            self._topo_cache.move_to_end(key)
+            bus_in_service, vm_init, va_init = init_results
+            bus_ppc = model["_pd2ppc_lookups"]["bus"][grid.bus.index.values[bus_in_service]]
+            model["_ppc"]["bus"][bus_ppc, VM] = vm_init
+            model["_ppc"]["bus"][bus_ppc, VA] = va_init
+            for attr_nm, attr_val in model.items():
+                grid[attr_nm] = attr_val
+            try:
+                pp.runpp(grid, recycle=type(self)._TOPO_CACHE_RECYCLE, **kwargs)
+            except pp.powerflow.LoadflowNotConverged:
+                # the model might have been modified by pandapower
+                del self._topo_cache[key]
+                raise
+        else:
+            self.topo_cache_misses += 1
+            if init_results is not None:
+                kwargs["init"] = "results"
+            pp.runpp(grid, **kwargs)
+
+        # pandapower creates a new model each time it is not reused, it can be stored without copy
+        self._topo_cache[key] = {attr_nm: grid[attr_nm]
+                                 for attr_nm in type(self)._TOPO_CACHE_ATTRS if attr_nm in grid}
+        while len(self._topo_cache) > self._topo_cache_size:
+            self._topo_cache.popitem(last=False)
+
+    def _aux_get_init_results(self):
+        """the voltages (of the buses in service) computed by the last powerflow or ``None`` if they cannot
+        be used to initialize the next one"""
+        if not self._aux_res_tables_initialized():
+            return None
+        grid = self._grid
+        bus_in_service = grid.bus["in_service"].values
+        vm_init = grid.res_bus["vm_pu"].values[bus_in_service]
+        va_init = grid.res_bus["va_degree"].values[bus_in_service]
+        if not (np.isfinite(vm_init).all() and np.isfinite(va_init).all()):
+            # some buses were not connected during the last powerflow
+            return None
+        return bus_in_service, vm_init, va_init
+
+    def _aux_res_tables_initialized(self):
+        """pandapower only fills the result tables when it reuses a model: they need to have been
+        created by a previous powerflow on this grid (which is not the case after a `reset` for example)"""
+        grid = self._grid
+        for el_nm in ["bus", "line", "trafo", "gen", "load", "ext_grid", "storage", "shunt"]:
+            res_nm = f"res_{el_nm}"
+            if res_nm not in grid or grid[res_nm].shape[0] != grid[el_nm].shape[0]:
+                return False
+        return True
+
+    def set_topo_cache_size(self, topo_cache_size):
+        """
+        .. versionadded:: 1.9.5
+
+        Sets the maximum number of topologies for which the internal pandapower model (bus-branch model,
+        admittance matrices etc.) is kept in memory, to be reused by the next AC powerflows computed with
+        these topologies. Use ``0`` to deactivate this cache.
+
+        The default value is :attr:`PandaPowerBackend.TOPO_CACHE_SIZE`. The number of times the model of a topology
+        has been reused (resp. built) is given by :attr:`PandaPowerBackend.topo_cache_hits`
+        (resp. :attr:`PandaPowerBackend.topo_cache_misses`).
+
+        Examples
+        ---------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            env.backend.set_topo_cache_size(0)  # deactivate the cache
+
+        """
+        topo_cache_size = int(topo_cache_size)
+        if topo_cache_size < 0:
+            raise BackendError(f"The size of the topology cache should be >= 0, found {topo_cache_size}")
+        self._topo_cache_size = topo_cache_size
+        while len(self._topo_cache) > self._topo_cache_size:
+            self._topo_cache.popitem(last=False)
+
+    def clear_topo_cache(self):
+        """
+        .. versionadded:: 1.9.5
+
+        Removes all the internal pandapower models stored in the topology cache and reset the counters
+        :attr:`PandaPowerBackend.topo_cache_hits` and :attr:`PandaPowerBackend.topo_cache_misses`.
+        """
+        self._topo_cache.clear()
+        self.topo_cache_hits = 0
+        self.topo_cache_misses = 0
+
     def assert_grid_correct(self):
         """
         INTERNAL
@@ -1185,6 +1403,79 @@ class PandaPowerBackend(Backend):
         self.gen_theta[:] = np.NaN
         self.storage_theta[:] = np.NaN
 
+    def _get_state(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.snapshot`
+
+        .. versionadded:: 1.9.5
+
+        Contrary to :func:`PandaPowerBackend.copy` the pandapower grid is not deep copied: only the columns modified
+        by :func:`PandaPowerBackend.apply_action` and the results of the last powerflow are stored (as
+        numpy arrays).
+        """
+        grid = self._grid
+        columns = {(tab_nm, col_nm): grid[tab_nm][col_nm].values.copy()
+                   for tab_nm, cols in type(self)._STATE_COLUMNS.items()
+                   for col_nm in cols}
+        res_tables = {}
+        for tab_nm in type(self)._STATE_RES_TABLES:
+            if tab_nm not in grid:
+                continue
+            tab = grid[tab_nm]
+            res_tables[tab_nm] = (tab.index, {col_nm: tab[col_nm].values.copy() for col_nm in tab.columns})
+        vectors = {attr_nm: getattr(self, attr_nm).copy() for attr_nm in type(self)._STATE_VECTORS}
+        other = {"_nb_bus_before": self._nb_bus_before,
+                 "_pf_init": self._pf_init,
+                 "converged": grid.converged,
+                 # a new "_ppc" is created by pandapower at each powerflow, it does not need to be copied
+                 "_ppc": grid["_ppc"] if "_ppc" in grid else None}
+        return columns, res_tables, vectors, other
+
+    @staticmethod
+    def _aux_set_column(tab, col_nm, values):
+        tmp = tab[col_nm].values
+        if tmp.shape == values.shape and tmp.dtype == values.dtype:
+            tmp[:] = values
+        else:
+            tab[col_nm] = values.copy()
+
+    def _set_state(self, state):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.restore`
+
+        .. versionadded:: 1.9.5
+
+        The data are copied inplace in the pandapower grid (the tables are not re created).
+        """
+        columns, res_tables, vectors, other = state
+        grid = self._grid
+        for (tab_nm, col_nm), values in columns.items():
+            self._aux_set_column(grid[tab_nm], col_nm, values)
+        for tab_nm, (index, values) in res_tables.items():
+            tab = grid[tab_nm]
+            if tab.shape[0] == index.shape[0] and set(tab.columns) == set(values.keys()):
+                for col_nm, col_val in values.items():
+                    self._aux_set_column(tab, col_nm, col_val)
+            else:
+                # the table has been modified by pandapower (eg after a divergence)
+                grid[tab_nm] = pd.DataFrame({col_nm: col_val.copy() for col_nm, col_val in values.items()},
+                                            index=index)
+        for attr_nm, values in vectors.items():
+            getattr(self, attr_nm)[:] = values
+        self._nb_bus_before = other["_nb_bus_before"]
+        self._pf_init = other["_pf_init"]
+        grid.converged = other["converged"]
+        if other["_ppc"] is not None:
+            grid["_ppc"] = other["_ppc"]
+
     def copy(self):
         """
         INTERNAL
@@ -1240,6 +1531,8 @@ class PandaPowerBackend(Backend):
 
         res._pf_init = self._pf_init
         res._nb_bus_before = self._nb_bus_before
+        # the models in the cache are not copied (they belong to the pandapower grid of this backend)
+        res._topo_cache_size = self._topo_cache_size
 
         res.thermal_limit_a = copy.deepcopy(self.thermal_limit_a)
 
@@ -1253,6 +1546,9 @@ class PandaPowerBackend(Backend):
         res.cst_1 = self.cst_1
         res._topo_vect = copy.deepcopy(self._topo_vect)
         res.slack_id = self.slack_id
+        res._topo_vect_pos = self._topo_vect_pos  # never modified, can be shared
+        res._topo_vect_subid = self._topo_vect_subid
+        res._topo_vect_line_pos = self._topo_vect_line_pos
 
         # function to rstore some information
         res.__nb_bus_before = (
@@ -1300,6 +1596,7 @@ class PandaPowerBackend(Backend):
         self._grid = None
         del self.__pp_backend_initial_grid
         self.__pp_backend_initial_grid = None
+        self._topo_cache.clear()
 
     def save_file(self, full_path):
         """
@@ -1346,6 +1643,19 @@ class PandaPowerBackend(Backend):
         self._topo_vect[self.line_ex_pos_topo_vect[id_]] = -1
         self.line_status[id_] = False
 
+    def _disconnect_lines(self, mask):
+        if not mask.any():
+            return
+        nb_line = self._number_true_line
+        self._grid.line["in_service"].values[mask[:nb_line]] = False
+        self._grid.trafo["in_service"].values[mask[nb_line:]] = False
+        self._topo_vect[self.line_or_pos_topo_vect[mask]] = -1
+        self._topo_vect[self.line_ex_pos_topo_vect[mask]] = -1
+        self.line_status[mask] = False
+        # buses are not modified: the next powerflow (computed during the
+        # cascading failure) can be initialized with the last results
+        self._nb_bus_before = self.get_nb_active_bus()
+
     def _reconnect_line(self, id_):
         if id_ < self._number_true_line:
             self._grid.line["in_service"].iloc[id_] = True
@@ -1353,74 +1663,75 @@ class PandaPowerBackend(Backend):
             self._grid.trafo["in_service"].iloc[id_ - self._number_true_line] = True
         self.line_status[id_] = True
 
+    def get_lodf(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Computes the LODF from the internal pandapower model of the last powerflow computed, see
+        :func:`grid2op.Backend.Backend.get_lodf` for more information.
+
+        It returns ``None`` if this model is not available (for example after a divergence).
+        """
+        if self._grid is None or "_ppc" not in self._grid or self._grid._ppc is None:
+            return None
+        if "internal" not in self._grid._ppc or "branch_is" not in self._grid._ppc["internal"]:
+            return None
+        ppci = self._grid._ppc["internal"]
+        lookup = self._grid._pd2ppc_lookups["branch"]
+        ext_ids = [np.arange(*lookup[nm_]) for nm_ in ["line", "trafo"] if nm_ in lookup]
+        ext_ids = np.concatenate(ext_ids).astype(dt_int)
+        if ext_ids.shape[0] != self.n_line:
+            return None
+
+        # pandapower removes the disconnected branches from the internal model
+        branch_is = ppci["branch_is"]
+        int_ids = np.cumsum(branch_is) - 1
+        line_in = branch_is[ext_ids]
+        idx = int_ids[ext_ids[line_in]]
+        try:
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                # a singular matrix is an error (and not a warning with a result full of nan)
+                warnings.filterwarnings("error", category=scipy.sparse.linalg.MatrixRankWarning)
+                ptdf = makePTDF(ppci["baseMVA"], ppci["bus"], ppci["branch"], using_sparse_solver=True)
+                lodf_int = makeLODF(ppci["branch"], ptdf)
+        except (np.linalg.LinAlgError, scipy.sparse.linalg.MatrixRankWarning, IndexError):
+            # the powergrid cannot be represented with a dc model (eg singular matrix)
+            return None
+        res = np.zeros((self.n_line, self.n_line), dtype=dt_float)
+        res[np.ix_(line_in, line_in)] = lodf_int[np.ix_(idx, idx)]
+        return res
+
     def get_topo_vect(self):
         return self._topo_vect
 
     def _get_topo_vect(self):
+        # bus ids read in the same order as in `_init_topo_vect_mapping`
+        bus_ids = [
+            self._grid.line["from_bus"].values,
+            self._grid.trafo["hv_bus"].values,
+            self._grid.line["to_bus"].values,
+            self._grid.trafo["lv_bus"].values,
+            self._grid.gen["bus"].values,
+            self._grid.load["bus"].values,
+        ]
+        if self.n_storage:
+            # storage can be deactivated by the environment for backward compatibility
+            bus_ids.append(self._grid.storage["bus"].values)
+        bus_ids = np.concatenate(bus_ids)
+
         res = np.full(self.dim_topo, fill_value=np.iinfo(dt_int).max, dtype=dt_int)
+        res[self._topo_vect_pos] = np.where(
+            bus_ids == self._topo_vect_subid, 1, 2
+        ).astype(dt_int)
 
         line_status = self.get_line_status()
-
-        i = 0
-        for row in self._grid.line[["from_bus", "to_bus"]].values:
-            bus_or_id = row[0]
-            bus_ex_id = row[1]
-            if line_status[i]:
-                res[self.line_or_pos_topo_vect[i]] = (
-                    1 if bus_or_id == self.line_or_to_subid[i] else 2
-                )
-                res[self.line_ex_pos_topo_vect[i]] = (
-                    1 if bus_ex_id == self.line_ex_to_subid[i] else 2
-                )
-            else:
-                res[self.line_or_pos_topo_vect[i]] = -1
-                res[self.line_ex_pos_topo_vect[i]] = -1
-            i += 1
-
-        nb = self._number_true_line
-        i = 0
-        for row in self._grid.trafo[["hv_bus", "lv_bus"]].values:
-            bus_or_id = row[0]
-            bus_ex_id = row[1]
-
-            j = i + nb
-            if line_status[j]:
-                res[self.line_or_pos_topo_vect[j]] = (
-                    1 if bus_or_id == self.line_or_to_subid[j] else 2
-                )
-                res[self.line_ex_pos_topo_vect[j]] = (
-                    1 if bus_ex_id == self.line_ex_to_subid[j] else 2
-                )
-            else:
-                res[self.line_or_pos_topo_vect[j]] = -1
-                res[self.line_ex_pos_topo_vect[j]] = -1
-            i += 1
-
-        i = 0
-        for bus_id in self._grid.gen["bus"].values:
-            res[self.gen_pos_topo_vect[i]] = 1 if bus_id == self.gen_to_subid[i] else 2
-            i += 1
-
-        i = 0
-        for bus_id in self._grid.load["bus"].values:
-            res[self.load_pos_topo_vect[i]] = (
-                1 if bus_id == self.load_to_subid[i] else 2
-            )
-            i += 1
-
+        res[self._topo_vect_line_pos[~np.concatenate((line_status, line_status))]] = -1
         if self.n_storage:
-            # storage can be deactivated by the environment for backward compatibility
-            i = 0
-            for bus_id in self._grid.storage["bus"].values:
-                status = self._grid.storage["in_service"].values[i]
-                if status:
-                    res[self.storage_pos_topo_vect[i]] = (
-                        1 if bus_id == self.storage_to_subid[i] else 2
-                    )
-                else:
-                    res[self.storage_pos_topo_vect[i]] = -1
-                i += 1
-
+            storage_status = self._grid.storage["in_service"].values
+            res[self.storage_pos_topo_vect[~storage_status]] = -1
         return res
 
     def _gens_info(self):
@@ -12,8 +12,9 @@ import pandas as pd
 from datetime import datetime, timedelta
 
 
-from grid2op.dtypes import dt_bool, dt_int
+from grid2op.dtypes import dt_bool
 from grid2op.Exceptions import Grid2OpException
+from grid2op.Chronics.gridValue import GridValue
 from grid2op.Chronics.gridStateFromFileWithForecasts import (
     GridStateFromFileWithForecasts,
 )
@@ -44,6 +45,9 @@ class GridStateFromFileWithForecastsWithMaintenance(GridStateFromFileWithForecas
     """
 
     MULTI_CHRONICS = False
+    # the maintenance are randomly generated when the data are initialized
+    _INIT_USES_SEED = True
+
     def __init__(
         self,
         path,
@@ -140,26 +144,72 @@ class GridStateFromFileWithForecastsWithMaintenance(GridStateFromFileWithForecas
 
     @staticmethod
     def _fix_maintenance_format(obj_with_maintenance):
-        obj_with_maintenance.maintenance_time = (
-            np.zeros(shape=(obj_with_maintenance.maintenance.shape[0], obj_with_maintenance.n_line), dtype=dt_int) - 1
-        )
-        obj_with_maintenance.maintenance_duration = np.zeros(
-            shape=(obj_with_maintenance.maintenance.shape[0], obj_with_maintenance.n_line), dtype=dt_int
+        # computed for all the powerlines at once
+        obj_with_maintenance.maintenance_time = GridValue.get_maintenance_time_2d(obj_with_maintenance.maintenance)
+        obj_with_maintenance.maintenance_duration = GridValue.get_maintenance_duration_2d(
+            obj_with_maintenance.maintenance
         )
 
-        # test that with chunk size
-        for line_id in range(obj_with_maintenance.n_line):
-            obj_with_maintenance.maintenance_time[:, line_id] = obj_with_maintenance.get_maintenance_time_1d(
-                obj_with_maintenance.maintenance[:, line_id]
-            )
-            obj_with_maintenance.maintenance_duration[:, line_id] = obj_with_maintenance.get_maintenance_duration_1d(
-                obj_with_maintenance.maintenance[:, line_id]
-            )
-
         # there are _maintenance and hazards only if the value in the file is not 0.
         obj_with_maintenance.maintenance = obj_with_maintenance.maintenance != 0.0
         obj_with_maintenance.maintenance = obj_with_maintenance.maintenance.astype(dt_bool)
-        
+
+    @staticmethod
+    def _sample_maintenance_days(space_prng, maintenance_daily_proba, max_daily_maintenance, n_lines_maintenance):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Sample, for each working day (rows) which lines (columns) will be in maintenance.
+
+        It gives the exact same results (and leaves `space_prng` in the exact same state) as calling, for
+        each working day, `space_prng.choice([False, True], p=[1 - proba, proba], size=n_lines_maintenance)`
+        and then removing at random some of the maintenance if there are more than `max_daily_maintenance`
+        of them (as it was done before grid2op 1.9.5).
+
+        The random numbers of all the days are drawn at once. This is done again (from the
+        day after) only when the maximum number of maintenance is exceeded for a given day, which requires
+        an extra random draw.
+        """
+        if ((maintenance_daily_proba < 0.) | (maintenance_daily_proba > 1.)).any():
+            raise ValueError("probabilities are not non-negative")
+        nb_days = maintenance_daily_proba.shape[0]
+        res = np.zeros((nb_days, n_lines_maintenance), dtype=dt_bool)
+        # same threshold as the one computed in `RandomState.choice` when `p` is provided
+        cdf = np.stack((1.0 - maintenance_daily_proba, maintenance_daily_proba), axis=1).cumsum(axis=1)
+        threshold = (cdf[:, 0] / cdf[:, 1]).reshape(-1, 1)
+        day_id = 0
+        while day_id < nb_days:
+            prng_state = space_prng.get_state()
+            are_lines_in_maintenance = (
+                space_prng.random_sample((nb_days - day_id, n_lines_maintenance)) >= threshold[day_id:]
+            )
+            n_generated_maintenance = are_lines_in_maintenance.sum(axis=1)
+            too_much = n_generated_maintenance > max_daily_maintenance[day_id:]
+            if not too_much.any():
+                res[day_id:] = are_lines_in_maintenance
+                break
+
+            # random numbers after this day are invalid: another random draw is needed
+            # to decide which maintenance to keep for this day
+            nb_ok = int(np.argmax(too_much)) + 1
+            space_prng.set_state(prng_state)
+            space_prng.random_sample((nb_ok, n_lines_maintenance))
+            res[day_id:(day_id + nb_ok)] = are_lines_in_maintenance[:nb_ok]
+            day_id += nb_ok
+
+            n_gen = n_generated_maintenance[nb_ok - 1]
+            not_chosen = space_prng.choice(
+                n_gen,
+                replace=False,
+                size=n_gen - max_daily_maintenance[day_id - 1],
+            )
+            res[day_id - 1, np.where(res[day_id - 1])[0][not_chosen]] = False
+        return res
+
     @staticmethod
     def _generate_matenance_static(name_line,
                                    n_,
@@ -199,12 +249,11 @@ class GridStateFromFileWithForecastsWithMaintenance(GridStateFromFileWithForecas
         )  # should be in the timedelta frequency format in pandas
         datelist = pd.date_range(start_datetime, periods=nbTimesteps, freq=freq)
 
-        datelist = np.unique(np.array([el.date() for el in datelist]))
+        datelist = datelist.normalize().unique()
         datelist = datelist[:-1]
 
         n_lines_maintenance = len(line_to_maintenance)
 
-        _24_h = timedelta(seconds=86400)
         nb_rows = int(86400 / time_interval.total_seconds())
         selected_rows_beg = int(
             maintenance_starting_hour * 3600 / time_interval.total_seconds()
@@ -213,59 +262,30 @@ class GridStateFromFileWithForecastsWithMaintenance(GridStateFromFileWithForecas
             maintenance_ending_hour * 3600 / time_interval.total_seconds()
         )
 
-        # TODO this is INSANELY slow for now. find a way to make it faster
-        # HINT: vectorize everything into one single numpy array, everything can be vectorized there...
-        month = 0
-        maintenance_daily_proba = -1
-        maxDailyMaintenance = -1
-        for nb_day_since_beg, this_day in enumerate(datelist):
-            dayOfWeek = this_day.weekday()
-            if dayOfWeek < 5:  # only maintenance starting on working days
-                month = this_day.month
-
-                maintenance_me = np.zeros((nb_rows, nb_line_maint))
-                # Careful: month start at 1 but inidces start at 0 in python
-                maintenance_daily_proba = daily_proba_per_month_maintenance[
-                    (month - 1)
-                ]
-                maxDailyMaintenance = max_daily_number_per_month_maintenance[
-                    (month - 1)
-                ]
-
-                # now for each line in self.line_to_maintenance, sample to know if we generate a maintenance
-                # for line in self.line_to_maintenance:
-                are_lines_in_maintenance = space_prng.choice(
-                    [False, True],
-                    p=[(1.0 - maintenance_daily_proba), maintenance_daily_proba],
-                    size=n_lines_maintenance,
-                )
-
-                n_Generated_Maintenance = are_lines_in_maintenance.sum()
-                # check if the number of maintenance is not above the max allowed. otherwise randomly pick up the right
-                # number
-                if n_Generated_Maintenance > maxDailyMaintenance:
-                    # we pick up only maxDailyMaintenance elements
-                    not_chosen = space_prng.choice(
-                        n_Generated_Maintenance,
-                        replace=False,
-                        size=n_Generated_Maintenance - maxDailyMaintenance,
-                    )
-                    are_lines_in_maintenance[
-                        np.where(are_lines_in_maintenance)[0][not_chosen]
-                    ] = False
-                maintenance_me[
-                    selected_rows_beg:selected_rows_end, are_lines_in_maintenance
-                ] = 1.0
-
-                # handle last iteration
-                n_max = res[
-                    (nb_day_since_beg * nb_rows) : ((nb_day_since_beg + 1) * nb_rows),
-                    idx_line_maintenance,
-                ].shape[0]
-                res[
-                    (nb_day_since_beg * nb_rows) : ((nb_day_since_beg + 1) * nb_rows),
-                    idx_line_maintenance,
-                ] = maintenance_me[:n_max, :]
+        # only maintenance starting on working days
+        working_days = np.asarray(datelist.weekday) < 5
+        # Careful: month start at 1 but inidces start at 0 in python
+        month_id = np.asarray(datelist.month)[working_days] - 1
+        maintenance_daily_proba = np.asarray(daily_proba_per_month_maintenance, dtype=float)[month_id]
+        maxDailyMaintenance = np.asarray(max_daily_number_per_month_maintenance)[month_id]
+
+        # now for each day and each line in self.line_to_maintenance, sample to know if we generate a maintenance
+        # (taking into account the maximum number of maintenance per day)
+        are_lines_in_maintenance = GridStateFromFileWithForecastsWithMaintenance._sample_maintenance_days(
+            space_prng, maintenance_daily_proba, maxDailyMaintenance, n_lines_maintenance
+        )
+
+        # view of `res` day by day, with shape (nb_days, nb_rows, n_line), maintenance are written directly in it
+        nb_days = datelist.shape[0]
+        if nb_days * nb_rows > nbTimesteps:
+            # handle last day (it can be incomplete)
+            res = np.zeros((nb_days * nb_rows, len(name_line)))
+        res_days = res[:(nb_days * nb_rows)].reshape(nb_days, nb_rows, len(name_line))
+        rows_maintenance = np.arange(nb_rows)[selected_rows_beg:selected_rows_end]
+        res_days[np.ix_(np.flatnonzero(working_days),
+                        rows_maintenance,
+                        np.flatnonzero(idx_line_maintenance))] = are_lines_in_maintenance[:, None, :]
+        res = res[:nbTimesteps]
         return res
     
     def _generate_maintenance(self):
@@ -13,7 +13,10 @@ __all__ = [
     "FromChronix2grid",
     "FromHandlers",
     "FromOneEpisodeData",
-    "FromMultiEpisodeData"
+    "FromMultiEpisodeData",
+    "GridStateFromBinary",
+    "GridStateFromBinaryWithForecasts",
+    "convert_chronics"
 ]
 
 from grid2op.Chronics.chronicsHandler import ChronicsHandler
@@ -35,3 +38,8 @@ from grid2op.Chronics.time_series_from_handlers import FromHandlers
 
 from grid2op.Chronics.fromOneEpisodeData import FromOneEpisodeData
 from grid2op.Chronics.fromMultiEpisodeData import FromMultiEpisodeData
+from grid2op.Chronics.gridStateFromBinary import (
+    GridStateFromBinary,
+    GridStateFromBinaryWithForecasts,
+    convert_chronics
+)
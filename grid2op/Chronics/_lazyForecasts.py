@@ -0,0 +1,49 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+class _LazyForecasts(object):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    Handle to the forecasts of a given step (see :func:`grid2op.Chronics.GridValue.lazy_forecasts`).
+
+    The forecasts are computed (by calling `fun`) the first time this object is called and then
+    stored. Calling it returns the same thing as what `GridValue.forecasts()` would have returned
+    when this object has been created.
+
+    As the forecasts of a given step never change, this object is not copied (it can be shared by
+    different observations). When pickled, the forecasts are computed and only the result is stored.
+
+    .. versionadded:: 1.9.5
+
+    """
+    def __init__(self, fun=None, value=None):
+        self._fun = fun
+        self._value = value
+
+    @property
+    def is_computed(self):
+        return self._fun is None
+
+    def __call__(self):
+        if self._fun is not None:
+            self._value = self._fun()
+            self._fun = None
+        return self._value
+
+    def __copy__(self):
+        return self
+
+    def __deepcopy__(self, memodict={}):
+        return self
+
+    def __reduce__(self):
+        return (type(self), (None, self()))
@@ -200,6 +200,36 @@ class ChronicsHandler(RandomObject):
         self._real_data.seed(seed_chronics)
         return seed, seed_chronics
 
+    def _get_state(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.snapshot`
+
+        .. versionadded:: 1.9.5
+
+        Returns the state of the time series (see :func:`grid2op.Chronics.GridValue._get_state`)
+        """
+        return self._real_data, self._real_data._get_state()
+
+    def _set_state(self, state):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.restore`
+
+        .. versionadded:: 1.9.5
+
+        Puts back the time series in the state returned by :func:`ChronicsHandler._get_state`
+        """
+        real_data, real_data_state = state
+        real_data._set_state(real_data_state)
+        self._real_data = real_data
+
     def __getattr__(self, name):
         if name in ["__getstate__", "__setstate__"]:
             # otherwise there is a recursion depth exceeded in multiprocessing
@@ -170,20 +170,8 @@ class FromNPY(GridValue):
             assert load_p.shape[0] == maintenance.shape[0]
             self.maintenance = maintenance  # TODO copy
 
-            self.maintenance_time = (
-                np.zeros(shape=(self.maintenance.shape[0], self.n_line), dtype=dt_int)
-                - 1
-            )
-            self.maintenance_duration = np.zeros(
-                shape=(self.maintenance.shape[0], self.n_line), dtype=dt_int
-            )
-            for line_id in range(self.n_line):
-                self.maintenance_time[:, line_id] = self.get_maintenance_time_1d(
-                    self.maintenance[:, line_id]
-                )
-                self.maintenance_duration[
-                    :, line_id
-                ] = self.get_maintenance_duration_1d(self.maintenance[:, line_id])
+            self.maintenance_time = self.get_maintenance_time_2d(self.maintenance)
+            self.maintenance_duration = self.get_maintenance_duration_2d(self.maintenance)
 
         self.has_hazards = False
         self.hazards = None
@@ -201,9 +189,7 @@ class FromNPY(GridValue):
             # assert load_p.shape[0] == hazards.shape[0]
 
             # self.hazards = hazards  # TODO copy !
-            # self.hazard_duration = np.zeros(shape=(self.hazards.shape[0], self.n_line), dtype=dt_int)
-            # for line_id in range(self.n_line):
-            #     self.hazard_duration[:, line_id] = self.get_hazard_duration_1d(self.hazards[:, line_id])
+            # self.hazard_duration = self.get_hazard_duration_2d(self.hazards)
 
         self._forecasts = None
         if load_p_forecast is not None:
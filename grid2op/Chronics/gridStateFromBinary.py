@@ -0,0 +1,233 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import re
+import json
+import argparse
+import shutil
+import numpy as np
+import pandas as pd
+
+from grid2op.Chronics.gridStateFromFile import GridStateFromFile
+from grid2op.Chronics.gridStateFromFileWithForecasts import GridStateFromFileWithForecasts
+from grid2op.Exceptions import ChronicsError
+
+BINARY_EXT = ".bin"
+HEADER_EXT = ".json"
+BINARY_FORMAT_VERSION = 1
+_CSV_FILE_REGEX = re.compile(r"^(.*)\.(csv|csv\.bz2|zip|csv\.gzip|csv\.xz)$")
+
+
+def _read_header(path, data_name):
+    """read the header of the data `data_name` (``None`` if this data is not present)"""
+    header_path = os.path.join(path, f"{data_name}{HEADER_EXT}")
+    if not os.path.exists(header_path):
+        return None
+    with open(header_path, "r", encoding="utf-8") as f:
+        header = json.load(f)
+    if header.get("format_version", None) != BINARY_FORMAT_VERSION:
+        raise ChronicsError(f'Unknown format for the binary chronics "{header_path}", please convert '
+                            f'the data again with `grid2op.convert_chronics`.')
+    return header
+
+
+def _aux_iter_chunks(data, columns, chunksize):
+    for beg_ in range(0, data.shape[0], chunksize):
+        yield pd.DataFrame(data[beg_:(beg_ + chunksize)], columns=columns, copy=False)
+
+
+class _BinaryDataMixin(object):
+    """read the data from the binary format generated by :func:`convert_chronics` instead of the csv files.
+    Everything else (the order of the columns, the chunks etc.) is handled by :class:`GridStateFromFile`"""
+    def _get_fileext(self, data_name):
+        if os.path.exists(os.path.join(self.path, f"{data_name}{HEADER_EXT}")):
+            return BINARY_EXT
+        return None
+
+    def _get_data(self, data_name, chunksize=-1, nrows=None):
+        header = _read_header(self.path, data_name)
+        if header is None:
+            return None
+
+        if nrows is None:
+            if self._max_iter > 0:
+                nrows = self._max_iter + 1
+        if chunksize == -1:
+            chunksize = self.chunk_size
+
+        data = np.memmap(os.path.join(self.path, f"{data_name}{BINARY_EXT}"),
+                         dtype=header["dtype"],
+                         mode="r",
+                         shape=tuple(header["shape"]))
+        if nrows is not None:
+            data = data[:nrows]
+        if chunksize is None:
+            return pd.DataFrame(data, columns=header["columns"], copy=False)
+        return _aux_iter_chunks(data, header["columns"], chunksize)
+
+    @staticmethod
+    def _file_len(fname, ext_):
+        path, fn = os.path.split(fname)
+        header = _read_header(path, fn[:-len(ext_)])
+        return header["shape"][0]
+
+
+class GridStateFromBinary(_BinaryDataMixin, GridStateFromFile):
+    """
+    It behaves exactly like :class:`GridStateFromFile` except that data are read from the
+    binary format generated by :func:`convert_chronics` (or the `grid2op.convert_chronics` command)
+    instead of being parsed from the csv files.
+
+    In this format each quantity (*eg* "load_p") is stored in two files:
+
+    - "load_p.bin": a contiguous float32 array (row major) with one row per step
+    - "load_p.json": a small header with the shape of this array, its dtype and the name of the columns
+
+    The arrays are memory mapped (and not parsed) so reading a scenario is much faster than from a
+    csv. When used with `chunk_size`, only the current chunk is copied in memory.
+
+    .. versionadded:: 1.9.5
+
+    Examples
+    ---------
+
+    .. code-block:: python
+
+        import os
+        import grid2op
+        from grid2op.Chronics import convert_chronics, GridStateFromBinaryWithForecasts
+
+        env_name = "l2rpn_case14_sandbox"
+        env = grid2op.make(env_name)
+
+        # convert the data once (you can also use the `grid2op.convert_chronics` command)
+        path_bin = os.path.join(env.get_path_env(), "chronics_bin")
+        convert_chronics(os.path.join(env.get_path_env(), "chronics"), path_bin)
+
+        # and use them
+        env_bin = grid2op.make(env_name,
+                               chronics_path=path_bin,
+                               data_feeding_kwargs={"gridvalueClass": GridStateFromBinaryWithForecasts})
+
+    """
+    pass
+
+
+class GridStateFromBinaryWithForecasts(_BinaryDataMixin, GridStateFromFileWithForecasts):
+    """
+    It behaves exactly like :class:`GridStateFromFileWithForecasts` except that data are read from the
+    binary format generated by :func:`convert_chronics`. See :class:`GridStateFromBinary` for more
+    information.
+
+    .. versionadded:: 1.9.5
+
+    """
+    pass
+
+
+def _convert_one_scenario(path_in, path_out, sep):
+    os.makedirs(path_out, exist_ok=True)
+    for fn in sorted(os.listdir(path_in)):
+        full_fn = os.path.join(path_in, fn)
+        if not os.path.isfile(full_fn):
+            continue
+        match_ = _CSV_FILE_REGEX.match(fn)
+        if match_ is None:
+            # not a csv (*eg* start_datetime.info): copied as is
+            shutil.copy(full_fn, os.path.join(path_out, fn))
+            continue
+        data_name = match_.group(1)
+        df = pd.read_csv(full_fn, sep=sep)
+        non_numeric = [str(col) for col, dt in df.dtypes.items() if not pd.api.types.is_numeric_dtype(dt)]
+        if non_numeric:
+            raise ChronicsError(f'Impossible to convert "{full_fn}": the column(s) {non_numeric} '
+                                f'are not numeric.')
+        data = np.ascontiguousarray(df.values, dtype=np.float32)
+        data.tofile(os.path.join(path_out, f"{data_name}{BINARY_EXT}"))
+        header = {"format_version": BINARY_FORMAT_VERSION,
+                  "dtype": "float32",
+                  "shape": list(data.shape),
+                  "columns": [str(el) for el in df.columns]}
+        with open(os.path.join(path_out, f"{data_name}{HEADER_EXT}"), "w", encoding="utf-8") as f:
+            json.dump(header, f, indent=4)
+
+
+def convert_chronics(path_in, path_out, sep=";"):
+    """
+    Convert some time series stored in csv (the format read by :class:`GridStateFromFile`) into
+    the binary format read by :class:`GridStateFromBinary` and :class:`GridStateFromBinaryWithForecasts`.
+
+    .. versionadded:: 1.9.5
+
+    Parameters
+    ----------
+    path_in: ``str``
+        Either the path of one scenario (a directory with csv files, *eg* "load_p.csv.bz2") or the path
+        of a directory containing one sub directory per scenario (*eg* the "chronics" directory of an environment).
+
+    path_out: ``str``
+        Where the converted data are stored (same structure as `path_in`). Files that are not csv (for
+        example "start_datetime.info") are copied.
+
+    sep: ``str``
+        The separator used in the csv files
+
+    Returns
+    -------
+    res: ``list``
+        The list of all the scenarios converted
+    """
+    path_in = os.path.abspath(path_in)
+    path_out = os.path.abspath(path_out)
+    if not os.path.isdir(path_in):
+        raise ChronicsError(f'"{path_in}" is not a directory.')
+    if path_in == path_out:
+        raise ChronicsError("Impossible to convert the data in place.")
+
+    has_csv = any([_CSV_FILE_REGEX.match(el) is not None and os.path.isfile(os.path.join(path_in, el))
+                   for el in os.listdir(path_in)])
+    if has_csv:
+        # this is a scenario
+        _convert_one_scenario(path_in, path_out, sep)
+        return [path_out]
+
+    res = []
+    for el in sorted(os.listdir(path_in)):
+        if not os.path.isdir(os.path.join(path_in, el)):
+            continue
+        _convert_one_scenario(os.path.join(path_in, el), os.path.join(path_out, el), sep)
+        res.append(os.path.join(path_out, el))
+    return res
+
+
+def convert_chronics_cli():
+    parser = argparse.ArgumentParser(
+        description="Convert grid2op time series (csv) into a binary format, see `GridStateFromBinary`."
+    )
+    parser.add_argument("--path_in", required=True, type=str,
+                        help="Path of a scenario or of a directory containing the scenarios (for example "
+                             "the \"chronics\" directory of an environment).")
+    parser.add_argument("--path_out", required=True, type=str,
+                        help="Where the converted data will be stored.")
+    parser.add_argument("--sep", default=";", type=str,
+                        help="The separator used in the csv files.")
+    args = parser.parse_args()
+    return args
+
+
+def main(args=None):
+    if args is None:
+        args = convert_chronics_cli()
+    res = convert_chronics(args.path_in, args.path_out, sep=args.sep)
+    print(f"{len(res)} scenario(s) converted in \"{os.path.abspath(args.path_out)}\"")
+
+
+if __name__ == "__main__":
+    args = convert_chronics_cli()
+    main(args)
@@ -116,6 +116,8 @@ class GridStateFromFile(GridValue):
         backed. See the help of :func:`GridValue.initialize` for more information).
     """
     MULTI_CHRONICS = False
+    # whether the data depend on the seed once initialized (used by the disk cache of :class:`MultifolderWithCache`)
+    _INIT_USES_SEED = False
 
     def __init__(
         self,
@@ -556,29 +558,9 @@ class GridStateFromFile(GridValue):
         load_q_iter = self._get_data("load_q")
         prod_p_iter = self._get_data("prod_p")
         prod_v_iter = self._get_data("prod_v")
-        read_compressed = self._get_fileext("hazards")
-        nrows = None
-        if self._max_iter > 0:
-            nrows = self._max_iter + 1
-
-        if read_compressed is not None:
-            hazards = pd.read_csv(
-                os.path.join(self.path, "hazards{}".format(read_compressed)),
-                sep=self.sep,
-                nrows=nrows,
-            )
-        else:
-            hazards = None
-
-        read_compressed = self._get_fileext("maintenance")
-        if read_compressed is not None:
-            maintenance = pd.read_csv(
-                os.path.join(self.path, "maintenance{}".format(read_compressed)),
-                sep=self.sep,
-                nrows=nrows,
-            )
-        else:
-            maintenance = None
+        # hazards and maintenance are never read by chunk
+        hazards = self._get_data("hazards", chunksize=None)
+        maintenance = self._get_data("maintenance", chunksize=None)
 
         # put the proper name in order
         order_backend_loads = {el: i for i, el in enumerate(order_backend_loads)}
@@ -723,40 +705,19 @@ class GridStateFromFile(GridValue):
                 prod_v.values[:, self._order_prod_v].astype(dt_float)
             )
 
-        # TODO optimize this piece of code, and the whole laoding process if hazards.csv and maintenance.csv are
-        # provided in the proper format.
         if hazards is not None:
             # hazards and maintenance cannot be computed by chunk. So we need to differenciate their behaviour
             self.hazards = copy.deepcopy(hazards.values[:, self._order_hazards])
-            self.hazard_duration = np.zeros(
-                shape=(self.hazards.shape[0], self.n_line), dtype=dt_int
-            )
-            for line_id in range(self.n_line):
-                self.hazard_duration[:, line_id] = self.get_hazard_duration_1d(
-                    self.hazards[:, line_id]
-                )
+            self.hazard_duration = self.get_hazard_duration_2d(self.hazards)
 
             self.hazards = self.hazards != 0.0
         if maintenance is not None:
             self.maintenance = copy.deepcopy(
                 maintenance.values[:, self._order_maintenance]
             )
-            self.maintenance_time = (
-                np.zeros(shape=(self.maintenance.shape[0], self.n_line), dtype=dt_int)
-                - 1
-            )
-            self.maintenance_duration = np.zeros(
-                shape=(self.maintenance.shape[0], self.n_line), dtype=dt_int
-            )
-
-            # test that with chunk size
-            for line_id in range(self.n_line):
-                self.maintenance_time[:, line_id] = self.get_maintenance_time_1d(
-                    self.maintenance[:, line_id]
-                )
-                self.maintenance_duration[
-                    :, line_id
-                ] = self.get_maintenance_duration_1d(self.maintenance[:, line_id])
+            # computed for all the powerlines at once
+            self.maintenance_time = self.get_maintenance_time_2d(self.maintenance)
+            self.maintenance_duration = self.get_maintenance_duration_2d(self.maintenance)
 
             # there are _maintenance and hazards only if the value in the file is not 0.
             self.maintenance = self.maintenance != 0.0
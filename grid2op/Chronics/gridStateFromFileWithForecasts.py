@@ -8,6 +8,7 @@
 
 import os
 import copy
+from functools import partial
 import numpy as np
 import pandas as pd
 from datetime import timedelta
@@ -21,6 +22,7 @@ from grid2op.Exceptions import (
 )
 from grid2op.Exceptions import ChronicsError
 from grid2op.Chronics.gridStateFromFile import GridStateFromFile
+from grid2op.Chronics._lazyForecasts import _LazyForecasts
 
 
 class GridStateFromFileWithForecasts(GridStateFromFile):
@@ -332,34 +334,71 @@ class GridStateFromFileWithForecasts(GridStateFromFile):
                 self._load_next_chunk_in_memory_forecast()
             except StopIteration as exc_:
                 raise exc_
+        return self._aux_forecasts(self._h_forecast,
+                                   self._nb_forecast,
+                                   self.current_index,
+                                   self.current_datetime,
+                                   self.load_p_forecast,
+                                   self.load_q_forecast,
+                                   self.prod_p_forecast,
+                                   self.prod_v_forecast)
+
+    @staticmethod
+    def _aux_forecasts(h_forecast, nb_forecast, current_index, current_datetime,
+                       load_p_forecast, load_q_forecast, prod_p_forecast, prod_v_forecast):
         res = []
-        for h_id, h in enumerate(self._h_forecast):
+        for h_id, h in enumerate(h_forecast):
             res_d = {}
             dict_ = {}
-            indx_to_look = self._nb_forecast * self.current_index + h_id
-            if self.load_p_forecast is not None:
+            indx_to_look = nb_forecast * current_index + h_id
+            if load_p_forecast is not None:
                 dict_["load_p"] = dt_float(
-                    1.0 * self.load_p_forecast[indx_to_look, :]
+                    1.0 * load_p_forecast[indx_to_look, :]
                 )
-            if self.load_q_forecast is not None:
+            if load_q_forecast is not None:
                 dict_["load_q"] = dt_float(
-                    1.0 * self.load_q_forecast[indx_to_look, :]
+                    1.0 * load_q_forecast[indx_to_look, :]
                 )
-            if self.prod_p_forecast is not None:
+            if prod_p_forecast is not None:
                 dict_["prod_p"] = dt_float(
-                    1.0 * self.prod_p_forecast[indx_to_look, :]
+                    1.0 * prod_p_forecast[indx_to_look, :]
                 )
-            if self.prod_v_forecast is not None:
+            if prod_v_forecast is not None:
                 dict_["prod_v"] = dt_float(
-                    1.0 * self.prod_v_forecast[indx_to_look, :]
+                    1.0 * prod_v_forecast[indx_to_look, :]
                 )
             if dict_:
                 res_d["injection"] = dict_
 
-            forecast_datetime = self.current_datetime + timedelta(minutes=h)
+            forecast_datetime = current_datetime + timedelta(minutes=h)
             res.append((forecast_datetime, res_d))
         return res
 
+    def lazy_forecasts(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        See :func:`grid2op.Chronics.GridValue.lazy_forecasts`. Nothing is copied here: only the position
+        in the time series (and a reference to the forecasts arrays) are stored until the
+        forecasts are needed.
+
+        .. versionadded:: 1.9.5
+        """
+        if type(self).forecasts is not GridStateFromFileWithForecasts.forecasts or not self._data_already_in_mem:
+            # forecasts are computed differently (or the next chunk needs to be read)
+            return super().lazy_forecasts()
+        return _LazyForecasts(fun=partial(self._aux_forecasts,
+                                          self._h_forecast,
+                                          self._nb_forecast,
+                                          self.current_index,
+                                          self.current_datetime,
+                                          self.load_p_forecast,
+                                          self.load_q_forecast,
+                                          self.prod_p_forecast,
+                                          self.prod_v_forecast))
+
     def get_id(self) -> str:
         return self.path
 
@@ -5,6 +5,7 @@
 # you can obtain one at http://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import copy
 import numpy as np
 import warnings
 from datetime import datetime, timedelta
@@ -13,6 +14,57 @@ from abc import ABC, abstractmethod
 from grid2op.dtypes import dt_int
 from grid2op.Space import RandomObject
 from grid2op.Exceptions import EnvError
+from grid2op.Chronics._lazyForecasts import _LazyForecasts
+
+def _get_shallow_state(obj):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    .. versionadded:: 1.9.5
+
+    "Shallow" state of a time series object, see :func:`GridValue._get_state`
+    """
+    attrs = {}
+    nested = {}
+    prngs = {}
+    for attr_nm, attr_val in obj.__dict__.items():
+        if isinstance(attr_val, np.random.RandomState):
+            prngs[attr_nm] = (attr_val, attr_val.get_state())
+        elif isinstance(attr_val, (dict, list)):
+            attrs[attr_nm] = copy.copy(attr_val)
+        elif isinstance(attr_val, RandomObject) and hasattr(attr_val, "_get_state"):
+            # other time series (or handlers) used by this one
+            nested[attr_nm] = (attr_val, attr_val._get_state())
+        else:
+            attrs[attr_nm] = attr_val
+    return attrs, nested, prngs
+
+
+def _set_shallow_state(obj, state):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    .. versionadded:: 1.9.5
+
+    Restore the state returned by :func:`_get_shallow_state`
+    """
+    attrs, nested, prngs = state
+    for attr_nm, attr_val in attrs.items():
+        if isinstance(attr_val, (dict, list)):
+            # the state can be restored multiple times
+            attr_val = copy.copy(attr_val)
+        obj.__dict__[attr_nm] = attr_val
+    for attr_nm, (attr_val, attr_state) in nested.items():
+        attr_val._set_state(attr_state)
+        obj.__dict__[attr_nm] = attr_val
+    for attr_nm, (prng, prng_state) in prngs.items():
+        prng.set_state(prng_state)
+        obj.__dict__[attr_nm] = prng
+
 
 # TODO sous echantillonner ou sur echantilloner les scenario: need to modify everything that affect the number
 # TODO of time steps there, for example "Space.gen_min_time_on" or "params.NB_TIMESTEP_POWERFLOW_ALLOWED" for
@@ -122,6 +174,48 @@ class GridValue(RandomObject, ABC):
     def max_iter(self, value : int):
         self._max_iter = int(value)
     
+    def _get_state(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.snapshot`
+
+        .. versionadded:: 1.9.5
+
+        Returns the state of these time series (*eg* the current time step) such that a call to
+        `self._set_state(state)` puts them back in the exact same state.
+
+        By default, the attributes of this object are "shallow" copied: the data (numpy arrays, pandas
+        dataframes, etc.) are not copied because they are replaced (and not modified inplace) when the
+        time series are read. Only the dictionaries and the lists are copied, the state of the random
+        number generators is stored and the other time series (or handlers) used by this one
+        are treated recursively.
+
+        You need to overload it if your class modifies some of its (mutable) attributes inplace.
+
+        Returns
+        -------
+        state:
+            The state of the time series, to be used by :func:`GridValue._set_state`
+        """
+        return _get_shallow_state(self)
+
+    def _set_state(self, state):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Environment.BaseEnv.restore`
+
+        .. versionadded:: 1.9.5
+
+        Puts back these time series in the state returned by :func:`GridValue._get_state`
+        """
+        _set_shallow_state(self, state)
+
     @abstractmethod
     def initialize(
         self,
@@ -283,24 +377,8 @@ class GridValue(RandomObject, ABC):
 
         """
 
-        res = np.full(maintenance.shape, fill_value=GridValue.NAN_BUT_IN_INT, dtype=dt_int)
-        maintenance = np.concatenate((maintenance, (0, 0)))
-        a = np.diff(maintenance)
-        # +1 is because numpy does the diff `t+1` - `t` so to get index of the initial array
-        # I need to "+1"
-        start = np.where(a == 1)[0] + 1  # start of maintenance
-        end = np.where(a == -1)[0] + 1  # end of maintenance
-        prev_ = 0
-        # it's efficient here as i do a loop only on the number of time there is a maintenance
-        # and maintenance are quite rare
-        for beg_, end_ in zip(start, end):
-            res[prev_:beg_] = list(range(beg_ - prev_, 0, -1))
-            res[beg_:end_] = 0
-            prev_ = end_
-
-        # no maintenance are planned in the forseeable future
-        res[prev_:] = -1
-        return res
+        maintenance = np.asarray(maintenance)
+        return GridValue.get_maintenance_time_2d(maintenance.reshape(-1, 1))[:, 0]
 
     @staticmethod
     def get_maintenance_duration_1d(maintenance):
@@ -357,24 +435,170 @@ class GridValue(RandomObject, ABC):
             assert np.all(maintenance_duration == np.array([3,3,3,3,3,3,2,1,2,2,2,2,2,1,0,0,0]))
 
         """
-        res = np.full(maintenance.shape, fill_value=GridValue.NAN_BUT_IN_INT, dtype=dt_int)
-        maintenance = np.concatenate((maintenance, (0, 0)))
-        a = np.diff(maintenance)
-        # +1 is because numpy does the diff `t+1` - `t` so to get index of the initial array
-        # I need to "+1"
-        start = np.where(a == 1)[0] + 1  # start of maintenance
-        end = np.where(a == -1)[0] + 1  # end of maintenance
-        prev_ = 0
-        # it's efficient here as i do a loop only on the number of time there is a maintenance
-        # and maintenance are quite rare
-        for beg_, end_ in zip(start, end):
-            res[prev_:beg_] = end_ - beg_
-            res[beg_:end_] = list(range(end_ - beg_, 0, -1))
-            prev_ = end_
-
-        # no maintenance are planned in the foreseeable future
-        res[prev_:] = 0
-        return res
+        maintenance = np.asarray(maintenance)
+        return GridValue.get_maintenance_duration_2d(maintenance.reshape(-1, 1))[:, 0]
+
+    @staticmethod
+    def _aux_runs_2d(arr, with_length=True):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Finds the "runs" (consecutive steps with a non zero value) of each column of the 2d array `arr`
+        and computes, for each step `t` of each column:
+
+            - `next_beg - t` where `next_beg` is the first step of the current run (if `arr[t]` is not 0) or of
+              the next one (or of the last run if there are no more run after `t`)
+            - `length` the duration of the current (or next) run, 0 if there are no more run after `t`
+
+        These are piecewise constant, so they are computed with a cumulative sum of their variations, which
+        are non zero only at the end of each run.
+
+        Only the columns with at least one non zero value are considered (given by `active`) and, for
+        performance, all the returned arrays are "transposed" (shape: number of active columns, number of steps).
+        """
+        mask = np.asarray(arr) != 0
+        nb_ts = mask.shape[0]
+        active = mask.any(axis=0)
+        mask = mask.T[active]
+        nb_col = mask.shape[0]
+
+        # start (included) and end (excluded) of each run, sorted by column and then by time
+        # (computed from the position of the non zero values, which are usually sparse)
+        pos = np.flatnonzero(mask)
+        is_beg = np.ones(pos.shape, dtype=bool)
+        is_beg[1:] = (pos[1:] != pos[:-1] + 1) | (pos[1:] % nb_ts == 0)
+        is_end = np.ones(pos.shape, dtype=bool)
+        is_end[:-1] = is_beg[1:]
+        col, beg_t = np.divmod(pos[is_beg], nb_ts)
+        end_t = pos[is_end] % nb_ts + 1
+        first_of_col = np.ones(col.shape, dtype=bool)
+        first_of_col[1:] = col[1:] != col[:-1]
+
+        # values of the previous run of the same column
+        prev_end = np.zeros_like(end_t)
+        prev_end[1:] = end_t[:-1]
+        prev_end[first_of_col] = 0
+        prev_beg = np.zeros_like(beg_t)
+        prev_beg[1:] = beg_t[:-1]
+        prev_beg[first_of_col] = 0
+
+        delta = np.zeros((nb_col, nb_ts + 1), dtype=dt_int)
+        delta[col, prev_end] = beg_t - prev_beg
+        next_beg = np.cumsum(delta[:, :nb_ts], axis=1, dtype=dt_int)
+        next_beg -= np.arange(nb_ts, dtype=dt_int)
+
+        length = None
+        if with_length:
+            run_length = end_t - beg_t
+            prev_length = np.zeros_like(run_length)
+            prev_length[1:] = run_length[:-1]
+            prev_length[first_of_col] = 0
+            last_of_col = np.ones(col.shape, dtype=bool)
+            last_of_col[:-1] = first_of_col[1:]
+            delta[:] = 0
+            delta[col, prev_end] = run_length - prev_length
+            delta[col[last_of_col], end_t[last_of_col]] = -run_length[last_of_col]
+            length = np.cumsum(delta[:, :nb_ts], axis=1, dtype=dt_int)
+        return active, mask, next_beg, length
+
+    @staticmethod
+    def _aux_expand_2d(res_active, active, fill_value):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Put back the results computed for the "active" columns only (see :func:`GridValue._aux_runs_2d`) in
+        the full array (with shape: number of steps, number of columns), the other columns being
+        filled with `fill_value`
+        """
+        if not active.all():
+            res = np.full((active.shape[0], res_active.shape[1]), fill_value=fill_value, dtype=dt_int)
+            res[active] = res_active
+            res_active = res
+        return np.ascontiguousarray(res_active.T)
+
+    @staticmethod
+    def get_maintenance_time_2d(maintenance):
+        """
+        Same as :func:`GridValue.get_maintenance_time_1d` but for all the powerlines at once.
+
+        It computes the time series of the "next maintenance time" (see :attr:`GridValue.maintenance_time`)
+        without any python loop.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        maintenance: ``numpy.ndarray``
+            2 dimensional array (shape: number of steps, number of powerlines) representing the time series of the
+            maintenance (0 there is no maintenance, any other value there is a maintenance at this time step)
+
+        Returns
+        -------
+        maintenance_time: ``numpy.ndarray``
+            2 dimensional array (same shape as `maintenance`) representing the number of steps before the next
+            maintenance (0 if a maintenance is being performed, -1 if none is planned)
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            maintenance = np.array([[0, 0], [1, 0], [1, 0], [0, 0], [0, 1]])
+            maintenance_time = GridValue.get_maintenance_time_2d(maintenance)
+            assert np.all(maintenance_time == np.array([[1, 4], [0, 3], [0, 2], [-1, 1], [-1, 0]]))
+
+        """
+        active, maintenance, res, _ = GridValue._aux_runs_2d(maintenance, with_length=False)
+        # after the last maintenance `next_beg - t` is < 0: no maintenance are planned in the forseeable future
+        np.maximum(res, -1, out=res)
+        res[maintenance] = 0
+        return GridValue._aux_expand_2d(res, active, fill_value=-1)
+
+    @staticmethod
+    def get_maintenance_duration_2d(maintenance):
+        """
+        Same as :func:`GridValue.get_maintenance_duration_1d` but for all the powerlines at once.
+
+        It computes the time series of the "next maintenance duration" (see :attr:`GridValue.maintenance_duration`)
+        without any python loop.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        maintenance: ``numpy.ndarray``
+            2 dimensional array (shape: number of steps, number of powerlines) representing the time series of the
+            maintenance (0 there is no maintenance, any other value there is a maintenance at this time step)
+
+        Returns
+        -------
+        maintenance_duration: ``numpy.ndarray``
+            2 dimensional array (same shape as `maintenance`) representing the duration of the next
+            maintenance forseeable.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            maintenance = np.array([[0, 0], [1, 0], [1, 0], [0, 0], [0, 1]])
+            maintenance_duration = GridValue.get_maintenance_duration_2d(maintenance)
+            assert np.all(maintenance_duration == np.array([[2, 1], [2, 1], [1, 1], [0, 1], [0, 1]]))
+
+        """
+        active, maintenance, next_beg, res = GridValue._aux_runs_2d(maintenance)
+        # during a maintenance, the remaining duration is `length - (t - next_beg)`
+        next_beg *= maintenance
+        res += next_beg
+        return GridValue._aux_expand_2d(res, active, fill_value=0)
 
     @staticmethod
     def get_hazard_duration_1d(hazard):
@@ -435,24 +659,45 @@ class GridValue(RandomObject, ABC):
 
         """
 
-        res = np.full(hazard.shape, fill_value=GridValue.NAN_BUT_IN_INT, dtype=dt_int)
-        hazard = np.concatenate((hazard, (0, 0)))
-        a = np.diff(hazard)
-        # +1 is because numpy does the diff `t+1` - `t` so to get index of the initial array
-        # I need to "+1"
-        start = np.where(a == 1)[0] + 1  # start of maintenance
-        end = np.where(a == -1)[0] + 1  # end of maintenance
-        prev_ = 0
-        # it's efficient here as i do a loop only on the number of time there is a maintenance
-        # and maintenance are quite rare
-        for beg_, end_ in zip(start, end):
-            res[prev_:beg_] = 0
-            res[(beg_):(end_)] = list(range(end_ - beg_, 0, -1))
-            prev_ = end_
+        hazard = np.asarray(hazard)
+        return GridValue.get_hazard_duration_2d(hazard.reshape(-1, 1))[:, 0]
 
-        # no maintenance are planned in the forseeable future
-        res[prev_:] = 0
-        return res
+    @staticmethod
+    def get_hazard_duration_2d(hazard):
+        """
+        Same as :func:`GridValue.get_hazard_duration_1d` but for all the powerlines at once.
+
+        It computes the time series of the "hazard duration" (see :attr:`GridValue.hazard_duration`)
+        without any python loop.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        hazard: ``numpy.ndarray``
+            2 dimensional array (shape: number of steps, number of powerlines) representing the time series of the
+            hazards (0 there is no hazard, any other value there is a hazard at this time step)
+
+        Returns
+        -------
+        hazard_duration: ``numpy.ndarray``
+            2 dimensional array (same shape as `hazard`) representing the remaining duration of the hazards.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            hazard = np.array([[0, 0], [1, 0], [1, 0], [0, 0], [0, 1]])
+            hazard_duration = GridValue.get_hazard_duration_2d(hazard)
+            assert np.all(hazard_duration == np.array([[0, 0], [2, 0], [1, 0], [0, 0], [0, 1]]))
+
+        """
+        active, hazard, res, length = GridValue._aux_runs_2d(hazard)
+        # remaining duration of the current hazard (`length - (t - next_beg)`), 0 if there are none
+        res += length
+        res *= hazard
+        return GridValue._aux_expand_2d(res, active, fill_value=0)
 
     @abstractmethod
     def load_next(self):
@@ -580,6 +825,32 @@ class GridValue(RandomObject, ABC):
         """
         return []
 
+    def lazy_forecasts(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Used by the environment to give the forecasts to the observation
+
+        Returns a "handle" to the forecasts of the current step: calling it returns the same thing as
+        :func:`GridValue.forecasts` would return now, even if it is called once the time series moved
+        to another step.
+
+        By default the forecasts are computed when this function is called. Classes for which computing
+        the forecasts is costly can overload it so that nothing is copied or converted until
+        the forecasts are really needed (*eg* when `obs.simulate` is called).
+
+        .. versionadded:: 1.9.5
+
+        Returns
+        -------
+        res: ``callable``
+            A function (without argument) returning the forecasts of the current step
+
+        """
+        return _LazyForecasts(value=self.forecasts())
+
     @abstractmethod
     def next_chronics(self):
         """
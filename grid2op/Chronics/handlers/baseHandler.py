@@ -11,6 +11,7 @@ import os
 import numpy as np
 from typing import Optional, Tuple
 from grid2op.Space import RandomObject
+from grid2op.Chronics.gridValue import _get_shallow_state, _set_shallow_state
 from datetime import timedelta, datetime
 
 
@@ -479,3 +480,28 @@ class BaseHandler(RandomObject):
         end of each episode when the next episode is loaded.
         """
         return None
+
+    def _get_state(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+            
+        .. versionadded:: 1.9.5
+
+        Returns the state of this handler (*eg* the current time step), see
+        :func:`grid2op.Chronics.GridValue._get_state` for more information.
+        """
+        return _get_shallow_state(self)
+
+    def _set_state(self, state):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+            
+        .. versionadded:: 1.9.5
+
+        Puts back this handler in the state returned by :func:`BaseHandler._get_state`
+        """
+        _set_shallow_state(self, state)
@@ -59,24 +59,9 @@ class CSVMaintenanceHandler(CSVHandler):
     
     def _init_attrs(self, array):
         super()._init_attrs(array)
-        n_line = self.array.shape[1]
-        
-        self.maintenance_time = (
-            np.zeros(shape=(self.array.shape[0], n_line), dtype=dt_int)
-            - 1
-        )
-        self.maintenance_duration = np.zeros(
-            shape=(self.array.shape[0], n_line), dtype=dt_int
-        )
-
-        # test that with chunk size
-        for line_id in range(n_line):
-            self.maintenance_time[:, line_id] = GridValue.get_maintenance_time_1d(
-                self.array[:, line_id]
-            )
-            self.maintenance_duration[
-                :, line_id
-            ] = GridValue.get_maintenance_duration_1d(self.array[:, line_id])
+        # computed for all the powerlines at once
+        self.maintenance_time = GridValue.get_maintenance_time_2d(self.array)
+        self.maintenance_duration = GridValue.get_maintenance_duration_2d(self.array)
 
         # there are _maintenance and hazards only if the value in the file is not 0.
         self.array = self.array != 0.0
@@ -489,6 +489,18 @@ class Multifolder(GridValue):
         """
         return self.data.forecasts()
 
+    def lazy_forecasts(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        See :func:`GridValue.lazy_forecasts`
+
+        .. versionadded:: 1.9.5
+        """
+        return self.data.lazy_forecasts()
+
     def tell_id(self, id_num, previous=False):
         """
         This tells this chronics to load for the next episode.
@@ -5,6 +5,14 @@
 # you can obtain one at http://mozilla.org/MPL/2.0/.
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+import os
+import re
+import copy
+import pickle
+import shutil
+import hashlib
+import tempfile
+from multiprocessing import Pool
 import numpy as np
 from datetime import timedelta, datetime
 
@@ -14,6 +22,124 @@ from grid2op.Chronics.gridStateFromFile import GridStateFromFile
 from grid2op.Exceptions import ChronicsError
 
 
+def _aux_cache_entry(cache_dir, path, key_elements, seed):
+    """compute the name of the directory in which a scenario is stored in the disk cache.
+
+    The data of a scenario are stored in `content_dir` (that depends on the content of the folder of the
+    scenario - name, size and last modification time of each file - so that the cache is invalidated
+    when one of the source file is modified - and on `key_elements`) in the sub directory
+    `entry` that depends on the seed (if the data depend on it).
+    """
+    path = os.path.abspath(path)
+    hash_path = hashlib.sha256(path.encode("utf-8")).hexdigest()[:8]
+    hash_key = hashlib.sha256()
+    hash_key.update(path.encode("utf-8"))
+    for fn in sorted(os.listdir(path)):
+        full_fn = os.path.join(path, fn)
+        if not os.path.isfile(full_fn):
+            continue
+        stat_ = os.stat(full_fn)
+        hash_key.update(f"{fn}:{stat_.st_size}:{stat_.st_mtime_ns}".encode("utf-8"))
+    hash_key.update(repr(key_elements).encode("utf-8"))
+    prefix = f"{os.path.basename(path)}_{hash_path}_"
+    content_dir = prefix + hash_key.hexdigest()[:16]
+    entry = os.path.join(content_dir, f"seed_{seed}" if seed is not None else "data")
+    return prefix, content_dir, entry
+
+
+def _aux_save_in_cache(data, cache_dir, prefix, content_dir, entry):
+    """save the initialized `data` in the cache: one ".npy" per numpy array and a pickle for the other attributes"""
+    os.makedirs(os.path.join(cache_dir, content_dir), exist_ok=True)
+    tmp_dir = tempfile.mkdtemp(dir=os.path.join(cache_dir, content_dir), prefix=".tmp_")
+    try:
+        arrays = {}
+        for attr_nm, attr in vars(data).items():
+            if isinstance(attr, np.ndarray) and attr.dtype != object:
+                arrays[attr_nm] = attr
+        data_no_array = copy.copy(data)
+        for attr_nm, attr in arrays.items():
+            np.save(os.path.join(tmp_dir, f"{attr_nm}.npy"), attr)
+            setattr(data_no_array, attr_nm, None)
+        with open(os.path.join(tmp_dir, "data.pickle"), "wb") as f:
+            pickle.dump({"data": data_no_array, "arrays": sorted(arrays.keys())}, f)
+        try:
+            os.rename(tmp_dir, os.path.join(cache_dir, entry))
+        except OSError:
+            # another process already stored this scenario
+            pass
+    finally:
+        if os.path.exists(tmp_dir):
+            shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    # remove the outdated versions of this scenario (the ones for which the files have been modified, the
+    # data stored for the other seeds are kept)
+    for el in os.listdir(cache_dir):
+        if el != content_dir and re.match(f"{re.escape(prefix)}[0-9a-f]{{16}}$", el) is not None:
+            shutil.rmtree(os.path.join(cache_dir, el), ignore_errors=True)
+
+
+def _aux_load_from_cache(cache_dir, entry):
+    """load a scenario stored in the cache, numpy arrays are memory mapped (read only). It returns ``None``
+    if the scenario is not (or not entirely) in the cache, for example if it has been removed by another process"""
+    entry_dir = os.path.join(cache_dir, entry)
+    try:
+        with open(os.path.join(entry_dir, "data.pickle"), "rb") as f:
+            tmp = pickle.load(f)
+        data = tmp["data"]
+        for attr_nm in tmp["arrays"]:
+            setattr(data, attr_nm, np.load(os.path.join(entry_dir, f"{attr_nm}.npy"), mmap_mode="r"))
+    except (FileNotFoundError, EOFError):
+        return None
+    return data
+
+
+def _aux_load_scenario(gridvalueClass, path, time_interval, sep, max_iter,
+                       seed, init_args, cache_dir=None, send_data=True):
+    """read and initialize one scenario, possibly using the disk cache (this is out of the class
+    to be usable in a process pool)"""
+    if cache_dir is not None:
+        # numpy arrays are converted to list to have their full representation
+        key_elements = (f"{gridvalueClass.__module__}.{gridvalueClass.__qualname__}",
+                        time_interval, sep, max_iter,
+                        [el.tolist() if isinstance(el, np.ndarray) else el for el in init_args])
+        # the seed is only used if the data depend on it
+        seed_key = seed if getattr(gridvalueClass, "_INIT_USES_SEED", True) else None
+        prefix, content_dir, entry = _aux_cache_entry(cache_dir, path, key_elements, seed_key)
+        data = None
+        if os.path.exists(os.path.join(cache_dir, entry)):
+            if not send_data:
+                # the data will be loaded (memory mapped) by the caller
+                return None
+            data = _aux_load_from_cache(cache_dir, entry)
+        if data is None:
+            data = _aux_load_scenario(gridvalueClass, path, time_interval, sep, max_iter,
+                                      seed, init_args)
+            _aux_save_in_cache(data, cache_dir, prefix, content_dir, entry)
+            if not send_data:
+                return None
+            # use the memory mapped version if possible
+            data_cache = _aux_load_from_cache(cache_dir, entry)
+            if data_cache is not None:
+                data = data_cache
+        return data
+
+    data = gridvalueClass(
+        time_interval=time_interval,
+        sep=sep,
+        path=path,
+        max_iter=max_iter,
+        chunk_size=None,
+    )
+    if seed is not None:
+        data.seed(seed)
+    data.initialize(*init_args)
+    return data
+
+
+def _aux_load_scenario_star(args):
+    return _aux_load_scenario(*args)
+
+
 class MultifolderWithCache(Multifolder):
     """
     This class is a particular type of :class:`Multifolder` that, instead of reading is all from disk each time
@@ -58,6 +184,21 @@ class MultifolderWithCache(Multifolder):
         2) load the data in memory: `env.chronics_handler.reset()`
         3) do whatever you want using `env`
     
+    .. versionadded:: 1.9.5
+        The scenarios can be read in parallel (with `nb_process` > 1) and / or stored in a cache 
+        on the hard drive (with `cache_dir`), see the examples below.
+    
+    When a `cache_dir` is provided, each scenario is read from the csv files only once and stored in
+    this directory (one ".npy" file per numpy array). Later calls to `env.chronics_handler.reset()` (in this 
+    process, in a later run of your program or in another process, for example the other environments
+    of a :class:`grid2op.Environment.MultiEnvironment`) load them from this directory using
+    memory mapping: data are then not duplicated in memory among different processes. 
+    A scenario is read from the csv files again (and the cache is updated) if any file of its directory 
+    is modified. When the data randomly generated when the scenario is initialized (for example
+    the maintenance with :class:`GridStateFromFileWithForecastsWithMaintenance`) depend on the seed,
+    the data of each seed are stored separately. This means that if no seed is set, the data randomly generated
+    the first time are the ones stored in the cache.
+    
     Examples
     ---------
     This is how this class can be used:
@@ -85,6 +226,18 @@ class MultifolderWithCache(Multifolder):
             act = my_agent.act(obs, reward, done)
             obs, reward, done, info = env.step(act)  # and step will NOT load any data from disk.
 
+    To read the scenarios with 4 processes and to store them in a cache on the hard drive, you can do:
+
+    .. code-block:: python
+
+        from grid2op import make
+        from grid2op.Chronics import MultifolderWithCache
+        env = make(...,
+                   chronics_class=MultifolderWithCache,
+                   data_feeding_kwargs={"cache_dir": "/path/to/a/cache/directory",
+                                        "nb_process": 4})
+        env.chronics_handler.reset()
+
     """
     MULTI_CHRONICS = True
     ERROR_MSG_NOT_LOADED = ("We detected a misusage of the `MultifolderWithCache` class: the cache "
@@ -104,6 +257,8 @@ class MultifolderWithCache(Multifolder):
         max_iter=-1,
         chunk_size=None,
         filter_func=None,
+        cache_dir=None,
+        nb_process=1,
         **kwargs,
     ):
         
@@ -140,6 +295,10 @@ class MultifolderWithCache(Multifolder):
         )
         self._cached_data = None
         self.cache_size = 0
+        self.cache_dir = os.path.abspath(cache_dir) if cache_dir is not None else None
+        self.nb_process = int(nb_process)
+        if self.nb_process <= 0:
+            raise ChronicsError("MultifolderWithCache: you need at least 1 process to load the data.")
         if not issubclass(self.gridvalueClass, GridStateFromFile):
             raise RuntimeError(
                 'MultifolderWithCache does not work when "gridvalueClass" does not inherit from '
@@ -177,27 +336,44 @@ class MultifolderWithCache(Multifolder):
         super().reset()
         self.cache_size = 0
         max_int = np.iinfo(dt_int).max
+        init_args = (
+            self._order_backend_loads,
+            self._order_backend_prods,
+            self._order_backend_lines,
+            self._order_backend_subs,
+            self._names_chronics_to_backend,
+        )
+        if self.cache_dir is not None:
+            os.makedirs(self.cache_dir, exist_ok=True)
+        # everything in "_order" need to be put in cache
+        # (seeds are drawn in this order, regardless of the number of process used)
+        all_args = []
         for i in self._order:
-            # everything in "_order" need to be put in cache
-            path = self.subpaths[i]
-            data = self.gridvalueClass(
-                time_interval=self.time_interval,
-                sep=self.sep,
-                path=path,
-                max_iter=self.max_iter,
-                chunk_size=None,
-            )
+            seed_chronics = None
             if self.seed_used is not None:
                 seed_chronics = self.space_prng.randint(max_int)
-                data.seed(seed_chronics)
-
-            data.initialize(
-                self._order_backend_loads,
-                self._order_backend_prods,
-                self._order_backend_lines,
-                self._order_backend_subs,
-                self._names_chronics_to_backend,
-            )
+            all_args.append((self.gridvalueClass,
+                             self.subpaths[i],
+                             self.time_interval,
+                             self.sep,
+                             self.max_iter,
+                             seed_chronics,
+                             init_args,
+                             self.cache_dir))
+
+        if self.nb_process > 1 and len(all_args) > 1:
+            # scenarios are read in parallel, when there is a cache on the disk 
+            # the processes only write it, it is then memory mapped by this process
+            all_args_pool = [(*el, self.cache_dir is None) for el in all_args]
+            with Pool(min(self.nb_process, len(all_args))) as p:
+                all_data = p.map(_aux_load_scenario_star, all_args_pool)
+            if self.cache_dir is not None:
+                # read from the cache (or read again from the csv if it has been removed meanwhile)
+                all_data = [_aux_load_scenario(*el) for el in all_args]
+        else:
+            all_data = [_aux_load_scenario(*el) for el in all_args]
+
+        for i, data in zip(self._order, all_data):
             self._cached_data[i] = data
             self.cache_size += 1
 
@@ -291,4 +467,8 @@ class MultifolderWithCache(Multifolder):
         dict_["_DONTUSE_nb_reset_called"] = self.__nb_reset_called
         dict_["_DONTUSE_nb_step_called"] = self.__nb_step_called
         dict_["_DONTUSE_nb_init_called"] = self.__nb_init_called
+        if self.cache_dir is not None:
+            dict_["cache_dir"] = self.cache_dir
+        if self.nb_process != 1:
+            dict_["nb_process"] = self.nb_process
         return super().get_kwargs(dict_)
@@ -10,7 +10,7 @@ import numpy as np
 import copy
 import warnings
 
-from grid2op.dtypes import dt_float, dt_int
+from grid2op.dtypes import dt_float, dt_int, dt_bool
 from grid2op.Backend import Backend
 from grid2op.Exceptions import Grid2OpException, BackendError
 
@@ -664,6 +664,11 @@ class BackendConverter(Backend):
         )  # not sure why, but it looks to work this way
         self.target_backend._disconnect_line(id_target)
 
+    def _disconnect_lines(self, mask):
+        mask_target = np.full(self.target_backend.n_line, fill_value=False, dtype=dt_bool)
+        mask_target[self._line_tg2sr[mask].astype(dt_int)] = True
+        self.target_backend._disconnect_lines(mask_target)
+
     def _transform_action(self, source_action):
         # transform the source action into the target backend action
         # source_action: a backend action!
@@ -6,11 +6,16 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 import os
+import json
+import hashlib
 import numpy as np
 from collections import OrderedDict
 
 from grid2op.Action import BaseAction
 from grid2op.Converter.Converters import Converter
+from grid2op.Converter._actionTable import (_ActionTable,
+                                            _get_all_unitary_topologies_set,
+                                            _get_all_unitary_topologies_change)
 from grid2op.Exceptions.Grid2OpException import Grid2OpException
 from grid2op.dtypes import dt_float, dt_int, int_types
 
@@ -65,8 +70,27 @@ class IdToAct(Converter):
     more than N = 15 or 16 elements, the amount of actions (for this substation alone) will be higher than 16.000
     which makes it rather difficult to handle for most machine learning algorithm. Be carefull with that !
 
+    .. versionchanged:: 1.9.5
+        When built from scratch (or loaded from vectors) the actions are no longer stored as
+        :class:`grid2op.Action.BaseAction` objects but as a sparse matrix (each row only stores what differs
+        from the "do nothing" action). The action `i` is only created when `converter.all_actions[i]`
+        (or `converter.convert_act(i)`) is called. The (exponential) enumeration of the topologies is
+        also vectorized and the resulting table can be cached on the hard drive (see the `cache_dir` argument of
+        :func:`IdToAct.init_converter`).
+
     """
 
+    # (name of the attribute in the action, key word argument of `init_converter`, function to build them)
+    _ACTION_FAMILIES = [
+        ("_set_line_status", "set_line_status", "get_all_unitary_line_set"),
+        ("_switch_line_status", "change_line_status", "get_all_unitary_line_change"),
+        ("_set_topo_vect", "set_topo_vect", _get_all_unitary_topologies_set),
+        ("_change_bus_vect", "change_bus_vect", _get_all_unitary_topologies_change),
+        ("_redispatch", "redispatch", "get_all_unitary_redispatch"),
+        ("_curtail", "curtail", "get_all_unitary_curtail"),
+        ("_storage_power", "storage", "get_all_unitary_storage"),
+    ]
+
     def __init__(self, action_space):
         Converter.__init__(self, action_space)
         self.__class__ = IdToAct.init_grid(action_space)
@@ -77,7 +101,7 @@ class IdToAct(Converter):
         self._init_size = action_space.size()
         self.kwargs_init = {}
 
-    def init_converter(self, all_actions=None, **kwargs):
+    def init_converter(self, all_actions=None, cache_dir=None, **kwargs):
         """
         This function is used to initialized the converter. When the converter is created, this method should be called
         otherwise the converter might be in an unstable state.
@@ -100,6 +124,15 @@ class IdToAct(Converter):
                   provide the full path, including the filename and its extension. It gives something like:
                   "/path/where/it/is/saved/action_space_vect.npy"
 
+        cache_dir: ``str``, optional
+            Only used if `all_actions` is ``None``. If provided, the table of all the actions is stored in this
+            directory (the first time) and reloaded from it (memory mapped) the next times a converter is built
+            for the same grid, the same action class and the same key word arguments. This allows to share the
+            (possibly large) table between different processes (*eg* the workers of a runner) without building
+            it again.
+
+            .. versionadded:: 1.9.5
+
         kwargs:
             other keyword arguments (all considered to be ``True`` by default) that can be:
 
@@ -169,64 +202,10 @@ class IdToAct(Converter):
         """
         self.kwargs_init = kwargs
         if all_actions is None:
-            self.all_actions = []
-            # add the do nothing action, always
-            self.all_actions.append(super().__call__())
-            if "_set_line_status" in self._template_act.attr_list_vect:
-                # lines 'set'
-                include_ = True
-                if "set_line_status" in kwargs:
-                    include_ = kwargs["set_line_status"]
-                if include_:
-                    self.all_actions += self.get_all_unitary_line_set(self)
-
-            if "_switch_line_status" in self._template_act.attr_list_vect:
-                # lines 'change'
-                include_ = True
-                if "change_line_status" in kwargs:
-                    include_ = kwargs["change_line_status"]
-                if include_:
-                    self.all_actions += self.get_all_unitary_line_change(self)
-
-            if "_set_topo_vect" in self._template_act.attr_list_vect:
-                # topologies 'set'
-                include_ = True
-                if "set_topo_vect" in kwargs:
-                    include_ = kwargs["set_topo_vect"]
-                if include_:
-                    self.all_actions += self.get_all_unitary_topologies_set(self)
-
-            if "_change_bus_vect" in self._template_act.attr_list_vect:
-                # topologies 'change'
-                include_ = True
-                if "change_bus_vect" in kwargs:
-                    include_ = kwargs["change_bus_vect"]
-                if include_:
-                    self.all_actions += self.get_all_unitary_topologies_change(self)
-
-            if "_redispatch" in self._template_act.attr_list_vect:
-                # redispatch (transformed to discrete variables)
-                include_ = True
-                if "redispatch" in kwargs:
-                    include_ = kwargs["redispatch"]
-                if include_:
-                    self.all_actions += self.get_all_unitary_redispatch(self)
-
-            if "_curtail" in self._template_act.attr_list_vect:
-                # redispatch (transformed to discrete variables)
-                include_ = True
-                if "curtail" in kwargs:
-                    include_ = kwargs["curtail"]
-                if include_:
-                    self.all_actions += self.get_all_unitary_curtail(self)
-
-            if "_storage_power" in self._template_act.attr_list_vect:
-                # redispatch (transformed to discrete variables)
-                include_ = True
-                if "storage" in kwargs:
-                    include_ = kwargs["storage"]
-                if include_:
-                    self.all_actions += self.get_all_unitary_storage(self)
+            if cache_dir is not None:
+                self.all_actions = self._aux_get_cached_table(cache_dir, kwargs)
+            else:
+                self.all_actions = self._aux_build_table(kwargs)
 
         elif isinstance(all_actions, str):
             # load the path from the path provided
@@ -236,16 +215,14 @@ class IdToAct(Converter):
                     "".format(all_actions)
                 )
             try:
-                all_act = np.load(all_actions)
+                all_act = np.load(all_actions, mmap_mode="r")
             except Exception as e:
                 raise RuntimeError(
                     'Impossible to load the data located at "{}" with error\n{}.'
                     "".format(all_actions, e)
                 )
             try:
-                self.all_actions = np.array([self.__call__() for _ in all_act])
-                for i, el in enumerate(all_act):
-                    self.all_actions[i].from_vect(el)
+                self.all_actions = self._aux_table_from_vects(all_act)
             except Exception as e:
                 raise RuntimeError(
                     'Impossible to convert the data located at "{}" into valid grid2op action. '
@@ -259,22 +236,67 @@ class IdToAct(Converter):
                 self.all_actions = np.array(all_actions)
             elif isinstance(possible_act, dict):
                 # list of dictionnary (obtained with `act.as_serializable_dict()`)
-                self.all_actions = np.array([self.__call__(el) for el in all_actions])
+                self.all_actions = _ActionTable.from_actions(self,
+                                                             [self.__call__(el) for el in all_actions],
+                                                             self._aux_template_vect())
             else:
                 # should be an array !
                 try:
-                    self.all_actions = np.array([self.__call__() for _ in all_actions])
-                    for i, el in enumerate(all_actions):
-                        self.all_actions[i].from_vect(el)
+                    self.all_actions = self._aux_table_from_vects(np.asarray(all_actions))
                 except Exception as exc_:
                     raise Grid2OpException(
                         'Impossible to convert the data provided in "all_actions" into valid '
-                        "grid2op action. The error was:\n{}".format(e)
+                        "grid2op action. The error was:\n{}".format(exc_)
                     ) from exc_
         else:
             raise RuntimeError("Impossible to load the action provided.")
         self.n = len(self.all_actions)
 
+    def _aux_template_vect(self):
+        """vector representation of the "do nothing" action"""
+        return self.__call__().to_vect().astype(dt_float)
+
+    def _aux_table_from_vects(self, vects):
+        """build the table of actions from their vector representation (one action per row)"""
+        if len(vects.shape) != 2 or vects.shape[1] != self._init_size:
+            raise Grid2OpException(f"The actions should be represented by a matrix with {self._init_size} "
+                                   f"columns, you provided an array of shape {vects.shape}")
+        return _ActionTable.from_vects(self, vects, self._aux_template_vect())
+
+    def _aux_build_table(self, kwargs):
+        """build the table of all the unary actions (see :func:`IdToAct.init_converter`)"""
+        template = self._aux_template_vect()
+        # add the do nothing action, always
+        li_tables = [_ActionTable.from_vects(self, template.reshape(1, -1), template)]
+        for attr_nm, kwarg_nm, fun_ in self._ACTION_FAMILIES:
+            if attr_nm not in self._template_act.attr_list_vect:
+                continue
+            include_ = True
+            if kwarg_nm in kwargs:
+                include_ = kwargs[kwarg_nm]
+            if not include_:
+                continue
+            if isinstance(fun_, str):
+                li_tables.append(_ActionTable.from_actions(self, getattr(self, fun_)(self), template))
+            else:
+                # vectorized enumeration
+                li_tables.append(fun_(self, template))
+        return _ActionTable.concatenate(self, li_tables, template)
+
+    def _aux_get_cached_table(self, cache_dir, kwargs):
+        """load the table of all the unary actions from `cache_dir` (it is built and saved there if needed)"""
+        import grid2op
+        key = {"space": self.cls_to_dict(),
+               "attr_list_vect": list(self._template_act.attr_list_vect),
+               "kwargs": {kwarg_nm: bool(kwargs.get(kwarg_nm, True)) for _, kwarg_nm, _ in self._ACTION_FAMILIES},
+               "version": grid2op.__version__}
+        hash_ = hashlib.sha256(json.dumps(key, sort_keys=True, default=str).encode("utf-8")).hexdigest()
+        path_table = os.path.join(cache_dir, f"IdToAct_{hash_}")
+        if not os.path.exists(path_table):
+            os.makedirs(cache_dir, exist_ok=True)
+            self._aux_build_table(kwargs).save(path_table)
+        return _ActionTable.load(self, path_table)
+
     def filter_action(self, filtering_fun):
         """
         This function allows you to "easily" filter generated actions.
@@ -289,9 +311,13 @@ class IdToAct(Converter):
             ``False`` meaning "this action will be dropped.
 
         """
-        self.all_actions = np.array(
-            [el for el in self.all_actions if filtering_fun(el)]
-        )
+        if isinstance(self.all_actions, _ActionTable):
+            to_keep = np.array([filtering_fun(el) for el in self.all_actions], dtype=bool)
+            self.all_actions = self.all_actions[to_keep]
+        else:
+            self.all_actions = np.array(
+                [el for el in self.all_actions if filtering_fun(el)]
+            )
         self.n = len(self.all_actions)
 
     def save(self, path, name="action_space_vect.npy"):
@@ -351,11 +377,14 @@ class IdToAct(Converter):
                 'The path to save the action space provided "{}" is not a directory.'
                 "".format(path)
             )
-        saved_npy = (
-            np.array([el.to_vect() for el in self.all_actions])
-            .astype(dtype=dt_float)
-            .reshape(self.n, -1)
-        )
+        if isinstance(self.all_actions, _ActionTable):
+            saved_npy = self.all_actions.to_dense().astype(dtype=dt_float)
+        else:
+            saved_npy = (
+                np.array([el.to_vect() for el in self.all_actions])
+                .astype(dtype=dt_float)
+                .reshape(self.n, -1)
+            )
         np.save(file=os.path.join(path, name), arr=saved_npy)
 
     def sample(self):
@@ -0,0 +1,266 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import shutil
+import operator
+import tempfile
+import numpy as np
+
+from grid2op.dtypes import dt_float, dt_int
+
+
+class _ActionTable(object):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    Table of actions used by the :class:`grid2op.Converter.IdToAct` converter.
+
+    Actions are not stored as :class:`grid2op.Action.BaseAction` objects but as a sparse matrix (in the "CSR" format):
+    the row `i` stores the components of the vector representation (see `act.to_vect()`) of the action `i`
+    that differ from the vector representation of the "do nothing" action (`template`).
+
+    Actions are built (from their row) only when they are accessed (`table[i]`).
+
+    .. versionadded:: 1.9.5
+
+    """
+    # files used to store the table on the hard drive
+    TEMPLATE = "template.npy"
+    INDPTR = "indptr.npy"
+    INDICES = "indices.npy"
+    DATA = "data.npy"
+
+    # number of rows processed at once when converting dense vectors
+    CHUNK_SIZE = 4096
+
+    def __init__(self, action_space, template, indptr, indices, data):
+        self._action_space = action_space
+        self.template = template
+        self.indptr = indptr
+        self.indices = indices
+        self.data = data
+
+    def __len__(self):
+        return self.indptr.shape[0] - 1
+
+    def __getitem__(self, item):
+        if not isinstance(item, slice) and np.ndim(item) == 0:
+            # python or numpy integers, 0-d arrays (eg the output of `np.argmax`)
+            nb_row = len(self)
+            row_id = operator.index(item)
+            if row_id < 0:
+                row_id += nb_row
+            if row_id < 0 or row_id >= nb_row:
+                raise IndexError(f"action index {item} is out of range (there are {nb_row} actions)")
+            return self.build_action(row_id)
+        # slices, masks or list of ids: returns another table
+        return self.select(np.arange(len(self))[item])
+
+    def __iter__(self):
+        for row_id in range(len(self)):
+            yield self.build_action(row_id)
+
+    def get_vect(self, row_id):
+        """vector representation of the action at row `row_id`"""
+        res = self.template.copy()
+        beg_, end_ = self.indptr[row_id], self.indptr[row_id + 1]
+        res[self.indices[beg_:end_]] = self.data[beg_:end_]
+        return res
+
+    def build_action(self, row_id):
+        """build the action stored at row `row_id`"""
+        res = self._action_space()
+        res.from_vect(self.get_vect(row_id))
+        return res
+
+    def to_dense(self):
+        """vector representation of all the actions (one action per row)"""
+        nb_row = len(self)
+        res = np.tile(self.template, (nb_row, 1))
+        rows = np.repeat(np.arange(nb_row), np.diff(self.indptr))
+        res[rows, self.indices] = self.data
+        return res
+
+    def select(self, row_ids):
+        """the table made of the rows `row_ids` of this table"""
+        row_ids = np.asarray(row_ids, dtype=np.int64)
+        beg_ = self.indptr[row_ids]
+        nb_el = self.indptr[row_ids + 1] - beg_
+        indptr = np.zeros(row_ids.shape[0] + 1, dtype=np.int64)
+        np.cumsum(nb_el, out=indptr[1:])
+        pos = np.repeat(beg_ - indptr[:-1], nb_el) + np.arange(indptr[-1])
+        return _ActionTable(self._action_space, self.template, indptr, self.indices[pos], self.data[pos])
+
+    @staticmethod
+    def _aux_diff(vects, template):
+        """position (row, col) of the components of `vects` that are different from `template`"""
+        is_diff = vects != template
+        # nan are equal to nan here
+        is_diff &= ~(np.isnan(vects) & np.isnan(template))
+        return np.nonzero(is_diff)
+
+    @classmethod
+    def from_vects(cls, action_space, vects, template):
+        """build a table from the vector representation of some actions (`vects` is a 2d array)"""
+        nb_row = vects.shape[0]
+        nb_el = np.zeros(nb_row, dtype=np.int64)
+        li_indices = []
+        li_data = []
+        for beg_ in range(0, nb_row, cls.CHUNK_SIZE):
+            chunk = np.asarray(vects[beg_:(beg_ + cls.CHUNK_SIZE)], dtype=dt_float)
+            rows, cols = cls._aux_diff(chunk, template)
+            nb_el[beg_:(beg_ + chunk.shape[0])] = np.bincount(rows, minlength=chunk.shape[0])
+            li_indices.append(cols.astype(dt_int))
+            li_data.append(chunk[rows, cols])
+        indptr = np.zeros(nb_row + 1, dtype=np.int64)
+        np.cumsum(nb_el, out=indptr[1:])
+        indices = np.concatenate(li_indices) if li_indices else np.zeros(0, dtype=dt_int)
+        data = np.concatenate(li_data) if li_data else np.zeros(0, dtype=dt_float)
+        return cls(action_space, template, indptr, indices, data)
+
+    @classmethod
+    def from_actions(cls, action_space, li_act, template):
+        """build a table from a list of :class:`grid2op.Action.BaseAction`"""
+        if not li_act:
+            return cls.from_vects(action_space, np.zeros((0, template.shape[0]), dtype=dt_float), template)
+        vects = np.array([el.to_vect() for el in li_act], dtype=dt_float).reshape(len(li_act), -1)
+        return cls.from_vects(action_space, vects, template)
+
+    @classmethod
+    def from_fixed_size_rows(cls, action_space, indices, data, template):
+        """build a table where each row has the same number of components (`indices` and `data` are 2d arrays)"""
+        nb_row, nb_el = indices.shape
+        indptr = np.arange(nb_row + 1, dtype=np.int64) * nb_el
+        return cls(action_space, template,
+                   indptr,
+                   indices.reshape(-1).astype(dt_int),
+                   data.reshape(-1).astype(dt_float))
+
+    @classmethod
+    def concatenate(cls, action_space, li_tables, template):
+        """stack the rows of different tables"""
+        li_indptr = [np.zeros(1, dtype=np.int64)]
+        offset = 0
+        for table in li_tables:
+            li_indptr.append(table.indptr[1:] + offset)
+            offset += table.indptr[-1]
+        indptr = np.concatenate(li_indptr)
+        indices = np.concatenate([np.zeros(0, dtype=dt_int)] + [np.asarray(el.indices) for el in li_tables])
+        data = np.concatenate([np.zeros(0, dtype=dt_float)] + [np.asarray(el.data) for el in li_tables])
+        return cls(action_space, template, indptr, indices, data)
+
+    def save(self, path):
+        """
+        save the table in the directory `path` (each array is saved in its own ".npy" file so that
+        it can be memory mapped, see :func:`_ActionTable.load`)
+
+        The directory is written atomically: if it already exists it is not modified.
+        """
+        if os.path.exists(path):
+            return
+        parent = os.path.dirname(os.path.abspath(path))
+        tmp_dir = tempfile.mkdtemp(dir=parent)
+        try:
+            np.save(os.path.join(tmp_dir, self.TEMPLATE), self.template)
+            np.save(os.path.join(tmp_dir, self.INDPTR), self.indptr)
+            np.save(os.path.join(tmp_dir, self.INDICES), self.indices)
+            np.save(os.path.join(tmp_dir, self.DATA), self.data)
+            os.rename(tmp_dir, path)
+        except OSError:
+            # another process saved the same table in the meantime
+            if not os.path.exists(path):
+                raise
+        finally:
+            if os.path.exists(tmp_dir):
+                shutil.rmtree(tmp_dir, ignore_errors=True)
+
+    @classmethod
+    def load(cls, action_space, path, mmap_mode="r"):
+        """load a table saved with :func:`_ActionTable.save` (the arrays are memory mapped by default)"""
+        return cls(action_space,
+                   np.load(os.path.join(path, cls.TEMPLATE)),
+                   np.load(os.path.join(path, cls.INDPTR), mmap_mode=mmap_mode),
+                   np.load(os.path.join(path, cls.INDICES), mmap_mode=mmap_mode),
+                   np.load(os.path.join(path, cls.DATA), mmap_mode=mmap_mode))
+
+
+def _aux_all_bits(nb_bit):
+    """all the tuples of `itertools.product([0, 1], repeat=nb_bit)` (in the same order) as a 2d boolean array"""
+    ids = np.arange(2 ** nb_bit, dtype=np.int64)
+    shifts = np.arange(nb_bit - 1, -1, -1, dtype=np.int64)
+    return ((ids[:, None] >> shifts[None, :]) & 1).astype(bool)
+
+
+def _get_topo_pos(action_space, attr_name):
+    """position, in the vector representation of an action, of the first component of the attribute `attr_name`"""
+    template = action_space._template_act
+    shapes = template.shape()
+    attr_id = list(template.attr_list_vect).index(attr_name)
+    return int(np.sum(shapes[:attr_id]))
+
+
+def _get_all_unitary_topologies_set(action_space, template):
+    """
+    Same as :func:`grid2op.Action.SerializableActionSpace.get_all_unitary_topologies_set` (same actions,
+    in the same order) but the enumeration is vectorized and the results is an :class:`_ActionTable`
+    """
+    cls = type(action_space)
+    offset = _get_topo_pos(action_space, "_set_topo_vect")
+    sub_beg = np.concatenate(([0], np.cumsum(cls.sub_info)))
+    li_tables = []
+    for sub_id_, num_el in enumerate(cls.sub_info):
+        num_el = int(num_el)
+        powerlines_or_id = cls.line_or_to_sub_pos[cls.line_or_to_subid == sub_id_]
+        powerlines_ex_id = cls.line_ex_to_sub_pos[cls.line_ex_to_subid == sub_id_]
+        powerlines_id = np.concatenate((powerlines_or_id, powerlines_ex_id))
+
+        # all the topologies at 2 buses, the first element is always on bus 2 (to break the symmetry)
+        indx = np.zeros((2 ** (num_el - 1), num_el), dtype=bool)
+        indx[:, 1:] = _aux_all_bits(num_el - 1)
+        # a topology is kept only if there is a powerline on each bus
+        on_bus_1 = indx[:, powerlines_id]
+        is_ok = on_bus_1.any(axis=1) & (~on_bus_1).any(axis=1)
+        topos = np.where(indx[is_ok], 1, 2)
+        if topos.shape[0] == 0:
+            # only the "set everything on bus 1" action: it is not added
+            continue
+        # first action: "set everything on bus 1"
+        topos = np.concatenate((np.ones((1, num_el), dtype=topos.dtype), topos))
+        indices = np.tile(offset + sub_beg[sub_id_] + np.arange(num_el), (topos.shape[0], 1))
+        li_tables.append(_ActionTable.from_fixed_size_rows(action_space, indices, topos, template))
+    return _ActionTable.concatenate(action_space, li_tables, template)
+
+
+def _get_all_unitary_topologies_change(action_space, template):
+    """
+    Same as :func:`grid2op.Action.SerializableActionSpace.get_all_unitary_topologies_change` (same actions,
+    in the same order) but the enumeration is vectorized and the results is an :class:`_ActionTable`
+    """
+    cls = type(action_space)
+    offset = _get_topo_pos(action_space, "_change_bus_vect")
+    sub_beg = np.concatenate(([0], np.cumsum(cls.sub_info)))
+    li_tables = []
+    for sub_id_, num_el in enumerate(cls.sub_info):
+        num_el = int(num_el)
+        if num_el <= 1:
+            continue
+        # changing the elements "A" or changing all the others has the same effect: only the
+        # configurations where the first element is not changed are kept (except "change nothing")
+        indx = np.zeros((2 ** (num_el - 1) - 1, num_el), dtype=bool)
+        indx[:, 1:] = _aux_all_bits(num_el - 1)[1:]
+        nb_el = indx.sum(axis=1)
+        rows, cols = np.nonzero(indx)
+        indptr = np.zeros(indx.shape[0] + 1, dtype=np.int64)
+        np.cumsum(nb_el, out=indptr[1:])
+        li_tables.append(_ActionTable(action_space, template, indptr,
+                                      (offset + sub_beg[sub_id_] + cols).astype(dt_int),
+                                      np.ones(cols.shape[0], dtype=dt_float)))
+    return _ActionTable.concatenate(action_space, li_tables, template)
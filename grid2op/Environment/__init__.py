@@ -5,7 +5,10 @@ __all__ = [
     "SingleEnvMultiProcess",
     "MultiEnvMultiProcess",
     "MultiMixEnvironment",
-    "TimedOutEnvironment"
+    "TimedOutEnvironment",
+    "EnvSnapshot",
+    "BaseTracer",
+    "HistogramTracer"
 ]
 
 from grid2op.Environment.baseEnv import BaseEnv
@@ -15,3 +18,5 @@ from grid2op.Environment.singleEnvMultiProcess import SingleEnvMultiProcess
 from grid2op.Environment.multiEnvMultiProcess import MultiEnvMultiProcess
 from grid2op.Environment.multiMixEnv import MultiMixEnvironment
 from grid2op.Environment.timedOutEnv import TimedOutEnvironment
+from grid2op.Environment.envSnapshot import EnvSnapshot
+from grid2op.Environment.stepTracer import BaseTracer, HistogramTracer
@@ -0,0 +1,81 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import numpy as np
+
+
+def _solve_dispatch_qp(target, weights, lower, upper, total):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    Solve exactly the "redispatching" problem:
+
+    .. math::
+
+        \\min_x \\sum_i w_i (x_i - t_i)^2 \\text{  s.t.  } \\sum_i x_i = total \\text{ and } l_i \\leq x_i \\leq u_i
+
+    The optimality (KKT) conditions give :math:`x_i(\\mu) = clip(t_i - \\mu / w_i, l_i, u_i)` for the
+    lagrange multiplier :math:`\\mu` of the equality constraint. The sum of the :math:`x_i(\\mu)` is
+    piecewise linear and non increasing in :math:`\\mu`, so :math:`\\mu` is found by
+    evaluating it at each "breakpoint" (when an :math:`x_i` reaches one of its bounds) and
+    interpolating linearly between two of them.
+
+    .. versionadded:: 1.9.5
+
+    Parameters
+    ----------
+    target: ``numpy.ndarray``
+        The target value of each variable (:math:`t`)
+
+    weights: ``numpy.ndarray``
+        The weights of each variable (:math:`w`), they should be > 0.
+
+    lower: ``numpy.ndarray``
+        The lower bound of each variable (:math:`l`)
+
+    upper: ``numpy.ndarray``
+        The upper bound of each variable (:math:`u`)
+
+    total: ``float``
+        The value of the sum of the variables.
+
+    Returns
+    -------
+    res: ``numpy.ndarray`` or ``None``
+        The optimal solution, or ``None`` if the problem is infeasible (or ill defined).
+    """
+    target = np.asarray(target, dtype=np.float64)
+    weights = np.asarray(weights, dtype=np.float64)
+    lower = np.asarray(lower, dtype=np.float64)
+    upper = np.asarray(upper, dtype=np.float64)
+    total = float(total)
+    if target.shape[0] == 0:
+        return None
+    if (lower > upper).any() or (weights <= 0.).any() or not np.isfinite(weights).all():
+        return None
+    if total > upper.sum() or total < lower.sum():
+        return None
+
+    # breakpoints of the sum of the x_i(mu)
+    breakpoints = np.sort(np.concatenate((weights * (target - upper), weights * (target - lower))))
+    sum_at_bp = np.clip(target - breakpoints.reshape(-1, 1) / weights,
+                        lower,
+                        upper).sum(axis=1)
+    # sum_at_bp is non increasing: first breakpoint is when all variables are at their upper bounds
+    # last one when they are all at their lower bounds
+    k = int(np.searchsorted(-sum_at_bp, -total, side="right")) - 1
+    k = min(max(k, 0), breakpoints.shape[0] - 1)
+    if k == breakpoints.shape[0] - 1 or sum_at_bp[k] == sum_at_bp[k + 1]:
+        mu = breakpoints[k]
+    else:
+        ratio = (sum_at_bp[k] - total) / (sum_at_bp[k] - sum_at_bp[k + 1])
+        mu = breakpoints[k] + ratio * (breakpoints[k + 1] - breakpoints[k])
+    res = np.clip(target - mu / weights, lower, upper)
+    return res
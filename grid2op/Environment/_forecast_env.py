@@ -6,8 +6,10 @@
 # SPDX-License-Identifier: MPL-2.0
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
-from typing import Tuple
+from typing import Tuple, Optional
+import numpy as np
 from grid2op.Action import BaseAction
+from grid2op.Exceptions import EnvError
 from grid2op.Observation import BaseObservation
 from grid2op.Environment.environment import Environment
 
@@ -17,11 +19,71 @@ class _ForecastEnv(Environment):
     
     It is used by obs.get_forecast_env.
     """
+    _TRACE_CATEGORY = "forecast_env"
+
     def __init__(self, *args, **kwargs):
         if "_update_obs_after_reward" not in kwargs:
             kwargs["_update_obs_after_reward"] = False
+        self._is_closed = False
+        self._need_reset = False
         super().__init__(*args, **kwargs)
-        
+
+    def _change_forecast_data(self,
+                              init_obs: BaseObservation,
+                              load_p: np.ndarray,
+                              load_q: np.ndarray,
+                              prod_p: np.ndarray,
+                              prod_v: Optional[np.ndarray] = None,
+                              maintenance: Optional[np.ndarray] = None,
+                              parameters=None) -> None:
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Re target this environment (inplace) to new forecast data and to a new initial state,
+        without building a new environment (the backend, the classes etc. are re used). It is used
+        by the pool of forecast environments (see
+        :func:`grid2op.Observation.ObservationSpace.set_forecast_env_pool_size`)
+
+        The new data are taken into account when the environment is reset (it needs to be reset
+        before it can be used, as is the case for any forecast environment).
+        """
+        from grid2op.Chronics import FromNPY
+        kwargs = dict(load_p=load_p,
+                      load_q=load_q,
+                      prod_p=prod_p,
+                      prod_v=prod_v,
+                      maintenance=maintenance)
+        chronics_handler = self.chronics_handler
+        chronics_handler._kwargs = kwargs
+        chronics_handler._real_data = FromNPY(time_interval=chronics_handler.time_interval,
+                                              max_iter=chronics_handler.max_iter,
+                                              **kwargs)
+        self._init_obs = init_obs.copy()
+        self._init_obs._obs_env = None
+        if parameters is not None:
+            self.change_parameters(parameters)
+        self._need_reset = True
+
+    def reset(self) -> BaseObservation:
+        self._need_reset = False
+        return super().reset()
+
+    def _custom_deepcopy_for_copy(self, new_obj):
+        super()._custom_deepcopy_for_copy(new_obj)
+        new_obj._is_closed = self._is_closed
+        new_obj._need_reset = self._need_reset
+
+    def close(self):
+        self._is_closed = True
+        super().close()
+
     def step(self, action: BaseAction) -> Tuple[BaseObservation, float, bool, dict]:
+        if self._need_reset:
+            raise EnvError("This forecast environment has been updated with new forecasts, "
+                           "you need to call `reset()` before using it.")
         self._highres_sim_counter += 1
         return super().step(action)
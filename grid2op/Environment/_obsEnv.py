@@ -46,6 +46,7 @@ class _ObsEnv(BaseEnv):
 
     This class is reserved for internal use. Do not attempt to do anything with it.
     """
+    _TRACE_CATEGORY = "simulate"
 
     def __init__(
         self,
@@ -137,6 +138,16 @@ class _ObsEnv(BaseEnv):
         self.no_overflow_disconnection = parameters.NO_OVERFLOW_DISCONNECTION
         self._topo_vect = np.zeros(type(backend_instanciated).dim_topo, dtype=dt_int)
 
+        # pool of observations returned by "obs.simulate" (deactivated if size is 0)
+        self._sim_obs_pool_size = 0
+        self._sim_obs_pool = []
+        self._sim_obs_pool_id = 0
+
+        # pool of environments returned by "obs.get_forecast_env" (deactivated if size is 0)
+        self._forecast_env_pool_size = 0
+        self._forecast_env_pool = []
+        self._forecast_env_pool_id = 0
+
         # other stuff
         self.is_init = False
         self._helper_action_env = helper_action_env
@@ -264,15 +275,120 @@ class _ObsEnv(BaseEnv):
         self.backend = None
         _highres_sim_counter = self._highres_sim_counter
         self._highres_sim_counter = None
+        _sim_obs_pool = self._sim_obs_pool
+        self._sim_obs_pool = []  # observations of the pool are not copied
+        _forecast_env_pool = self._forecast_env_pool
+        self._forecast_env_pool = []  # neither are the forecast environments
         with warnings.catch_warnings():
             warnings.simplefilter("ignore", FutureWarning)
             res = copy.deepcopy(self)
             res.backend = backend.copy()
         res._highres_sim_counter = _highres_sim_counter
+        res._sim_obs_pool_id = 0
+        res._forecast_env_pool_id = 0
         self.backend = backend
         self._highres_sim_counter = _highres_sim_counter
+        self._sim_obs_pool = _sim_obs_pool
+        self._forecast_env_pool = _forecast_env_pool
         return res
 
+    @property
+    def use_obs_pool(self):
+        return self._sim_obs_pool_size > 0
+
+    def set_obs_pool_size(self, pool_size):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Observation.ObservationSpace.set_simulate_pool_size`
+
+        Set the number of observations that are re used by `obs.simulate` (0 to deactivate it)
+        """
+        pool_size = int(pool_size)
+        if pool_size < 0:
+            raise EnvError("The size of the pool of observation should be >= 0")
+        self._sim_obs_pool_size = pool_size
+        self._sim_obs_pool = self._sim_obs_pool[:pool_size]
+        self._sim_obs_pool_id = 0
+
+    def get_obs_from_pool(self, sim_obs):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Copy `sim_obs` into the next observation of the pool (instead of allocating a new one) and
+        return it. This observation will be overwritten by the `pool_size` th next call to this function.
+        """
+        pool_id = self._sim_obs_pool_id
+        if pool_id >= len(self._sim_obs_pool):
+            # the pool is filled lazily
+            self._sim_obs_pool.append(
+                type(sim_obs)(obs_env=sim_obs._obs_env,
+                              action_helper=sim_obs.action_helper,
+                              kwargs_env=sim_obs._ptr_kwargs_env)
+            )
+        res = self._sim_obs_pool[pool_id]
+        self._sim_obs_pool_id = (pool_id + 1) % self._sim_obs_pool_size
+        sim_obs._copy_into(res)
+        return res
+
+    @property
+    def use_forecast_env_pool(self):
+        return self._forecast_env_pool_size > 0
+
+    def set_forecast_env_pool_size(self, pool_size):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+            Prefer using :func:`grid2op.Observation.ObservationSpace.set_forecast_env_pool_size`
+
+        Set the number of environments that are re used by `obs.get_forecast_env` (0 to deactivate it)
+        """
+        pool_size = int(pool_size)
+        if pool_size < 0:
+            raise EnvError("The size of the pool of forecast environment should be >= 0")
+        for forecast_env in self._forecast_env_pool[pool_size:]:
+            forecast_env.close()
+        self._forecast_env_pool_size = pool_size
+        self._forecast_env_pool = self._forecast_env_pool[:pool_size]
+        self._forecast_env_pool_id = 0
+
+    def get_forecast_env_from_pool(self, make_forecast_env):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Return the next environment of the pool of forecast environments. It is built (by calling
+        `make_forecast_env()`) only if it does not exist yet (the pool is filled lazily) or if it has been closed.
+
+        Returns
+        -------
+        res: :class:`grid2op.Environment._forecast_env._ForecastEnv`
+            The forecast environment
+
+        reused: ``bool``
+            Whether this environment was already in the pool (in this case it needs to be re targeted to the new
+            forecast data)
+        """
+        pool_id = self._forecast_env_pool_id
+        self._forecast_env_pool_id = (pool_id + 1) % self._forecast_env_pool_size
+        if pool_id < len(self._forecast_env_pool):
+            res = self._forecast_env_pool[pool_id]
+            if not res._is_closed:
+                return res, True
+            res = make_forecast_env()
+            self._forecast_env_pool[pool_id] = res
+        else:
+            res = make_forecast_env()
+            self._forecast_env_pool.append(res)
+        return res, False
+
     def _reset_to_orig_state(self, obs):
         super()._reset_to_orig_state(obs)
         self._line_status_me[:] = obs._env_internal_params["_line_status_env"]
@@ -314,6 +430,61 @@ class _ObsEnv(BaseEnv):
             raise EnvError("Impossible to use a Observation backend with an "
                            "environment that cannot be copied.")
         
+        set_status, topo_vect = self._aux_init_state(obs, time_step)
+            
+        # TODO set the shunts here
+        # update the action that set the grid to the real value
+        self._backend_action_set += self._helper_action_env(
+            {
+                "set_line_status": set_status,
+                "set_bus": topo_vect,
+                "injection": {
+                    "prod_p": obs.gen_p,
+                    "prod_v": obs.gen_v,
+                    "load_p": obs.load_p,
+                    "load_q": obs.load_q,
+                },
+            }
+        )
+        self._backend_action_set += new_state_action
+        # for storage unit
+        self._backend_action_set.storage_power.values[:] = 0.0
+        self._backend_action_set.all_changed()
+        self._backend_action = copy.deepcopy(self._backend_action_set)
+        self._aux_end_init()
+        self.time_stamp = time_stamp
+        
+    def reinit(self, obs, time_step=1):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Put back this "environment" in the state it was right after the last call to :func:`_ObsEnv.init`.
+
+        Contrary to :func:`_ObsEnv.init`, the action setting the grid to its forecasted state is not
+        computed again (which saves some time) so this function is only valid if the last call to
+        :func:`_ObsEnv.init` has been made with the same `obs` and the same `time_step`.
+        This is used by :func:`grid2op.Observation.BaseObservation.simulate_batch`.
+
+        Parameters
+        ----------
+        obs: :class:`grid2op.Observation.BaseObservation`
+            The observation used in the last call to :func:`_ObsEnv.init`
+
+        time_step: ``int``
+            The time step used in the last call to :func:`_ObsEnv.init`
+        """
+        if self.__unusable:
+            raise EnvError("Impossible to use a Observation backend with an "
+                           "environment that cannot be copied.")
+        self._aux_init_state(obs, time_step)
+        self._backend_action = copy.deepcopy(self._backend_action_set)
+        self._aux_end_init()
+
+    def _aux_init_state(self, obs, time_step):
+        """reset the time dependant attributes of this "environment" and compute the status of the lines 
+        and of the elements of the forecasted grid"""
         self.reset()  # reset the "BaseEnv"
         self._reset_to_orig_state(obs)
         self._topo_vect[:] = obs.topo_vect
@@ -345,34 +516,15 @@ class _ObsEnv(BaseEnv):
         else:
             set_status = self._line_status_me
             topo_vect = self._topo_vect
-            
-        # TODO set the shunts here
-        # update the action that set the grid to the real value
-        self._backend_action_set += self._helper_action_env(
-            {
-                "set_line_status": set_status,
-                "set_bus": topo_vect,
-                "injection": {
-                    "prod_p": obs.gen_p,
-                    "prod_v": obs.gen_v,
-                    "load_p": obs.load_p,
-                    "load_q": obs.load_q,
-                },
-            }
-        )
-        self._backend_action_set += new_state_action
-        # for storage unit
-        self._backend_action_set.storage_power.values[:] = 0.0
-        self._backend_action_set.all_changed()
-        self._backend_action = copy.deepcopy(self._backend_action_set)
-        
+        return set_status, topo_vect
+
+    def _aux_end_init(self):
         # for curtailment
         if self._env_modification is not None:
             self._env_modification._dict_inj = {}
         
         self.is_init = True
         self.current_obs.reset()
-        self.time_stamp = time_stamp
 
     def _get_new_prod_setpoint(self, action):
         new_p = 1.0 * self._backend_action_set.prod_p.values
@@ -510,6 +662,9 @@ class _ObsEnv(BaseEnv):
     
     def close(self):
         """close this environment, once and for all"""
+        for forecast_env in self._forecast_env_pool:
+            forecast_env.close()
+        self._forecast_env_pool = []
         super().close()
 
         # clean all the attributes
@@ -16,7 +16,6 @@ import json
 from typing import Optional, Tuple
 import warnings
 import numpy as np
-from scipy.optimize import (minimize, LinearConstraint)
 from abc import ABC, abstractmethod
 from grid2op.Action import ActionSpace
 from grid2op.Observation import (BaseObservation,
@@ -36,6 +35,10 @@ from grid2op.Opponent import BaseOpponent
 from grid2op.operator_attention import LinearAttentionBudget
 from grid2op.Action._backendAction import _BackendAction
 from grid2op.Chronics import ChronicsHandler
+from grid2op.Chronics._lazyForecasts import _LazyForecasts
+from grid2op.Environment._dispatchSolver import _solve_dispatch_qp
+from grid2op.Environment.envSnapshot import EnvSnapshot
+from grid2op.Environment.stepTracer import BaseTracer
 from grid2op.Rules import AlwaysLegal, BaseRules
 
 
@@ -234,6 +237,35 @@ class BaseEnv(GridObjects, RandomObject, ABC):
     
     CAN_SKIP_TS = False  # each step is exactly one time step
 
+    # relative weight (in the redispatching objective) of the generators
+    # that are not targeted by a redispatching action
+    _weight_gen_not_modified = 1e-7
+
+    # "category" of the calls to `env.step` given to the tracer (see `BaseEnv.set_tracer`)
+    _TRACE_CATEGORY = "step"
+
+    # attributes of the environment stored in the snapshots (see `BaseEnv.snapshot`)
+    # immutable (or replaced at each step) attributes, that are not copied
+    _SNAPSHOT_ATTRS = ("time_stamp", "nb_time_step", "done", "current_reward",
+                       "_amount_storage", "_amount_storage_prev",
+                       "_sum_curtailment_mw", "_sum_curtailment_mw_prev", "_limited_before",
+                       "_is_alarm_illegal", "_is_alarm_used_in_reward",
+                       "_is_alert_illegal", "_is_alert_used_in_reward", "_total_number_of_alert",
+                       "_injection", "_maintenance", "_hazards", "_env_modification",
+                       "_has_just_been_seeded")
+    # vectors modified inplace
+    _SNAPSHOT_ARRAYS = ("_line_status", "_timestep_overflow", "_disc_lines",
+                        "_times_before_line_status_actionable", "_times_before_topology_actionable",
+                        "_target_dispatch", "_already_modified_gen", "_actual_dispatch",
+                        "_gen_uptime", "_gen_downtime", "_gen_activeprod_t", "_gen_activeprod_t_redisp",
+                        "_storage_current_charge", "_storage_previous_charge", "_action_storage",
+                        "_storage_power", "_storage_power_prev",
+                        "_limit_curtailment", "_limit_curtailment_prev", "_gen_before_curtailment",
+                        "_last_alert", "_time_since_last_alert", "_alert_duration", "_time_since_last_attack",
+                        "_is_already_attacked", "_attack_under_alert", "_was_alert_used_after_attack")
+    # vectors replaced (with the data of the time series) at each step
+    _SNAPSHOT_REPLACED_ARRAYS = ("_time_next_maintenance", "_duration_next_maintenance", "_hazard_duration")
+
     def __init__(
         self,
         init_env_path: os.PathLike,
@@ -303,6 +335,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self._parameters: Parameters = copy.deepcopy(parameters)
         self.with_forecast: bool = with_forecast
         self._forecasts = None
+        self._forecasts_lazy = None  # handle to the forecasts, computed only when needed
 
         # some timers
         self._time_apply_act: float = dt_float(0)
@@ -316,6 +349,8 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         # data relative to interpolation
         self._epsilon_poly: float = dt_float(epsilon_poly)
         self._tol_poly: float = dt_float(tol_poly)
+        # use the dedicated solver for the redispatching (scipy is used only if it fails)
+        self._use_fast_dispatch_solver: bool = True
 
         # class used for the action spaces
         self._helper_action_class: ActionSpace = None
@@ -524,6 +559,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             self._highres_sim_counter = highres_sim_counter
         else:
             self._highres_sim_counter = HighResSimCounter()
+
+        # records the time spent in the different phases of `step` (does nothing by default)
+        self._tracer = BaseTracer()
             
         self._update_obs_after_reward = update_obs_after_reward
         
@@ -547,6 +585,52 @@ class BaseEnv(GridObjects, RandomObject, ABC):
     @property
     def nb_highres_called(self):
         return self._highres_sim_counter.nb_highres_called
+
+    @property
+    def tracer(self):
+        """The tracer used by this environment (see :func:`BaseEnv.set_tracer`)"""
+        return self._tracer
+
+    def set_tracer(self, tracer):
+        """
+        Set the "tracer" used by this environment: an object that records the time spent in each phase of
+        `env.step`, `env.reset` and of the `obs.simulate` performed on the observations of this
+        environment.
+
+        .. versionadded:: 1.9.5
+
+        By default, the tracer does nothing (it is a :class:`grid2op.Environment.BaseTracer`).
+
+        Parameters
+        ----------
+        tracer: :class:`grid2op.Environment.BaseTracer`
+            The tracer to use (*eg* a :class:`grid2op.Environment.HistogramTracer`), or ``None`` to deactivate
+            the tracing.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            from grid2op.Environment import HistogramTracer
+
+            env = grid2op.make("l2rpn_case14_sandbox")
+            tracer = HistogramTracer()
+            env.set_tracer(tracer)
+            obs = env.reset()
+            obs, reward, done, info = env.step(env.action_space())
+            tracer.get_stats()["phases"]["step.powerflow"]  # statistics about the powerflows computed in `env.step`
+
+        """
+        if tracer is None:
+            tracer = BaseTracer()
+        if not isinstance(tracer, BaseTracer):
+            raise EnvError("The tracer should be an instance of grid2op.Environment.BaseTracer")
+        self._tracer = tracer
+        obs_space = self._observation_space
+        if obs_space is not None and getattr(obs_space, "obs_env", None) is not None:
+            obs_space.obs_env._tracer = tracer
         
     def _custom_deepcopy_for_copy(self, new_obj, dict_=None):
         if self.__closed:
@@ -566,6 +650,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         new_obj._parameters = copy.deepcopy(self._parameters)
         new_obj.with_forecast = self.with_forecast
         new_obj._forecasts = copy.deepcopy(self._forecasts)
+        new_obj._forecasts_lazy = self._forecasts_lazy  # never modified
 
         # some timers
         new_obj._time_apply_act = self._time_apply_act
@@ -579,6 +664,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         # data relative to interpolation
         new_obj._epsilon_poly = self._epsilon_poly
         new_obj._tol_poly = self._tol_poly
+        new_obj._use_fast_dispatch_solver = self._use_fast_dispatch_solver
 
         #
         new_obj._complete_action_cls = copy.deepcopy(self._complete_action_cls)
@@ -796,6 +882,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         
         # do not copy it.
         new_obj._highres_sim_counter = self._highres_sim_counter        
+        new_obj._tracer = self._tracer
         
         # alert
         new_obj._last_alert = copy.deepcopy(self._last_alert)
@@ -809,6 +896,139 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         
         new_obj._update_obs_after_reward = copy.deepcopy(self._update_obs_after_reward)
 
+    def snapshot(self) -> EnvSnapshot:
+        """
+        Take a "snapshot" of the current state of the environment, that can be used to put the environment back
+        in this exact state later on with :func:`BaseEnv.restore`.
+
+        This is much faster than copying the environment (see :func:`grid2op.Environment.Environment.copy`)
+        so it can be used at each step, for example by agents performing a "tree search" (*eg* MCTS) or some
+        "rollouts".
+
+        .. versionadded:: 1.9.5
+
+        Returns
+        -------
+        res: :class:`grid2op.Environment.EnvSnapshot`
+            The snapshot of the environment. It can be pickled.
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env = grid2op.make("l2rpn_case14_sandbox")
+            obs = env.reset()
+
+            snapshot = env.snapshot()
+            obs1, reward1, done1, info1 = env.step(env.action_space())
+            obs2, reward2, done2, info2 = env.step(env.action_space())
+
+            env.restore(snapshot)
+            # env is back in the state it was before the two steps
+            obs1_, reward1_, done1_, info1_ = env.step(env.action_space())
+            # obs1 and obs1_ are equal
+
+        Notes
+        -----
+        The "internal" state of the rewards (if any) and the parameters of the environment are not part
+        of the snapshot.
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        env_attrs = {attr_nm: getattr(self, attr_nm) for attr_nm in type(self)._SNAPSHOT_ATTRS}
+        env_attrs["_reward_to_obs"] = copy.deepcopy(self._reward_to_obs)
+        env_arrays = {}
+        for attr_nm in type(self)._SNAPSHOT_ARRAYS + type(self)._SNAPSHOT_REPLACED_ARRAYS:
+            tmp = getattr(self, attr_nm)
+            env_arrays[attr_nm] = tmp.copy() if tmp is not None else None
+        env_arrays["backend.thermal_limit_a"] = self.backend.thermal_limit_a.copy()
+
+        state_me, state_opp = self._oppSpace._get_state()
+        attention_budget_state = None
+        if self._has_attention_budget:
+            attention_budget_state = copy.deepcopy(self._attention_budget.get_state())
+        prng_states = {"env": self.space_prng.get_state(),
+                       "opponent": self._opponent.space_prng.get_state()}
+        res = EnvSnapshot(env_name=type(self).env_name,
+                          is_init=self.__is_init,
+                          env_attrs=env_attrs,
+                          env_arrays=env_arrays,
+                          backend_state=self.backend._get_state(),
+                          backend_action_state=self._backend_action._get_state(),
+                          chronics_state=self.chronics_handler._get_state(),
+                          opponent_state=(state_me, copy.deepcopy(state_opp)),
+                          attention_budget_state=attention_budget_state,
+                          prng_states=prng_states,
+                          current_obs=self.current_obs,
+                          last_obs=self._last_obs)
+        return res
+
+    def restore(self, snapshot: EnvSnapshot):
+        """
+        Put the environment back (inplace) in the state it was when `snapshot` has been taken
+        (see :func:`BaseEnv.snapshot`).
+
+        No object is created: the vectors of the environment (and of its backend) are updated inplace.
+        The same snapshot can be restored multiple times.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        snapshot: :class:`grid2op.Environment.EnvSnapshot`
+            The snapshot, taken with :func:`BaseEnv.snapshot` on this environment (or on an environment
+            created with the same arguments, for example in another process)
+
+        Raises
+        ------
+        EnvError
+            If the snapshot has not been taken on the same kind of environment
+
+        """
+        if self.__closed:
+            raise EnvError("This environment is closed, you cannot use it.")
+        if not isinstance(snapshot, EnvSnapshot):
+            raise EnvError(f"You can only restore an `EnvSnapshot` and not a {type(snapshot)}")
+        if snapshot.env_name != type(self).env_name:
+            raise EnvError(f"Impossible to restore a snapshot of the environment \"{snapshot.env_name}\" "
+                           f"in the environment \"{type(self).env_name}\"")
+
+        for attr_nm, attr_val in snapshot.env_attrs.items():
+            if attr_nm == "_reward_to_obs":
+                attr_val = copy.deepcopy(attr_val)
+            setattr(self, attr_nm, attr_val)
+        for attr_nm in type(self)._SNAPSHOT_ARRAYS:
+            tmp = snapshot.env_arrays[attr_nm]
+            if tmp is not None:
+                getattr(self, attr_nm)[:] = tmp
+        for attr_nm in type(self)._SNAPSHOT_REPLACED_ARRAYS:
+            # these vectors can be views on the data of the time series: they are not modified inplace
+            tmp = snapshot.env_arrays[attr_nm]
+            setattr(self, attr_nm, tmp.copy() if tmp is not None else None)
+        self.backend.thermal_limit_a[:] = snapshot.env_arrays["backend.thermal_limit_a"]
+
+        self.backend._set_state(snapshot.backend_state)
+        self._backend_action._set_state(snapshot.backend_action_state)
+        self.chronics_handler._set_state(snapshot.chronics_state)
+        state_me, state_opp = snapshot.opponent_state
+        self._oppSpace._set_state(state_me, copy.deepcopy(state_opp))
+        if self._has_attention_budget:
+            self._attention_budget.set_state(copy.deepcopy(snapshot.attention_budget_state))
+        self.space_prng.set_state(snapshot.prng_states["env"])
+        self._opponent.space_prng.set_state(snapshot.prng_states["opponent"])
+        self.__is_init = snapshot.is_init
+
+        self._forecasts = None  # force reading the forecast from the time series
+        self._forecasts_lazy = None
+        self._last_obs = snapshot.last_obs
+        self.current_obs = snapshot.current_obs
+        if self.current_obs is None and self.__is_init:
+            # snapshot has been pickled, the observation is computed again
+            self.current_obs = self.get_obs(_do_copy=False)
+
     def get_path_env(self):
         """
         Get the path that allows to create this environment.
@@ -1950,20 +2170,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         max_disp = np.minimum(p_max_const, ramp_up_const)
         max_disp = max_disp.astype(dt_float)
 
-        # add everything into a linear constraint object
-        # equality
         added = 0.5 * self._epsilon_poly
-        equality_const = LinearConstraint(
-            mat_sum_0_no_turn_on,  # do the sum
-            (const_sum_0_no_turn_on) / scale_x,  # lower bound
-            (const_sum_0_no_turn_on) / scale_x,  # upper bound
-        )
-        mat_pmin_max_ramps = np.eye(nb_dispatchable)
-        ineq_const = LinearConstraint(
-            mat_pmin_max_ramps,
-            (min_disp - added) / scale_x,
-            (max_disp + added) / scale_x,
-        )
 
         # choose a good initial point (close to the solution)
         # the idea here is to chose a initial point that would be close to the
@@ -1994,6 +2201,44 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             # to "force" the exact reset to 0.0 for all components
             x0 -= self._actual_dispatch[gen_participating] / scale_x
 
+        if self._use_fast_dispatch_solver:
+            # this problem is a projection on the "sum = cst" hyperplane with box constraints:
+            # it is solved exactly by a dedicated solver (see `_solve_dispatch_qp`).
+            # Generators not in the objective are kept as close as possible to their initial 
+            # guess (`x0`) by giving them a very small weight.
+            target_fast = x0 * scale_x
+            target_fast[already_modified_gen_me] = target_vals_me
+            weights_fast = np.full(nb_dispatchable, 
+                                   fill_value=weights.min() * self._weight_gen_not_modified,
+                                   dtype=float)
+            weights_fast[already_modified_gen_me] = weights[already_modified_gen_me]
+            res_fast = _solve_dispatch_qp(target_fast,
+                                          weights_fast,
+                                          min_disp - added,
+                                          max_disp + added,
+                                          const_sum_0_no_turn_on[0])
+            if res_fast is not None:
+                self._actual_dispatch[gen_participating] += res_fast
+                return except_
+            # otherwise i fall back to the generic optimizer below
+
+        # scipy.optimize is long to import, it is only imported when needed
+        from scipy.optimize import (minimize, LinearConstraint)
+
+        # add everything into a linear constraint object
+        # equality
+        equality_const = LinearConstraint(
+            mat_sum_0_no_turn_on,  # do the sum
+            (const_sum_0_no_turn_on) / scale_x,  # lower bound
+            (const_sum_0_no_turn_on) / scale_x,  # upper bound
+        )
+        mat_pmin_max_ramps = np.eye(nb_dispatchable)
+        ineq_const = LinearConstraint(
+            mat_pmin_max_ramps,
+            (min_disp - added) / scale_x,
+            (max_disp + added) / scale_x,
+        )
+
         def target(actual_dispatchable):
             # define my real objective
             quad_ = (
@@ -2955,7 +3200,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self.current_obs = self.get_obs(_do_copy=False)
         # TODO storage: get back the result of the storage ! with the illegal action when a storage unit
         # TODO is non zero and disconnected, this should be ok.
-        self._time_extract_obs += time.perf_counter() - beg_res
+        end_res = time.perf_counter()
+        self._time_extract_obs += end_res - beg_res
+        self._tracer.record(self._TRACE_CATEGORY, "observation", beg_res, end_res)
 
     def _aux_run_pf_after_state_properly_set(
         self, action, init_line_status, new_p, except_
@@ -2968,7 +3215,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 env=self, is_dc=self._env_dc
             )
             self._disc_lines[:] = disc_lines
-            self._time_powerflow += time.perf_counter() - beg_pf
+            end_pf = time.perf_counter()
+            self._time_powerflow += end_pf - beg_pf
+            self._tracer.record(self._TRACE_CATEGORY, "powerflow", beg_pf, end_pf)
             if conv_ is None:
                 # everything went well, so i register what is needed
                 self._aux_register_env_converged(
@@ -3114,8 +3363,11 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         self._disc_lines[:] = -1
 
         beg_step = time.perf_counter()
+        tracer = self._tracer
+        trace_cat = self._TRACE_CATEGORY
         self._last_obs : Optional[BaseObservation] = None
         self._forecasts = None  # force reading the forecast from the time series
+        self._forecasts_lazy = None
         try:
             beg_ = time.perf_counter()
 
@@ -3162,7 +3414,10 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                     self._is_alarm_illegal = reason_alarm_illegal is not None
 
             # get the modification of generator active setpoint from the environment
+            tick = time.perf_counter()
+            tracer.record(trace_cat, "rules", beg_, tick)
             self._env_modification, prod_v_chronics = self._update_actions()
+            tracer.record(trace_cat, "update_actions", tick, time.perf_counter())
             self._env_modification._single_act = (
                 False  # because it absorbs all redispatching actions
             )
@@ -3190,7 +3445,9 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 )
                 action, is_illegal_redisp, is_illegal_reco, is_done = res_disp
                 
-            self._time_redisp += time.perf_counter() - beg__redisp
+            tick = time.perf_counter()
+            self._time_redisp += tick - beg__redisp
+            tracer.record(trace_cat, "redispatching", beg__redisp, tick)
             
             if not is_done:
                 self._aux_update_backend_action(action, action_storage_power, init_disp)
@@ -3207,9 +3464,12 @@ class BaseEnv(GridObjects, RandomObject, ABC):
                 tock = time.perf_counter()
                 self._time_opponent += tock - tick
                 self._time_create_bk_act += tock - beg_
+                tracer.record(trace_cat, "opponent", tick, tock)
                 
                 self.backend.apply_action(self._backend_action)
-                self._time_apply_act += time.perf_counter() - beg_
+                tick = time.perf_counter()
+                self._time_apply_act += tick - beg_
+                tracer.record(trace_cat, "apply_action", tock, tick)
 
                 # now it's time to run the powerflow properly
                 # and to update the time dependant properties
@@ -3247,6 +3507,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             self.infos["detailed_infos_for_cascading_failures"] = detailed_info
             
         self.done = self._is_done(has_error, is_done)
+        beg_reward = time.perf_counter()
         self.current_reward, other_reward = self._get_reward(
             action,
             has_error,
@@ -3254,6 +3515,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             is_illegal or is_illegal_redisp or is_illegal_reco,
             is_ambiguous,
         )
+        tracer.record(trace_cat, "reward", beg_reward, time.perf_counter())
         self.infos["rewards"] = other_reward
         if has_error and self.current_obs is not None:
             # forward to the observation if an alarm is used or not
@@ -3276,6 +3538,7 @@ class BaseEnv(GridObjects, RandomObject, ABC):
         # TODO documentation on all the possible way to be illegal now
         if self.done:
             self.__is_init = False
+        tracer.record(trace_cat, "total", beg_step, time.perf_counter())
         return self.current_obs, self.current_reward, self.done, self.infos
 
     def _get_reward(self, action, has_error, is_done, is_illegal, is_ambiguous):
@@ -4080,9 +4343,35 @@ class BaseEnv(GridObjects, RandomObject, ABC):
             raise Grid2OpException("Attempt to retrieve the forecasts when they are not available.")
         
         if self._forecasts is None:
-            self._forecasts = self.chronics_handler.forecasts()
+            beg_ = time.perf_counter()
+            if self._forecasts_lazy is not None:
+                self._forecasts = self._forecasts_lazy()
+            else:
+                self._forecasts = self.chronics_handler.forecasts()
+            self._tracer.record(self._TRACE_CATEGORY, "forecasts", beg_, time.perf_counter())
         return self._forecasts
 
+    def _lazy_forecasts(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Same as :func:`BaseEnv.forecasts` but the forecasts are only read from the time series
+        when they are needed (see :func:`grid2op.Chronics.GridValue.lazy_forecasts`). It is used
+        by the observations.
+
+        .. versionadded:: 1.9.5
+        """
+        if not self.with_forecast:
+            raise Grid2OpException("Attempt to retrieve the forecasts when they are not available.")
+
+        if self._forecasts is not None:
+            return _LazyForecasts(value=self._forecasts)
+        if self._forecasts_lazy is None:
+            self._forecasts_lazy = self.chronics_handler.lazy_forecasts()
+        return self._forecasts_lazy
+
     @staticmethod
     def _check_rules_correct(legalActClass):
         if isinstance(legalActClass, type):
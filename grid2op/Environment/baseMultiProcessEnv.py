@@ -11,13 +11,97 @@ import warnings
 import time
 
 from grid2op.Exceptions import EnvError
-from grid2op.dtypes import dt_int
+from grid2op.dtypes import dt_int, dt_float, dt_bool
 from grid2op.Exceptions import Grid2OpException, MultiEnvException
 from grid2op.Space import GridObjects
 from grid2op.Environment.environment import Environment
 from grid2op.Action import BaseAction
 
 
+class _SharedMemoryTransport(object):
+    """
+    INTERNAL
+
+    .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+    Memory shared between the main process and the sub environments of a :class:`BaseMultiProcessEnvironment`.
+
+    It holds:
+
+    - the actions (represented as vectors) of each sub environment
+    - a "ring buffer" of `nb_slot` slots for the observations (represented as vectors), the rewards and
+      the "done" flags of each sub environment
+    - the same "ring buffer" for the results of `simulate`
+
+    Only small "control" messages (the command and the slot to use) are then sent through the pipes.
+    The data of the slot `i` are overwritten every `nb_slot` calls, which allows to return to the
+    user a view on the data of a slot (no copy) that stays valid until `nb_slot - 1` other
+    steps are performed.
+
+    .. versionadded:: 1.9.5
+
+    """
+
+    def __init__(self, obs_sizes, act_sizes, nb_slot=2):
+        self.nb_env = len(obs_sizes)
+        self.nb_slot = int(nb_slot)
+        self.obs_offsets = np.concatenate(([0], np.cumsum(obs_sizes))).astype(int)
+        self.act_offsets = np.concatenate(([0], np.cumsum(act_sizes))).astype(int)
+        tot_obs = int(self.obs_offsets[-1])
+        tot_act = int(self.act_offsets[-1])
+        # typecode "f" is float32 (dt_float)
+        self._raw_act = Array("f", max(tot_act, 1), lock=False)
+        self._raw_obs = Array("f", max(self.nb_slot * tot_obs, 1), lock=False)
+        self._raw_sim_obs = Array("f", max(self.nb_slot * tot_obs, 1), lock=False)
+        self._raw_rew = Array("d", self.nb_slot * self.nb_env, lock=False)
+        self._raw_sim_rew = Array("d", self.nb_slot * self.nb_env, lock=False)
+        self._raw_done = Array("b", self.nb_slot * self.nb_env, lock=False)
+        self._raw_sim_done = Array("b", self.nb_slot * self.nb_env, lock=False)
+        self._init_views()
+
+    def _init_views(self):
+        tot_obs = int(self.obs_offsets[-1])
+        tot_act = int(self.act_offsets[-1])
+        self.act = np.frombuffer(self._raw_act, dtype=dt_float)[:tot_act]
+        self.obs = np.frombuffer(self._raw_obs, dtype=dt_float)[:self.nb_slot * tot_obs].reshape(self.nb_slot, tot_obs)
+        self.sim_obs = np.frombuffer(self._raw_sim_obs, dtype=dt_float)[:self.nb_slot * tot_obs].reshape(self.nb_slot, tot_obs)
+        self.rew = np.frombuffer(self._raw_rew, dtype=np.float64).reshape(self.nb_slot, self.nb_env)
+        self.sim_rew = np.frombuffer(self._raw_sim_rew, dtype=np.float64).reshape(self.nb_slot, self.nb_env)
+        self.done = np.frombuffer(self._raw_done, dtype=dt_bool).reshape(self.nb_slot, self.nb_env)
+        self.sim_done = np.frombuffer(self._raw_sim_done, dtype=dt_bool).reshape(self.nb_slot, self.nb_env)
+
+    def __getstate__(self):
+        # numpy views cannot be sent to the other processes, only the shared memory
+        res = self.__dict__.copy()
+        for attr_nm in ["act", "obs", "sim_obs", "rew", "sim_rew", "done", "sim_done"]:
+            del res[attr_nm]
+        return res
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._init_views()
+
+    def get_act(self, env_id):
+        return self.act[self.act_offsets[env_id]:self.act_offsets[env_id + 1]]
+
+    def get_obs(self, slot, env_id, sim=False):
+        tmp = self.sim_obs if sim else self.obs
+        return tmp[slot, self.obs_offsets[env_id]:self.obs_offsets[env_id + 1]]
+
+    def get_all_obs(self, slot, sim=False):
+        """all the observations of a slot, as a matrix if possible (zero copy)"""
+        tmp = self.sim_obs if sim else self.obs
+        sizes = np.diff(self.obs_offsets)
+        if (sizes == sizes[0]).all():
+            res = tmp[slot].reshape(self.nb_env, sizes[0])
+            res.flags.writeable = False
+            return res
+        res = [self.get_obs(slot, env_id, sim) for env_id in range(self.nb_env)]
+        for el in res:
+            el.flags.writeable = False
+        return res
+
+
 class RemoteEnv(Process):
     """
     INTERNAL
@@ -43,6 +127,7 @@ class RemoteEnv(Process):
         name=None,
         return_info=True,
         _obs_to_vect=True,
+        _transport=None,
     ):
         Process.__init__(self, group=None, target=None, name=name)
 
@@ -70,6 +155,12 @@ class RemoteEnv(Process):
         self._obs_to_vect = _obs_to_vect
         self._comp_time = 0.0
 
+        # shared memory (if any) used to send the data to / receive the data from the main process
+        if _transport is not None and not _obs_to_vect:
+            raise MultiEnvException("The observations can only be exchanged through shared memory "
+                                    "as vectors (`_obs_to_vect=True`)")
+        self._transport = _transport
+
     def init_env(self):
         """
         INTERNAL
@@ -141,6 +232,48 @@ class RemoteEnv(Process):
             res = obs
         return res
 
+    def _obs_after_step(self, obs, done):
+        """the observation sent back to the main process after a step (the one after a reset if the
+        environment is "done")"""
+        obs_v = obs.to_vect()
+        if done or (~np.isfinite(obs_v)).any():
+            # if done do a reset
+            return self.get_obs_ifnotconv()
+        if self._obs_to_vect:
+            return obs_v
+        return self._clean_observation(obs)
+
+    _SHARED_CMD = {"s", "r", "sim"}
+
+    def _run_shared_memory(self, cmd, slot):
+        """perform the commands that exchange data through the shared memory, `slot` is the slot to use"""
+        transport = self._transport
+        if cmd == "s":
+            # perform a step
+            beg_ = time.perf_counter()
+            action = self.env.action_space.from_vect(transport.get_act(self.p_id))
+            obs, reward, done, info = self.env.step(action)
+            transport.get_obs(slot, self.p_id)[:] = self._obs_after_step(obs, done)
+            transport.rew[slot, self.p_id] = reward
+            transport.done[slot, self.p_id] = done
+            if not self.return_info:
+                info = None
+            end_ = time.perf_counter()
+            self._comp_time += end_ - beg_
+            self.remote.send(info)
+        elif cmd == "r":
+            # perfom a reset
+            transport.get_obs(slot, self.p_id)[:] = self.get_obs_ifnotconv()
+            self.remote.send(None)
+        elif cmd == "sim":
+            action = self.env.action_space.from_vect(transport.get_act(self.p_id))
+            obs = self.env.get_obs()
+            sim_obs, sim_reward, sim_done, sim_info = obs.simulate(action)
+            transport.get_obs(slot, self.p_id, sim=True)[:] = sim_obs.to_vect()
+            transport.sim_rew[slot, self.p_id] = sim_reward
+            transport.sim_done[slot, self.p_id] = sim_done
+            self.remote.send(sim_info)
+
     def run(self):
         if self.env is None:
             self.init_env()
@@ -149,6 +282,8 @@ class RemoteEnv(Process):
             cmd, data = self.remote.recv()
             if cmd == "get_spaces":
                 self.remote.send((self.env.observation_space, self.env.action_space))
+            elif self._transport is not None and cmd in self._SHARED_CMD:
+                self._run_shared_memory(cmd, data)
             elif cmd == "s":
                 # perform a step
                 beg_ = time.perf_counter()
@@ -157,14 +292,7 @@ class RemoteEnv(Process):
                 else:
                     data = self.env.action_space.from_vect(data)
                 obs, reward, done, info = self.env.step(data)
-                obs_v = obs.to_vect()
-                if done or (~np.isfinite(obs_v)).any():
-                    # if done do a reset
-                    res_obs = self.get_obs_ifnotconv()
-                elif self._obs_to_vect:
-                    res_obs = obs.to_vect()
-                else:
-                    res_obs = self._clean_observation(obs)
+                res_obs = self._obs_after_step(obs, done)
 
                 if not self.return_info:
                     info = None
@@ -237,6 +365,9 @@ class BaseMultiProcessEnvironment(GridObjects):
     - a call to :func:`MultiEnv.step` will perform one step per environment, in parallel using a ``Pipe`` to transfer data
       to and from the main process from each individual environment process. It is a synchronous function. It means
       it will wait for every environment to finish the step before returning all the information.
+    - if `use_shared_memory=True` the actions, observations, rewards and "done" flags are not sent through the
+      ``Pipe`` but written in memory shared between the processes (only small "control" messages and the
+      "info" dictionaries go through the pipes).
 
     There are some limitations. For example, even if forecast are available, it's not possible to use forecast of the
     observations. This imply that :func:`grid2op.Observation.BaseObservation.simulate` is not available when using
@@ -271,9 +402,25 @@ class BaseMultiProcessEnvironment(GridObjects):
     return_info: ``bool``
         Whether to return the information dictionary or not (might speed up computation)
 
+    use_shared_memory: ``bool``
+        Whether to exchange the data with the sub environments through shared memory or through the
+        pipes (default, as in grid2op < 1.9.5).
+
+        When using shared memory and `obs_as_class=False`, the observations returned by
+        :func:`BaseMultiProcessEnvironment.step` (and `reset`, `simulate`) are read only views on the shared
+        memory (no copy is made). They remain valid until :attr:`BaseMultiProcessEnvironment.NB_SLOT_SHARED_MEMORY`
+        other calls to `step` (or `reset`) are made. Copy them (`obs.copy()`) if you need them for longer.
+        :func:`BaseMultiProcessEnvironment.get_obs` always uses the pipes and does not overwrite any of these
+        observations.
+
+        .. versionadded:: 1.9.5
+
     """
 
-    def __init__(self, envs, obs_as_class=True, return_info=True, logger=None):
+    # number of slots in the "ring buffer" of shared memory used to store the observations
+    NB_SLOT_SHARED_MEMORY = 2
+
+    def __init__(self, envs, obs_as_class=True, return_info=True, logger=None, use_shared_memory=False):
         GridObjects.__init__(self)
         self.__closed = False
         for env in envs:
@@ -289,6 +436,15 @@ class BaseMultiProcessEnvironment(GridObjects):
         _remotes, _work_remotes = zip(*[Pipe() for _ in range(self.nb_env)])
 
         env_params = [sub_env.get_kwargs(with_backend=False) for sub_env in envs]
+        self._transport = None
+        if use_shared_memory:
+            self._transport = _SharedMemoryTransport(
+                obs_sizes=[sub_env.observation_space.size() for sub_env in envs],
+                act_sizes=[sub_env.action_space.size() for sub_env in envs],
+                nb_slot=type(self).NB_SLOT_SHARED_MEMORY,
+            )
+        self._slot = 0
+        self._sim_slot = 0
         self._ps = [
             RemoteEnv(
                 env_params=env_,
@@ -301,6 +457,7 @@ class BaseMultiProcessEnvironment(GridObjects):
                 logger=logger.getChild("BaseMultiProcessEnvironment")
                 if logger is not None
                 else None,
+                _transport=self._transport,
             )
             for i, (work_remote, remote, env_) in enumerate(
                 zip(_work_remotes, _remotes, env_params)
@@ -323,14 +480,56 @@ class BaseMultiProcessEnvironment(GridObjects):
         # self.__return_info = return_info
         self._waiting = True
 
-    def _send_act(self, actions):
+    def _next_slot(self, sim=False):
+        """get the slot of the shared memory to use for the next command"""
+        if sim:
+            res = self._sim_slot
+            self._sim_slot = (self._sim_slot + 1) % self._transport.nb_slot
+        else:
+            res = self._slot
+            self._slot = (self._slot + 1) % self._transport.nb_slot
+        return res
+
+    def _send_act(self, actions, cmd="s"):
+        if self._transport is not None:
+            slot = self._next_slot(sim=cmd == "sim")
+            for env_id, action in enumerate(actions):
+                self._transport.get_act(env_id)[:] = action.to_vect()
+            for remote in self._remotes:
+                remote.send((cmd, slot))
+            self._waiting = True
+            return slot
+
         for remote, action in zip(self._remotes, actions):
             vect = action.to_vect()
             # vect = None  # TODO
-            remote.send(("s", vect))
+            remote.send((cmd, vect))
         self._waiting = True
+        return None
+
+    def _get_obs_from_transport(self, slot, sim=False):
+        """read the observations of the given slot of the shared memory"""
+        obs = self._transport.get_all_obs(slot, sim=sim)
+        if self.obs_as_class:
+            obs = np.stack([
+                self.envs[e].observation_space.from_vect(ob) for e, ob in enumerate(obs)
+            ])
+        # otherwise: a matrix if all the observations have the same size, a list of vectors if not
+        return obs
+
+    def _wait_for_obs(self, slot=None, sim=False):
+        if self._transport is not None:
+            infos = tuple([remote.recv() for remote in self._remotes])
+            self._waiting = False
+            obs = self._get_obs_from_transport(slot, sim=sim)
+            if sim:
+                rews = self._transport.sim_rew[slot].copy()
+                dones = self._transport.sim_done[slot].copy()
+            else:
+                rews = self._transport.rew[slot].copy()
+                dones = self._transport.done[slot].copy()
+            return obs, rews, dones, infos
 
-    def _wait_for_obs(self):
         results = [remote.recv() for remote in self._remotes]
         self._waiting = False
         obs, rews, dones, infos = zip(*results)
@@ -460,8 +659,8 @@ class BaseMultiProcessEnvironment(GridObjects):
                     "and not {}".format(type(act))
                 )
 
-        self._send_act(actions)
-        obs, rews, dones, infos = self._wait_for_obs()
+        slot = self._send_act(actions)
+        obs, rews, dones, infos = self._wait_for_obs(slot)
         return obs, rews, dones, infos
 
     def reset(self):
@@ -481,6 +680,14 @@ class BaseMultiProcessEnvironment(GridObjects):
         """
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        if self._transport is not None:
+            slot = self._next_slot()
+            for remote in self._remotes:
+                remote.send(("r", slot))
+            for remote in self._remotes:
+                remote.recv()
+            return self._get_obs_from_transport(slot)
+
         for remote in self._remotes:
             remote.send(("r", None))
         res = [remote.recv() for e, remote in enumerate(self._remotes)]
@@ -578,6 +785,8 @@ class BaseMultiProcessEnvironment(GridObjects):
         """implement the get_obs function that is "broken" if you use the __getattr__"""
         if self.__closed:
             raise EnvError("This environment is closed, you cannot use it.")
+        # the observations are sent through the pipes even when the shared memory is used: this does not
+        # overwrite the observations previously returned by `step` or `reset`
         for remote in self._remotes:
             remote.send(("o", None))
         res = [
@@ -587,9 +796,7 @@ class BaseMultiProcessEnvironment(GridObjects):
         return res
 
     def _send_sim(self, actions):
-        for remote, action in zip(self._remotes, actions):
-            remote.send(("sim", action.to_vect()))
-        self._waiting = True
+        return self._send_act(actions, cmd="sim")
 
     def simulate(self, actions):
         """
@@ -648,8 +855,8 @@ class BaseMultiProcessEnvironment(GridObjects):
                     '"grid2op.BaseAction" and not {}'.format(type(act))
                 )
 
-        self._send_sim(actions)
-        sim_obs, sim_rews, sim_dones, sim_infos = self._wait_for_obs()
+        slot = self._send_sim(actions)
+        sim_obs, sim_rews, sim_dones, sim_infos = self._wait_for_obs(slot, sim=True)
         return sim_obs, sim_rews, sim_dones, sim_infos
 
     def __getattr__(self, name):
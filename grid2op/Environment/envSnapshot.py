@@ -0,0 +1,94 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+
+class EnvSnapshot(object):
+    """
+    State of an environment at a given time, returned by :func:`grid2op.Environment.BaseEnv.snapshot`. It can be
+    given to :func:`grid2op.Environment.BaseEnv.restore` to put an environment back in this exact state.
+
+    It is meant to be much "lighter" than a copy of the environment (see :func:`grid2op.Environment.Environment.copy`):
+    it only stores the vectors that are modified when a step is performed (topology, injections and results
+    of the powerflow computed by the backend, position in the time series, cooldowns, redispatching,
+    storage units, curtailment, opponent and attention budget...) and no object is
+    created when it is restored.
+
+    It can be pickled (for example to be sent to another process that uses the same environment). In this
+    case, the observation is not pickled (it will be computed again when the snapshot is restored) but the data
+    of the current time series are.
+
+    .. versionadded:: 1.9.5
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        env = grid2op.make("l2rpn_case14_sandbox")
+        obs = env.reset()
+
+        snapshot = env.snapshot()
+        for act in candidate_actions:
+            obs, reward, done, info = env.step(act)
+            # look a few steps ahead
+            ...
+            env.restore(snapshot)  # back to the state in which the snapshot has been taken
+
+    Notes
+    -----
+    The time series (and the handlers) are not copied: only their current position is stored. The "internal" state
+    of the rewards (if any) is not stored either.
+
+    """
+
+    def __init__(self,
+                 env_name,
+                 is_init,
+                 env_attrs,
+                 env_arrays,
+                 backend_state,
+                 backend_action_state,
+                 chronics_state,
+                 opponent_state,
+                 attention_budget_state,
+                 prng_states,
+                 current_obs=None,
+                 last_obs=None):
+        self.env_name = env_name
+        self.is_init = is_init
+        self.env_attrs = env_attrs
+        self.env_arrays = env_arrays
+        self.backend_state = backend_state
+        self.backend_action_state = backend_action_state
+        self.chronics_state = chronics_state
+        self.opponent_state = opponent_state
+        self.attention_budget_state = attention_budget_state
+        self.prng_states = prng_states
+        self.current_obs = current_obs
+        self.last_obs = last_obs
+
+    @property
+    def nb_time_step(self):
+        """The step at which this snapshot has been taken"""
+        return self.env_attrs["nb_time_step"]
+
+    @property
+    def time_stamp(self):
+        """The time stamp (in the time series) at which this snapshot has been taken"""
+        return self.env_attrs["time_stamp"]
+
+    def __getstate__(self):
+        # the observations (that hold a reference to the "obs env") are not sent
+        res = self.__dict__.copy()
+        res["current_obs"] = None
+        res["last_obs"] = None
+        return res
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
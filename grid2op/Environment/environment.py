@@ -7,6 +7,7 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 import os
 import copy
+import time
 import warnings
 import numpy as np
 import re
@@ -29,6 +30,7 @@ from grid2op.Backend import Backend
 from grid2op.Chronics import ChronicsHandler
 from grid2op.VoltageControler import ControlVoltageFromFile, BaseVoltageController
 from grid2op.Environment.baseEnv import BaseEnv
+from grid2op.Environment.stepTracer import BaseTracer
 from grid2op.Opponent import BaseOpponent, NeverAttackBudget
 from grid2op.operator_attention import LinearAttentionBudget
 
@@ -839,7 +841,12 @@ class Environment(BaseEnv):
         self._backend_action = self._backend_action_class()
         self.nb_time_step = -1  # to have init obs at step 1
         do_nothing = self._helper_action_env({})
-        *_, fail_to_start, info = self.step(do_nothing)
+        # this step is traced as part of the reset, not as a step of the episode
+        self._TRACE_CATEGORY = "reset_step"
+        try:
+            *_, fail_to_start, info = self.step(do_nothing)
+        finally:
+            del self._TRACE_CATEGORY
         if fail_to_start:
             raise Grid2OpException(
                 "Impossible to initialize the powergrid, the powerflow diverge at iteration 0. "
@@ -893,6 +900,7 @@ class Environment(BaseEnv):
                 action = agent.act(obs, reward, done)
                 obs, reward, done, info = env.step(action)
         """
+        beg_reset = time.perf_counter()
         super().reset()
         self.chronics_handler.next_chronics()
         self.chronics_handler.initialize(
@@ -906,7 +914,9 @@ class Environment(BaseEnv):
         self._reset_maintenance()
         self._reset_redispatching()
         self._reset_vectors_and_timings()  # it need to be done BEFORE to prevent cascading failure when there has been
+        beg_ = time.perf_counter()
         self.reset_grid()
+        self._tracer.record("reset", "reset_grid", beg_, time.perf_counter())
         if self.viewer_fig is not None:
             del self.viewer_fig
             self.viewer_fig = None
@@ -929,7 +939,9 @@ class Environment(BaseEnv):
         
         if self._init_obs is not None:
             self._reset_to_orig_state(self._init_obs)
-        return self.get_obs()
+        res = self.get_obs()
+        self._tracer.record("reset", "total", beg_reset, time.perf_counter())
+        return res
 
     def render(self, mode="rgb_array"):
         """
@@ -1718,6 +1730,7 @@ class Environment(BaseEnv):
         res["kwargs_observation"] = copy.deepcopy(self._kwargs_observation)
         res["observation_bk_class"] = self._observation_bk_class
         res["observation_bk_kwargs"] = self._observation_bk_kwargs
+        res["tracer"] = self._tracer if type(self._tracer) is not BaseTracer else None
         res["_is_test"] = self._is_test  # TODO not implemented !!
         return res
 
@@ -0,0 +1,283 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import copy
+import json
+import math
+import numpy as np
+
+from grid2op.Exceptions import EnvError
+
+
+class BaseTracer(object):
+    """
+    Base class of the "tracers": objects that record the time spent in the different phases
+    of `env.step`, `env.reset` and `obs.simulate` (see :func:`grid2op.Environment.BaseEnv.set_tracer`).
+
+    This base class does nothing: it is the tracer used by default by all the environments.
+
+    .. versionadded:: 1.9.5
+
+    Each time a "phase" (*eg* the powerflow, the computation of the reward etc.) is over, the environment
+    calls :func:`BaseTracer.record` with:
+
+    - the "category" of the call: "step" (for `env.step`), "reset" (for `env.reset`), "reset_step" (for
+      the step performed at the end of `env.reset` to compute the initial state of the grid), "simulate" (for
+      the steps performed by `obs.simulate`) or "forecast_env" (for the environments returned
+      by `obs.get_forecast_env`)
+    - the name of the phase: "total" (the whole call), "rules" (ambiguity and legality of the action),
+      "update_actions" (reading of the time series and maintenance), "redispatching", "opponent",
+      "apply_action" (the backend action is given to the backend), "powerflow" (computation of the next
+      state of the grid, including the cascading failures), "cascading_failure" (one stage of a cascading failure),
+      "observation" (update of the environment and computation of the observation), "forecasts" (reading of the
+      forecasts), "reward" or "reset_grid" (only for "reset").
+    - the time (as given by `time.perf_counter()`) at which the phase started and the time at which it ended
+
+    If you want to implement your own tracer, you need to overload :func:`BaseTracer.record`,
+    :func:`BaseTracer.reset_stats` and :func:`BaseTracer.get_stats` (the latter should return something that
+    can be pickled and serialized in json).
+
+    """
+    def record(self, category, phase, beg, end):
+        """
+        Record that the phase `phase` of the call `category` lasted from `beg` to `end`
+
+        Parameters
+        ----------
+        category: ``str``
+            "step", "reset", "reset_step", "simulate" or "forecast_env"
+
+        phase: ``str``
+            name of the phase (see the description of :class:`BaseTracer`)
+
+        beg: ``float``
+            beginning of the phase (given by `time.perf_counter()`)
+
+        end: ``float``
+            end of the phase (given by `time.perf_counter()`)
+        """
+        pass
+
+    def reset_stats(self):
+        """Forget everything that has been recorded (called by the runner at the beginning of each episode)"""
+        pass
+
+    def get_stats(self):
+        """Return what has been recorded (``None`` if nothing is recorded)"""
+        return None
+
+    def copy(self):
+        """Return a tracer with the same configuration but with nothing recorded"""
+        res = copy.deepcopy(self)
+        res.reset_stats()
+        return res
+
+
+class HistogramTracer(BaseTracer):
+    """
+    This tracer stores the duration of each phase of each call in a fixed size histogram
+    (the bins are spaced logarithmically between `min_duration` and `max_duration`) so that
+    the distribution of the durations (and not only the total time) can be retrieved.
+
+    It can also (optionally) store each call individually and export them in the
+    "chrome trace" format (that can be read by `chrome://tracing` or `https://ui.perfetto.dev`).
+
+    .. versionadded:: 1.9.5
+
+    Examples
+    --------
+
+    .. code-block:: python
+
+        import grid2op
+        from grid2op.Environment import HistogramTracer
+
+        env = grid2op.make("l2rpn_case14_sandbox")
+        tracer = HistogramTracer()
+        env.set_tracer(tracer)
+
+        obs = env.reset()
+        done = False
+        while not done:
+            obs, reward, done, info = env.step(env.action_space())
+
+        tracer.percentile("step", "powerflow", 99)  # 99th percentile of the time spent in the powerflow (in s)
+        stats = tracer.get_stats()  # all the stats, as a dictionary
+
+        # with the runner, the stats are available for each episode
+        from grid2op.Runner import Runner
+        runner = Runner(**env.get_params_for_runner())
+        res = runner.run(nb_episode=2)
+        all_episodes = HistogramTracer.merge_stats(runner.tracer_stats)
+
+    """
+    def __init__(self,
+                 min_duration=1e-6,
+                 max_duration=100.,
+                 nb_bins_per_decade=10,
+                 chrome_trace=False,
+                 max_nb_events=1_000_000):
+        BaseTracer.__init__(self)
+        if min_duration <= 0. or max_duration <= min_duration:
+            raise EnvError("HistogramTracer: you should have 0 < min_duration < max_duration")
+        self.min_duration = float(min_duration)
+        self.max_duration = float(max_duration)
+        self.nb_bins_per_decade = int(nb_bins_per_decade)
+        self._log_min = math.log10(self.min_duration)
+        nb_decades = math.log10(self.max_duration) - self._log_min
+        # bin 0 is for the durations < min_duration and the last bin for the durations >= max_duration
+        self.nb_bins = int(math.ceil(nb_decades * self.nb_bins_per_decade)) + 2
+        self.chrome_trace = bool(chrome_trace)
+        self.max_nb_events = int(max_nb_events)
+        self._stats = {}
+        self._events = []
+
+    @property
+    def bin_edges(self):
+        """The upper limits of the bins of the histograms (in s), the last one is `+inf`"""
+        res = 10. ** (self._log_min + np.arange(self.nb_bins - 1) / self.nb_bins_per_decade)
+        return np.concatenate((res, [np.inf]))
+
+    def record(self, category, phase, beg, end):
+        duration = end - beg
+        key = (category, phase)
+        stats = self._stats.get(key)
+        if stats is None:
+            # count, total, max, histogram
+            stats = [0, 0., 0., [0 for _ in range(self.nb_bins)]]
+            self._stats[key] = stats
+        stats[0] += 1
+        stats[1] += duration
+        if duration > stats[2]:
+            stats[2] = duration
+        if duration < self.min_duration:
+            bin_id = 0
+        else:
+            bin_id = min(int((math.log10(duration) - self._log_min) * self.nb_bins_per_decade) + 1,
+                         self.nb_bins - 1)
+        stats[3][bin_id] += 1
+        if self.chrome_trace and len(self._events) < self.max_nb_events:
+            self._events.append((category, phase, beg, duration))
+
+    def reset_stats(self):
+        self._stats = {}
+        self._events = []
+
+    def get_stats(self):
+        """
+        Return all the recorded statistics, as a dictionary (that can be serialized in json) with keys:
+
+        - "bin_edges": the upper limits of the bins of the histograms
+        - "phases": a dictionary with keys "category.phase" (*eg* "step.powerflow") and the statistics
+          of this phase as value (a dictionary with keys "count", "total", "mean", "max" and "histogram")
+        """
+        phases = {}
+        for (category, phase), (count, total, max_, hist) in self._stats.items():
+            phases[f"{category}.{phase}"] = {"count": count,
+                                             "total": total,
+                                             "mean": total / count,
+                                             "max": max_,
+                                             "histogram": list(hist)}
+        return {"bin_edges": [float(el) for el in self.bin_edges],
+                "phases": phases}
+
+    def percentile(self, category, phase, q):
+        """
+        Approximate value of the `q` th percentile of the durations (in s) of the phase `phase` of the
+        calls `category`. This value is the upper limit of the bin of the histogram in which this
+        percentile is. It is ``None`` if nothing has been recorded for this phase.
+        """
+        stats = self._stats.get((category, phase))
+        if stats is None:
+            return None
+        count, total, max_, hist = stats
+        return self._aux_percentile(hist, self.bin_edges, max_, q)
+
+    @staticmethod
+    def _aux_percentile(hist, bin_edges, max_, q):
+        cum_hist = np.cumsum(hist)
+        bin_id = np.searchsorted(cum_hist, q / 100. * cum_hist[-1])
+        return min(float(bin_edges[bin_id]), max_)
+
+    @staticmethod
+    def percentile_from_stats(stats, name, q):
+        """
+        Same as :func:`HistogramTracer.percentile` but for statistics returned by
+        :func:`HistogramTracer.get_stats` or :func:`HistogramTracer.merge_stats`
+        (`name` being "category.phase", *eg* "step.powerflow")
+        """
+        if name not in stats["phases"]:
+            return None
+        phase_stats = stats["phases"][name]
+        return HistogramTracer._aux_percentile(phase_stats["histogram"],
+                                               stats["bin_edges"],
+                                               phase_stats["max"],
+                                               q)
+
+    @staticmethod
+    def merge_stats(list_stats):
+        """
+        Merge the statistics (returned by :func:`HistogramTracer.get_stats`) of different
+        tracers (*eg* different episodes, see :attr:`grid2op.Runner.Runner.tracer_stats`).
+
+        ``None`` in `list_stats` are ignored.
+        """
+        res = None
+        for stats in list_stats:
+            if stats is None:
+                continue
+            if res is None:
+                res = copy.deepcopy(stats)
+                continue
+            if stats["bin_edges"] != res["bin_edges"]:
+                raise EnvError("Impossible to merge statistics computed with different histograms.")
+            for name, phase_stats in stats["phases"].items():
+                if name not in res["phases"]:
+                    res["phases"][name] = copy.deepcopy(phase_stats)
+                    continue
+                res_phase = res["phases"][name]
+                res_phase["count"] += phase_stats["count"]
+                res_phase["total"] += phase_stats["total"]
+                res_phase["mean"] = res_phase["total"] / res_phase["count"]
+                res_phase["max"] = max(res_phase["max"], phase_stats["max"])
+                res_phase["histogram"] = [el1 + el2 for el1, el2 in zip(res_phase["histogram"],
+                                                                        phase_stats["histogram"])]
+        return res
+
+    def to_chrome_trace(self, path=None):
+        """
+        Export the recorded calls (only available if the tracer has been created with `chrome_trace=True`)
+        in the "chrome trace" format.
+
+        Parameters
+        ----------
+        path: ``str``, optional
+            If provided, the trace is written (in json) in this file
+
+        Returns
+        -------
+        res: ``dict``
+            The trace, in the "chrome trace" format
+        """
+        if not self.chrome_trace:
+            raise EnvError("This tracer does not store the calls, you need to build it with `chrome_trace=True`")
+        pid = os.getpid()
+        events = [{"name": phase,
+                   "cat": category,
+                   "ph": "X",
+                   "ts": beg * 1e6,  # in micro seconds
+                   "dur": duration * 1e6,
+                   "pid": pid,
+                   "tid": category}
+                  for category, phase, beg, duration in self._events]
+        res = {"traceEvents": events, "displayTimeUnit": "ms"}
+        if path is not None:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(obj=res, fp=f)
+        return res
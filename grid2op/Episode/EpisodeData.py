@@ -10,6 +10,7 @@ import json
 import os
 import warnings
 import copy
+import shutil
 import numpy as np
 
 import grid2op
@@ -73,6 +74,18 @@ class EpisodeData:
     All of the above should allow to read back, and better understand the behaviour of some
     :class:`grid2op.Agent.BaseAgent`, even though such utility functions have not been coded yet.
 
+    When the episode is stored in "streaming" mode (`episode_chunk_size` argument of :func:`grid2op.Runner.Runner.run`)
+    the actions, environment modifications, observations and attacks are written on the hard drive
+    during the episode (by chunks of `episode_chunk_size` steps) instead of being kept in memory.
+    At the end of the episode they are stored in the (uncompressed) ".npy" format instead of the ".npz" one
+    (for example "observations.npy" instead of "observations.npz").
+
+    When an episode is read back (:func:`EpisodeData.from_disk`) the objects (observations, actions etc.)
+    are built only when accessed and the ".npy" files are memory mapped.
+
+    .. versionchanged:: 1.9.5
+        Addition of the "streaming" mode and objects are built only when accessed.
+
     Attributes
     ----------
     actions: ``type``
@@ -87,6 +100,12 @@ class EpisodeData:
     attacks: ``type``
         Stores the Opponent actions as a collection of :class:`grid2op.BaseAction`.
         The collection is stored the utility class :class:`grid2op.Episode.CollectionWrapper`.
+    tracer_stats: ``dict``
+        The statistics recorded by the tracer of the environment during this episode (see
+        :func:`grid2op.Environment.BaseEnv.set_tracer`), ``None`` if the environment did not use any
+        tracer. They are stored in "episode_times.json" (key "Tracer").
+
+        .. versionadded:: 1.9.5
 
     Examples
     --------
@@ -189,6 +208,7 @@ class EpisodeData:
         legal=None,
         ambiguous=None,
         has_legal_ambiguous=False,
+        chunk_size=None,
         _init_collections=False,
     ):
         self.parameters = None
@@ -222,7 +242,6 @@ class EpisodeData:
         action_go = self.actions._game_over
         obs_go = self.observations._game_over
         env_go = self.env_actions._game_over
-        # raise RuntimeError("Add the attaks game over too !")
         real_go = action_go
         if self.meta is not None:
             # when initialized by the runner, meta is None
@@ -248,6 +267,7 @@ class EpisodeData:
             self.actions._game_over = real_go
             self.observations._game_over = real_go + 1
             self.env_actions._game_over = real_go
+            self.attacks._game_over = real_go
 
         self.other_rewards = other_rewards
         self.observation_space = observation_space
@@ -257,6 +277,10 @@ class EpisodeData:
         self.times = times
         self.params = params
         self.episode_times = episode_times
+        # statistics recorded by the tracer of the environment (see `BaseEnv.set_tracer`)
+        self.tracer_stats = None
+        if isinstance(episode_times, dict):
+            self.tracer_stats = episode_times.get("Tracer")
         self.name = name
         self.disc_lines_templ = disc_lines_templ
 
@@ -326,6 +350,38 @@ class EpisodeData:
                     )
                 )
 
+            if chunk_size is not None:
+                self._start_streaming(chunk_size)
+
+    def _start_streaming(self, chunk_size):
+        """the actions, observations, environment modifications and attacks are written on the
+        hard drive during the episode (and not kept in memory)"""
+        for collection, file_name in [(self.actions, EpisodeData.ACTIONS_FILE),
+                                      (self.env_actions, EpisodeData.ENV_ACTIONS_FILE),
+                                      (self.observations, EpisodeData.OBSERVATIONS_FILE),
+                                      (self.attacks, EpisodeData.ATTACK)]:
+            collection.start_streaming(
+                os.path.join(self.episode_path, EpisodeData._get_stream_file_name(file_name)),
+                chunk_size
+            )
+
+    @staticmethod
+    def _get_stream_file_name(file_name):
+        """name of the file (".npy" format) used in the "streaming" mode instead of `file_name` (".npz" format)"""
+        return f"{os.path.splitext(file_name)[0]}.npy"
+
+    @staticmethod
+    def _load_collection(episode_path, file_name):
+        """load a collection stored either in the ".npz" format (read in memory) or in the ".npy" format
+        (memory mapped, when the episode has been stored in "streaming" mode)"""
+        path_npz = os.path.join(episode_path, file_name)
+        if os.path.exists(path_npz):
+            return np.load(path_npz)["data"]
+        path_npy = os.path.join(episode_path, EpisodeData._get_stream_file_name(file_name))
+        if os.path.exists(path_npy):
+            return np.load(path_npy, mmap_mode="r")
+        raise FileNotFoundError(f'No such file: "{path_npz}"')
+
     @staticmethod
     def list_episode(path_agent):
         """
@@ -386,7 +442,9 @@ class EpisodeData:
                 continue
             ok_ = True
             for file_that_should_be in EpisodeData.ATTR_EPISODE:
-                if not os.path.exists(os.path.join(this_dir, file_that_should_be)):
+                if (not os.path.exists(os.path.join(this_dir, file_that_should_be)) and 
+                    not os.path.exists(os.path.join(this_dir, 
+                                                    EpisodeData._get_stream_file_name(file_that_should_be)))):
                     # one file is missing
                     ok_ = False
                     break
@@ -460,17 +518,13 @@ class EpisodeData:
             times = np.load(os.path.join(episode_path, EpisodeData.AG_EXEC_TIMES))[
                 "data"
             ]
-            actions = np.load(os.path.join(episode_path, EpisodeData.ACTIONS_FILE))["data"]
-            env_actions = np.load(os.path.join(episode_path, EpisodeData.ENV_ACTIONS_FILE))[
-                "data"
-            ]
-            observations = np.load(
-                os.path.join(episode_path, EpisodeData.OBSERVATIONS_FILE)
-            )["data"]
+            actions = EpisodeData._load_collection(episode_path, EpisodeData.ACTIONS_FILE)
+            env_actions = EpisodeData._load_collection(episode_path, EpisodeData.ENV_ACTIONS_FILE)
+            observations = EpisodeData._load_collection(episode_path, EpisodeData.OBSERVATIONS_FILE)
             disc_lines = np.load(
                 os.path.join(episode_path, EpisodeData.LINES_FAILURES)
             )["data"]
-            attack = np.load(os.path.join(episode_path, EpisodeData.ATTACK))["data"]
+            attack = EpisodeData._load_collection(episode_path, EpisodeData.ATTACK)
             rewards = np.load(os.path.join(episode_path, EpisodeData.REWARDS))["data"]
 
             path_legal_ambiguous = os.path.join(episode_path, EpisodeData.LEGAL_AMBIGUOUS)
@@ -637,21 +691,19 @@ class EpisodeData:
         self.env_actions.update(time_step, env_act, efficient_storing)
         # deactive the possibility to do "forecast" in this serialized instance
         tmp_obs_env = obs._obs_env
-        tmp_inj = obs._forecasted_inj
+        tmp_inj = obs._forecasted_inj_
+        tmp_inj_lazy = obs._forecasted_inj_lazy  # forecasts are not read here
         obs._obs_env = None
         obs._forecasted_inj = []
         self.observations.update(time_step + 1, obs, efficient_storing)
         obs._obs_env = tmp_obs_env
-        obs._forecasted_inj = tmp_inj
+        obs._forecasted_inj_ = tmp_inj
+        obs._forecasted_inj_lazy = tmp_inj_lazy
 
         if opp_attack is not None:
             self.attacks.update(time_step, opp_attack, efficient_storing)
         else:
-            if efficient_storing:
-                self.attacks.collection[time_step - 1, :] = 0.0
-            else:
-                # might not work !
-                self.attacks = np.concatenate((self.attacks, self.attack_templ))
+            self.attacks.update_vect(time_step, self.attack_templ[0], efficient_storing)
 
         if efficient_storing:
             # efficient way of writing
@@ -721,6 +773,7 @@ class EpisodeData:
         -------
 
         """
+        self.tracer_stats = env._tracer.get_stats()
         if self.force_detail or self.serialize:
             self.episode_times = {}
             self.episode_times["Env"] = {}
@@ -737,6 +790,8 @@ class EpisodeData:
             self.episode_times["Agent"] = {}
             self.episode_times["Agent"]["total"] = float(time_act)
             self.episode_times["total"] = float(end_ - beg_)
+            if self.tracer_stats is not None:
+                self.episode_times["Tracer"] = self.tracer_stats
 
     def to_disk(self):
         """
@@ -860,7 +915,11 @@ class CollectionWrapper:
         The time step at which the game_over occurs. None if there is no game_over
 
     objects:
-        The collection of objects built with the `from_vect` method
+        The collection of objects built with the `from_vect` method. Objects are built only when they are
+        accessed (``None`` otherwise).
+
+        .. versionchanged:: 1.9.5
+            Objects are not all built when the collection is created anymore.
 
     Methods
     -------
@@ -870,6 +929,9 @@ class CollectionWrapper:
     save(path)
         save the collection to disk using `path` as the path to the file to write in.
 
+    start_streaming(path, chunk_size)
+        do not keep the next elements in memory but write them on the hard drive
+
     Raises
     ------
     :class:`grid2op.Exceptions.Grid2OpException`
@@ -889,33 +951,71 @@ class CollectionWrapper:
         self.helper = helper
         self.collection_name = collection_name
         self.elem_name = self.collection_name[:-1]
+        self.check_legit = check_legit
         self.i = 0
         self._game_over = None
-        self.objects = []
+        self.objects = [None] * len(self.collection)
+
+        # used when the collection is streamed on the hard drive (see `start_streaming`)
+        self._stream_path = None
+        self._stream_chunk_size = None
+        self._stream_buffer = None
+        self._stream_buffer_pos = 0
+        self._stream_chunks = []
+        self._stream_nb_row = 0
 
         if not init_me:
             # the runner just has been created, so i don't need to update this collection
             # from previous data, but we need to initialize the list holder
-            self.objects = [None] * len(self.collection)
             return
 
-        for i, elem in enumerate(self.collection):
-            try:
-                collection_obj = self.helper.from_vect(
-                    self.collection[i, :], check_legit=check_legit
-                )
-                self.objects.append(collection_obj)
-            except IncorrectNumberOfElements as exc_:
-                # grid2op does not allow to load the object: there is a mismatch between what has been stored
-                # and what is currently used.
-                raise
-            except NonFiniteElement:
-                self._game_over = i
-                break
-            except EnvError as exc_:
-                self._game_over = i
-                break
-            
+        # objects are built only when accessed (see `__getitem__`) but the size
+        # and the game over are checked now
+        if self.collection.shape[0] and self.collection.shape[1] != self.helper.size():
+            # grid2op does not allow to load the object: there is a mismatch between what has been stored
+            # and what is currently used.
+            raise IncorrectNumberOfElements(
+                "Incorrect number of elements found while load a GridObjects "
+                "from a vector. Found {} elements instead of {}"
+                "".format(self.collection.shape[1], self.helper.size())
+            )
+        self._game_over = self._find_game_over()
+
+    def _find_game_over(self, nb_row_per_batch=1024):
+        """first row that cannot be converted to an object because of non finite values 
+        (``None`` if there are none). It is the same check as the one performed by `from_vect` but it is
+        vectorized (and done by batch of rows to avoid loading everything in memory at once)."""
+        template = self.helper._template_obj
+        nan_ok = type(template).attr_nan_list_set
+        must_be_finite = np.ones(self.collection.shape[1], dtype=bool)
+        prev_ = 0
+        for attr_nm, sh in zip(template.attr_list_vect, template.shape()):
+            if attr_nm in nan_ok:
+                must_be_finite[prev_ : (prev_ + sh)] = False
+            prev_ += sh
+        if not must_be_finite.any():
+            return None
+        for beg_ in range(0, self.collection.shape[0], nb_row_per_batch):
+            tmp = np.asarray(self.collection[beg_ : (beg_ + nb_row_per_batch)])
+            is_ko = (~np.isfinite(tmp[:, must_be_finite])).any(axis=1)
+            if is_ko.any():
+                return beg_ + int(np.argmax(is_ko))
+        return None
+
+    def _build_obj(self, i):
+        return self.helper.from_vect(
+            np.asarray(self.collection[i, :]), check_legit=self.check_legit
+        )
+
+    def _get_obj(self, i, cache=True):
+        """return the object at position `i` (built from the collection if it has not been yet)"""
+        res = self.objects[i]
+        if res is None:
+            res = self._build_obj(i)
+            if cache:
+                self.objects[i] = res
+        return res
+
     def set_game_over(self, game_over_step: int):
         self._game_over = game_over_step
         
@@ -926,8 +1026,12 @@ class CollectionWrapper:
             return self._game_over
 
     def __getitem__(self, i):
-        if isinstance(i, slice) or i < len(self):
-            return self.objects[i]
+        if isinstance(i, slice):
+            return [self._get_obj(el) for el in range(*i.indices(len(self)))]
+        if i < len(self):
+            if i < 0:
+                i += len(self)
+            return self._get_obj(i)
         else:
             raise Grid2OpException(
                 f"Trying to reach {self.elem_name} {i + 1} but "
@@ -941,20 +1045,122 @@ class CollectionWrapper:
     def __next__(self):
         self.i = self.i + 1
         if self.i < len(self) + 1:
-            return self.objects[self.i - 1]
+            # objects built when iterating are not kept, so that looping
+            # through a long episode does not store all of them in memory
+            return self._get_obj(self.i - 1, cache=False)
         else:
             raise StopIteration
 
     def update(self, time_step, value, efficient_storage):
+        if self._stream_path is not None:
+            # streaming mode: the objects are not kept in memory
+            self._stream_append(value.to_vect())
+            return
         if efficient_storage:
             self.collection[time_step - 1, :] = value.to_vect()
         else:
             self.collection = np.concatenate(
                 (self.collection, value.to_vect().reshape(1, -1))
             )
-        self.objects[time_step - 1] = value
+        if time_step - 1 < len(self.objects):
+            self.objects[time_step - 1] = value
+        else:
+            self.objects.append(value)
+
+    def update_vect(self, time_step, vect, efficient_storage):
+        """same as :func:`CollectionWrapper.update` but from the vector representation of an object"""
+        if self._stream_path is not None:
+            self._stream_append(vect)
+            return
+        if efficient_storage:
+            self.collection[time_step - 1, :] = vect
+        else:
+            self.collection = np.concatenate(
+                (self.collection, np.asarray(vect).reshape(1, -1))
+            )
+        if time_step - 1 < len(self.objects):
+            self.objects[time_step - 1] = None
+        else:
+            self.objects.append(None)
+
+    def start_streaming(self, path, chunk_size):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        The next elements of the collection are not kept in memory. They are written on the hard drive, in files
+        of (at most) `chunk_size` rows, as soon as `chunk_size` elements have been added. 
+        The rows already present in the collection are the first ones written.
+
+        When :func:`CollectionWrapper.save` is called, all these files are merged into the
+        file `path` (in the ".npy" format) which is then memory mapped.
+
+        .. versionadded:: 1.9.5
+
+        """
+        chunk_size = int(chunk_size)
+        if chunk_size <= 0:
+            raise Grid2OpException(f"The size of the chunks should be > 0, found {chunk_size}")
+        self._stream_path = path
+        self._stream_chunk_size = chunk_size
+        self._stream_buffer = np.full((chunk_size, self.collection.shape[1]),
+                                      fill_value=np.NaN,
+                                      dtype=self.collection.dtype)
+        self._stream_buffer_pos = 0
+        self._stream_chunks = []
+        self._stream_nb_row = 0
+        os.makedirs(self._get_chunk_dir(), exist_ok=True)
+        for vect in self.collection:
+            self._stream_append(vect)
+        self.collection = self.collection[:0]
+        self.objects = []
+
+    def _get_chunk_dir(self):
+        return f"{self._stream_path}_chunks"
+
+    def _stream_append(self, vect):
+        self._stream_buffer[self._stream_buffer_pos, :] = vect
+        self._stream_buffer_pos += 1
+        self._stream_nb_row += 1
+        if self._stream_buffer_pos == self._stream_chunk_size:
+            self._stream_flush()
+
+    def _stream_flush(self):
+        if self._stream_buffer_pos == 0:
+            return
+        chunk_path = os.path.join(self._get_chunk_dir(), 
+                                  "chunk_{:06d}.npy".format(len(self._stream_chunks)))
+        np.save(chunk_path, self._stream_buffer[:self._stream_buffer_pos])
+        self._stream_chunks.append(chunk_path)
+        self._stream_buffer_pos = 0
+
+    def _end_streaming(self):
+        """merge all the chunks in the final file and memory map it"""
+        self._stream_flush()
+        final = np.lib.format.open_memmap(self._stream_path,
+                                          mode="w+",
+                                          dtype=self._stream_buffer.dtype,
+                                          shape=(self._stream_nb_row, self._stream_buffer.shape[1]))
+        prev_ = 0
+        for chunk_path in self._stream_chunks:
+            chunk = np.load(chunk_path)
+            final[prev_:(prev_ + chunk.shape[0])] = chunk
+            prev_ += chunk.shape[0]
+        final.flush()
+        del final
+        shutil.rmtree(self._get_chunk_dir(), ignore_errors=True)
+        self.collection = np.load(self._stream_path, mmap_mode="r")
+        self.objects = [None] * self.collection.shape[0]
+        self._stream_path = None
+        self._stream_buffer = None
+        self._stream_chunks = []
 
     def save(self, path):
+        if self._stream_path is not None:
+            # the data are already on the hard drive
+            self._end_streaming()
+            return
         np.savez_compressed(
             path, data=self.collection
         )  # do not change keyword arguments
@@ -124,7 +124,8 @@ class EpisodeReplay(object):
         self.episode_data = EpisodeData.from_disk(
             agent_path=self.agent_path, name=episode_id
         )
-        all_obs = [el for el in self.episode_data.observations]
+        # observations are built one at a time, when needed
+        all_obs = self.episode_data.observations
         # Create a plotter
         width, height = resolution
         plot_runner = PlotMatplot(
@@ -7,10 +7,8 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import time
-import requests
 import os
 import warnings
-import pkg_resources
 from typing import Union, Optional
 import logging
 
@@ -23,7 +21,8 @@ from grid2op.Download.DownloadDataset import _aux_download
 
 _VAR_FORCE_TEST = "_GRID2OP_FORCE_TEST"
 
-DEV_DATA_FOLDER = pkg_resources.resource_filename("grid2op", "data")
+# same as `pkg_resources.resource_filename("grid2op", "data")` (pkg_resources is slow to import)
+DEV_DATA_FOLDER = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
 DEV_DATASET = os.path.join(DEV_DATA_FOLDER, "{}")
 TEST_DEV_ENVS = {
     "blank": DEV_DATASET.format("blank"),
@@ -145,6 +144,8 @@ def _send_request_retry(url, nb_retry=10, gh_session=None):
         raise Grid2OpException(_REQUEST_FAIL_EXHAUSTED_ERR.format(url))
 
     if gh_session is None:
+        # requests is only imported when something needs to be downloaded
+        import requests
         gh_session = requests.Session()
 
     try:
@@ -13,7 +13,7 @@ import json
 import warnings
 
 from grid2op.Environment import Environment
-from grid2op.Backend import Backend, PandaPowerBackend
+from grid2op.Backend import Backend
 from grid2op.Opponent.opponentSpace import OpponentSpace
 from grid2op.Parameters import Parameters
 from grid2op.Chronics import ChronicsHandler, ChangeNothing, FromNPY, FromChronix2grid
@@ -374,9 +374,11 @@ def make_from_dataset_path(
         names_chronics_to_backend = None
         
     # Get default backend class
-    backend_class_cfg = PandaPowerBackend
     if "backend_class" in config_data and config_data["backend_class"] is not None:
         backend_class_cfg = config_data["backend_class"]
+    else:
+        from grid2op.Backend import PandaPowerBackend
+        backend_class_cfg = PandaPowerBackend
     ## Create the backend, to compute the powerflow
     backend = _get_default_aux(
         "backend",
@@ -8,10 +8,9 @@
 
 import os
 import warnings
-import pkg_resources
 
 from grid2op.Environment import Environment
-from grid2op.Backend import Backend, PandaPowerBackend
+from grid2op.Backend import Backend
 from grid2op.Parameters import Parameters
 from grid2op.Chronics import ChronicsHandler, Multifolder, ChangeNothing
 from grid2op.Chronics import (
@@ -61,7 +60,7 @@ from grid2op.Chronics.Settings_case14_realistic import (
 from grid2op.MakeEnv.get_default_aux import _get_default_aux
 
 
-data_folder = pkg_resources.resource_filename("grid2op", "data")
+data_folder = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "data")
 CASE_14_FILE = os.path.abspath(
     os.path.join(data_folder, "rte_case14_redisp", "grid.json")
 )
@@ -262,6 +261,7 @@ def make_old(name_env="case14_realistic", **kwargs):
 
     ## the backend use, to compute the powerflow
     msg_error = 'The backend of the environment (keyword "backend") must be an instance of grid2op.Backend'
+    from grid2op.Backend import PandaPowerBackend
     backend = _get_default_aux(
         "backend",
         kwargs,
@@ -9,10 +9,8 @@
 import copy
 import datetime
 import warnings
-import networkx
 from abc import abstractmethod
 import numpy as np
-from scipy.sparse import csr_matrix
 from typing import Optional
 
 from grid2op.dtypes import dt_int, dt_float, dt_bool
@@ -484,6 +482,11 @@ class BaseObservation(GridObjects):
     # value to assess if two observations are equal
     _tol_equal = 1e-3
 
+    # static part of the connectivity matrix (computed once per grid class, see `_get_connectivity_pattern`)
+    _connectivity_pattern = None
+    # above this fraction of modified substations, the connectivity matrix is computed from scratch
+    _max_ratio_sub_incremental = 0.3
+
     def __init__(self,
                  obs_env=None,
                  action_helper=None,
@@ -496,6 +499,7 @@ class BaseObservation(GridObjects):
         self.action_helper = action_helper
         # handles the forecasts here
         self._forecasted_grid_act = {}
+        self._forecasted_inj_lazy = None  # forecasts not read yet (see `_forecasted_inj`)
         self._forecasted_inj = []
         self._env_internal_params = {}
         
@@ -578,7 +582,10 @@ class BaseObservation(GridObjects):
         
         # to save some computation time
         self._connectivity_matrix_ = None
+        self._connectivity_matrix_key_ = None
         self._bus_connectivity_matrix_ = None
+        self._bus_mapping_ = None
+        self._energy_graph_ = None
         self._dictionnarized = None
         self._vectorized = None
 
@@ -699,17 +706,54 @@ class BaseObservation(GridObjects):
 
         # just copy
         res._connectivity_matrix_ = copy.copy(self._connectivity_matrix_)
+        res._connectivity_matrix_key_ = copy.deepcopy(self._connectivity_matrix_key_)
         res._bus_connectivity_matrix_ = copy.copy(self._bus_connectivity_matrix_)
+        res._bus_mapping_ = self._bus_mapping_  # never modified inplace
+        res._energy_graph_ = self._energy_graph_  # frozen
         res._dictionnarized = copy.copy(self._dictionnarized)
         res._vectorized = copy.copy(self._vectorized)
 
         # handles the forecasts here
         res._forecasted_grid_act = copy.copy(self._forecasted_grid_act)
-        res._forecasted_inj = copy.copy(self._forecasted_inj)
+        res._forecasted_inj_ = copy.copy(self._forecasted_inj_)
+        res._forecasted_inj_lazy = self._forecasted_inj_lazy  # never modified
         res._env_internal_params  = copy.copy(self._env_internal_params )
 
         return res
 
+    def _copy_into(self, other):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Copy the content of this observation into `other` (an observation of the same class) without allocating
+        any new observation. It is used by the pool of observations of the simulate function.
+        """
+        other._obs_env = self._obs_env
+        other.action_helper = self.action_helper
+        other._ptr_kwargs_env = self._ptr_kwargs_env
+
+        # copy regular attributes
+        self._aux_copy(other=other)
+
+        # just copy (the connectivity matrix of `other` is kept if this one has none: it is updated
+        # incrementally next time it is needed)
+        if self._connectivity_matrix_ is not None:
+            other._connectivity_matrix_ = copy.copy(self._connectivity_matrix_)
+            other._connectivity_matrix_key_ = copy.deepcopy(self._connectivity_matrix_key_)
+        other._bus_connectivity_matrix_ = copy.copy(self._bus_connectivity_matrix_)
+        other._bus_mapping_ = self._bus_mapping_
+        other._energy_graph_ = self._energy_graph_
+        other._dictionnarized = copy.copy(self._dictionnarized)
+        other._vectorized = copy.copy(self._vectorized)
+
+        # handles the forecasts here
+        other._forecasted_grid_act = copy.copy(self._forecasted_grid_act)
+        other._forecasted_inj_ = copy.copy(self._forecasted_inj_)
+        other._forecasted_inj_lazy = self._forecasted_inj_lazy
+        other._env_internal_params = copy.copy(self._env_internal_params)
+
     def __deepcopy__(self, memodict={}):
         res = type(self)(obs_env=self._obs_env,
                          action_helper=self.action_helper,
@@ -720,15 +764,19 @@ class BaseObservation(GridObjects):
 
         # just deepcopy
         res._connectivity_matrix_ = copy.deepcopy(self._connectivity_matrix_, memodict)
+        res._connectivity_matrix_key_ = copy.deepcopy(self._connectivity_matrix_key_, memodict)
         res._bus_connectivity_matrix_ = copy.deepcopy(
             self._bus_connectivity_matrix_, memodict
         )
+        res._bus_mapping_ = copy.deepcopy(self._bus_mapping_, memodict)
+        res._energy_graph_ = None  # computed again if needed
         res._dictionnarized = copy.deepcopy(self._dictionnarized, memodict)
         res._vectorized = copy.deepcopy(self._vectorized, memodict)
 
         # handles the forecasts here
         res._forecasted_grid_act = copy.deepcopy(self._forecasted_grid_act, memodict)
-        res._forecasted_inj = copy.deepcopy(self._forecasted_inj, memodict)
+        res._forecasted_inj_ = copy.deepcopy(self._forecasted_inj_, memodict)
+        res._forecasted_inj_lazy = self._forecasted_inj_lazy
         res._env_internal_params = copy.deepcopy(self._env_internal_params, memodict)
 
         return res
@@ -1216,9 +1264,9 @@ class BaseObservation(GridObjects):
         self.storage_power[:] = np.NaN
 
         # to save up computation time
+        # (the connectivity matrices depend only on the topology, they are recomputed if it changes)
         self._dictionnarized = None
-        self._connectivity_matrix_ = None
-        self._bus_connectivity_matrix_ = None
+        self._energy_graph_ = None
 
         if self.shunts_data_available:
             self._shunt_p[:] = np.NaN
@@ -1268,6 +1316,7 @@ class BaseObservation(GridObjects):
         non deterministic behaviour.
         """
         self._is_done = True
+        self._energy_graph_ = None
         self.gen_p[:] = 0.0
         self.gen_q[:] = 0.0
         self.gen_v[:] = 0.0
@@ -1666,77 +1715,124 @@ class BaseObservation(GridObjects):
             #     - assign bus 2 to load 0 [on substation 1]
             # -> one of them is on bus 1 [line (extremity) 0] and the other on bus 2 [load 0]
         """
+        from scipy.sparse import csr_matrix
+        cls = type(self)
         if (
-            self._connectivity_matrix_ is None
-            or (
-                isinstance(self._connectivity_matrix_, csr_matrix) and not as_csr_matrix
-            )
-            or (
-                (not isinstance(self._connectivity_matrix_, csr_matrix))
-                and as_csr_matrix
-            )
+            self._connectivity_matrix_ is not None
+            and isinstance(self._connectivity_matrix_, csr_matrix) == as_csr_matrix
+            and self._connectivity_matrix_key_ is not None
         ):
-            # self._connectivity_matrix_ = np.zeros(shape=(self.dim_topo, self.dim_topo), dtype=dt_float)
-            # fill it by block for the objects
-            beg_ = 0
-            end_ = 0
-            row_ind = []
-            col_ind = []
-            for sub_id, nb_obj in enumerate(self.sub_info):
-                # it must be a vanilla python integer, otherwise it's not handled by some backend
-                # especially if written in c++
-                nb_obj = int(nb_obj)
-                end_ += nb_obj
-                # tmp = np.zeros(shape=(nb_obj, nb_obj), dtype=dt_float)
-                for obj1 in range(nb_obj):
-                    my_bus = self.topo_vect[beg_ + obj1]
-                    if my_bus == -1:
-                        # object is disconnected, nothing is done
-                        continue
-                    # connect an object to itself
-                    row_ind.append(beg_ + obj1)
-                    col_ind.append(beg_ + obj1)
-
-                    # connect the other objects to it
-                    for obj2 in range(obj1 + 1, nb_obj):
-                        my_bus2 = self.topo_vect[beg_ + obj2]
-                        if my_bus2 == -1:
-                            # object is disconnected, nothing is done
-                            continue
-                        if my_bus == my_bus2:
-                            # objects are on the same bus
-                            # tmp[obj1, obj2] = 1
-                            # tmp[obj2, obj1] = 1
-                            row_ind.append(beg_ + obj2)
-                            col_ind.append(beg_ + obj1)
-                            row_ind.append(beg_ + obj1)
-                            col_ind.append(beg_ + obj2)
-                beg_ += nb_obj
-
-            # both ends of a line are connected together (if line is connected)
-            for q_id in range(self.n_line):
-                if self.line_status[q_id]:
-                    # if powerline is connected connect both its side
-                    row_ind.append(self.line_or_pos_topo_vect[q_id])
-                    col_ind.append(self.line_ex_pos_topo_vect[q_id])
-                    row_ind.append(self.line_ex_pos_topo_vect[q_id])
-                    col_ind.append(self.line_or_pos_topo_vect[q_id])
-            row_ind = np.array(row_ind).astype(dt_int)
-            col_ind = np.array(col_ind).astype(dt_int)
+            prev_topo, prev_status = self._connectivity_matrix_key_
+            changed = prev_topo != self.topo_vect
+            line_changed = prev_status != self.line_status
+            if not changed.any() and not line_changed.any():
+                # nothing changed since last time
+                return self._connectivity_matrix_
             if not as_csr_matrix:
-                self._connectivity_matrix_ = np.zeros(
-                    shape=(self.dim_topo, self.dim_topo), dtype=dt_float
-                )
-                self._connectivity_matrix_[row_ind.T, col_ind] = 1.0
-            else:
-                data = np.ones(row_ind.shape[0], dtype=dt_float)
-                self._connectivity_matrix_ = csr_matrix(
-                    (data, (row_ind, col_ind)),
-                    shape=(self.dim_topo, self.dim_topo),
-                    dtype=dt_float,
-                )
+                sub_changed = np.unique(cls._topo_vect_to_sub[changed])
+                if sub_changed.shape[0] <= cls._max_ratio_sub_incremental * cls.n_sub:
+                    # only a few substations are affected, i only update them
+                    self._aux_update_connectivity_matrix(sub_changed, line_changed)
+                    return self._connectivity_matrix_
+
+        row_ind, col_ind = self._aux_get_connectivity_ind()
+        if not as_csr_matrix:
+            self._connectivity_matrix_ = np.zeros(
+                shape=(self.dim_topo, self.dim_topo), dtype=dt_float
+            )
+            self._connectivity_matrix_[row_ind, col_ind] = 1.0
+        else:
+            data = np.ones(row_ind.shape[0], dtype=dt_float)
+            self._connectivity_matrix_ = csr_matrix(
+                (data, (row_ind, col_ind)),
+                shape=(self.dim_topo, self.dim_topo),
+                dtype=dt_float,
+            )
+        self._connectivity_matrix_key_ = (self.topo_vect.copy(), self.line_status.copy())
         return self._connectivity_matrix_
 
+    @classmethod
+    def _get_connectivity_pattern(cls):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Compute (once per grid class) the static part of the connectivity matrix: all pairs of elements
+        (`el_1`, `el_2`) with `el_1 < el_2` that are connected to the same substation. Only these
+        pairs (and the ones made of the two sides of a powerline) can be non zero in the
+        connectivity matrix.
+
+        .. versionadded:: 1.9.5
+
+        Returns
+        -------
+        pair_1: ``numpy.ndarray``
+            The position in the topo vect of the first element of each pair
+
+        pair_2: ``numpy.ndarray``
+            The position in the topo vect of the second element of each pair
+
+        sub_start: ``numpy.ndarray``
+            The position in the topo vect of the first element of each substation
+
+        """
+        if cls.__dict__.get("_connectivity_pattern") is None:
+            sub_info = np.asarray(cls.sub_info, dtype=dt_int)
+            sub_start = np.concatenate(([0], np.cumsum(sub_info)[:-1])).astype(dt_int)
+            li_pair_1 = []
+            li_pair_2 = []
+            for beg_, nb_obj in zip(sub_start, sub_info):
+                pair_1, pair_2 = np.triu_indices(int(nb_obj), k=1)
+                li_pair_1.append(pair_1 + beg_)
+                li_pair_2.append(pair_2 + beg_)
+            pair_1 = np.concatenate(li_pair_1).astype(dt_int)
+            pair_2 = np.concatenate(li_pair_2).astype(dt_int)
+            cls._connectivity_pattern = (pair_1, pair_2, sub_start)
+        return cls._connectivity_pattern
+
+    def _aux_get_connectivity_ind(self):
+        """compute the (row, col) of the non zero coefficients of the connectivity matrix, see `connectivity_matrix`"""
+        cls = type(self)
+        pair_1, pair_2, _ = cls._get_connectivity_pattern()
+        topo_vect = self.topo_vect
+        is_connected = topo_vect != -1
+        same_bus = (topo_vect[pair_1] == topo_vect[pair_2]) & is_connected[pair_1]
+        pair_1 = pair_1[same_bus]
+        pair_2 = pair_2[same_bus]
+        # objects are connected to themselves
+        diag = np.where(is_connected)[0]
+        # both ends of a line are connected together (if line is connected)
+        lor = cls.line_or_pos_topo_vect[self.line_status]
+        lex = cls.line_ex_pos_topo_vect[self.line_status]
+        row_ind = np.concatenate((diag, pair_2, pair_1, lor, lex)).astype(dt_int)
+        col_ind = np.concatenate((diag, pair_1, pair_2, lex, lor)).astype(dt_int)
+        return row_ind, col_ind
+
+    def _aux_update_connectivity_matrix(self, sub_changed, line_changed):
+        """update the (dense) connectivity matrix, only for the substations in `sub_changed` and the
+        powerlines in `line_changed`"""
+        cls = type(self)
+        _, _, sub_start = cls._get_connectivity_pattern()
+        for sub_id in sub_changed:
+            beg_ = sub_start[sub_id]
+            end_ = beg_ + cls.sub_info[sub_id]
+            bus = self.topo_vect[beg_:end_]
+            is_connected = bus != -1
+            block = (bus.reshape(-1, 1) == bus.reshape(1, -1)) & is_connected.reshape(-1, 1)
+            self._connectivity_matrix_[beg_:end_, beg_:end_] = block
+        # both ends of the powerlines
+        line_disc = line_changed & (~self.line_status)
+        lor = cls.line_or_pos_topo_vect[line_disc]
+        lex = cls.line_ex_pos_topo_vect[line_disc]
+        self._connectivity_matrix_[lor, lex] = 0.0
+        self._connectivity_matrix_[lex, lor] = 0.0
+        lor = cls.line_or_pos_topo_vect[self.line_status]
+        lex = cls.line_ex_pos_topo_vect[self.line_status]
+        self._connectivity_matrix_[lor, lex] = 1.0
+        self._connectivity_matrix_[lex, lor] = 1.0
+        self._connectivity_matrix_key_ = (self.topo_vect.copy(), self.line_status.copy())
+
     def _aux_fun_get_bus(self):
         """see in bus_connectivity matrix"""
         bus_or = self.topo_vect[self.line_or_pos_topo_vect]
@@ -1751,6 +1847,51 @@ class BaseObservation(GridObjects):
         nb_bus = unique_bus.shape[0]
         return nb_bus, unique_bus, bus_or, bus_ex
 
+    def _aux_get_bus_mapping(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        Computes the bus (row / column in the "bus" matrices, see :func:`BaseObservation.bus_connectivity_matrix`
+        and :func:`BaseObservation.flow_bus_matrix`) of each element of the grid.
+
+        The result only depends on the topology and is kept as long as the topology does not change.
+
+        .. versionadded:: 1.9.5
+
+        Returns
+        -------
+        res: ``dict``
+            With keys "nb_bus", "bus_or", "bus_ex" (see `_aux_fun_get_bus`), "tmplate" (to convert
+            a bus id to a row in the matrices) and, for "load", "gen", "storage", "line_or", "line_ex":
+            the "grid2op" bus id (see `_get_bus_id`) and if the element is connected
+            (*eg* `res["load"] = (load_bus, load_conn)`)
+
+        """
+        if self._bus_mapping_ is not None and (self._bus_mapping_["topo_vect"] == self.topo_vect).all():
+            return self._bus_mapping_
+        cls = type(self)
+        nb_bus, unique_bus, bus_or, bus_ex = self._aux_fun_get_bus()
+        # convert the bus id (from 0 to 2 * n_sub) to the row / column in the matrix (number between 0 and nb_bus)
+        tmplate = np.arange(np.max(unique_bus) + 1)
+        tmplate[unique_bus] = np.arange(nb_bus)
+        res = {"topo_vect": self.topo_vect.copy(),
+               "nb_bus": nb_bus,
+               "bus_or": bus_or,
+               "bus_ex": bus_ex,
+               "tmplate": tmplate,
+               "load": self._get_bus_id(cls.load_pos_topo_vect, cls.load_to_subid),
+               "gen": self._get_bus_id(cls.gen_pos_topo_vect, cls.gen_to_subid),
+               "storage": self._get_bus_id(cls.storage_pos_topo_vect, cls.storage_to_subid),
+               "line_or": self._get_bus_id(cls.line_or_pos_topo_vect, cls.line_or_to_subid),
+               "line_ex": self._get_bus_id(cls.line_ex_pos_topo_vect, cls.line_ex_to_subid),
+               }
+        self._bus_mapping_ = res
+        # the topology changed, this matrix needs to be recomputed
+        self._bus_connectivity_matrix_ = None
+        return res
+
     def bus_connectivity_matrix(self, as_csr_matrix=False, return_lines_index=False):
         """
         If we denote by `nb_bus` the total number bus of the powergrid (you can think of a "bus" being
@@ -1806,6 +1947,7 @@ class BaseObservation(GridObjects):
             # (of course you can replace 0 with any integer `0 <= l_id < obs.n_line`
 
         """
+        from scipy.sparse import csr_matrix
         if self._is_done:
             self._bus_connectivity_matrix_ = None
             nb_bus = 1
@@ -1822,23 +1964,17 @@ class BaseObservation(GridObjects):
                 res = (tmp_, lor_bus, lex_bus)
             return res
         if (
-            self._bus_connectivity_matrix_ is None
-            or (
-                isinstance(self._bus_connectivity_matrix_, csr_matrix)
-                and not as_csr_matrix
-            )
-            or (
-                (not isinstance(self._bus_connectivity_matrix_, csr_matrix))
-                and as_csr_matrix
-            )
-            or return_lines_index
+            self._bus_connectivity_matrix_ is not None
+            and isinstance(self._bus_connectivity_matrix_, csr_matrix) != as_csr_matrix
         ):
-            nb_bus, unique_bus, bus_or, bus_ex = self._aux_fun_get_bus()
-
-            # convert the bus id (from 0 to 2 * n_sub) to the row / column in the matrix (number between 0 and nb_bus)
+            self._bus_connectivity_matrix_ = None
+        mapping = self._aux_get_bus_mapping()
+        tmplate = mapping["tmplate"]
+        if self._bus_connectivity_matrix_ is None:
+            nb_bus = mapping["nb_bus"]
+            bus_or = mapping["bus_or"]
+            bus_ex = mapping["bus_ex"]
             all_indx = np.arange(nb_bus)
-            tmplate = np.arange(np.max(unique_bus) + 1)
-            tmplate[unique_bus] = all_indx
             bus_or_in_mat = tmplate[bus_or]
             bus_ex_in_mat = tmplate[bus_ex]
 
@@ -1862,13 +1998,8 @@ class BaseObservation(GridObjects):
         if not return_lines_index:
             res = self._bus_connectivity_matrix_
         else:
-            # bus or and bus ex are defined above is return_line_index is True
-            lor_bus, _ = self._get_bus_id(
-                self.line_or_pos_topo_vect, self.line_or_to_subid
-            )
-            lex_bus, _ = self._get_bus_id(
-                self.line_ex_pos_topo_vect, self.line_ex_to_subid
-            )
+            lor_bus, _ = mapping["line_or"]
+            lex_bus, _ = mapping["line_ex"]
             res = (self._bus_connectivity_matrix_, (tmplate[lor_bus], tmplate[lex_bus]))
         return res
 
@@ -1960,6 +2091,7 @@ class BaseObservation(GridObjects):
         matrix. `flow_mat.sum(axis=1)`
 
         """
+        from scipy.sparse import csr_matrix
         if self._is_done:
             flow_mat = csr_matrix((1,1), dtype=dt_float)
             if not as_csr_matrix:
@@ -1972,22 +2104,13 @@ class BaseObservation(GridObjects):
             lex_bus = np.zeros(cls.n_line, dtype=dt_int)
             return flow_mat, (load_bus, prod_bus, stor_bus, lor_bus, lex_bus)
         
-        nb_bus, unique_bus, bus_or, bus_ex = self._aux_fun_get_bus()
-        prod_bus, prod_conn = self._get_bus_id(
-            self.gen_pos_topo_vect, self.gen_to_subid
-        )
-        load_bus, load_conn = self._get_bus_id(
-            self.load_pos_topo_vect, self.load_to_subid
-        )
-        stor_bus, stor_conn = self._get_bus_id(
-            self.storage_pos_topo_vect, self.storage_to_subid
-        )
-        lor_bus, lor_conn = self._get_bus_id(
-            self.line_or_pos_topo_vect, self.line_or_to_subid
-        )
-        lex_bus, lex_conn = self._get_bus_id(
-            self.line_ex_pos_topo_vect, self.line_ex_to_subid
-        )
+        mapping = self._aux_get_bus_mapping()
+        nb_bus = mapping["nb_bus"]
+        prod_bus, prod_conn = mapping["gen"]
+        load_bus, load_conn = mapping["load"]
+        stor_bus, stor_conn = mapping["storage"]
+        lor_bus, lor_conn = mapping["line_or"]
+        lex_bus, lex_conn = mapping["line_ex"]
 
         if self.shunts_data_available:
             sh_bus = 1 * self._shunt_bus
@@ -2000,8 +2123,7 @@ class BaseObservation(GridObjects):
         # convert the bus to be "id of row or column in the matrix" instead of the bus id with
         # the "grid2op convention"
         all_indx = np.arange(nb_bus)
-        tmplate = np.arange(np.max(unique_bus) + 1)
-        tmplate[unique_bus] = all_indx
+        tmplate = mapping["tmplate"]
         prod_bus = tmplate[prod_bus]
         load_bus = tmplate[load_bus]
         lor_bus = tmplate[lor_bus]
@@ -2029,50 +2151,12 @@ class BaseObservation(GridObjects):
         data = np.zeros(nb_bus + nb_lor + nb_lex, dtype=dt_float)
 
         # if two generators / loads / storage unit are connected at the same bus
-        # this is why i go with matrix product and sparse matrices
-        nb_prod = prod_conn.sum()
-        if nb_prod:
-            bus_prod = np.arange(prod_bus[prod_conn].max() + 1)
-            map_mat = csr_matrix(
-                (np.ones(nb_prod), (prod_bus[prod_conn], np.arange(nb_prod))),
-                shape=(bus_prod.shape[0], nb_prod),
-                dtype=dt_float,
-            )
-            data[bus_prod] += map_mat.dot(prod_vect[prod_conn])
-
-        # handle load
-        nb_load = load_conn.sum()
-        if nb_load:
-            bus_load = np.arange(load_bus[load_conn].max() + 1)
-            map_mat = csr_matrix(
-                (np.ones(nb_load), (load_bus[load_conn], np.arange(nb_load))),
-                shape=(bus_load.shape[0], nb_load),
-                dtype=dt_float,
-            )
-            data[bus_load] -= map_mat.dot(load_vect[load_conn])
-
-        # handle storage
-        nb_stor = stor_conn.sum()
-        if nb_stor:
-            bus_stor = np.arange(stor_bus[stor_conn].max() + 1)
-            map_mat = csr_matrix(
-                (np.ones(nb_stor), (stor_bus[stor_conn], np.arange(nb_stor))),
-                shape=(bus_stor.shape[0], nb_stor),
-                dtype=dt_float,
-            )
-            data[bus_stor] -= map_mat.dot(stor_vect[stor_conn])
-
+        # their values are summed
+        self._aux_add_to_bus(data, prod_bus, prod_conn, prod_vect)
+        self._aux_add_to_bus(data, load_bus, load_conn, -load_vect)
+        self._aux_add_to_bus(data, stor_bus, stor_conn, -stor_vect)
         if self.shunts_data_available:
-            # handle shunts
-            nb_shunt = sh_conn.sum()
-            if nb_shunt:
-                bus_shunt = np.arange(sh_bus[sh_conn].max() + 1)
-                map_mat = csr_matrix(
-                    (np.ones(nb_shunt), (sh_bus[sh_conn], np.arange(nb_shunt))),
-                    shape=(bus_shunt.shape[0], nb_shunt),
-                    dtype=dt_float,
-                )
-                data[bus_shunt] -= map_mat.dot(sh_vect[sh_conn])
+            self._aux_add_to_bus(data, sh_bus, sh_conn, -sh_vect)
 
         # powerlines
         data[np.arange(nb_lor) + nb_bus] -= or_vect[lor_conn]
@@ -2087,8 +2171,16 @@ class BaseObservation(GridObjects):
 
         return res, (load_bus, prod_bus, stor_bus, lor_bus, lex_bus)
 
+    @staticmethod
+    def _aux_add_to_bus(data, el_bus, el_conn, el_vect):
+        """add the value `el_vect` of each connected element to the bus `el_bus` to which it is connected"""
+        if el_conn.any():
+            tmp_ = np.bincount(el_bus[el_conn], weights=el_vect[el_conn])
+            data[np.arange(tmp_.shape[0])] += tmp_
+
     def _add_edges_simple(self, vector, attr_nm, lor_bus, lex_bus, graph, fun_reduce=None):
         """add the edges, when the attributes are common for the all the powerline"""
+        import networkx
         dict_ = {}
         for lid, val in enumerate(vector):
             if not self.line_status[lid]:
@@ -2117,6 +2209,7 @@ class BaseObservation(GridObjects):
         Utilities to add attributes of the edges of the graph in networkx, because edges are not necessarily
         "oriented" the same way (so we need to reverse or / ex if networkx oriented it in the same way)
         """
+        import networkx
         dict_or_glop = {}
         for lid, val in enumerate(vector_or):
             if not self.line_status[lid]:
@@ -2160,17 +2253,21 @@ class BaseObservation(GridObjects):
         networkx.set_edge_attributes(graph, dict_or, "{}_or".format(attr_nm))
         networkx.set_edge_attributes(graph, dict_ex, "{}_ex".format(attr_nm))
 
-    def as_networkx(self) -> networkx.Graph:
+    def as_networkx(self) -> "networkx.Graph":
         """Old name for :func:`BaseObservation.get_energy_graph`,
         will be removed in the future.
         """
         return self.get_energy_graph()
     
-    def get_energy_graph(self) -> networkx.Graph:
+    def get_energy_graph(self) -> "networkx.Graph":
         """
         Convert this observation as a networkx graph. This graph is the graph "seen" by
         "the electron" / "the energy" of the power grid.
 
+        .. versionchanged:: 1.9.5
+            The graph is computed only once per observation: calling this function twice returns
+            the same graph.
+
         Notes
         ------
         The resulting graph is "frozen" this means that you cannot add / remove attribute on nodes or edges, nor add /
@@ -2289,8 +2386,11 @@ class BaseObservation(GridObjects):
                 assert abs(q_line - q_) <= 1e-5, "error for kirchoff's law for graph for Q"
 
         """
+        import networkx
+        if self._energy_graph_ is not None:
+            # graph is frozen, it cannot be modified
+            return self._energy_graph_
         cls = type(self)
-        # TODO save this graph somewhere, in a self._as_networkx attributes for example
         mat_p, (load_bus, gen_bus, stor_bus, lor_bus, lex_bus) = self.flow_bus_matrix(
             active_flow=True, as_csr_matrix=True
         )
@@ -2412,6 +2512,7 @@ class BaseObservation(GridObjects):
         
         # extra layer of security: prevent accidental modification of this graph
         networkx.freeze(graph)  
+        self._energy_graph_ = graph
         return graph
 
     def _aux_get_connected_buses(self):
@@ -2692,7 +2793,7 @@ class BaseObservation(GridObjects):
                                                  )
         return sto_ids
     
-    def get_elements_graph(self) -> networkx.DiGraph:
+    def get_elements_graph(self) -> "networkx.DiGraph":
         """This function returns the "elements graph" as a networkx object.
         
         .. seealso::
@@ -2747,6 +2848,7 @@ class BaseObservation(GridObjects):
         networkx.DiGraph
             The "elements graph", see :ref:`elmnt-graph-gg` .
         """
+        import networkx
         cls = type(self)
         
         # init the graph with "grid level" attributes
@@ -2982,6 +3084,11 @@ class BaseObservation(GridObjects):
 
         Notes
         ------
+        If the pool of observations is activated (see
+        :func:`grid2op.Observation.ObservationSpace.set_simulate_pool_size`) the returned
+        observation is re used (and overwritten) by the following calls to `simulate`. Use
+        `simulated_observation.copy()` if you want to keep it.
+
         This is a simulation in the sense that the "next grid state" is not the real grid state you will get. As you
         don't know the future, the "injections you forecast for the next step" will not be the real injection you
         will get in the next step.
@@ -3101,6 +3208,137 @@ class BaseObservation(GridObjects):
         There is no coupling between the different simulation that you perform here.
         
         """
+        timestamp, inj_action = self._aux_get_simulate_inj_action(time_step)
+        self._obs_env.init(
+            inj_action,
+            time_stamp=timestamp,
+            obs=self,
+            time_step=time_step,
+        )
+
+        sim_obs, *rest = self._obs_env.simulate(action)
+        # "self" might be overwritten if it comes from the pool
+        has_forecasted_inj = len(self._forecasted_inj) > 0
+        next_forecasted_inj = self._forecasted_inj[1:]  # remove the first one
+        action_helper = self.action_helper
+        obs_env = self._obs_env
+        if obs_env.use_obs_pool:
+            # see `ObservationSpace.set_simulate_pool_size`
+            sim_obs = obs_env.get_obs_from_pool(sim_obs)
+        else:
+            sim_obs = copy.deepcopy(sim_obs)
+        if has_forecasted_inj:
+            # allow "chain" to simulate
+            sim_obs.action_helper = action_helper  # no copy !
+            sim_obs._obs_env = obs_env  # no copy
+            sim_obs._forecasted_inj = next_forecasted_inj
+            sim_obs._update_internal_env_params(obs_env)
+        return (sim_obs, *rest)  # parentheses are needed for python 3.6 at least.
+
+    def simulate_batch(self, actions, time_step=1):
+        """
+        This method allows to evaluate, in one call, the effect of many "candidate" actions on the
+        forecasted powergrid state. It is equivalent to calling :func:`BaseObservation.simulate` once for each
+        action in `actions` but:
+
+        - the candidates are grouped by injection forecast (*ie* by `time_step`) and the state of the
+          "simulated environment" for a given forecast is computed only once per group
+        - it does not return an observation for each candidate (which would need to be copied) but only
+          stacked numpy arrays
+
+        .. versionadded:: 1.9.5
+
+        .. note::
+            Each candidate counts as one call to `simulate` (see :attr:`grid2op.Parameters.Parameters.MAX_SIMULATE_PER_STEP`
+            and :attr:`grid2op.Parameters.Parameters.MAX_SIMULATE_PER_EPISODE`)
+
+        Parameters
+        ----------
+        actions: ``list``
+            The list of all the :class:`grid2op.Action.BaseAction` you want to simulate
+
+        time_step: ``int`` or ``list``
+            Either the same time step (see :func:`BaseObservation.simulate`) for all the candidates, or
+            one time step per action.
+
+        Returns
+        -------
+        rho: ``numpy.ndarray``
+            The capacity of each powerline (see :attr:`BaseObservation.rho`) after each action.
+            It has the shape (nb_action, n_line).
+
+        reward: ``numpy.ndarray``
+            The simulated reward of each action. It has the shape (nb_action, ).
+
+        done: ``numpy.ndarray``
+            For each action, whether the simulation ended in a game over. It has the shape (nb_action, ).
+
+        has_error: ``numpy.ndarray``
+            For each action, whether an exception has been raised during the simulation (for example if
+            the action is ambiguous, illegal or if the powerflow diverged). It has the shape (nb_action, ).
+
+        Examples
+        ---------
+
+        .. code-block:: python
+
+            import numpy as np
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"  # or any other name
+            env = grid2op.make(env_name)
+            obs = env.reset()
+
+            candidates = [env.action_space({"set_line_status": [(l_id, -1)]})
+                          for l_id in range(env.n_line)]
+            rho, reward, done, has_error = obs.simulate_batch(candidates)
+            best_action = candidates[int(np.argmax(reward))]
+
+        """
+        nb_act = len(actions)
+        if isinstance(time_step, (int, np.integer)):
+            time_steps = np.full(nb_act, fill_value=time_step, dtype=dt_int)
+        else:
+            time_steps = np.array(time_step).astype(dt_int)
+            if time_steps.shape != (nb_act,):
+                raise NoForecastAvailable(
+                    f"You provided {time_steps.shape[0] if time_steps.ndim else 1} time steps for "
+                    f"{nb_act} actions. Please provide either one time step for all actions or "
+                    f"one time step per action."
+                )
+        cls = type(self)
+        rho = np.zeros((nb_act, cls.n_line), dtype=dt_float)
+        reward = np.zeros(nb_act, dtype=dt_float)
+        done = np.zeros(nb_act, dtype=dt_bool)
+        has_error = np.zeros(nb_act, dtype=dt_bool)
+        if nb_act == 0:
+            return rho, reward, done, has_error
+
+        for ts in np.unique(time_steps):
+            ts = int(ts)
+            timestamp, inj_action = self._aux_get_simulate_inj_action(ts)
+            first = True
+            for act_id in np.where(time_steps == ts)[0]:
+                if first:
+                    self._obs_env.init(
+                        inj_action,
+                        time_stamp=timestamp,
+                        obs=self,
+                        time_step=ts,
+                    )
+                    first = False
+                else:
+                    # the action setting the forecasted state is the same for the whole group
+                    self._obs_env.reinit(self, time_step=ts)
+                sim_obs, sim_r, sim_done, sim_info = self._obs_env.simulate(actions[act_id])
+                rho[act_id] = sim_obs.rho
+                reward[act_id] = sim_r
+                done[act_id] = sim_done
+                has_error[act_id] = len(sim_info["exception"]) > 0
+        return rho, reward, done, has_error
+
+    def _aux_get_simulate_inj_action(self, time_step):
+        """check that `simulate` can be used for `time_step` and return the timestamp and the 
+        action (built once and then cached) setting the forecasted injections."""
         if self.action_helper is None:
             raise NoForecastAvailable(
                 "No forecasts are available for this instance of BaseObservation "
@@ -3135,22 +3373,7 @@ class BaseObservation(GridObjects):
 
         timestamp = self._forecasted_grid_act[time_step]["timestamp"]
         inj_action = self._forecasted_grid_act[time_step]["inj_action"]
-        self._obs_env.init(
-            inj_action,
-            time_stamp=timestamp,
-            obs=self,
-            time_step=time_step,
-        )
-
-        sim_obs, *rest = self._obs_env.simulate(action)
-        sim_obs = copy.deepcopy(sim_obs)
-        if self._forecasted_inj:
-            # allow "chain" to simulate
-            sim_obs.action_helper = self.action_helper  # no copy !
-            sim_obs._obs_env = self._obs_env  # no copy
-            sim_obs._forecasted_inj = self._forecasted_inj[1:]  # remove the first one
-            sim_obs._update_internal_env_params(self._obs_env)
-        return (sim_obs, *rest)  # parentheses are needed for python 3.6 at least.
+        return timestamp, inj_action
 
     def copy(self):
         """
@@ -3365,6 +3588,7 @@ class BaseObservation(GridObjects):
 
     def _reset_matrices(self):
         self._vectorized = None
+        self._energy_graph_ = None
 
     def from_vect(self, vect, check_legit=True):
         """
@@ -4001,20 +4225,46 @@ class BaseObservation(GridObjects):
         if not with_forecast:
             return
         
-        inj_action = {}
-        dict_ = {}
-        dict_["load_p"] = dt_float(1.0 * self.load_p)
-        dict_["load_q"] = dt_float(1.0 * self.load_q)
-        dict_["prod_p"] = dt_float(1.0 * self.gen_p)
-        dict_["prod_v"] = dt_float(1.0 * self.gen_v)
-        inj_action["injection"] = dict_
-        # inj_action = self.action_helper(inj_action)
-        timestamp = self.get_time_stamp()
-        self._forecasted_inj = [(timestamp, inj_action)]
-        self._forecasted_inj += env.forecasts()
-        self._forecasted_grid = [None for _ in self._forecasted_inj]
+        # forecasts are only read (and copied) when they are used, see `_forecasted_inj`
+        self._forecasted_inj = []
+        self._forecasted_inj_lazy = env._lazy_forecasts()
         self._env_internal_params = {}
         self._update_internal_env_params(env)
+
+    @property
+    def _forecasted_inj(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        The "forecasts" of the injections: a list of tuple (timestamp, dictionary representing the injections),
+        the first element being the current step.
+
+        .. versionchanged:: 1.9.5
+            It is computed the first time it is used (*eg* by `obs.simulate`, `obs.get_forecasted_inj`,
+            `obs.get_forecast_arrays` or `obs.get_forecast_env`) and not each time the observation
+            is updated.
+        """
+        if self._forecasted_inj_lazy is not None:
+            inj_action = {}
+            dict_ = {}
+            dict_["load_p"] = dt_float(1.0 * self.load_p)
+            dict_["load_q"] = dt_float(1.0 * self.load_q)
+            dict_["prod_p"] = dt_float(1.0 * self.gen_p)
+            dict_["prod_v"] = dt_float(1.0 * self.gen_v)
+            inj_action["injection"] = dict_
+            # inj_action = self.action_helper(inj_action)
+            timestamp = self.get_time_stamp()
+            self._forecasted_inj_ = [(timestamp, inj_action)]
+            self._forecasted_inj_ += self._forecasted_inj_lazy()
+            self._forecasted_inj_lazy = None
+        return self._forecasted_inj_
+
+    @_forecasted_inj.setter
+    def _forecasted_inj(self, value):
+        self._forecasted_inj_ = value
+        self._forecasted_inj_lazy = None
         
     def _update_alarm(self, env):
         if not (self.dim_alarms and env._has_attention_budget):
@@ -4404,6 +4654,25 @@ class BaseObservation(GridObjects):
                              prod_p: np.ndarray,
                              prod_v: Optional[np.ndarray] = None,
                              maintenance: Optional[np.ndarray] = None):
+        obs_env = self._obs_env
+        if obs_env.use_forecast_env_pool:
+            # re use (and re target) one of the environments of the pool
+            res, reused = obs_env.get_forecast_env_from_pool(
+                lambda: self._aux_build_forecast_env(load_p, load_q, prod_p, prod_v, maintenance)
+            )
+            if reused:
+                res._change_forecast_data(self, load_p, load_q, prod_p, prod_v, maintenance,
+                                          parameters=obs_env.parameters)
+                res.set_tracer(obs_env._tracer)
+            return res
+        return self._aux_build_forecast_env(load_p, load_q, prod_p, prod_v, maintenance)
+
+    def _aux_build_forecast_env(self,
+                                load_p: np.ndarray,
+                                load_q: np.ndarray,
+                                prod_p: np.ndarray,
+                                prod_v: Optional[np.ndarray] = None,
+                                maintenance: Optional[np.ndarray] = None):
         from grid2op.Chronics import FromNPY, ChronicsHandler
         from grid2op.Environment._forecast_env import _ForecastEnv
         ch = ChronicsHandler(FromNPY,
@@ -4425,6 +4694,7 @@ class BaseObservation(GridObjects):
                            )
         # it does one simulation when it inits it (calling env.step) so I remove 1 here
         res.highres_sim_counter._HighResSimCounter__nb_highres_called = nb_highres_called
+        res.set_tracer(self._obs_env._tracer)
         return res
 
     def change_forecast_parameters(self, params):
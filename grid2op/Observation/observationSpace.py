@@ -112,6 +112,8 @@ class ObservationSpace(SerializableObservationSpace):
         self.reward_helper = RewardHelper(reward_func=self._reward_func, logger=self.logger)
 
         self.__can_never_use_simulate = False
+        self._simulate_pool_size = 0
+        self._forecast_env_pool_size = 0
         # TODO here: have another backend class maybe
         _with_obs_env = _with_obs_env and self._create_backend_obs(env, observation_bk_class, observation_bk_kwargs)
             
@@ -203,6 +205,9 @@ class ObservationSpace(SerializableObservationSpace):
         )
         for k, v in self.obs_env.other_rewards.items():
             v.initialize(self.obs_env)
+        self.obs_env._tracer = env._tracer
+        self.obs_env.set_obs_pool_size(self._simulate_pool_size)
+        self.obs_env.set_forecast_env_pool_size(self._forecast_env_pool_size)
     
     def _aux_create_backend(self, env, observation_bk_class, observation_bk_kwargs, path_grid_for):
         if observation_bk_kwargs is None:
@@ -288,6 +293,109 @@ class ObservationSpace(SerializableObservationSpace):
         self.set_real_env_kwargs(env)
         self.with_forecast = True
         
+    def set_simulate_pool_size(self, pool_size):
+        """
+        .. versionadded:: 1.9.5
+
+        Activate (if `pool_size` > 0) or deactivate (if `pool_size` is 0) the pool of observations
+        used by :func:`grid2op.Observation.BaseObservation.simulate`.
+
+        By default (when it is deactivated) each call to `obs.simulate` returns a new observation (deep copied).
+        When it is activated, the observations returned by `obs.simulate` are taken from a pool of
+        `pool_size` pre allocated observations: no new observation is created, the results of the simulation are
+        copied in the next observation of the pool.
+
+        This is faster, but the observation returned by `obs.simulate` is overwritten by
+        the `pool_size` th next call to `obs.simulate`. If you want to keep it, you need to copy it
+        explicitly (with `sim_obs.copy()`).
+
+        Parameters
+        ----------
+        pool_size: ``int``
+            Number of observations in the pool (0 to deactivate it)
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            env.observation_space.set_simulate_pool_size(1)
+
+            obs = env.reset()
+            best_rho = None
+            best_obs = None
+            for act in [env.action_space(), env.action_space.disconnect_powerline(line_id=0)]:
+                sim_obs, sim_r, sim_d, sim_i = obs.simulate(act)
+                if sim_d:
+                    continue
+                if best_rho is None or sim_obs.rho.max() < best_rho:
+                    best_rho = sim_obs.rho.max()
+                    best_obs = sim_obs.copy()  # it would be overwritten by the next simulate otherwise
+
+        """
+        pool_size = int(pool_size)
+        if pool_size < 0:
+            raise EnvError("The size of the pool of observation should be >= 0")
+        self._simulate_pool_size = pool_size
+        if self.obs_env is not None:
+            self.obs_env.set_obs_pool_size(pool_size)
+
+    def set_forecast_env_pool_size(self, pool_size):
+        """
+        .. versionadded:: 1.9.5
+
+        Activate (if `pool_size` > 0) or deactivate (if `pool_size` is 0) the pool of environments
+        returned by :func:`grid2op.Observation.BaseObservation.get_forecast_env` and
+        :func:`grid2op.Observation.BaseObservation.get_env_from_external_forecasts`.
+
+        By default (when it is deactivated) each call to these functions builds a new environment (which
+        includes a copy of the backend, the creation of all the spaces etc.).
+        When it is activated, the environments are taken from a pool of `pool_size` environments: they are
+        only built once and then "re targeted" to the new forecasts and to the
+        state of the observation at each call (as always, they need to be reset before being used).
+
+        This is much faster, but the environment returned is modified by the `pool_size` th next call to
+        one of these functions. If you need to use different forecast environments at the same time (for
+        example one for each horizon), use a pool of the appropriate size.
+
+        Parameters
+        ----------
+        pool_size: ``int``
+            Number of environments in the pool (0 to deactivate it)
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            import grid2op
+            env_name = "l2rpn_case14_sandbox"
+            env = grid2op.make(env_name)
+            env.observation_space.set_forecast_env_pool_size(1)
+
+            obs = env.reset()
+            done = False
+            while not done:
+                forecast_env = obs.get_forecast_env()  # built only the first time
+                f_obs = forecast_env.reset()
+                ...  # use the forecast environment
+                obs, reward, done, info = env.step(env.action_space())
+
+        Notes
+        -----
+        The environments of the pool are closed when the observation space is closed.
+
+        """
+        pool_size = int(pool_size)
+        if pool_size < 0:
+            raise EnvError("The size of the pool of forecast environment should be >= 0")
+        self._forecast_env_pool_size = pool_size
+        if self.obs_env is not None:
+            self.obs_env.set_forecast_env_pool_size(pool_size)
+
     def simulate_called(self):
         """
         INTERNAL
@@ -472,6 +580,8 @@ class ObservationSpace(SerializableObservationSpace):
         new_obj.obs_env = self.obs_env  # it is None anyway !
         new_obj._update_env_time = self._update_env_time
         new_obj.__can_never_use_simulate = self.__can_never_use_simulate
+        new_obj._simulate_pool_size = self._simulate_pool_size
+        new_obj._forecast_env_pool_size = self._forecast_env_pool_size
         new_obj.__nb_simulate_called_this_step = self.__nb_simulate_called_this_step
         new_obj.__nb_simulate_called_this_episode = (
             self.__nb_simulate_called_this_episode
@@ -7,7 +7,6 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 
 import numpy as np
-import networkx as nx
 
 from grid2op.Reward.baseReward import BaseReward
 from grid2op.dtypes import dt_float
@@ -48,6 +47,9 @@ class BridgeReward(BaseReward):
         if has_error or is_illegal or is_ambiguous:
             return self.reward_min
 
+        # networkx is long to import, it is only imported when needed
+        import networkx as nx
+
         n_bus = 2
 
         # Get info from env
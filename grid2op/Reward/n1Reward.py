@@ -54,6 +54,14 @@ class N1Reward(BaseReward):
         obs_n1, *_ = obs.simulate(env.action_space({"set_line_status": [(L_ID, -1)]}), time_step=0)
         print(f"\tmax flow after disconnection of line {L_ID}: {obs_n1.rho.max():.3f}")
 
+    If you want to assess lots of contingencies, it is usually faster to use
+    :func:`grid2op.Backend.Backend.run_contingencies` that evaluates them all in one call (and
+    only runs AC powerflows for the contingencies flagged as critical by a DC screening):
+
+    .. code-block:: python
+
+        rho, flows, computed_ac, converged = env.backend.run_contingencies(line_ids=[0, 1])
+
     """
 
     def __init__(self, l_id=0, logger=None):
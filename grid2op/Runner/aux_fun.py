@@ -8,6 +8,7 @@
 
 import copy
 import time
+import traceback
 
 import numpy as np
 
@@ -35,40 +36,56 @@ def _aux_add_data(reward, env, episode,
         info,
     )
     return reward
-                
-def _aux_one_process_parrallel(
+
+
+def _aux_worker_parrallel(
     runner,
-    episode_this_process,
-    process_id,
+    worker_id,
+    task_queue,
+    result_queue,
     path_save=None,
-    env_seeds=None,
-    agent_seeds=None,
     max_iter=None,
     add_detailed_output=False,
     add_nb_highres_sim=False,
+    episode_chunk_size=None,
 ):
-    """this is out of the runner, otherwise it does not work on windows / macos"""
-    chronics_handler = ChronicsHandler(
-        chronicsClass=runner.gridStateclass,
-        path=runner.path_chron,
-        **runner.gridStateclass_kwargs
-    )
-    parameters = copy.deepcopy(runner.parameters)
-    nb_episode_this_process = len(episode_this_process)
-    res = [(None, None, None) for _ in range(nb_episode_this_process)]
-    for i, ep_id in enumerate(episode_this_process):
-        # `ep_id`: grid2op id of the episode i want to play
-        # `i`: my id of the episode played (0, 1, ... episode_this_process)
+    """this is out of the runner, otherwise it does not work on windows / macos
+    
+    Persistent worker used by `Runner._run_parrallel`: it pulls the episodes to play one by one
+    from `task_queue` (until it receives ``None``) and send the results back in `result_queue` as soon 
+    as they are available. The environment is created once and re used for all the episodes 
+    played by this worker.
+    
+    Messages sent in `result_queue` are tuples:
+    
+    - ("episode", position of the episode, (results of this episode, statistics of the tracer))
+    - ("error", worker_id, the formatted traceback of the error)
+    - ("stats", worker_id, dictionary of the utilization statistics of this worker)
+    """
+    beg_ = time.perf_counter()
+    time_busy = 0.
+    nb_episode = 0
+    nb_time_step_total = 0
+    env = None
+    try:
+        chronics_handler = ChronicsHandler(
+            chronicsClass=runner.gridStateclass,
+            path=runner.path_chron,
+            **runner.gridStateclass_kwargs
+        )
+        parameters = copy.deepcopy(runner.parameters)
         env, agent = runner._new_env(
             chronics_handler=chronics_handler, parameters=parameters
         )
-        try:
-            env_seed = None
-            if env_seeds is not None:
-                env_seed = env_seeds[i]
-            agt_seed = None
-            if agent_seeds is not None:
-                agt_seed = agent_seeds[i]
+        while True:
+            task = task_queue.get()
+            if task is None:
+                # no more episode to play
+                break
+            # `ep_pos`: position of this episode in the list of all episodes played by the runner
+            # `ep_id`: grid2op id of the episode i want to play
+            ep_pos, ep_id, env_seed, agt_seed = task
+            beg__ = time.perf_counter()
             tmp_ = _aux_run_one_episode(
                 env,
                 agent,
@@ -79,18 +96,36 @@ def _aux_one_process_parrallel(
                 max_iter=max_iter,
                 agent_seed=agt_seed,
                 detailed_output=add_detailed_output,
+                episode_chunk_size=episode_chunk_size,
             )
+            if max_iter is not None:
+                # the environment is used for the next episodes
+                env.chronics_handler.set_max_iter(-1)
             (name_chron, cum_reward, nb_time_step, max_ts, episode_data, nb_highres_sim)  = tmp_
             id_chron = chronics_handler.get_id()
-            res[i] = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
-            
+            res = (id_chron, name_chron, float(cum_reward), nb_time_step, max_ts)
             if add_detailed_output:
-                res[i] = (*res[i], episode_data)
+                res = (*res, episode_data)
             if add_nb_highres_sim:
-                res[i] = (*res[i], nb_highres_sim)                
-        finally:
+                res = (*res, nb_highres_sim)
+            result_queue.put(("episode", ep_pos, (res, episode_data.tracer_stats)))
+            time_busy += time.perf_counter() - beg__
+            nb_episode += 1
+            nb_time_step_total += nb_time_step
+    except Exception:
+        result_queue.put(("error", worker_id, traceback.format_exc()))
+    finally:
+        if env is not None:
             env.close()
-    return res
+    time_total = time.perf_counter() - beg_
+    stats = {"worker_id": worker_id,
+             "nb_episode": nb_episode,
+             "nb_time_step": nb_time_step_total,
+             "time_busy": time_busy,
+             "time_total": time_total,
+             "utilization": time_busy / time_total if time_total > 0. else 0.,
+             }
+    result_queue.put(("stats", worker_id, stats))
 
 
 def _aux_run_one_episode(
@@ -104,6 +139,7 @@ def _aux_run_one_episode(
     agent_seed=None,
     max_iter=None,
     detailed_output=False,
+    episode_chunk_size=None,
 ):
     done = False
     time_step = int(0)
@@ -120,7 +156,8 @@ def _aux_run_one_episode(
     if max_iter is not None:
         env.chronics_handler.set_max_iter(max_iter)
         
-    # reset it
+    # reset it (the tracer records only what happens during this episode)
+    env._tracer.reset_stats()
     obs = env.reset()
     # reset the number of calls to high resolution simulator
     env._highres_sim_counter._HighResSimCounter__nb_highres_called = 0
@@ -145,6 +182,9 @@ def _aux_run_one_episode(
         (1, env._oppSpace.action_space.size()), fill_value=0.0, dtype=dt_float
     )
     
+    # big arrays (observations, actions etc.) are written on the hard drive during the episode
+    streaming = path_save is not None and episode_chunk_size is not None
+    
     if efficient_storing:
         times = np.full(nb_timestep_max, fill_value=np.NaN, dtype=dt_float)
         rewards = np.full(nb_timestep_max, fill_value=np.NaN, dtype=dt_float)
@@ -171,6 +211,12 @@ def _aux_run_one_episode(
         )
         legal = np.full(nb_timestep_max, fill_value=True, dtype=dt_bool)
         ambiguous = np.full(nb_timestep_max, fill_value=False, dtype=dt_bool)
+        if streaming:
+            # these are written on the hard drive during the episode
+            actions = actions[:0]
+            env_actions = env_actions[:0]
+            observations = observations[:0]
+            attack = attack[:0]
     else:
         times = np.full(0, fill_value=np.NaN, dtype=dt_float)
         rewards = np.full(0, fill_value=np.NaN, dtype=dt_float)
@@ -191,7 +237,7 @@ def _aux_run_one_episode(
     need_store_first_act = path_save is not None or detailed_output
     if need_store_first_act:
         # store observation at timestep 0
-        if efficient_storing:
+        if efficient_storing and not streaming:
             observations[time_step, :] = obs.to_vect()
         else:
             observations = np.concatenate((observations, obs.to_vect().reshape(1, -1)))
@@ -218,12 +264,8 @@ def _aux_run_one_episode(
         legal=legal,
         ambiguous=ambiguous,
         has_legal_ambiguous=True,
+        chunk_size=episode_chunk_size if streaming else None,
     )
-    if need_store_first_act:
-        # I need to manually force in the first observation (otherwise it's not computed)
-        episode.observations.objects[0] = episode.observations.helper.from_vect(
-            observations[time_step, :]
-        )
     episode.set_parameters(env)
 
     beg_ = time.perf_counter()
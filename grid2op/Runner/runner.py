@@ -9,7 +9,8 @@
 import os
 import warnings
 import copy
-from multiprocessing import Pool
+import queue
+from multiprocessing import Process, Queue
 from typing import Tuple, Optional, List, Union
 
 from grid2op.Environment import BaseEnv
@@ -21,7 +22,7 @@ from grid2op.Reward import FlatReward, BaseReward
 from grid2op.Rules import AlwaysLegal, BaseRules
 from grid2op.Environment import Environment
 from grid2op.Chronics import ChronicsHandler, GridStateFromFile, GridValue
-from grid2op.Backend import Backend, PandaPowerBackend
+from grid2op.Backend import Backend
 from grid2op.Parameters import Parameters
 from grid2op.Agent import DoNothingAgent, BaseAgent
 from grid2op.VoltageControler import ControlVoltageFromFile
@@ -31,7 +32,7 @@ from grid2op.operator_attention import LinearAttentionBudget
 from grid2op.Runner.aux_fun import (
     _aux_run_one_episode,
     _aux_make_progress_bar,
-    _aux_one_process_parrallel,
+    _aux_worker_parrallel,
 )
 from grid2op.Runner.basic_logger import DoNothingLog, ConsoleLog
 from grid2op.Episode import EpisodeData
@@ -218,6 +219,23 @@ class Runner(object):
     grid_layout: ``dict``, optional
         The layout of the grid (position of each substation) usefull if you need to plot some things for example.
 
+    workers_stats: ``list``
+        Statistics about each process used by the last call to :func:`Runner.run` with `nb_process` > 1 (``None`` if 
+        there was no such call). It is a list with one dictionary per process, with keys "worker_id",
+        "nb_episode" (number of episodes played by this process), "nb_time_step" (total number of steps 
+        played by this process), "time_busy" (time spent, in seconds, playing episodes), "time_total"
+        (life time of this process, in seconds) and "utilization" (`time_busy / time_total`).
+
+        .. versionadded:: 1.9.5
+
+    tracer_stats: ``list``
+        The statistics recorded by the tracer (see the `tracer` argument of the runner and
+        :func:`grid2op.Environment.BaseEnv.set_tracer`) during each episode of the last call to
+        :func:`Runner.run`, in the same order as the episodes (``None`` if there was no such call). They can be
+        aggregated with :func:`grid2op.Environment.HistogramTracer.merge_stats`.
+
+        .. versionadded:: 1.9.5
+
     TODO
     _attention_budget_cls=LinearAttentionBudget,
     _kwargs_attention_budget=None,
@@ -255,7 +273,7 @@ class Runner(object):
         gridStateclass=GridStateFromFile,
         # type of chronics to use. For example GridStateFromFile if forecasts are not used,
         # or GridStateFromFileWithForecasts otherwise
-        backendClass=PandaPowerBackend,
+        backendClass=None,
         backend_kwargs=None,
         agentClass=DoNothingAgent,  # class used to build the agent
         agentInstance=None,
@@ -283,6 +301,7 @@ class Runner(object):
         kwargs_observation=None,
         observation_bk_class=None,
         observation_bk_kwargs=None,
+        tracer=None,
         # experimental: whether to read from local dir or generate the classes on the fly:
         _read_from_local_dir=False,
         _is_test=False,  # TODO not implemented !!
@@ -325,7 +344,8 @@ class Runner(object):
             Used to initialize :attr:`Runner.gridStateclass`.
 
         backendClass: ``type``, optional
-            Used to initialize :attr:`Runner.backendClass`.
+            Used to initialize :attr:`Runner.backendClass`. If ``None`` (default) the
+            :class:`grid2op.Backend.PandaPowerBackend` is used.
 
         agentClass: ``type``, optional
             Used to initialize :attr:`Runner.agentClass`.
@@ -343,6 +363,13 @@ class Runner(object):
         voltagecontrolerClass: :class:`grid2op.VoltageControler.ControlVoltageFromFile`, optional
             The controler that will change the voltage setpoints of the generators.
 
+        tracer: :class:`grid2op.Environment.BaseTracer`, optional
+            The tracer (see :func:`grid2op.Environment.BaseEnv.set_tracer`) used by the environments of the runner.
+            Each environment uses a copy of it and the statistics it recorded during each episode are
+            stored in :attr:`Runner.tracer_stats`. By default (``None``) nothing is recorded.
+
+            .. versionadded:: 1.9.5
+
         # TODO documentation on the opponent
         # TOOD doc for the attention budget
         """
@@ -423,6 +450,9 @@ class Runner(object):
         self.envClass._check_rules_correct(legalActClass)
         self.legalActClass = legalActClass
 
+        if backendClass is None:
+            from grid2op.Backend import PandaPowerBackend
+            backendClass = PandaPowerBackend
         if not isinstance(backendClass, type):
             raise Grid2OpException(
                 'Parameter "legalActClass" used to build the Runner should be a type (a class) and not an object '
@@ -489,6 +519,7 @@ class Runner(object):
         self._read_from_local_dir = _read_from_local_dir
         self._observation_bk_class = observation_bk_class
         self._observation_bk_kwargs = observation_bk_kwargs
+        self._tracer = tracer
 
         self.logger = ConsoleLog(DoNothingLog.INFO if verbose else DoNothingLog.ERROR)
         if logger is None:
@@ -605,6 +636,12 @@ class Runner(object):
 
         self.__used = False
 
+        # statistics about each process used in the last parallel run (see `_run_parrallel`)
+        self.workers_stats = None
+        
+        # statistics recorded by the tracer for each episode of the last run
+        self.tracer_stats = None
+
     def _new_env(self, chronics_handler, parameters) -> Tuple[BaseEnv, BaseAgent]:
         # the same chronics_handler is used for all the environments.
         # make sure to "reset" it properly
@@ -655,6 +692,9 @@ class Runner(object):
         if self.grid_layout is not None:
             res.attach_layout(self.grid_layout)
 
+        if self._tracer is not None:
+            res.set_tracer(self._tracer.copy())
+
         if self._useclass:
             agent = self.agentClass(res.action_space)
         else:
@@ -698,6 +738,7 @@ class Runner(object):
         episode_id=None,
         detailed_output=False,
         add_nb_highres_sim=False,
+        episode_chunk_size=None,
     ) -> runner_returned_type:
         """
         INTERNAL
@@ -721,6 +762,9 @@ class Runner(object):
         add_nb_highres_sim: 
             See descr. of :func:`Runner.run` method
 
+        episode_chunk_size: 
+            See descr. of :func:`Runner.run` method
+
         Returns
         -------
         TODO DEPRECATED DOC
@@ -746,6 +790,7 @@ class Runner(object):
                 max_iter=max_iter,
                 agent_seed=agent_seed,
                 detailed_output=detailed_output,
+                episode_chunk_size=episode_chunk_size,
             )
             if max_iter is not None:
                 env.chronics_handler.set_max_iter(-1)
@@ -768,6 +813,7 @@ class Runner(object):
         episode_id=None,
         add_detailed_output=False,
         add_nb_highres_sim=False,
+        episode_chunk_size=None,
     ) -> List[runner_returned_type]:
         """
         INTERNAL
@@ -808,6 +854,8 @@ class Runner(object):
 
         add_detailed_output: see Runner.run method
 
+        episode_chunk_size: see Runner.run method
+
         Returns
         -------
         res: ``list``
@@ -823,6 +871,7 @@ class Runner(object):
         """
         res = [(None, None, None, None, None, None) 
                for _ in range(nb_episode)]
+        tracer_stats = [None for _ in range(nb_episode)]
 
         next_pbar = [False]
         with _aux_make_progress_bar(pbar, nb_episode, next_pbar) as pbar_:
@@ -851,7 +900,8 @@ class Runner(object):
                     agent_seed=agt_seed,
                     max_iter=max_iter,
                     detailed_output=True,
-                    add_nb_highres_sim=True
+                    add_nb_highres_sim=True,
+                    episode_chunk_size=episode_chunk_size,
                 )
                 id_chron = self.chronics_handler.get_id()
                 res[i] = (id_chron,
@@ -864,7 +914,9 @@ class Runner(object):
                     res[i] = (*res[i], episode_data)
                 if add_nb_highres_sim:
                     res[i] = (*res[i], nb_call_highres_sim)
+                tracer_stats[i] = episode_data.tracer_stats
                 pbar_.update(1)
+        self.tracer_stats = tracer_stats
         return res
 
     def _run_parrallel(
@@ -878,6 +930,8 @@ class Runner(object):
         episode_id=None,
         add_detailed_output=False,
         add_nb_highres_sim=False,
+        pbar=False,
+        episode_chunk_size=None,
     ) -> List[runner_returned_type]:
         """
         INTERNAL
@@ -891,10 +945,17 @@ class Runner(object):
         Note that it restarts completely the :attr:`Runner.backend` and :attr:`Runner.env` if the computation
         is actually performed with more than 1 cores (nb_process > 1)
 
-        It uses the python multiprocess, and especially the :class:`multiprocess.Pool` to perform the computations.
+        It uses the python multiprocess to perform the computations.
         This implies that all runs are completely independent (they happen in different process) and that the
         memory consumption can be big. Tests may be recommended if the amount of RAM is low.
 
+        .. versionchanged:: 1.9.5
+            The episodes are not split between the processes before the computation starts anymore. 
+            Each process creates its environment once, then pulls the episodes one by one (an episode
+            is given to the first process available) until all of them are played. The results are sent back 
+            as soon as an episode is over and some statistics about each process are stored 
+            in :attr:`Runner.workers_stats`.
+
         It has the same return type as the :func:`Runner.run_sequential`.
 
         Parameters
@@ -920,13 +981,19 @@ class Runner(object):
 
         add_detailed_output: see Runner.run method
 
+        pbar: ``bool`` or ``type`` or ``object``
+            How to display the progress bar, see :func:`Runner.run`. The progress bar is updated each time 
+            an episode is over (no progress bar is displayed for the steps of an episode).
+
+        episode_chunk_size: see Runner.run method
+
         Returns
         -------
         res: ``list``
             List of tuple. Each tuple having 3 elements:
 
-              - "i" unique identifier of the episode (compared to :func:`Runner.run_sequential`, the elements of the
-                returned list are not necessarily sorted by this value)
+              - "i" unique identifier of the episode (the elements of the returned list are in the same order as
+                the episodes, for example the first element is the results of `episode_id[0]`)
               - "cum_reward" the cumulative reward obtained by the :attr:`Runner.BaseAgent` on this episode i
               - "nb_time_step": the number of time steps played in this episode.
               - "max_ts" : the maximum number of time steps of the chronics
@@ -955,55 +1022,75 @@ class Runner(object):
                 episode_id=episode_id,
                 add_detailed_output=add_detailed_output,
                 add_nb_highres_sim=add_nb_highres_sim,
+                episode_chunk_size=episode_chunk_size,
             )
         else:
             self._clean_up()
 
             nb_process = int(nb_process)
-            process_ids = [[] for i in range(nb_process)]
+            task_queue = Queue()
+            result_queue = Queue()
+            # episodes are pulled one by one by the workers: a worker that finished 
+            # its episode (possibly early because of a game over) takes the next one
             for i in range(nb_episode):
-                if episode_id is None:
-                    process_ids[i % nb_process].append(i)
+                ep_id = i if episode_id is None else episode_id[i]
+                env_seed = None if env_seeds is None else env_seeds[i]
+                agt_seed = None if agent_seeds is None else agent_seeds[i]
+                task_queue.put((i, ep_id, env_seed, agt_seed))
+            for _ in range(nb_process):
+                # tell each worker there is nothing more to do
+                task_queue.put(None)
+
+            workers = []
+            for worker_id in range(nb_process):
+                if _IS_LINUX:
+                    runner = self
                 else:
-                    process_ids[i % nb_process].append(episode_id[i])
-
-            if env_seeds is None:
-                seeds_env_res = [None for _ in range(nb_process)]
-            else:
-                # split the seeds according to the process
-                seeds_env_res = [[] for i in range(nb_process)]
-                for i in range(nb_episode):
-                    seeds_env_res[i % nb_process].append(env_seeds[i])
-
-            if agent_seeds is None:
-                seeds_agt_res = [None for _ in range(nb_process)]
-            else:
-                # split the seeds according to the process
-                seeds_agt_res = [[] for i in range(nb_process)]
-                for i in range(nb_episode):
-                    seeds_agt_res[i % nb_process].append(agent_seeds[i])
-
-            res = []
-            if _IS_LINUX:
-                lists = [(self,) for _ in enumerate(process_ids)]
-            else:
-                lists = [(Runner(**self._get_params()),) for _ in enumerate(process_ids)]
-            
-            for i, pn in enumerate(process_ids):
-                lists[i] = (*lists[i],
-                            pn,
-                            i,
-                            path_save,
-                            seeds_env_res[i],
-                            seeds_agt_res[i],
-                            max_iter,
-                            add_detailed_output,
-                            add_nb_highres_sim)
-                
-            with Pool(nb_process) as p:
-                tmp = p.starmap(_aux_one_process_parrallel, lists)
-            for el in tmp:
-                res += el
+                    runner = Runner(**self._get_params())
+                workers.append(Process(target=_aux_worker_parrallel,
+                                       args=(runner,
+                                             worker_id,
+                                             task_queue,
+                                             result_queue,
+                                             path_save,
+                                             max_iter,
+                                             add_detailed_output,
+                                             add_nb_highres_sim,
+                                             episode_chunk_size)))
+            for worker in workers:
+                worker.start()
+
+            res = [None for _ in range(nb_episode)]
+            tracer_stats = [None for _ in range(nb_episode)]
+            workers_stats = [None for _ in range(nb_process)]
+            nb_msg_missing = nb_episode + nb_process
+            next_pbar = [False]
+            try:
+                with _aux_make_progress_bar(pbar, nb_episode, next_pbar) as pbar_:
+                    while nb_msg_missing > 0:
+                        try:
+                            msg_type, msg_id, msg_content = result_queue.get(timeout=1.)
+                        except queue.Empty:
+                            if any([(not worker.is_alive()) and worker.exitcode != 0 for worker in workers]):
+                                raise RuntimeError("Runner: one of the process used to run the episodes died.")
+                            continue
+                        if msg_type == "error":
+                            raise RuntimeError(f"Runner: error in the process {msg_id}:\n{msg_content}")
+                        if msg_type == "episode":
+                            res[msg_id], tracer_stats[msg_id] = msg_content
+                            pbar_.update(1)
+                        else:
+                            workers_stats[msg_id] = msg_content
+                        nb_msg_missing -= 1
+            except BaseException:
+                for worker in workers:
+                    worker.terminate()
+                raise
+            finally:
+                for worker in workers:
+                    worker.join()
+            self.workers_stats = workers_stats
+            self.tracer_stats = tracer_stats
         return res
 
     def _get_params(self):
@@ -1046,6 +1133,7 @@ class Runner(object):
             "has_attention_budget": self._has_attention_budget,
             "logger": self.logger,
             "kwargs_observation": self._kwargs_observation,
+            "tracer": self._tracer,
             "_read_from_local_dir": self._read_from_local_dir,
             "_is_test": self._is_test,
         }
@@ -1074,6 +1162,7 @@ class Runner(object):
         episode_id=None,
         add_detailed_output=False,
         add_nb_highres_sim=False,
+        episode_chunk_size=None,
     ) -> List[runner_returned_type]:
         """
         Main method of the :class:`Runner` class. It will either call :func:`Runner._run_sequential` if "nb_process" is
@@ -1127,6 +1216,15 @@ class Runner(object):
         add_nb_highres_sim: ``bool``
             Whether to add an estimated number of "high resolution simulator" called performed by the agent (either by
             obs.simulate, or by obs.get_forecast_env or by obs.get_simulator)
+
+        episode_chunk_size: ``int``
+            Only used if `path_save` is not ``None``. If set, the observations, actions, environment 
+            modifications and attacks are written on the hard drive during each episode by chunks of 
+            `episode_chunk_size` steps instead of being kept in memory until the end of the episode 
+            (see :class:`grid2op.Episode.EpisodeData`). This is especially useful for long episodes.
+            By default (``None``) everything is kept in memory and written at the end of the episode.
+
+            .. versionadded:: 1.9.5
             
         Returns
         -------
@@ -1215,6 +1313,11 @@ class Runner(object):
         if max_iter is not None:
             max_iter = int(max_iter)
 
+        if episode_chunk_size is not None:
+            episode_chunk_size = int(episode_chunk_size)
+            if episode_chunk_size <= 0:
+                raise RuntimeError("The size of the chunks (`episode_chunk_size`) should be > 0.")
+
         if nb_episode == 0:
             res = []
         else:
@@ -1234,6 +1337,7 @@ class Runner(object):
                         episode_id=episode_id,
                         add_detailed_output=add_detailed_output,
                         add_nb_highres_sim=add_nb_highres_sim,
+                        episode_chunk_size=episode_chunk_size,
                     )
                 else:
                     if add_detailed_output and (_IS_WINDOWS or _IS_MACOS):
@@ -1252,6 +1356,7 @@ class Runner(object):
                             episode_id=episode_id,
                             add_detailed_output=add_detailed_output,
                             add_nb_highres_sim=add_nb_highres_sim,
+                            episode_chunk_size=episode_chunk_size,
                         )
                     else:
                         self.logger.info("Parallel runner used.")
@@ -1265,6 +1370,8 @@ class Runner(object):
                             episode_id=episode_id,
                             add_detailed_output=add_detailed_output,
                             add_nb_highres_sim=add_nb_highres_sim,
+                            pbar=pbar,
+                            episode_chunk_size=episode_chunk_size,
                         )
             finally:
                 self._clean_up()
@@ -46,6 +46,12 @@ def download():
     downloadEntryPoint()
 
 
+def convert_chronics():
+    from grid2op.Chronics.gridStateFromBinary import main as convertChronicsEntryPoint
+
+    convertChronicsEntryPoint()
+
+
 def replay():
     try:
         from grid2op.Episode.EpisodeReplay import main as replayEntryPoint
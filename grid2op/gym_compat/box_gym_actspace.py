@@ -330,6 +330,12 @@ class __AuxBoxGymActSpace:
         # self._multiply = {k: v.astype(self.dtype) for k, v in self._multiply.items()}
         self._fix_value_sub_div(self._add, functs)
         self._fix_value_sub_div(self._multiply, functs)
+
+        # precompute where each attribute is stored in the gym action
+        self._gather_plan = None
+        self._fused_multiply = None
+        self._fused_add = None
+        self._build_gather_plan()
         
     def _get_shape(self, el, functs):
         if el in functs:
@@ -479,6 +485,45 @@ class __AuxBoxGymActSpace:
 
         return low, high, shape, dtype
 
+    def _build_gather_plan(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Compute, once and for all, where each attribute is stored in the gym action
+        (`self._gather_plan`) and the "fused" vectors (of the size of the gym action) used to
+        multiply / add all the continuous attributes at once in :func:`BoxGymActSpace.from_gym`.
+
+        It needs to be called each time `self._multiply` or `self._add` is modified.
+        """
+        self._gather_plan = []
+        fused_multiply = np.ones(self.shape, dtype=self.dtype)
+        fused_add = np.zeros(self.shape, dtype=self.dtype)
+        has_multiply = False
+        has_add = False
+        prev = 0
+        for attr_nm, where_to_put, dtype in zip(
+            self._attr_to_keep, self._dims, self._dtypes
+        ):
+            funct = self.__func.get(attr_nm)
+            glop_dtype = self._key_dict_to_proptype.get(attr_nm)
+            # only the continuous attributes are scaled before being converted
+            is_fused = funct is None and glop_dtype == dt_float
+            self._gather_plan.append((attr_nm, prev, where_to_put, dtype, funct, glop_dtype, is_fused))
+            if is_fused:
+                if attr_nm in self._multiply:
+                    fused_multiply[prev:where_to_put] = self._multiply[attr_nm]
+                    has_multiply = True
+                if attr_nm in self._add:
+                    fused_add[prev:where_to_put] = self._add[attr_nm]
+                    has_add = True
+            prev = where_to_put
+        self._fused_multiply = fused_multiply if has_multiply else None
+        self._fused_add = fused_add if has_add else None
+
     def _handle_attribute(self, res, gym_act_this, attr_nm):
         """
         INTERNAL
@@ -499,7 +544,9 @@ class __AuxBoxGymActSpace:
             gym_act_this *= self._multiply[attr_nm]
         if attr_nm in self._add:
             gym_act_this += self._add[attr_nm]
+        return self._set_attribute(res, gym_act_this, attr_nm)
 
+    def _set_attribute(self, res, gym_act_this, attr_nm):
         if attr_nm == "curtail":
             gym_act_this_ = np.full(
                 self._act_space.n_gen, fill_value=np.NaN, dtype=dt_float
@@ -580,17 +627,47 @@ class __AuxBoxGymActSpace:
             The corresponding grid2op action.
 
         """
+        return self._aux_from_gym(self._scale_gym_act(gym_act))
+
+    def from_gym_batch(self, gym_acts):
+        """
+        Convert a matrix of gym actions (one action per row) to a list of grid2op actions,
+        each one being the result of :func:`BoxGymActSpace.from_gym` for the corresponding row.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        gym_acts: ``numpy.ndarray``
+            the gym actions, with shape `(nb_action, dim)`
+
+        Returns
+        -------
+        res: ``list``
+            The list of the corresponding grid2op actions.
+
+        """
+        gym_acts = self._scale_gym_act(gym_acts)
+        return [self._aux_from_gym(gym_act) for gym_act in gym_acts]
+
+    def _scale_gym_act(self, gym_act):
+        """multiply / add (at once) the continuous attributes, it always returns a new array"""
+        if self._fused_multiply is not None:
+            res = gym_act * self._fused_multiply
+        else:
+            res = 1 * gym_act
+        if self._fused_add is not None:
+            res += self._fused_add
+        return res
+
+    def _aux_from_gym(self, gym_act):
         res = self._act_space()
-        prev = 0
-        for attr_nm, where_to_put, dtype in zip(
-            self._attr_to_keep, self._dims, self._dtypes
-        ):
-            this_part = 1 * gym_act[prev:where_to_put]
-            if attr_nm in self.__func:
-                glop_act_tmp = self.__func[attr_nm](this_part)
+        for attr_nm, prev, where_to_put, dtype, funct, glop_dtype, is_fused in self._gather_plan:
+            this_part = gym_act[prev:where_to_put]
+            if funct is not None:
+                glop_act_tmp = funct(this_part)
                 res += glop_act_tmp
             elif hasattr(res, attr_nm):
-                glop_dtype = self._key_dict_to_proptype[attr_nm]
                 if glop_dtype == dt_int:
                     # convert floating point actions to integer.
                     # NB: i round first otherwise it is cut.
@@ -599,12 +676,17 @@ class __AuxBoxGymActSpace:
                     # convert floating point actions to bool.
                     # NB: it's important here the numbers are between 0 and 1
                     this_part = (this_part >= 0.5).astype(dt_bool)
+                elif glop_dtype is None:
+                    raise KeyError(attr_nm)
                 if this_part.shape and this_part.shape[0]:
                     # only update the attribute if there is actually something to update
-                    self._handle_attribute(res, this_part, attr_nm)
+                    if is_fused:
+                        # already multiplied / added in `_scale_gym_act`
+                        self._set_attribute(res, this_part, attr_nm)
+                    else:
+                        self._handle_attribute(res, this_part, attr_nm)
             else:
                 raise RuntimeError(f'Unknown attribute "{attr_nm}".')
-            prev = where_to_put
         return res
 
     def close(self):
@@ -669,6 +751,7 @@ class __AuxBoxGymActSpace:
                 self.low[prev:where_to_put][both_finite] = 0.0
                 break
             prev = where_to_put
+        self._build_gather_plan()
 
 
 if GYM_AVAILABLE:
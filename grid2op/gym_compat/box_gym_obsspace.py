@@ -637,6 +637,12 @@ class __AuxBoxGymObsSpace:
         self._fix_value_sub_div(self._subtract, functs)
         self._fix_value_sub_div(self._divide, functs)
 
+        # precompute where each attribute is stored in the gym observation
+        self._gather_plan = None
+        self._fused_subtract = None
+        self._fused_divide = None
+        self._build_gather_plan()
+
     def _get_shape(self, el, functs):
         if el in functs:
             callable_, low_, high_, shape_, dtype_ = functs[el]
@@ -774,15 +780,67 @@ class __AuxBoxGymObsSpace:
 
         return low, high, shape, dtype
 
-    def _handle_attribute(self, grid2op_observation, attr_nm):
-        res = getattr(grid2op_observation, attr_nm).astype(self.dtype)
-        if attr_nm in self._subtract:
-            res -= self._subtract[attr_nm]
-        if attr_nm in self._divide:
-            res /= self._divide[attr_nm]
+    def _build_gather_plan(self):
+        """
+        INTERNAL
+
+        .. warning:: /!\\\\ Internal, do not use unless you know what you are doing /!\\\\
+
+        .. versionadded:: 1.9.5
+
+        Compute, once and for all, where each attribute is stored in the gym observation
+        (`self._gather_plan`) and the "fused" vectors (of the size of the gym observation) used to
+        subtract / divide all the attributes at once in :func:`BoxGymObsSpace.to_gym`.
+
+        It needs to be called each time `self._subtract` or `self._divide` is modified.
+        """
+        self._gather_plan = []
+        fused_subtract = np.zeros(self.shape, dtype=self.dtype)
+        fused_divide = np.ones(self.shape, dtype=self.dtype)
+        prev = 0
+        for attr_nm, where_to_put in zip(self._attr_to_keep, self._dims):
+            funct = self.__func.get(attr_nm)
+            self._gather_plan.append((attr_nm, prev, where_to_put, funct))
+            if funct is None:
+                # the output of the "functs" are not modified
+                if attr_nm in self._subtract:
+                    fused_subtract[prev:where_to_put] = self._subtract[attr_nm]
+                if attr_nm in self._divide:
+                    fused_divide[prev:where_to_put] = self._divide[attr_nm]
+            prev = where_to_put
+        self._fused_subtract = fused_subtract if self._subtract else None
+        self._fused_divide = fused_divide if self._divide else None
+
+    def _fill_gym_obs(self, grid2op_observation, res):
+        """write the attributes of `grid2op_observation` in `res` (without subtract / divide)"""
+        for attr_nm, prev, where_to_put, funct in self._gather_plan:
+            if funct is not None:
+                res[prev:where_to_put] = funct(grid2op_observation)
+            else:
+                try:
+                    res[prev:where_to_put] = getattr(grid2op_observation, attr_nm)
+                except AttributeError as exc_:
+                    raise RuntimeError(f'Unknown attribute "{attr_nm}".') from exc_
+
+    def _get_out_buffer(self, out, shape):
+        if out is None:
+            return np.empty(shape=shape, dtype=self.dtype)
+        if out.shape != shape:
+            raise Grid2OpException(f"The buffer \"out\" should have the shape {shape}, "
+                                   f"found {out.shape}")
+        if out.dtype != self.dtype:
+            raise Grid2OpException(f"The buffer \"out\" should have the dtype {self.dtype}, "
+                                   f"found {out.dtype}")
+        return out
+
+    def _scale_gym_obs(self, res):
+        if self._fused_subtract is not None:
+            res -= self._fused_subtract
+        if self._fused_divide is not None:
+            res /= self._fused_divide
         return res
 
-    def to_gym(self, grid2op_observation):
+    def to_gym(self, grid2op_observation, out=None):
         """
         This is the function that is called to transform a grid2Op observation, sent by the grid2op environment
         and convert it to a numpy array (an element of a gym Box)
@@ -792,24 +850,60 @@ class __AuxBoxGymObsSpace:
         grid2op_observation:
             The grid2op observation (as a grid2op object)
 
+        out: ``numpy.ndarray``, optional
+            .. versionadded:: 1.9.5
+
+            If provided, the result is written in this array (that should have the shape and the dtype
+            of this space) instead of a new one.
+
         Returns
         -------
         res: :class:`numpy.ndarray`
             A numpy array compatible with the openAI gym Box that represents the action space.
 
         """
-        res = np.empty(shape=self.shape, dtype=self.dtype)
-        prev = 0
-        for attr_nm, where_to_put in zip(self._attr_to_keep, self._dims):
-            if attr_nm in self.__func:
-                tmp = self.__func[attr_nm](grid2op_observation)
-            elif hasattr(grid2op_observation, attr_nm):
-                tmp = self._handle_attribute(grid2op_observation, attr_nm)
-            else:
-                raise RuntimeError(f'Unknown attribute "{attr_nm}".')
-            res[prev:where_to_put] = tmp
-            prev = where_to_put
-        return res
+        res = self._get_out_buffer(out, self.shape)
+        self._fill_gym_obs(grid2op_observation, res)
+        return self._scale_gym_obs(res)
+
+    def to_gym_batch(self, list_of_obs, out=None):
+        """
+        Convert a list of grid2op observations to a matrix, each row being the result
+        of :func:`BoxGymObsSpace.to_gym` for the corresponding observation.
+
+        .. versionadded:: 1.9.5
+
+        Parameters
+        ----------
+        list_of_obs:
+            The grid2op observations (a list of grid2op objects)
+
+        out: ``numpy.ndarray``, optional
+            If provided, the result is written in this matrix (of shape `(len(list_of_obs), dim)` and
+            with the dtype of this space) instead of a new one.
+
+        Returns
+        -------
+        res: :class:`numpy.ndarray`
+            The matrix of the gym observations
+
+        Examples
+        --------
+
+        .. code-block:: python
+
+            gym_env = ... # an environment with a BoxGymObsSpace
+            # obs_list = list of grid2op observations, for example coming from
+            # different environments
+            buffer = np.empty((len(obs_list), gym_env.observation_space.shape[0]),
+                              dtype=gym_env.observation_space.dtype)
+            gym_env.observation_space.to_gym_batch(obs_list, out=buffer)
+
+        """
+        res = self._get_out_buffer(out, (len(list_of_obs), *self.shape))
+        for grid2op_observation, res_row in zip(list_of_obs, res):
+            self._fill_gym_obs(grid2op_observation, res_row)
+        return self._scale_gym_obs(res)
 
     def close(self):
         pass
@@ -924,6 +1018,7 @@ class __AuxBoxGymObsSpace:
                 self.low[prev:where_to_put][both_finite] = 0.0
                 break
             prev = where_to_put
+        self._build_gather_plan()
 
 
 if GYM_AVAILABLE:
@@ -0,0 +1,444 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+"""
+Asyncio version of the grid2op server (see `app.py` for the flask version).
+
+.. versionadded:: 1.9.5
+
+It exposes the same endpoints as `app.py` (with the same json payloads) and:
+
+- the calls to the environments are performed in a pool of worker threads (`--nb_worker`) so that a slow
+  powerflow does not block the other clients
+- some environments can be created when the server starts (`--env_name` and `--pool_size`), a call to
+  `make` then only resets one of them
+- observations and actions can be exchanged in "binary" instead of json: the body of the request / the response
+  is then the raw bytes of the float32 vector (`obs.to_vect()`, `act.to_vect()`). To use it, send the requests
+  with the header "Content-Type: application/octet-stream" (for `step` and `step_many`)
+  or "Accept: application/octet-stream" (for `make` and `reset`). In this case, the other information
+  (id of the environment, reward, done, etc.) are sent in the headers of the response ("X-Grid2Op-Id",
+  "X-Grid2Op-Reward", "X-Grid2Op-Done", "X-Grid2Op-Info")
+- a "step_many" endpoint to perform a step on multiple environments (with the same name) with one request
+
+Example of usage (binary protocol):
+
+.. code-block:: python
+
+    import numpy as np
+    import requests
+    import grid2op
+
+    env_name = "l2rpn_case14_sandbox"
+    env = grid2op.make(env_name)  # local environment, to build the actions and read the observations
+    # the server has been started with `python async_app.py --port 3000 --env_name l2rpn_case14_sandbox`
+    url = "http://127.0.0.1:3000"
+    binary = {"Content-Type": "application/octet-stream", "Accept": "application/octet-stream"}
+
+    resp = requests.get(f"{url}/make/{env_name}", headers=binary)
+    env_id = resp.headers["X-Grid2Op-Id"]
+    obs = env.observation_space.from_vect(np.frombuffer(resp.content, dtype=np.float32))
+
+    act = env.action_space()
+    resp = requests.post(f"{url}/step/{env_name}/{env_id}", data=act.to_vect().astype(np.float32).tobytes(),
+                         headers=binary)
+    obs = env.observation_space.from_vect(np.frombuffer(resp.content, dtype=np.float32))
+    reward = float(resp.headers["X-Grid2Op-Reward"])
+    done = resp.headers["X-Grid2Op-Done"] == "1"
+
+"""
+
+import json
+import argparse
+from collections.abc import Iterable
+
+from aiohttp import web
+
+from grid2op.rest_server.async_env_cache import AsyncEnvCache
+
+try:
+    import ujson
+
+    _dumps = ujson.dumps
+    _loads = ujson.loads
+except ImportError as exc_:
+    _dumps = json.dumps
+    _loads = json.loads
+
+BINARY_MIME = "application/octet-stream"
+ENV_CACHE_KEY = "env_cache"
+HEADER_ID = "X-Grid2Op-Id"
+HEADER_ENV_IDS = "X-Grid2Op-Env-Ids"
+HEADER_REWARD = "X-Grid2Op-Reward"
+HEADER_DONE = "X-Grid2Op-Done"
+HEADER_INFO = "X-Grid2Op-Info"
+
+routes = web.RouteTableDef()
+
+
+def _env_cache(request) -> AsyncEnvCache:
+    return request.app[ENV_CACHE_KEY]
+
+
+def _binary_payload(request):
+    """the body of the request is a binary payload"""
+    return request.headers.get("Content-Type", "") == BINARY_MIME
+
+
+def _binary_answer(request):
+    """the client asked for a binary answer"""
+    return _binary_payload(request) or BINARY_MIME in request.headers.get("Accept", "")
+
+
+def _json_response(resp, status=200):
+    return web.json_response(resp, status=status, dumps=_dumps)
+
+
+def _error_response(error_msg, error_code=None):
+    resp = {"error": error_msg}
+    if error_code is not None:
+        resp["error_code"] = error_code
+    return _json_response(resp, status=400)
+
+
+async def _read_json(request, key, error_msg):
+    try:
+        data = await request.json(loads=_loads)
+    except Exception as exc_:
+        data = None
+    if not data or key not in data:
+        return None, _error_response(error_msg)
+    return data[key], None
+
+
+@routes.get("/")
+async def index(request):
+    return web.Response(
+        text="Welcome to grid2op. This small server lets you use grid2op as an web service to use some grid2op "
+        "features for example in different computer languages. See the documentation for more information."
+        "(asyncio version)"
+        "(alpha mode at the moment)"
+    )
+
+
+@routes.get("/make/{env_name}")
+async def make_env(request):
+    """
+    Same as the "make" endpoint of `app.py`. If the answer is binary, the id of the environment
+    is in the "X-Grid2Op-Id" header.
+    """
+    env_name = request.match_info["env_name"]
+    binary = _binary_answer(request)
+    id_, obs, exc_ = await _env_cache(request).make(env_name, binary=binary)
+    if exc_ is not None:
+        return _error_response(f'Impossible to create environment "{env_name}" with error:\n{exc_}')
+    if binary:
+        return web.Response(body=obs, content_type=BINARY_MIME, headers={HEADER_ID: f"{id_}"})
+    return _json_response({"id": id_, "env_name": env_name, "obs": obs})
+
+
+@routes.get("/reset/{env_name}/{env_id}")
+async def reset(request):
+    """Same as the "reset" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    binary = _binary_answer(request)
+    obs, (error_code, error_msg) = await _env_cache(request).reset(env_name, env_id, binary=binary)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    if binary:
+        return web.Response(body=obs, content_type=BINARY_MIME, headers={HEADER_ID: f"{env_id}"})
+    return _json_response({"id": env_id, "env_name": env_name, "obs": obs})
+
+
+@routes.post("/step/{env_name}/{env_id}")
+async def step(request):
+    """
+    Same as the "step" endpoint of `app.py`.
+
+    In binary mode, the body of the request is the action (as a float32 vector) and
+    the body of the answer is the observation. The reward, the done flag ("0" or "1") and the info (as json)
+    are in the headers of the answer.
+    """
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    binary = _binary_payload(request)
+    if binary:
+        action = await request.read()
+    else:
+        action, error_resp = await _read_json(request, "action",
+                                              'You need to provide an action in order to do a "step".')
+        if error_resp is not None:
+            return error_resp
+
+    (obs, reward, done, info), (error_code, error_msg) = await _env_cache(request).step(
+        env_name, env_id, action, binary=binary
+    )
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+
+    if binary:
+        headers = {HEADER_ID: f"{env_id}",
+                   HEADER_REWARD: f"{reward}",
+                   HEADER_DONE: "1" if done else "0",
+                   HEADER_INFO: _dumps(info)}
+        return web.Response(body=obs, content_type=BINARY_MIME, headers=headers)
+    resp = {
+        "id": env_id,
+        "env_name": env_name,
+        "obs": obs,
+        "reward": reward,
+        "done": done,
+        "info": info,
+    }
+    return _json_response(resp)
+
+
+@routes.post("/step_many/{env_name}")
+async def step_many(request):
+    """
+    Perform a step on multiple environments named "env_name" with a single request (the steps are
+    performed concurrently).
+
+    In json, the payload should have keys "env_ids" (the ids of the environments) and "actions" (the
+    json representation of the actions, in the same order). The answer is a json with keys "env_name"
+    and "results" (the list of the results of each step, each one being the json
+    returned by the "step" endpoint).
+
+    In binary, the ids of the environments are given (comma separated) in the "X-Grid2Op-Env-Ids" header
+    and the body is the concatenation of the actions (as float32 vectors). The body of the
+    answer is the concatenation of the observations and the rewards and
+    done flags are given (comma separated) in the "X-Grid2Op-Reward" and "X-Grid2Op-Done" headers.
+    """
+    env_name = request.match_info["env_name"]
+    binary = _binary_payload(request)
+    if binary:
+        env_ids = [el.strip() for el in request.headers.get(HEADER_ENV_IDS, "").split(",") if el.strip()]
+        if not env_ids:
+            return _error_response(f'You need to provide the ids of the environments in the "{HEADER_ENV_IDS}" '
+                                   f'header in order to do a "step_many".')
+        payload = await request.read()
+        if len(payload) % len(env_ids):
+            return _error_response(f"The payload cannot be split into {len(env_ids)} actions of the same size.",
+                                   AsyncEnvCache.INVALID_BINARY_PAYLOAD)
+        size = len(payload) // len(env_ids)
+        actions = [payload[i * size:(i + 1) * size] for i in range(len(env_ids))]
+    else:
+        try:
+            data = await request.json(loads=_loads)
+        except Exception as exc_:
+            data = None
+        if not data or "env_ids" not in data or "actions" not in data:
+            return _error_response('You need to provide "env_ids" and "actions" in order to do a "step_many".')
+        env_ids = data["env_ids"]
+        actions = data["actions"]
+
+    results = await _env_cache(request).step_many(env_name, env_ids, actions, binary=binary)
+    for (_, (error_code, error_msg)) in results:
+        if error_code is not None:
+            return _error_response(error_msg, error_code)
+
+    if binary:
+        headers = {HEADER_ENV_IDS: ",".join([f"{el}" for el in env_ids]),
+                   HEADER_REWARD: ",".join([f"{reward}" for (_, reward, _, _), _ in results]),
+                   HEADER_DONE: ",".join(["1" if done else "0" for (_, _, done, _), _ in results])}
+        return web.Response(body=b"".join([obs for (obs, *_), _ in results]),
+                            content_type=BINARY_MIME,
+                            headers=headers)
+    resp = {"env_name": env_name,
+            "results": [{"id": env_id, "obs": obs, "reward": reward, "done": done, "info": info}
+                        for env_id, ((obs, reward, done, info), _) in zip(env_ids, results)]
+            }
+    return _json_response(resp)
+
+
+@routes.get("/close/{env_name}/{env_id}")
+async def close(request):
+    """Same as the "close" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    error_code, error_msg = await _env_cache(request).call("close", env_name, env_id)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    return _json_response({"id": env_id, "env_name": env_name})
+
+
+@routes.get("/get_path_env/{env_name}/{env_id}")
+async def get_path_env(request):
+    """Same as the "get_path_env" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    path, (error_code, error_msg) = await _env_cache(request).call("get_path_env", env_name, env_id)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    return _json_response({"id": env_id, "env_name": env_name, "path": path})
+
+
+@routes.get("/get_thermal_limit/{env_name}/{env_id}")
+async def get_thermal_limit(request):
+    """Same as the "get_thermal_limit" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    th_lim, (error_code, error_msg) = await _env_cache(request).call("get_thermal_limit", env_name, env_id)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    return _json_response({"id": env_id, "env_name": env_name, "thermal_limit": th_lim})
+
+
+@routes.post("/seed/{env_name}/{env_id}")
+async def seed(request):
+    """Same as the "seed" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    seed_, error_resp = await _read_json(request, "seed",
+                                         'You need to provide a seed in order to "seed" the environment.')
+    if error_resp is not None:
+        return error_resp
+    seeds, (error_code, error_msg) = await _env_cache(request).call("seed", env_name, env_id, seed_)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    resp = {
+        "id": env_id,
+        "env_name": env_name,
+        "seeds": seeds,
+        "info": "this has no effect until reset() is called",
+    }
+    return _json_response(resp)
+
+
+@routes.post("/set_id/{env_name}/{env_id}")
+async def set_id(request):
+    """Same as the "set_id" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    chron_id, error_resp = await _read_json(request, "id",
+                                            'You need to provide an id in order to "set_id" the environment.')
+    if error_resp is not None:
+        return error_resp
+    error_code, error_msg = await _env_cache(request).call("set_id", env_name, env_id, chron_id)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    resp = {
+        "id": env_id,
+        "env_name": env_name,
+        "info": "this has no effect until reset() is called",
+    }
+    return _json_response(resp)
+
+
+@routes.post("/set_thermal_limit/{env_name}/{env_id}")
+async def set_thermal_limit(request):
+    """Same as the "set_thermal_limit" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    th_lim, error_resp = await _read_json(request, "thermal_limits",
+                                          'You need to provide thermal limits in order to "set_thermal_limit" '
+                                          'the environment.')
+    if error_resp is not None:
+        return error_resp
+    error_code, error_msg = await _env_cache(request).call("set_thermal_limit", env_name, env_id, th_lim)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    return _json_response({"id": env_id, "env_name": env_name})
+
+
+@routes.post("/fast_forward_chronics/{env_name}/{env_id}")
+async def fast_forward_chronics(request):
+    """Same as the "fast_forward_chronics" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    nb_step, error_resp = await _read_json(request, "nb_step",
+                                           'You need to provide a number of step in order to '
+                                           '"fast_forward_chronics" the environment.')
+    if error_resp is not None:
+        return error_resp
+    error_code, error_msg = await _env_cache(request).call("fast_forward_chronics", env_name, env_id, nb_step)
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    return _json_response({"id": env_id, "env_name": env_name})
+
+
+@routes.post("/train_val_split/{env_name}/{env_id}")
+async def train_val_split(request):
+    """Same as the "train_val_split" endpoint of `app.py`"""
+    env_name, env_id = request.match_info["env_name"], request.match_info["env_id"]
+    chron_id_val, error_resp = await _read_json(request, "chron_id_val",
+                                                "You need to provide with the id of the chronics that will "
+                                                "go to the validation set")
+    if error_resp is not None:
+        return error_resp
+    if not isinstance(chron_id_val, Iterable):
+        return _error_response('"chron_id_val"  should be an iterable representing the name of the scenarios '
+                               'you want to place in the validation set.')
+    (nm_train, nm_val), (error_code, error_msg) = await _env_cache(request).call(
+        "train_val_split", env_name, env_id, chron_id_val
+    )
+    if error_code is not None:
+        return _error_response(error_msg, error_code)
+    return _json_response({"id": env_id, "env_name": env_name, "nm_train": nm_train, "nm_val": nm_val})
+
+
+def make_app(env_names=(), pool_size=0, nb_worker=None):
+    """
+    Create the asyncio server application.
+
+    Parameters
+    ----------
+    env_names: ``list``
+        Names of the environments for which `pool_size` environments are created when the server starts
+
+    pool_size: ``int``
+        Number of "pre warmed" environments to keep (for each environment in `env_names`)
+
+    nb_worker: ``int``
+        Number of worker threads used to perform the computation (``None`` for the python default)
+    """
+    # observations are always converted to python types (and serialized with ujson if available)
+    env_cache = AsyncEnvCache(False, env_names=env_names, pool_size=pool_size, nb_worker=nb_worker)
+    app = web.Application(client_max_size=1024 ** 3)
+    app[ENV_CACHE_KEY] = env_cache
+    app.add_routes(routes)
+
+    async def _warm_up(app_):
+        await app_[ENV_CACHE_KEY].warm_up()
+
+    async def _close(app_):
+        app_[ENV_CACHE_KEY].close_all()
+
+    app.on_startup.append(_warm_up)
+    app.on_cleanup.append(_close)
+    return app
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description="Start an asyncio grid2op environment server"
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=3000,
+        help="On which port to start the server (default 3000)",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="On which host to start the server (default 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--env_name",
+        type=str,
+        nargs="*",
+        default=[],
+        help="Name of the environments created when the server starts (default: none)",
+    )
+    parser.add_argument(
+        "--pool_size",
+        type=int,
+        default=1,
+        help="Number of environments created in advance for each `--env_name` (default 1)",
+    )
+    parser.add_argument(
+        "--nb_worker",
+        type=int,
+        default=None,
+        help="Number of threads used to perform the computations (default: python default)",
+    )
+    args = parser.parse_args()
+    web.run_app(make_app(args.env_name, args.pool_size, args.nb_worker), host=args.host, port=args.port)
@@ -0,0 +1,198 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import asyncio
+import functools
+from concurrent.futures import ThreadPoolExecutor
+import numpy as np
+
+from grid2op.Exceptions import EnvError
+from grid2op.rest_server.env_cache import EnvCache
+
+# dtype of the vectors exchanged with the "binary" protocol
+BINARY_DTYPE = np.float32
+
+
+class AsyncEnvCache(EnvCache):
+    """
+    Version of the :class:`EnvCache` used by the asyncio server (see `async_app.py`).
+
+    .. versionadded:: 1.9.5
+
+    Compared to the :class:`EnvCache`:
+
+    - the calls to the environments (`make`, `reset`, `step` etc.) are performed in a pool of worker threads,
+      so that a slow powerflow does not block the other clients of the server. The calls
+      to the same environment are serialized (one lock per environment).
+    - it keeps a pool of "pre warmed" environments (already created) for each of the `env_names`, so that
+      a call to `make` only needs to reset an existing environment.
+    - observations and actions can be exchanged as json (as in the :class:`EnvCache`) or in "binary": the raw
+      bytes of the float32 vectors given by `to_vect()` / expected by `from_vect()`.
+    - a batch of steps (on different environments with the same name) can be performed at once,
+      see :func:`AsyncEnvCache.step_many`.
+
+    """
+
+    INVALID_BINARY_PAYLOAD = 11
+
+    def __init__(self, ujson_as_json, env_names=(), pool_size=0, nb_worker=None):
+        super().__init__(ujson_as_json)
+        self._executor = ThreadPoolExecutor(max_workers=nb_worker)
+        self._env_names = list(env_names)
+        self._pool_size = int(pool_size)
+        # environments created but not given to any client yet
+        self._warm_envs = {env_name: [] for env_name in self._env_names}
+        self._nb_warming = {env_name: 0 for env_name in self._env_names}
+        self._locks = {}
+        self._refill_tasks = set()
+
+    async def _run(self, func, *args, **kwargs):
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, functools.partial(func, *args, **kwargs))
+
+    def _get_lock(self, env_name, env_id):
+        key = (env_name, str(env_id))
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    async def _run_locked(self, env_name, env_id, func, *args, **kwargs):
+        async with self._get_lock(env_name, env_id):
+            return await self._run(func, *args, **kwargs)
+
+    async def warm_up(self):
+        """Fill the pool of pre warmed environments (called when the server starts)"""
+        await asyncio.gather(*[self._refill(env_name) for env_name in self._env_names])
+
+    async def _refill(self, env_name):
+        while len(self._warm_envs[env_name]) + self._nb_warming[env_name] < self._pool_size:
+            self._nb_warming[env_name] += 1
+            try:
+                env = await self._run(self._make_env, env_name)
+            finally:
+                self._nb_warming[env_name] -= 1
+            self._warm_envs[env_name].append(env)
+
+    def _obs_to_payload(self, obs, binary):
+        if binary:
+            return obs.to_vect().astype(BINARY_DTYPE, copy=False).tobytes()
+        return obs.to_json(convert=self._convert_json)
+
+    def _payload_to_act(self, env, payload, binary):
+        act = env.action_space()
+        if binary:
+            act.from_vect(np.frombuffer(payload, dtype=BINARY_DTYPE))
+        else:
+            act.from_json(payload)
+        return act
+
+    async def make(self, env_name, binary=False):
+        """
+        Same as :func:`EnvCache.insert_env` but uses a pre warmed environment (if any is available)
+        """
+        env = None
+        if self._warm_envs.get(env_name):
+            env = self._warm_envs[env_name].pop()
+            # prepare the next one
+            task = asyncio.ensure_future(self._refill(env_name))
+            self._refill_tasks.add(task)
+            task.add_done_callback(self._refill_tasks.discard)
+        try:
+            if env is None:
+                env = await self._run(self._make_env, env_name)
+            obs = await self._run(self._aux_reset, env, binary)
+        except Exception as exc_:
+            return None, None, exc_
+        # environments are registered by the event loop (and not by the workers) to have consistent ids
+        id_ = self._register_env(env_name, env)
+        return id_, obs, None
+
+    def _aux_reset(self, env, binary):
+        obs = env.reset()
+        return self._obs_to_payload(obs, binary)
+
+    async def reset(self, env_name, env_id, binary=False):
+        """Same as :func:`EnvCache.reset`"""
+        env, (error_id, error_msg) = self._aux_get_env(env_name, env_id)
+        if error_id is not None:
+            return None, (error_id, error_msg)
+        try:
+            obs = await self._run_locked(env_name, env_id, self._aux_reset, env, binary)
+        except Exception as exc_:
+            msg_ = f"Impossible to reset the environment with error {exc_}"
+            return None, (self.ERROR_ENV_RESET, msg_)
+        return obs, (None, None)
+
+    def _aux_step(self, env, payload, binary):
+        res_env = (None, None, None, None)
+        try:
+            act = self._payload_to_act(env, payload, binary)
+        except Exception as exc_:
+            msg_ = (
+                f"impossible to convert the provided action to a valid action on this environment with error:\n"
+                f"{exc_}"
+            )
+            error_id = self.INVALID_BINARY_PAYLOAD if binary else self.INVALID_ACTION
+            return res_env, (error_id, msg_)
+
+        try:
+            obs, reward, done, info = env.step(act)
+        except Exception as exc_:
+            msg_ = (
+                f"impossible to make a step on the give environment with error\n{exc_}"
+            )
+            return res_env, (self.INVALID_STEP, msg_)
+        return (
+            self._obs_to_payload(obs, binary),
+            float(reward),
+            bool(done),
+            self._aux_info_to_json(info),
+        ), (None, None)
+
+    async def step(self, env_name, env_id, action, binary=False):
+        """
+        Same as :func:`EnvCache.step`, `action` being either the json representation of the action or
+        (if `binary` is ``True``) the bytes of its vector representation.
+        """
+        env, (error_id, error_msg) = self._aux_get_env(env_name, env_id)
+        if error_id is not None:
+            return (None, None, None, None), (error_id, error_msg)
+        return await self._run_locked(env_name, env_id, self._aux_step, env, action, binary)
+
+    async def step_many(self, env_name, env_ids, actions, binary=False):
+        """
+        Perform a step on each of the environments `env_name` with ids `env_ids` (`actions[i]` being
+        the action for the environment `env_ids[i]`). The steps are performed concurrently.
+
+        It returns the list of the results of :func:`AsyncEnvCache.step` (in the same order as `env_ids`)
+        """
+        if len(env_ids) != len(actions):
+            msg_ = f"you provided {len(actions)} actions for {len(env_ids)} environments"
+            return [((None, None, None, None), (self.INVALID_ACTION, msg_))]
+        return await asyncio.gather(*[self.step(env_name, env_id, act, binary)
+                                      for env_id, act in zip(env_ids, actions)])
+
+    async def call(self, method_name, env_name, env_id, *args):
+        """
+        Call (in the pool of worker) the method `method_name` of the :class:`EnvCache`
+        (*eg* "seed", "set_id", "close", etc.)
+        """
+        return await self._run_locked(env_name, env_id,
+                                      getattr(super(), method_name),
+                                      env_name, env_id, *args)
+
+    def close_all(self):
+        """Close all the environments and the pool of workers"""
+        for li_env in list(self._warm_envs.values()) + list(self.all_env.values()):
+            for env in li_env:
+                try:
+                    env.close()
+                except EnvError:
+                    # this environment has already been closed by a client
+                    pass
+        self._executor.shutdown(wait=True)
@@ -55,21 +55,27 @@ class EnvCache(object):
         TODO
         """
         try:
-            env = make(env_name, backend=bkclass())  # TODO look at the RemoteEnv here
-            env.deactivate_forecast()
-            # call deactivate_forecast
-
+            env = self._make_env(env_name)
         except Exception as exc_:
             return None, None, exc_
 
+        id_ = self._register_env(env_name, env)
+        obs = env.reset()
+        return id_, obs.to_json(convert=self._convert_json), None
+
+    def _make_env(self, env_name):
+        env = make(env_name, backend=bkclass())  # TODO look at the RemoteEnv here
+        env.deactivate_forecast()
+        return env
+
+    def _register_env(self, env_name, env):
         if env_name not in self.all_env:
             # create an environment with that name
             self.all_env[env_name] = [env]
         else:
             self.all_env[env_name].append(env)
         id_ = len(self.all_env[env_name]) - 1
-        obs = env.reset()
-        return id_, obs.to_json(convert=self._convert_json), None
+        return id_
 
     def step(self, env_name, env_id, action_as_json):
         """
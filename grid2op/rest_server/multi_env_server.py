@@ -7,6 +7,7 @@
 # This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
 import copy
 import os
+import json
 
 import requests
 import time
@@ -33,7 +34,10 @@ ERROR_NO_200 = "error due to not receiving 200 status"
 NB_SUB_ENV = 4
 ENV_NAME = "l2rpn_neurips_2020_track2_small"
 SYNCH = True
+# use the asyncio server (`async_app.py`) and exchange observations / actions as float32 vectors
+BINARY = True
 NB_step = 300
+BINARY_HEADERS = {"Content-Type": "application/octet-stream", "Accept": "application/octet-stream"}
 
 
 PORTS = [3000 + i for i in range(NB_SUB_ENV)]  # TODO start them on the fly
@@ -50,10 +54,11 @@ class MultiEnvServer:
             p_ = subprocess.Popen(
                 [
                     sys.executable,
-                    "/home/benjamin/Documents/grid2op_dev/grid2op/rest_server/app.py",
+                    os.path.join(os.path.dirname(os.path.abspath(__file__)),
+                                 "async_app.py" if BINARY else "app.py"),
                     "--port",
                     f"{port}",
-                ],
+                ] + (["--env_name", env_name] if BINARY else []),
                 env=os.environ,
                 # stdout=subprocess.DEVNULL,  # TODO logger
                 # stderr=subprocess.DEVNULL  # TODO logger
@@ -86,48 +91,80 @@ class MultiEnvServer:
     def _make_env_synch(self):
         answs = []
         for url in self.li_urls:
-            resp = self.session.get(f"{url}/make/{self.env_name}")
+            resp = self.session.get(f"{url}/make/{self.env_name}", headers=BINARY_HEADERS if BINARY else None)
             answs.append(resp)
-        import pdb
-
-        pdb.set_trace()
         assert np.all(np.array([el.status_code for el in answs]) == 200), ERROR_NO_200
-        answ_json = [el.json() for el in answs]
+        if BINARY:
+            answ_json = [{"id": el.headers["X-Grid2Op-Id"], "obs": self._aux_read_obs(el.content)}
+                         for el in answs]
+        else:
+            answ_json = [el.json() for el in answs]
         return answ_json
 
     async def _make_env_asynch(self):
-        answ_json = []
         async with aiohttp.ClientSession() as session:
-            for url in self.li_urls:
-                async with session.get(f"{url}/make/{self.env_name}") as resp:
-                    if resp.status != 200:
-                        raise RuntimeError(ERROR_NO_200)
-                    answ_json.append(await resp.json())
+            # all the requests are sent at once
+            answ_json = await asyncio.gather(*[self._aux_make_one_asynch(session, url)
+                                               for url in self.li_urls])
         return answ_json
 
+    async def _aux_make_one_asynch(self, session, url):
+        async with session.get(f"{url}/make/{self.env_name}",
+                               headers=BINARY_HEADERS if BINARY else None) as resp:
+            if resp.status != 200:
+                raise RuntimeError(ERROR_NO_200)
+            if BINARY:
+                return {"id": resp.headers["X-Grid2Op-Id"], "obs": self._aux_read_obs(await resp.read())}
+            return await resp.json()
+
+    def _aux_read_obs(self, payload):
+        return self.observation_space.from_vect(np.frombuffer(payload, dtype=np.float32))
+
+    def _aux_binary_answ(self, headers, payload):
+        return {"obs": self._aux_read_obs(payload),
+                "reward": float(headers["X-Grid2Op-Reward"]),
+                "done": headers["X-Grid2Op-Done"] == "1",
+                "info": json.loads(headers["X-Grid2Op-Info"])}
+
     def _step_synch(self, acts):
         answs = []
         for url, id_env, act in zip(self.li_urls, self.env_id, acts):
-            resp = self.session.post(
-                f"{url}/step/{self.env_name}/{id_env}", json={"action": act.to_json()}
-            )
+            if BINARY:
+                resp = self.session.post(
+                    f"{url}/step/{self.env_name}/{id_env}",
+                    data=act.to_vect().astype(np.float32).tobytes(),
+                    headers=BINARY_HEADERS,
+                )
+            else:
+                resp = self.session.post(
+                    f"{url}/step/{self.env_name}/{id_env}", json={"action": act.to_json()}
+                )
             answs.append(resp)
-        answs = [el.json() for el in answs]
+        if BINARY:
+            answs = [self._aux_binary_answ(el.headers, el.content) for el in answs]
+        else:
+            answs = [el.json() for el in answs]
         return answs
 
     async def _step_asynch(self, acts):
-        answs = []
         async with aiohttp.ClientSession() as session:
-            for url, id_env, act in zip(self.li_urls, self.env_id, acts):
-                async with session.post(
-                    f"{url}/step/{self.env_name}/{id_env}",
-                    json={"action": act.to_json()},
-                ) as resp:
-                    if resp.status != 200:
-                        raise RuntimeError(ERROR_NO_200)
-                    answs.append(await resp.json())
+            # all the requests are sent at once
+            answs = await asyncio.gather(*[self._aux_step_one_asynch(session, url, id_env, act)
+                                           for url, id_env, act in zip(self.li_urls, self.env_id, acts)])
         return answs
 
+    async def _aux_step_one_asynch(self, session, url, id_env, act):
+        if BINARY:
+            kwargs = {"data": act.to_vect().astype(np.float32).tobytes(), "headers": BINARY_HEADERS}
+        else:
+            kwargs = {"json": {"action": act.to_json()}}
+        async with session.post(f"{url}/step/{self.env_name}/{id_env}", **kwargs) as resp:
+            if resp.status != 200:
+                raise RuntimeError(ERROR_NO_200)
+            if BINARY:
+                return self._aux_binary_answ(resp.headers, await resp.read())
+            return await resp.json()
+
     def step(self, acts):
         if SYNCH:
             answ_json = self._step_synch(acts)
@@ -1856,9 +1856,10 @@ class BaseTestEnvPerformsCorrectCascadingFailures(MakeBackend):
         assert disco[self.id_2nd_line_disco] >= 0
         assert np.sum(disco >= 0) == 2
         for i, grid_tmp in enumerate(infos):
-            assert not grid_tmp.get_line_status()[self.id_first_line_disco]
+            assert not grid_tmp["line_status"][self.id_first_line_disco]
+            assert grid_tmp["a_or"][self.id_first_line_disco] == 0.
             if i == 1:
-                assert not grid_tmp.get_line_status()[self.id_2nd_line_disco]
+                assert not grid_tmp["line_status"][self.id_2nd_line_disco]
 
 
 class BaseTestChangeBusAffectRightBus(MakeBackend):
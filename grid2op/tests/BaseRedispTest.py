@@ -202,6 +202,7 @@ class BaseTestRedispatch(MakeBackend):
         th_dispatch = np.array([0.0, 10.0, 20.0, 0.0, -30.0])
         th_dispatch = np.array([0.0, 4.0765514, 20.004545, 0.0, -24.081097])
         th_dispatch = np.array([0., 4.0710216, 20.015802, 0., -24.086824])
+        th_dispatch = np.array([0., 4.0740724, 20., 0., -24.074072])  # exact solution (1.9.5)
         assert self.compare_vect(self.env._actual_dispatch, th_dispatch)
 
         target_val = (
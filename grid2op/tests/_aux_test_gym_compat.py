@@ -14,6 +14,7 @@ from grid2op.tests.helper_path_test import *
 
 import grid2op
 from grid2op.dtypes import dt_float, dt_int
+from grid2op.Exceptions import Grid2OpException
 from grid2op.tests.helper_path_test import *
 from grid2op.Action import PlayableAction
 
@@ -1073,6 +1074,68 @@ class _AuxTestBoxGymObsSpace:
         )
 
 
+    def test_to_gym_batch(self):
+        kept_attr = ["gen_p", "load_p", "topo_vect", "rho", "connectivity_matrix"]
+        observation_space = self._aux_BoxGymObsSpace_cls()(
+            self.env.observation_space,
+            attr_to_keep=kept_attr,
+            divide={"gen_p": self.env.gen_pmax, "load_p": self.obs_env.load_p},
+            subtract={"gen_p": 1.0, "rho": 0.5},
+            functs={
+                "connectivity_matrix": (
+                    lambda grid2obs: grid2obs.connectivity_matrix().flatten(),
+                    0.0,
+                    1.0,
+                    None,
+                    None,
+                )
+            },
+        )
+        list_obs = [self.obs_env]
+        for _ in range(3):
+            obs, *_ = self.env.step(self.env.action_space())
+            list_obs.append(obs)
+
+        # same results as when computed attribute by attribute
+        for obs in list_obs:
+            ref_ = []
+            for attr_nm in observation_space._attr_to_keep:
+                if attr_nm == "connectivity_matrix":
+                    ref_.append(obs.connectivity_matrix().flatten().astype(dt_float))
+                    continue
+                tmp = getattr(obs, attr_nm).astype(dt_float)
+                if attr_nm in observation_space._subtract:
+                    tmp -= observation_space._subtract[attr_nm]
+                if attr_nm in observation_space._divide:
+                    tmp /= observation_space._divide[attr_nm]
+                ref_.append(tmp)
+            assert np.array_equal(observation_space.to_gym(obs), np.concatenate(ref_))
+
+        # in a buffer
+        buffer = np.zeros(observation_space.shape, dtype=observation_space.dtype)
+        res = observation_space.to_gym(list_obs[1], out=buffer)
+        assert res is buffer
+        assert np.array_equal(buffer, observation_space.to_gym(list_obs[1]))
+
+        # in batch
+        res = observation_space.to_gym_batch(list_obs)
+        assert res.shape == (len(list_obs), observation_space.shape[0])
+        for obs, res_row in zip(list_obs, res):
+            assert np.array_equal(res_row, observation_space.to_gym(obs))
+        buffer = np.zeros(res.shape, dtype=observation_space.dtype)
+        assert observation_space.to_gym_batch(list_obs, out=buffer) is buffer
+        assert np.array_equal(buffer, res)
+        with self.assertRaises(Grid2OpException):
+            observation_space.to_gym_batch(list_obs, out=np.zeros((2, observation_space.shape[0]),
+                                                                  dtype=observation_space.dtype))
+
+        # normalize_attr is taken into account
+        observation_space.normalize_attr("topo_vect")
+        res_norm = observation_space.to_gym_batch(list_obs)
+        beg_, end_ = observation_space.get_indexes("topo_vect")
+        assert not np.array_equal(res_norm[:, beg_:end_], res[:, beg_:end_])
+        assert np.all(res_norm[:, beg_:end_] <= 1.)
+
 class _AuxTestBoxGymActSpace:
     def setUp(self) -> None:
         self._skip_if_no_gym()
@@ -1345,6 +1408,34 @@ class _AuxTestBoxGymActSpace:
         assert not grid2op_act3.is_ambiguous()[0]
         assert np.all(np.isclose(grid2op_act.redispatch, grid2op_act3.redispatch))
 
+    def test_from_gym_batch(self):
+        kept_attr = ["set_bus", "change_bus", "redispatch", "set_storage"]
+        gen_redisp = self.env.gen_redispatchable
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            action_space = self._aux_BoxGymActSpace_cls()(
+                self.env.action_space,
+                attr_to_keep=kept_attr,
+                multiply={"redispatch": self.env.gen_max_ramp_up[gen_redisp]},
+                add={"redispatch": self.env.gen_max_ramp_up[gen_redisp], "set_storage": 0.5},
+            )
+        action_space.seed(0)
+        gym_acts = np.array([action_space.sample() for _ in range(10)])
+        gym_acts_cpy = gym_acts.copy()
+        res = action_space.from_gym_batch(gym_acts)
+        assert len(res) == gym_acts.shape[0]
+        for gym_act, grid2op_act in zip(gym_acts, res):
+            assert grid2op_act == action_space.from_gym(gym_act)
+            # same as when the scaling is done attribute by attribute
+            beg_, end_ = action_space.get_indexes("redispatch")
+            redisp = gym_act[beg_:end_] * action_space._multiply["redispatch"]
+            redisp += action_space._add["redispatch"]
+            assert np.array_equal(grid2op_act.redispatch[gen_redisp], redisp)
+            beg_, end_ = action_space.get_indexes("set_storage")
+            assert np.array_equal(grid2op_act.storage_p, gym_act[beg_:end_] + action_space._add["set_storage"])
+        # the input is not modified
+        assert np.array_equal(gym_acts, gym_acts_cpy)
+
 
 class _AuxTestMultiDiscreteGymActSpace:
     def setUp(self) -> None:
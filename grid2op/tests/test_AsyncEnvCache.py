@@ -0,0 +1,210 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.rest_server.async_env_cache import AsyncEnvCache, BINARY_DTYPE
+
+try:
+    import aiohttp
+    from aiohttp.test_utils import TestClient, TestServer
+    AIOHTTP_AVAILABLE = True
+except ImportError as exc_:
+    AIOHTTP_AVAILABLE = False
+
+ENV_NAME = "l2rpn_case14_sandbox"
+
+
+class _AsyncEnvCacheForTest(AsyncEnvCache):
+    """uses the test environments (and not the ones downloaded)"""
+    def _make_env(self, env_name):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(env_name, test=True)
+        env.deactivate_forecast()
+        return env
+
+
+class TestAsyncEnvCache(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        self.env_cache = _AsyncEnvCacheForTest(False, env_names=[ENV_NAME], pool_size=1, nb_worker=2)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make(ENV_NAME, test=True)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env_cache.close_all()
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_act_json(self):
+        return self.env.action_space().to_json()
+
+    def _aux_act_binary(self):
+        return self.env.action_space().to_vect().astype(BINARY_DTYPE).tobytes()
+
+    async def test_make(self):
+        await self.env_cache.warm_up()
+        assert len(self.env_cache._warm_envs[ENV_NAME]) == 1
+        id_, obs, exc_ = await self.env_cache.make(ENV_NAME)
+        assert exc_ is None
+        assert id_ == 0
+        assert isinstance(obs, dict)
+        obs_grid2op = self.env.get_obs()
+        obs_grid2op.from_json(obs)
+
+        # binary encoding
+        id_, obs, exc_ = await self.env_cache.make(ENV_NAME, binary=True)
+        assert exc_ is None
+        assert id_ == 1
+        assert isinstance(obs, bytes)
+        obs_v = np.frombuffer(obs, dtype=BINARY_DTYPE)
+        assert obs_v.shape == (self.env.observation_space.size(), )
+        obs_grid2op.from_vect(obs_v.astype(np.float64))
+
+        # unknown environment
+        id_, obs, exc_ = await self.env_cache.make("unknown_env_name")
+        assert id_ is None
+        assert exc_ is not None
+
+    async def test_step(self):
+        for binary, act in [(False, self._aux_act_json()), (True, self._aux_act_binary())]:
+            id_, obs, exc_ = await self.env_cache.make(ENV_NAME, binary=binary)
+            (obs, reward, done, info), (error_code, error_msg) = await self.env_cache.step(ENV_NAME, id_, act,
+                                                                                          binary=binary)
+            assert error_code is None
+            assert isinstance(obs, bytes if binary else dict)
+            assert isinstance(reward, float)
+            assert not done
+            assert isinstance(info, dict)
+            assert not info["is_illegal"]
+
+    async def test_step_many(self):
+        ids = []
+        for _ in range(3):
+            id_, obs, exc_ = await self.env_cache.make(ENV_NAME)
+            ids.append(id_)
+        for binary, act in [(False, self._aux_act_json()), (True, self._aux_act_binary())]:
+            results = await self.env_cache.step_many(ENV_NAME, ids, [act for _ in ids], binary=binary)
+            assert len(results) == len(ids)
+            for (obs, reward, done, info), (error_code, error_msg) in results:
+                assert error_code is None
+                assert isinstance(obs, bytes if binary else dict)
+                assert not done
+
+        # not the same number of actions and environments
+        results = await self.env_cache.step_many(ENV_NAME, ids, [self._aux_act_json()])
+        assert len(results) == 1
+        assert results[0][1][0] == AsyncEnvCache.INVALID_ACTION
+
+    async def test_call_seed(self):
+        id_, obs, exc_ = await self.env_cache.make(ENV_NAME)
+        all_obs = []
+        for _ in range(2):
+            seeds, (error_code, error_msg) = await self.env_cache.call("seed", ENV_NAME, id_, 0)
+            assert error_code is None
+            error_code, error_msg = await self.env_cache.call("set_id", ENV_NAME, id_, 0)
+            assert error_code is None
+            obs, (error_code, error_msg) = await self.env_cache.reset(ENV_NAME, id_, binary=True)
+            assert error_code is None
+            all_obs.append(np.frombuffer(obs, dtype=BINARY_DTYPE))
+        assert np.array_equal(all_obs[0], all_obs[1], equal_nan=True)
+
+    async def test_unknown_env(self):
+        id_, obs, exc_ = await self.env_cache.make(ENV_NAME)
+        act = self._aux_act_json()
+        res, (error_code, error_msg) = await self.env_cache.step("unknown_env_name", 0, act)
+        assert error_code == AsyncEnvCache.ENV_NOT_FOUND
+        res, (error_code, error_msg) = await self.env_cache.step(ENV_NAME, id_ + 1, act)
+        assert error_code == AsyncEnvCache.ENV_ID_NOT_FOUND
+        res, (error_code, error_msg) = await self.env_cache.reset(ENV_NAME, id_ + 1)
+        assert error_code == AsyncEnvCache.ENV_ID_NOT_FOUND
+        res, (error_code, error_msg) = await self.env_cache.call("seed", ENV_NAME, id_ + 1, 0)
+        assert error_code == AsyncEnvCache.ENV_ID_NOT_FOUND
+
+    async def test_env_errors(self):
+        id_, obs, exc_ = await self.env_cache.make(ENV_NAME)
+        # invalid actions
+        res, (error_code, error_msg) = await self.env_cache.step(ENV_NAME, id_, b"\x00\x01\x02", binary=True)
+        assert error_code == AsyncEnvCache.INVALID_BINARY_PAYLOAD
+        res, (error_code, error_msg) = await self.env_cache.step(ENV_NAME, id_, {"set_bus": "not an action"})
+        assert error_code == AsyncEnvCache.INVALID_ACTION
+
+        # the environment raises an error
+        def _raise(*args, **kwargs):
+            raise RuntimeError("error in the environment")
+        env = self.env_cache.all_env[ENV_NAME][id_]
+        env.step = _raise
+        env.reset = _raise
+        res, (error_code, error_msg) = await self.env_cache.step(ENV_NAME, id_, self._aux_act_json())
+        assert error_code == AsyncEnvCache.INVALID_STEP
+        assert "error in the environment" in error_msg
+        res, (error_code, error_msg) = await self.env_cache.reset(ENV_NAME, id_)
+        assert error_code == AsyncEnvCache.ERROR_ENV_RESET
+
+
+@unittest.skipIf(not AIOHTTP_AVAILABLE, "aiohttp is not installed")
+class TestAsyncApp(unittest.IsolatedAsyncioTestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make(ENV_NAME, test=True)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    async def test_routes(self):
+        from grid2op.rest_server.async_app import (make_app, ENV_CACHE_KEY, BINARY_MIME,
+                                                   HEADER_ID, HEADER_ENV_IDS, HEADER_DONE)
+        app = make_app()
+        app[ENV_CACHE_KEY] = _AsyncEnvCacheForTest(False)
+        async with TestClient(TestServer(app)) as client:
+            resp = await client.get(f"/make/{ENV_NAME}")
+            assert resp.status == 200
+            data = await resp.json()
+            id_ = data["id"]
+            assert data["env_name"] == ENV_NAME
+
+            resp = await client.post(f"/step/{ENV_NAME}/{id_}",
+                                     json={"action": self.env.action_space().to_json()})
+            assert resp.status == 200
+            data = await resp.json()
+            assert not data["done"]
+
+            # binary protocol
+            resp = await client.get(f"/make/{ENV_NAME}", headers={"Accept": BINARY_MIME})
+            assert resp.status == 200
+            id_bin = int(resp.headers[HEADER_ID])
+            obs = np.frombuffer(await resp.read(), dtype=BINARY_DTYPE)
+            assert obs.shape == (self.env.observation_space.size(), )
+
+            act = self.env.action_space().to_vect().astype(BINARY_DTYPE).tobytes()
+            resp = await client.post(f"/step_many/{ENV_NAME}",
+                                     data=act + act,
+                                     headers={"Content-Type": BINARY_MIME,
+                                              HEADER_ENV_IDS: f"{id_},{id_bin}"})
+            assert resp.status == 200
+            obs = np.frombuffer(await resp.read(), dtype=BINARY_DTYPE)
+            assert obs.shape == (2 * self.env.observation_space.size(), )
+            assert resp.headers[HEADER_DONE] == "0,0"
+
+            # errors
+            resp = await client.get(f"/reset/{ENV_NAME}/{id_bin + 1}")
+            assert resp.status == 400
+            data = await resp.json()
+            assert data["error_code"] == AsyncEnvCache.ENV_ID_NOT_FOUND
+
+
+if __name__ == "__main__":
+    unittest.main()
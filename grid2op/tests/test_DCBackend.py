@@ -0,0 +1,219 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import pickle
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Backend import PandaPowerBackend, DCBackend
+from grid2op.Parameters import Parameters
+
+
+class TestDCBackend(unittest.TestCase):
+    def _aux_make(self, backend, env_name="l2rpn_case14_sandbox", **kwargs):
+        param = Parameters()
+        param.ENV_DC = True
+        param.NO_OVERFLOW_DISCONNECTION = True
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(env_name, test=True, param=param, backend=backend, **kwargs)
+        env.seed(0)
+        env.set_id(0)
+        env.reset()
+        return env
+
+    def setUp(self) -> None:
+        self.env = self._aux_make(DCBackend())
+        self.env_ref = self._aux_make(PandaPowerBackend())
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def _aux_compare(self, obs, obs_ref):
+        for attr_nm in ["p_or", "p_ex", "a_or", "a_ex", "v_or", "v_ex", "theta_or", "theta_ex",
+                        "gen_p", "gen_v", "load_p", "rho", "topo_vect", "line_status"]:
+            assert np.allclose(getattr(obs, attr_nm), getattr(obs_ref, attr_nm), atol=1e-3), f"error for {attr_nm}"
+        assert np.all(obs.q_or == 0.)
+        assert np.all(obs.gen_q == 0.)
+
+    def test_same_as_pandapower_dc(self):
+        actions = [self.env.action_space(),
+                   self.env.action_space({"set_line_status": [(3, -1)]}),
+                   self.env.action_space(),
+                   self.env.action_space({"set_bus": {"substations_id": [(5, [1, 1, 2, 2, 1, 2, 2])]}}),
+                   self.env.action_space(),
+                   self.env.action_space({"set_line_status": [(3, 1)]}),
+                   self.env.action_space({"redispatch": [(0, 2.)]}),
+                   ]
+        for act in actions:
+            obs, reward, done, info = self.env.step(act)
+            obs_ref, reward_ref, done_ref, info_ref = self.env_ref.step(act)
+            assert not done
+            assert not done_ref
+            self._aux_compare(obs, obs_ref)
+
+    def test_cache(self):
+        backend = self.env.backend
+        hits, misses = backend.cache_hits, backend.cache_misses
+        for _ in range(3):
+            self.env.step(self.env.action_space())
+        assert backend.cache_hits == hits + 3
+        assert backend.cache_misses == misses
+
+        # a new topology is added to the cache
+        self.env.step(self.env.action_space({"set_line_status": [(3, -1)]}))
+        assert backend.cache_misses == misses + 1
+        self.env.step(self.env.action_space({"set_line_status": [(3, 1)]}))
+        assert backend.cache_misses == misses + 1
+
+        # the cache is shared with the copies
+        backend_cpy = backend.copy()
+        assert backend_cpy._dc_cache is backend._dc_cache
+        conv, exc_ = backend_cpy.runpf()
+        assert conv
+        assert backend_cpy.cache_hits == 1
+        assert backend_cpy.cache_misses == 0
+        assert np.array_equal(backend_cpy.get_line_flow(), backend.get_line_flow())
+
+        backend.clear_cache()
+        assert len(backend._dc_cache) == 0
+        assert backend.cache_hits == 0
+
+    def test_max_cache_size(self):
+        env = self._aux_make(DCBackend(max_cache_size=2))
+        for l_id in range(4):
+            env.step(env.action_space({"set_line_status": [(l_id + 2, -1)]}))
+            env.step(env.action_space({"set_line_status": [(l_id + 2, 1)]}))
+        assert len(env.backend._dc_cache) == 2
+        env.close()
+
+    def test_ptdf_lodf(self):
+        backend = self.env.backend
+        ptdf = backend.get_ptdf()
+        assert ptdf.shape == (self.env.n_line, 2 * self.env.n_sub)
+        # all elements are on bus 1 in this state
+        p_bus = np.bincount(self.env.gen_to_subid, weights=backend.prod_p, minlength=2 * self.env.n_sub)
+        p_bus -= np.bincount(self.env.load_to_subid, weights=backend.load_p, minlength=2 * self.env.n_sub)
+        assert np.allclose(ptdf @ p_bus, backend.p_or, atol=1e-3)
+
+        lodf = backend.get_lodf()
+        lodf_ref = self.env_ref.backend.get_lodf()
+        # powerline 18 is the only one connecting substation 7 to the grid
+        is_bridge = ~np.isfinite(lodf_ref).all(axis=0)
+        assert np.array_equal(np.where(is_bridge)[0], [18])
+        assert np.all(np.isnan(lodf[:, is_bridge]))
+        assert np.allclose(lodf[:, ~is_bridge], lodf_ref[:, ~is_bridge], atol=1e-5)
+
+        # in dc, voltages are constant: the contingencies estimated with the lodf are exact
+        rho_dc, *_ = backend.run_contingencies(screen_threshold=np.inf)
+        rho, *_ = backend.run_contingencies(dc_screen=False)
+        assert np.allclose(rho_dc, rho, atol=1e-4, equal_nan=True)
+
+    def test_bridge(self):
+        # line 0 disconnected: line 1 is the only one connected to the slack bus
+        self.env.step(self.env.action_space({"set_line_status": [(0, -1)]}))
+        lodf = self.env.backend.get_lodf()
+        assert np.all(np.isnan(lodf[1:, 1]))
+        # the disconnected powerline is not affected by the other contingencies
+        assert np.all(lodf[0] == 0.)
+        assert np.all(lodf[:, 0] == 0.)
+        is_bridge = ~np.isfinite(lodf).all(axis=0)
+        assert np.array_equal(np.where(is_bridge)[0], [1, 18])
+
+    def test_isolated_load(self):
+        # load 0 alone on bus 2
+        obs, reward, done, info = self.env.step(
+            self.env.action_space({"set_bus": {"loads_id": [(0, 2)]}})
+        )
+        assert done
+        assert self.env.backend.get_lodf() is None
+        assert self.env.backend.get_ptdf() is None
+
+    def test_snapshot(self):
+        snapshot = self.env.snapshot()
+        obs1, *_ = self.env.step(self.env.action_space({"set_line_status": [(3, -1)]}))
+        self.env.restore(snapshot)
+        obs2, *_ = self.env.step(self.env.action_space({"set_line_status": [(3, -1)]}))
+        assert np.array_equal(obs1.p_or, obs2.p_or)
+
+    def test_snapshot_lodf(self):
+        lodf_before = self.env.backend.get_lodf()
+        snapshot = self.env.snapshot()
+        self.env.step(self.env.action_space({"set_line_status": [(5, -1)]}))
+        assert np.all(self.env.backend.get_lodf()[:, 5] == 0.)
+        self.env.restore(snapshot)
+        lodf = self.env.backend.get_lodf()
+        assert np.array_equal(lodf, lodf_before, equal_nan=True)
+        rho_dc, *_ = self.env.backend.run_contingencies(screen_threshold=np.inf)
+        rho, *_ = self.env.backend.run_contingencies(dc_screen=False)
+        assert np.allclose(rho_dc, rho, atol=1e-4, equal_nan=True)
+
+    def test_pickle(self):
+        backend = self.env.backend
+        self.env.step(self.env.action_space({"set_line_status": [(5, -1)]}))
+        backend_unpickled = pickle.loads(pickle.dumps(backend))
+        assert len(backend_unpickled._dc_cache) == 0
+        assert backend_unpickled._dc_model is None
+        # the model of the last powerflow is built again when needed
+        assert np.array_equal(backend_unpickled.get_lodf(), backend.get_lodf(), equal_nan=True)
+        assert np.array_equal(backend_unpickled.get_ptdf(), backend.get_ptdf())
+        conv, exc_ = backend_unpickled.runpf()
+        assert conv
+        assert np.allclose(backend_unpickled.p_or, backend.p_or)
+
+        # snapshots (that store the model) can be pickled too
+        snapshot = pickle.loads(pickle.dumps(self.env.snapshot()))
+        self.env.step(self.env.action_space({"set_line_status": [(5, 1)]}))
+        self.env.restore(snapshot)
+        assert np.all(self.env.backend.get_lodf()[:, 5] == 0.)
+
+
+class TestDCBackendSimulate(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True, observation_backend_class=DCBackend)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_simulate(self):
+        assert isinstance(self.env.backend, PandaPowerBackend)
+        assert not isinstance(self.env.backend, DCBackend)
+        assert isinstance(self.env.observation_space._backend_obs, DCBackend)
+
+        act = self.env.action_space({"set_line_status": [(3, -1)]})
+        sim_obs, sim_r, sim_d, sim_i = self.obs.simulate(act, time_step=0)
+        assert not sim_d
+        assert np.all(sim_obs.q_or == 0.)
+        # same as the dc powerflow of pandapower
+        backend = self.env.backend.copy()
+        backend._disconnect_line(3)
+        backend.runpf(is_dc=True)
+        assert np.allclose(sim_obs.p_or, backend.p_or, atol=1e-3)
+
+    def test_simulator(self):
+        simulator = self.obs.get_simulator()
+        assert isinstance(simulator.backend, DCBackend)
+        res = simulator.predict(self.env.action_space({"set_line_status": [(3, -1)]}))
+        assert res.converged
+        assert np.all(res.current_obs.q_or == 0.)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,127 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import tempfile
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Action import BaseAction, PlayableAction
+from grid2op.Converter import IdToAct
+from grid2op.Converter._actionTable import _ActionTable
+
+
+class TestIdToActTable(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("educ_case14_storage", test=True, action_class=PlayableAction)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_all_unitary_actions(self):
+        """the actions, as they were built before the table was introduced"""
+        act_space = self.env.action_space
+        res = [act_space()]
+        res += act_space.get_all_unitary_line_set(act_space)
+        res += act_space.get_all_unitary_line_change(act_space)
+        res += act_space.get_all_unitary_topologies_set(act_space)
+        res += act_space.get_all_unitary_topologies_change(act_space)
+        res += act_space.get_all_unitary_redispatch(act_space)
+        res += act_space.get_all_unitary_curtail(act_space)
+        res += act_space.get_all_unitary_storage(act_space)
+        return res
+
+    def test_same_actions(self):
+        converter = IdToAct(self.env.action_space)
+        converter.init_converter()
+        assert isinstance(converter.all_actions, _ActionTable)
+        ref_actions = self._aux_all_unitary_actions()
+        assert converter.n == len(ref_actions)
+        ref_vect = np.array([el.to_vect() for el in ref_actions], dtype=np.float32)
+        vect = converter.all_actions.to_dense()
+        assert np.array_equal(vect, ref_vect, equal_nan=True)
+        # the table is sparse
+        assert converter.all_actions.data.shape[0] < 0.1 * vect.size
+        for act_id in [0, 1, 150, 400, converter.n - 1, -1, np.int64(27)]:
+            act = converter.convert_act(act_id)
+            assert isinstance(act, BaseAction)
+            assert act == ref_actions[act_id]
+        with self.assertRaises(IndexError):
+            converter.convert_act(converter.n)
+
+    def test_numpy_scalar_index(self):
+        converter = IdToAct(self.env.action_space)
+        converter.init_converter()
+        ref_actions = self._aux_all_unitary_actions()
+        for act_id in [0, 27, converter.n - 1]:
+            # eg the output of np.argmax
+            for id_ in [np.int64(act_id), np.int32(act_id), np.array(act_id)]:
+                act = converter.convert_act(id_)
+                assert isinstance(act, BaseAction)
+                assert act == ref_actions[act_id]
+        with self.assertRaises(IndexError):
+            converter.convert_act(np.array(converter.n))
+        with self.assertRaises(TypeError):
+            converter.convert_act(np.array(1.5))
+
+    def test_filter_action(self):
+        converter = IdToAct(self.env.action_space)
+        converter.init_converter()
+        ref_actions = [el for el in self._aux_all_unitary_actions()
+                       if el.get_topological_impact()[1].any()]
+        converter.filter_action(lambda act: act.get_topological_impact()[1].any())
+        assert converter.n == len(ref_actions)
+        for act_id in [0, 10, converter.n - 1]:
+            assert converter.convert_act(act_id) == ref_actions[act_id]
+
+    def test_cache_dir(self):
+        with tempfile.TemporaryDirectory() as path:
+            converter = IdToAct(self.env.action_space)
+            converter.init_converter(cache_dir=path, redispatch=False)
+            assert len(os.listdir(path)) == 1
+            converter2 = IdToAct(self.env.action_space)
+            converter2.init_converter(cache_dir=path, redispatch=False)
+            assert len(os.listdir(path)) == 1  # the table is reused
+            assert isinstance(converter2.all_actions.data, np.memmap)
+            assert converter2.n == converter.n
+            assert converter2.convert_act(27) == converter.convert_act(27)
+
+            # different arguments: different table
+            converter3 = IdToAct(self.env.action_space)
+            converter3.init_converter(cache_dir=path)
+            assert len(os.listdir(path)) == 2
+            assert converter3.n > converter.n
+            del converter2, converter3
+
+    def test_save_load_dense(self):
+        converter = IdToAct(self.env.action_space)
+        converter.init_converter(set_line_status=False, change_bus_vect=False)
+        with tempfile.TemporaryDirectory() as path:
+            converter.save(path, "tmp_convert.npy")
+            converter2 = IdToAct(self.env.action_space)
+            converter2.init_converter(all_actions=os.path.join(path, "tmp_convert.npy"))
+            assert converter2.n == converter.n
+            assert converter2.convert_act(27) == converter.convert_act(27)
+            del converter2
+
+        # from an array
+        vects = converter.all_actions[:10].to_dense()
+        converter3 = IdToAct(self.env.action_space)
+        converter3.init_converter(all_actions=vects)
+        assert converter3.n == 10
+        assert converter3.convert_act(5) == converter.convert_act(5)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -9,6 +9,7 @@
 import warnings
 import tempfile
 import json
+import queue
 import pdb
 
 from grid2op.tests.helper_path_test import *
@@ -24,7 +25,7 @@ from grid2op.Chronics import Multifolder, ChangeNothing
 from grid2op.Reward import L2RPNReward, N1Reward
 from grid2op.Backend import PandaPowerBackend
 from grid2op.MakeEnv import make
-from grid2op.Runner.aux_fun import _aux_one_process_parrallel
+from grid2op.Runner.aux_fun import _aux_worker_parrallel
 from grid2op.Runner import Runner
 from grid2op.dtypes import dt_float
 from grid2op.Agent import RandomAgent
@@ -134,20 +135,29 @@ class TestRunner(HelperTests):
     def test_one_process_par(self):
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
-            res = _aux_one_process_parrallel(
+            task_queue = queue.Queue()
+            result_queue = queue.Queue()
+            task_queue.put((0, 0, None, None))
+            task_queue.put(None)
+            _aux_worker_parrallel(
                 self.runner,
-                [0],
                 0,
-                env_seeds=None,
-                agent_seeds=None,
+                task_queue,
+                result_queue,
                 max_iter=self.max_iter,
             )
-        assert len(res) == 1
-        _, el1, el2, el3, el4 = res[0]
+        msg_type, ep_pos, (res, tracer_stats) = result_queue.get_nowait()
+        assert msg_type == "episode"
+        assert ep_pos == 0
+        _, el1, el2, el3, el4 = res
         assert el1 == "1"
         assert np.abs(el2 - self.real_reward) <= self.tol_one
         assert el3 == 10
         assert el4 == 10
+        msg_type, worker_id, stats = result_queue.get_nowait()
+        assert msg_type == "stats"
+        assert stats["nb_episode"] == 1
+        assert result_queue.empty()
 
     def test_2episode_2process(self):
         with warnings.catch_warnings():
@@ -178,6 +188,28 @@ class TestRunner(HelperTests):
         assert res_2[0][1] == "2"
         assert res_2[1][1] == "1"
 
+    def test_par_workers_stats(self):
+        """test the episodes are dispatched dynamically between the process and that the stats are filled"""
+        assert self.runner.workers_stats is None
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            res = self.runner._run_parrallel(
+                nb_episode=5, nb_process=2, episode_id=[0, 1, 1, 0, 1], max_iter=self.max_iter
+            )
+        assert len(res) == 5
+        assert [el[1] for el in res] == ["1", "2", "2", "1", "2"]
+        for _, _, cum_reward, timestep, total_ts in res:
+            assert int(timestep) == self.max_iter
+            assert np.abs(cum_reward - self.real_reward) <= self.tol_one
+        stats = self.runner.workers_stats
+        assert len(stats) == 2
+        assert [el["worker_id"] for el in stats] == [0, 1]
+        assert sum([el["nb_episode"] for el in stats]) == 5
+        assert sum([el["nb_time_step"] for el in stats]) == 5 * self.max_iter
+        for el in stats:
+            assert 0. <= el["utilization"] <= 1.
+            assert el["time_busy"] <= el["time_total"]
+
     def test_2episodes_with_id(self):
         with warnings.catch_warnings():
             warnings.filterwarnings("ignore")
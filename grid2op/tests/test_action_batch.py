@@ -0,0 +1,167 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Action import ActionBatch, PlayableAction, TopologyAction
+from grid2op.Exceptions import AmbiguousAction, IncorrectNumberOfElements, NonFiniteElement
+
+
+class TestActionBatch(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("educ_case14_storage", test=True, action_class=PlayableAction)
+        self.act_space = self.env.action_space
+        self.act_space.seed(0)
+        self.actions = [self.act_space.sample() for _ in range(100)]
+        self.actions.append(self.act_space({"curtail": [(2, 0.5)]}))
+        self.actions.append(self.act_space({"redispatch": [(0, 1.)]}))
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_from_to_vect(self):
+        matrix = self.act_space.to_vect_batch(self.actions)
+        assert matrix.shape == (len(self.actions), self.act_space.size())
+        for act, vect in zip(self.actions, matrix):
+            assert np.array_equal(act.to_vect(), vect)
+        res = self.act_space.from_vect_batch(matrix)
+        assert len(res) == len(self.actions)
+        for act, act_batch in zip(self.actions, res):
+            assert act_batch == self.act_space.from_vect(act.to_vect())
+            assert np.array_equal(act_batch.to_vect(), act.to_vect())
+
+    def test_as_batch(self):
+        matrix = self.act_space.to_vect_batch(self.actions)
+        batch = self.act_space.from_vect_batch(matrix, as_batch=True)
+        assert isinstance(batch, ActionBatch)
+        assert len(batch) == len(self.actions)
+        assert batch.set_bus.shape == (len(self.actions), self.env.dim_topo)
+        assert batch.change_bus.shape == (len(self.actions), self.env.dim_topo)
+        assert batch.redispatch.shape == (len(self.actions), self.env.n_gen)
+        assert batch.storage_p.shape == (len(self.actions), self.env.n_storage)
+        for i, act in enumerate(self.actions):
+            assert np.array_equal(batch.set_bus[i], act._set_topo_vect)
+            assert np.array_equal(batch.change_bus[i], act._change_bus_vect)
+            assert np.array_equal(batch.set_line_status[i], act._set_line_status)
+            assert np.array_equal(batch.redispatch[i], act._redispatch)
+            assert np.array_equal(batch.curtail[i], act._curtail)
+        assert batch[-1] == self.actions[-1]
+        assert len(batch[2:5]) == 3
+        assert np.array_equal(batch.to_vect(), matrix)
+        assert np.array_equal(self.act_space.to_vect_batch(batch), matrix)
+        with self.assertRaises(IndexError):
+            batch[len(self.actions)]
+
+    def test_wrong_input(self):
+        with self.assertRaises(IncorrectNumberOfElements):
+            self.act_space.from_vect_batch(np.zeros((3, self.act_space.size() + 1)))
+        matrix = np.zeros((3, self.act_space.size()))
+        matrix[1, 0] = np.NaN
+        with self.assertRaises(NonFiniteElement):
+            self.act_space.from_vect_batch(matrix)
+
+    def test_ambiguous_same_as_single(self):
+        """the ambiguity is detected exactly as for the single actions"""
+        rng = np.random.default_rng(0)
+        matrix = self.act_space.to_vect_batch(self.actions)
+        # perturb some actions so that some of them are ambiguous
+        for row_id in range(matrix.shape[0]):
+            col_id = rng.integers(matrix.shape[1])
+            matrix[row_id, col_id] = rng.choice([-2., -1., 1., 3., 0.7, 50.])
+        batch = self.act_space.from_vect_batch(matrix, check_legit=False, as_batch=True)
+        is_amb, info = batch.is_ambiguous()
+        assert is_amb.any()
+        assert (~is_amb).any()
+        for row_id, vect in enumerate(matrix):
+            ref_amb, ref_info = self.act_space.from_vect(vect, check_legit=False).is_ambiguous()
+            assert ref_amb == is_amb[row_id]
+            assert type(ref_info) == type(info[row_id])
+        first_amb = np.where(is_amb)[0][0]
+        with self.assertRaises(type(info[first_amb])):
+            self.act_space.from_vect_batch(matrix)
+        # no error without the ambiguous actions
+        self.act_space.from_vect_batch(matrix[~is_amb])
+
+    def test_mask_same_as_check_for_ambiguity(self):
+        """the mask used to pre filter the actions flags exactly the ambiguous actions"""
+        rng = np.random.default_rng(1)
+        act = self.act_space()
+        cls = type(act)
+        slices = {}
+        prev_ = 0
+        for attr_nm, sh in zip(cls.attr_list_vect, act.shape()):
+            slices[attr_nm] = (prev_, prev_ + sh)
+            prev_ += sh
+        values = {"_redispatch": [-20., -1., 1., 20.],
+                  "_storage_power": [-20., -1., 1., 20.],
+                  "_curtail": [-2., -1., -0.5, 0.5, 1.5],
+                  "_set_topo_vect": [-2., -1., 1., 2., 3.],
+                  "_change_bus_vect": [1.],
+                  "_set_line_status": [-1., 1.],
+                  "_switch_line_status": [1.],
+                  }
+        nb_row = 500
+        matrix = np.tile(act.to_vect(), (nb_row, 1))
+        for row_id in range(nb_row):
+            for _ in range(rng.integers(1, 4)):
+                attr_nm = rng.choice(sorted(values.keys()))
+                beg_, end_ = slices[attr_nm]
+                matrix[row_id, rng.integers(beg_, end_)] = rng.choice(values[attr_nm])
+        # set and change the same element / line
+        beg_set, _ = slices["_set_topo_vect"]
+        beg_change, _ = slices["_change_bus_vect"]
+        for row_id in range(10):
+            el_id = rng.integers(self.env.dim_topo)
+            matrix[row_id, beg_set + el_id] = 1.
+            matrix[row_id, beg_change + el_id] = 1.
+        beg_set, _ = slices["_set_line_status"]
+        beg_change, _ = slices["_switch_line_status"]
+        for row_id in range(10, 20):
+            l_id = rng.integers(self.env.n_line)
+            matrix[row_id, beg_set + l_id] = -1.
+            matrix[row_id, beg_change + l_id] = 1.
+
+        mask = self.act_space.from_vect_batch(matrix, check_legit=False, as_batch=True)._get_ambiguous_mask()
+        nb_amb = 0
+        for row_id, vect in enumerate(matrix):
+            try:
+                self.act_space.from_vect(vect, check_legit=False)._check_for_ambiguity()
+                ref_amb = False
+            except AmbiguousAction:
+                ref_amb = True
+            nb_amb += ref_amb
+            assert mask[row_id] == ref_amb, f"error for action {row_id}"
+        assert 0 < nb_amb < nb_row
+
+    def test_other_action_type(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make("l2rpn_case14_sandbox", test=True, action_class=TopologyAction)
+        env.action_space.seed(0)
+        actions = [env.action_space.sample() for _ in range(20)]
+        matrix = env.action_space.to_vect_batch(actions)
+        res = env.action_space.from_vect_batch(matrix)
+        for vect, act_batch in zip(matrix, res):
+            assert act_batch == env.action_space.from_vect(vect)
+        # redispatching is not part of this action, but is accessible in the batch
+        batch = env.action_space.from_vect_batch(matrix, as_batch=True)
+        assert np.all(batch.redispatch == 0.)
+        with self.assertRaises(AmbiguousAction):
+            env.action_space.to_vect_batch([self.act_space()])
+        env.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
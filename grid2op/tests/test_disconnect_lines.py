@@ -0,0 +1,65 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Backend import Backend, PandaPowerBackend
+
+
+class PPDefaultDisconnectLines(PandaPowerBackend):
+    """use the default (loop based) implementation of `_disconnect_lines`"""
+    def _disconnect_lines(self, mask):
+        Backend._disconnect_lines(self, mask)
+
+
+class DisconnectLinesTester(unittest.TestCase):
+    def _aux_make_env(self, backend):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make("l2rpn_case14_sandbox", test=True, backend=backend)
+        env.seed(0)
+        env.reset()
+        return env
+
+    def setUp(self) -> None:
+        self.env = self._aux_make_env(PandaPowerBackend())
+        self.env_ref = self._aux_make_env(PPDefaultDisconnectLines())
+        self.mask = np.full(self.env.n_line, fill_value=False)
+        self.mask[[0, 4, 17]] = True  # 17 is a transformer
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def test_same_results(self):
+        self.env.backend._disconnect_lines(self.mask)
+        self.env_ref.backend._disconnect_lines(self.mask)
+        assert np.array_equal(self.env.backend.get_line_status(), ~self.mask)
+        assert np.array_equal(self.env.backend._get_line_status(), ~self.mask)
+        assert np.array_equal(self.env.backend.get_topo_vect(), self.env_ref.backend.get_topo_vect())
+        conv, exc_ = self.env.backend.runpf()
+        conv_ref, exc_ref = self.env_ref.backend.runpf()
+        assert conv and conv_ref
+        assert np.allclose(self.env.backend.get_line_flow(), self.env_ref.backend.get_line_flow(), atol=1e-4)
+
+    def test_nothing_disconnected(self):
+        flows = 1.0 * self.env.backend.get_line_flow()
+        self.env.backend._disconnect_lines(np.full(self.env.n_line, fill_value=False))
+        assert self.env.backend.get_line_status().all()
+        conv, exc_ = self.env.backend.runpf()
+        assert conv
+        assert np.allclose(self.env.backend.get_line_flow(), flows, atol=1e-4)
+
+
+if __name__ == "__main__":
+    unittest.main()
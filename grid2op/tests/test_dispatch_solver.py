@@ -0,0 +1,119 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+from scipy.optimize import minimize, LinearConstraint
+
+import grid2op
+from grid2op.Parameters import Parameters
+from grid2op.Environment._dispatchSolver import _solve_dispatch_qp
+
+
+class TestSolveDispatchQP(unittest.TestCase):
+    def _aux_scipy(self, target, weights, lower, upper, total):
+        nb = target.shape[0]
+        res = minimize(lambda x: (weights * (x - target) ** 2).sum(),
+                       np.clip(target, lower, upper),
+                       jac=lambda x: 2. * weights * (x - target),
+                       method="SLSQP",
+                       constraints=[LinearConstraint(np.ones((1, nb)), total, total)],
+                       bounds=list(zip(lower, upper)),
+                       options={"ftol": 1e-12, "maxiter": 500})
+        return res.x
+
+    def test_same_as_scipy(self):
+        rng = np.random.default_rng(0)
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            for _ in range(100):
+                nb = rng.integers(1, 8)
+                target = rng.normal(size=nb) * 10.
+                weights = rng.uniform(0.1, 2., size=nb)
+                lower = -rng.uniform(0., 20., size=nb)
+                upper = rng.uniform(0., 20., size=nb)
+                total = rng.uniform(lower.sum(), upper.sum())
+                res = _solve_dispatch_qp(target, weights, lower, upper, total)
+                assert abs(res.sum() - total) <= 1e-8
+                assert (res >= lower).all()
+                assert (res <= upper).all()
+                res_scipy = self._aux_scipy(target, weights, lower, upper, total)
+                obj = (weights * (res - target) ** 2).sum()
+                obj_scipy = (weights * (res_scipy - target) ** 2).sum()
+                assert obj <= obj_scipy + 1e-6
+
+    def test_closed_form(self):
+        # no bounds active: x = t - mu / w
+        res = _solve_dispatch_qp(np.array([1., 1.]), np.array([1., 3.]),
+                                 np.array([-10., -10.]), np.array([10., 10.]), 0.)
+        assert np.allclose(res, [-0.5, 0.5])
+        # one bound active
+        res = _solve_dispatch_qp(np.array([1., 1.]), np.array([1., 3.]),
+                                 np.array([-0.2, -10.]), np.array([10., 10.]), 0.)
+        assert np.allclose(res, [-0.2, 0.2])
+
+    def test_infeasible(self):
+        assert _solve_dispatch_qp(np.zeros(2), np.ones(2), -np.ones(2), np.ones(2), 5.) is None
+        assert _solve_dispatch_qp(np.zeros(2), np.ones(2), -np.ones(2), np.ones(2), -5.) is None
+        assert _solve_dispatch_qp(np.zeros(2), np.ones(2), np.ones(2), -np.ones(2), 0.) is None
+        assert _solve_dispatch_qp(np.zeros(0), np.ones(0), np.ones(0), np.ones(0), 0.) is None
+
+
+class TestFastDispatchEnv(unittest.TestCase):
+    def setUp(self) -> None:
+        param = Parameters()
+        param.NO_OVERFLOW_DISCONNECTION = True
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("rte_case14_redisp", test=True, param=param)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_run(self, use_fast):
+        self.env._use_fast_dispatch_solver = use_fast
+        self.env.set_id(0)
+        self.env.seed(0)
+        self.env.reset()
+        res = []
+        for gen_id, amount in [(0, 5.), (1, -3.), (0, 0.), (4, 2.), (1, 10.)]:
+            act = self.env.action_space({"redispatch": [(gen_id, amount)]})
+            obs, reward, done, info = self.env.step(act)
+            assert not done
+            assert not info["is_dispatching_illegal"]
+            res.append(obs)
+        for _ in range(3):
+            obs, reward, done, info = self.env.step(self.env.action_space())
+            assert not done
+            res.append(obs)
+        return res
+
+    def test_same_as_scipy(self):
+        res_scipy = self._aux_run(use_fast=False)
+        res_fast = self._aux_run(use_fast=True)
+        for obs_scipy, obs_fast in zip(res_scipy, res_fast):
+            assert np.abs(obs_fast.actual_dispatch.sum()) <= self.env._tol_poly
+            assert np.allclose(obs_fast.target_dispatch, obs_scipy.target_dispatch)
+            # the dispatch of the generators targeted by the actions is unique (scipy is less precise)
+            is_targeted = obs_fast.target_dispatch != 0.
+            assert np.allclose(obs_fast.actual_dispatch[is_targeted],
+                               obs_scipy.actual_dispatch[is_targeted],
+                               atol=5e-2)
+
+    def test_copy(self):
+        self.env._use_fast_dispatch_solver = False
+        env_cpy = self.env.copy()
+        assert not env_cpy._use_fast_dispatch_solver
+        env_cpy.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
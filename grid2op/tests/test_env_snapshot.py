@@ -0,0 +1,113 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import pickle
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Environment import EnvSnapshot
+from grid2op.Exceptions import EnvError
+
+
+class TestEnvSnapshot(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_icaps_2021", test=True)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.env.reset()
+        self.env.action_space.seed(0)
+        for _ in range(3):
+            self.env.step(self.env.action_space())
+        self.actions = [self.env.action_space.sample() for _ in range(10)]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_run(self):
+        res = []
+        for act in self.actions:
+            obs, reward, done, info = self.env.step(act)
+            res.append((obs, reward, done))
+            if done:
+                break
+        return res
+
+    def _aux_compare(self, res1, res2):
+        assert len(res1) == len(res2)
+        for (obs1, reward1, done1), (obs2, reward2, done2) in zip(res1, res2):
+            assert reward1 == reward2
+            assert done1 == done2
+            assert obs1 == obs2
+            assert np.array_equal(obs1.to_vect(), obs2.to_vect())
+
+    def test_restore(self):
+        obs_before = self.env.get_obs()
+        snapshot = self.env.snapshot()
+        assert isinstance(snapshot, EnvSnapshot)
+        assert snapshot.nb_time_step == 3
+        res1 = self._aux_run()
+        self.env.restore(snapshot)
+        assert self.env.nb_time_step == 3
+        assert self.env.get_obs() == obs_before
+        res2 = self._aux_run()
+        self._aux_compare(res1, res2)
+        # restored multiple times
+        self.env.restore(snapshot)
+        res3 = self._aux_run()
+        self._aux_compare(res1, res3)
+
+    def test_restore_after_game_over(self):
+        snapshot = self.env.snapshot()
+        self.env.step(self.env.action_space({"set_bus": {"loads_id": [(0, -1)]}}))
+        with self.assertRaises(grid2op.Exceptions.Grid2OpException):
+            self.env.step(self.env.action_space())
+        self.env.restore(snapshot)
+        obs, reward, done, info = self.env.step(self.env.action_space())
+        assert not done
+
+    def test_pickle(self):
+        snapshot = self.env.snapshot()
+        res1 = self._aux_run()
+        snapshot_unpickled = pickle.loads(pickle.dumps(snapshot))
+        assert snapshot_unpickled.current_obs is None
+        self.env.restore(snapshot_unpickled)
+        res2 = self._aux_run()
+        self._aux_compare(res1, res2)
+
+    def test_backend_state(self):
+        backend = self.env.backend
+        state = backend._get_state()
+        p_or = 1.0 * backend.get_line_flow()
+        topo_vect = 1 * backend.get_topo_vect()
+        self.env.step(self.env.action_space({"set_line_status": [(0, -1)]}))
+        assert not np.array_equal(backend.get_line_flow(), p_or)
+        backend._set_state(state)
+        assert np.array_equal(backend.get_line_flow(), p_or)
+        assert np.array_equal(backend.get_topo_vect(), topo_vect)
+        assert backend._grid.line["in_service"].values[0]
+        # same results as a powerflow computed from scratch
+        backend.runpf()
+        assert np.allclose(backend.get_line_flow(), p_or, atol=1e-3)
+
+    def test_wrong_env(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make("l2rpn_case14_sandbox", test=True)
+        with self.assertRaises(EnvError):
+            env.restore(self.env.snapshot())
+        env.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,137 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import shutil
+import tempfile
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Agent import RandomAgent
+from grid2op.Runner import Runner
+from grid2op.Episode import EpisodeData
+from grid2op.Episode.EpisodeData import CollectionWrapper
+
+
+class TestEpisodeDataStreaming(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("rte_case5_example", test=True)
+        self.agent = RandomAgent(self.env.action_space)
+        self.runner = Runner(**self.env.get_params_for_runner(),
+                             agentClass=None,
+                             agentInstance=self.agent)
+        self.tmp_dir = tempfile.mkdtemp()
+        self.path_ref = os.path.join(self.tmp_dir, "ref")
+        self.path_stream = os.path.join(self.tmp_dir, "stream")
+        self.max_iter = 25
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        return super().tearDown()
+
+    def _aux_run(self, path_save, nb_process=1, **kwargs):
+        return self.runner.run(nb_episode=2,
+                               nb_process=nb_process,
+                               path_save=path_save,
+                               max_iter=self.max_iter,
+                               env_seeds=[0, 1],
+                               agent_seeds=[2, 3],
+                               **kwargs)
+
+    def _aux_check_same(self, ep_ref, ep):
+        assert len(ep) == len(ep_ref)
+        for nm in ["observations", "actions", "env_actions", "attacks"]:
+            coll_ref = getattr(ep_ref, nm)
+            coll = getattr(ep, nm)
+            assert len(coll) == len(coll_ref), f"wrong size for {nm}"
+            for obj_ref, obj in zip(coll_ref, coll):
+                assert obj_ref == obj, f"wrong {nm}"
+        assert np.array_equal(ep.rewards, ep_ref.rewards, equal_nan=True)
+
+    def test_same_as_default(self):
+        res_ref = self._aux_run(self.path_ref)
+        res = self._aux_run(self.path_stream, episode_chunk_size=7)
+        assert [el[:3] for el in res] == [el[:3] for el in res_ref]
+        li_episode = EpisodeData.list_episode(self.path_stream)
+        assert len(li_episode) == 2
+        for _, name in li_episode:
+            path_ep = os.path.join(self.path_stream, name)
+            assert os.path.exists(os.path.join(path_ep, "observations.npy"))
+            assert not os.path.exists(os.path.join(path_ep, "observations.npz"))
+            # the chunks are removed at the end of the episode
+            assert not [el for el in os.listdir(path_ep) if el.endswith("_chunks")]
+            ep_ref = EpisodeData.from_disk(self.path_ref, name)
+            ep = EpisodeData.from_disk(self.path_stream, name)
+            assert isinstance(ep.observations.collection, np.memmap)
+            self._aux_check_same(ep_ref, ep)
+
+    def test_parallel(self):
+        res_ref = self._aux_run(self.path_ref)
+        res = self._aux_run(self.path_stream, nb_process=2, episode_chunk_size=4)
+        assert [el[:3] for el in res] == [el[:3] for el in res_ref]
+        for _, name in EpisodeData.list_episode(self.path_stream):
+            self._aux_check_same(EpisodeData.from_disk(self.path_ref, name),
+                                 EpisodeData.from_disk(self.path_stream, name))
+
+    def test_detailed_output(self):
+        res_ref = self._aux_run(self.path_ref)
+        res = self._aux_run(self.path_stream, add_detailed_output=True, episode_chunk_size=10)
+        for el_ref, el in zip(res_ref, res):
+            self._aux_check_same(EpisodeData.from_disk(self.path_ref, el_ref[1]), el[-1])
+
+    def test_lazy_loading(self):
+        res = self._aux_run(self.path_ref)
+        ep = EpisodeData.from_disk(self.path_ref, res[0][1])
+        assert len(ep.observations.objects) == self.max_iter + 1
+        assert all([el is None for el in ep.observations.objects])
+        # objects built when iterating are not kept
+        for _ in ep.observations:
+            pass
+        assert all([el is None for el in ep.observations.objects])
+        # objects accessed are kept
+        obs = ep.observations[3]
+        assert ep.observations.objects[3] is obs
+        assert ep.observations[3] is obs
+        assert ep.observations[-1] == ep.observations[len(ep.observations) - 1]
+        assert len(ep.observations[2:5]) == 3
+
+    def test_collection_chunks(self):
+        obs = self.env.reset()
+        coll = CollectionWrapper(obs.to_vect().reshape(1, -1),
+                                 self.env.observation_space,
+                                 "observations",
+                                 init_me=False)
+        path = os.path.join(self.tmp_dir, "observations.npy")
+        coll.start_streaming(path, 3)
+        all_obs = [obs.copy()]
+        for ts in range(7):
+            obs, *_ = self.env.step(self.env.action_space())
+            coll.update(ts + 1, obs, True)
+            all_obs.append(obs.copy())
+        # 8 observations in total (the first one + 7 steps): 2 chunks written, 2 observations in memory
+        assert len(os.listdir(f"{path}_chunks")) == 2
+        coll.save(os.path.join(self.tmp_dir, "observations.npz"))
+        assert not os.path.exists(f"{path}_chunks")
+        assert not os.path.exists(os.path.join(self.tmp_dir, "observations.npz"))
+        assert len(coll) == 8
+        for obs_ref, obs in zip(all_obs, coll):
+            assert obs_ref == obs
+
+    def test_wrong_chunk_size(self):
+        with self.assertRaises(RuntimeError):
+            self._aux_run(self.path_stream, episode_chunk_size=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,103 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Exceptions import EnvError
+
+
+class TestForecastEnvPool(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs_list = [self.env.reset()]
+        for _ in range(3):
+            obs, *_ = self.env.step(self.env.action_space())
+            self.obs_list.append(obs)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_run(self, forecast_env):
+        res = [forecast_env.reset().to_vect()]
+        done = False
+        while not done:
+            obs, reward, done, info = forecast_env.step(self.env.action_space())
+            res.append(obs.to_vect())
+        return res
+
+    def _aux_compare(self, res1, res2):
+        assert len(res1) == len(res2)
+        for vect1, vect2 in zip(res1, res2):
+            assert np.array_equal(vect1, vect2)
+
+    def test_same_results(self):
+        ref_ = [self._aux_run(obs.get_forecast_env()) for obs in self.obs_list]
+        self.env.observation_space.set_forecast_env_pool_size(1)
+        forecast_env = self.obs_list[0].get_forecast_env()
+        for obs, res_ref in zip(self.obs_list, ref_):
+            f_env = obs.get_forecast_env()
+            assert f_env is forecast_env
+            self._aux_compare(self._aux_run(f_env), res_ref)
+
+    def test_pool_size(self):
+        self.env.observation_space.set_forecast_env_pool_size(2)
+        f_env0 = self.obs_list[0].get_forecast_env()
+        f_env1 = self.obs_list[1].get_forecast_env()
+        assert f_env0 is not f_env1
+        assert self.obs_list[2].get_forecast_env() is f_env0
+        assert self.obs_list[3].get_forecast_env() is f_env1
+        # environments of the pool can be used "at the same time"
+        f_env2 = self.obs_list[2].get_forecast_env()
+        ref_2 = self._aux_run(f_env2)
+        ref_3 = self._aux_run(f_env1)
+        self.env.observation_space.set_forecast_env_pool_size(0)
+        self._aux_compare(ref_2, self._aux_run(self.obs_list[2].get_forecast_env()))
+        self._aux_compare(ref_3, self._aux_run(self.obs_list[3].get_forecast_env()))
+        assert self.obs_list[3].get_forecast_env() is not f_env1
+
+    def test_external_forecasts(self):
+        obs = self.obs_list[0]
+        load_p = np.tile(obs.load_p, 3).reshape(3, -1)
+        ref_ = self._aux_run(obs.get_env_from_external_forecasts(load_p=load_p))
+        self.env.observation_space.set_forecast_env_pool_size(1)
+        f_env = obs.get_forecast_env()
+        len_forecast = len(self._aux_run(f_env))
+        # a different horizon
+        assert obs.get_env_from_external_forecasts(load_p=load_p) is f_env
+        res = self._aux_run(f_env)
+        assert len(res) != len_forecast
+        self._aux_compare(res, ref_)
+
+    def test_reset_needed_and_closed(self):
+        self.env.observation_space.set_forecast_env_pool_size(1)
+        f_env = self.obs_list[0].get_forecast_env()
+        f_env.reset()
+        f_env.step(self.env.action_space())
+        assert self.obs_list[1].get_forecast_env() is f_env
+        with self.assertRaises(EnvError):
+            f_env.step(self.env.action_space())
+        f_env.close()
+        # a closed environment is built again
+        f_env2 = self.obs_list[1].get_forecast_env()
+        assert f_env2 is not f_env
+        self._aux_run(f_env2)
+        with self.assertRaises(EnvError):
+            self.env.observation_space.set_forecast_env_pool_size(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,143 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import json
+import shutil
+import argparse
+import tempfile
+import warnings
+import unittest
+import numpy as np
+import pandas as pd
+
+import grid2op
+from grid2op.tests.helper_path_test import *
+from grid2op.Chronics import (GridStateFromBinary,
+                              GridStateFromBinaryWithForecasts,
+                              GridStateFromFile,
+                              convert_chronics)
+from grid2op.Chronics.gridStateFromBinary import main as convert_chronics_main
+from grid2op.Exceptions import ChronicsError
+
+
+class TestGridStateFromBinary(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp()
+        self.env_path = os.path.join(PATH_DATA, "rte_case5_example")
+        self.chronics_bin = os.path.join(self.tmp_dir, "chronics")
+        convert_chronics(os.path.join(self.env_path, "chronics"), self.chronics_bin)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        return super().tearDown()
+
+    def _aux_make_env(self, gridvalueClass=None, chunk_size=None):
+        kwargs = {}
+        if gridvalueClass is not None:
+            kwargs["chronics_path"] = self.chronics_bin
+            kwargs["data_feeding_kwargs"] = {"gridvalueClass": gridvalueClass}
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(self.env_path, test=True, **kwargs)
+        if chunk_size is not None:
+            env.set_chunk_size(chunk_size)
+        return env
+
+    def _aux_get_obs(self, env, nb_step=12):
+        res = []
+        sim_res = []
+        env.seed(0)
+        for ep_id in [0, 3]:
+            env.set_id(ep_id)
+            obs = env.reset()
+            res.append(obs.to_vect())
+            for _ in range(nb_step):
+                obs, *_ = env.step(env.action_space())
+                res.append(obs.to_vect())
+                sim_obs, *_ = obs.simulate(env.action_space())
+                sim_res.append(sim_obs.to_vect())
+        return np.array(res), np.array(sim_res)
+
+    def test_format(self):
+        assert sorted(os.listdir(self.chronics_bin)) == sorted(os.listdir(os.path.join(self.env_path, "chronics")))
+        path_0 = os.path.join(self.chronics_bin, "00")
+        assert os.path.exists(os.path.join(path_0, "start_datetime.info"))
+        with open(os.path.join(path_0, "load_p.json"), "r", encoding="utf-8") as f:
+            header = json.load(f)
+        assert header["dtype"] == "float32"
+        data = np.fromfile(os.path.join(path_0, "load_p.bin"), dtype=np.float32)
+        assert data.shape[0] == header["shape"][0] * header["shape"][1]
+        assert len(header["columns"]) == header["shape"][1]
+
+    def test_same_as_csv(self):
+        env_ref = self._aux_make_env()
+        obs_ref, sim_ref = self._aux_get_obs(env_ref)
+        env_ref.close()
+
+        env = self._aux_make_env(GridStateFromBinaryWithForecasts)
+        assert isinstance(env.chronics_handler.real_data.data, GridStateFromBinaryWithForecasts)
+        obs, sim = self._aux_get_obs(env)
+        assert np.allclose(obs, obs_ref)
+        assert np.allclose(sim, sim_ref)
+        env.close()
+
+    def test_chunk(self):
+        env_ref = self._aux_make_env()
+        obs_ref, sim_ref = self._aux_get_obs(env_ref)
+        env_ref.close()
+
+        env = self._aux_make_env(GridStateFromBinaryWithForecasts, chunk_size=5)
+        obs, sim = self._aux_get_obs(env)
+        assert np.allclose(obs, obs_ref)
+        assert np.allclose(sim, sim_ref)
+        env.close()
+
+    def test_no_forecast(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env_ref = grid2op.make(self.env_path, test=True,
+                                   data_feeding_kwargs={"gridvalueClass": GridStateFromFile})
+        obs_ref = env_ref.reset()
+        env_ref.close()
+        env = self._aux_make_env(GridStateFromBinary)
+        obs = env.reset()
+        assert np.allclose(obs.to_vect(), obs_ref.to_vect())
+        env.close()
+
+    def test_cli(self):
+        path_out = os.path.join(self.tmp_dir, "cli")
+        args = argparse.Namespace(path_in=os.path.join(self.env_path, "chronics", "01"),
+                                  path_out=path_out,
+                                  sep=";")
+        convert_chronics_main(args)
+        assert os.path.exists(os.path.join(path_out, "prod_p.bin"))
+        assert os.path.exists(os.path.join(path_out, "prod_p.json"))
+        assert os.path.exists(os.path.join(path_out, "time_interval.info"))
+
+    def test_errors(self):
+        with self.assertRaises(ChronicsError):
+            convert_chronics(self.chronics_bin, self.chronics_bin)
+        with self.assertRaises(ChronicsError):
+            convert_chronics(os.path.join(self.tmp_dir, "i_dont_exist"), self.chronics_bin)
+
+    def test_non_numeric_column(self):
+        path_in = os.path.join(self.tmp_dir, "scenario_csv")
+        shutil.copytree(os.path.join(self.env_path, "chronics", "01"), path_in)
+        df = pd.read_csv(os.path.join(path_in, "load_p.csv.bz2"), sep=";")
+        df["datetime"] = "2019-01-01 00:00"
+        df.to_csv(os.path.join(path_in, "load_p.csv.bz2"), sep=";", index=False)
+        with self.assertRaises(ChronicsError) as exc_:
+            convert_chronics(path_in, os.path.join(self.tmp_dir, "scenario_bin"))
+        assert "load_p.csv.bz2" in str(exc_.exception)
+        assert "datetime" in str(exc_.exception)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,77 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import copy
+import pickle
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+
+
+class TestLazyForecasts(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_compare(self, forecasts, forecasts_ref):
+        assert len(forecasts) == len(forecasts_ref)
+        for (ts, inj), (ts_ref, inj_ref) in zip(forecasts, forecasts_ref):
+            assert ts == ts_ref
+            for key, val in inj_ref["injection"].items():
+                assert np.array_equal(inj["injection"][key], val)
+
+    def test_not_read_by_step(self):
+        obs, *_ = self.env.step(self.env.action_space())
+        assert obs._forecasted_inj_lazy is not None
+        assert not obs._forecasted_inj_lazy.is_computed
+        assert self.env._forecasts is None
+
+        # forecasts are read when needed
+        load_p, *_ = obs.get_forecast_arrays()
+        assert obs._forecasted_inj_lazy is None
+        assert len(obs._forecasted_inj) == 2
+        assert np.array_equal(load_p[1], self.env.chronics_handler.real_data.data.load_p_forecast[1])
+        assert self.env.forecasts() is not None
+
+    def test_read_after_env_moved(self):
+        obs, *_ = self.env.step(self.env.action_space())
+        obs_ref = obs.copy()
+        forecasts_ref = copy.deepcopy(obs_ref._forecasted_inj)
+        for _ in range(3):
+            self.env.step(self.env.action_space())
+        # the forecasts are the one of the step the observation has been made at
+        self._aux_compare(obs._forecasted_inj, forecasts_ref)
+        sim_obs, *_ = obs.simulate(self.env.action_space())
+        sim_obs_ref, *_ = obs_ref.simulate(self.env.action_space())
+        assert np.array_equal(sim_obs.load_p, sim_obs_ref.load_p)
+
+    def test_copy_pickle(self):
+        obs, *_ = self.env.step(self.env.action_space())
+        obs_cpy = obs.copy()
+        obs_deepcpy = copy.deepcopy(obs)
+        obs_pickle = pickle.loads(pickle.dumps(obs._forecasted_inj_lazy))
+        assert obs_pickle.is_computed
+        forecasts = obs._forecasted_inj
+        self._aux_compare(obs_cpy._forecasted_inj, forecasts)
+        self._aux_compare(obs_deepcpy._forecasted_inj, forecasts)
+        self._aux_compare(obs_pickle(), forecasts[1:])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,42 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import sys
+import json
+import subprocess
+import unittest
+
+
+class TestLazyImports(unittest.TestCase):
+    def _aux_loaded_modules(self, cmd, modules):
+        cmd = (f"import sys, json\n{cmd}\n"
+               f"print(json.dumps({{el: el in sys.modules for el in {modules}}}))")
+        out = subprocess.run([sys.executable, "-W", "ignore", "-c", cmd],
+                             check=True, capture_output=True, text=True)
+        return json.loads(out.stdout.strip().split("\n")[-1])
+
+    def test_import_grid2op(self):
+        modules = ["pandapower", "networkx", "scipy.optimize", "scipy.sparse", "requests", "pkg_resources"]
+        res = self._aux_loaded_modules("import grid2op\n"
+                                       "from grid2op.Runner import Runner\n"
+                                       "from grid2op.Reward import BridgeReward",
+                                       modules)
+        for el in modules:
+            assert not res[el], f"{el} is imported by grid2op"
+
+    def test_pandapower_backend(self):
+        res = self._aux_loaded_modules("from grid2op.Backend import PandaPowerBackend",
+                                       ["pandapower"])
+        assert res["pandapower"]
+        import grid2op.Backend
+        with self.assertRaises(AttributeError):
+            grid2op.Backend.UnknownBackend
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,145 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import unittest
+import numpy as np
+import pandas as pd
+from datetime import datetime, timedelta
+
+from grid2op.Chronics import GridValue, GridStateFromFileWithForecastsWithMaintenance
+
+
+def _ref_maintenance_time_duration(maintenance):
+    """step by step (slow) computation of the maintenance time, maintenance duration and hazard duration
+    of one powerline"""
+    nb_ts = maintenance.shape[0]
+    maintenance_time = np.full(nb_ts, fill_value=-1, dtype=int)
+    maintenance_duration = np.zeros(nb_ts, dtype=int)
+    hazard_duration = np.zeros(nb_ts, dtype=int)
+    for t in range(nb_ts):
+        next_ = np.where(maintenance[t:])[0]
+        if next_.shape[0] == 0:
+            continue
+        beg_ = t + next_[0]
+        end_ = beg_
+        while end_ < nb_ts and maintenance[end_]:
+            end_ += 1
+        maintenance_time[t] = beg_ - t
+        maintenance_duration[t] = end_ - max(beg_, t)
+        if beg_ == t:
+            hazard_duration[t] = end_ - t
+    return maintenance_time, maintenance_duration, hazard_duration
+
+
+def _ref_generate_maintenance(name_line, n_, line_to_maintenance, time_interval, start_datetime,
+                              maintenance_starting_hour, maintenance_ending_hour,
+                              daily_proba_per_month_maintenance, max_daily_number_per_month_maintenance,
+                              space_prng):
+    """day by day sampling of the maintenance (as it was done before grid2op 1.9.5)"""
+    res = np.zeros((n_, len(name_line)))
+    idx_line_maintenance = np.array([el in line_to_maintenance for el in name_line])
+    datelist = pd.date_range(start_datetime, periods=n_, freq=f"{int(time_interval.total_seconds())}s")
+    datelist = np.unique(np.array([el.date() for el in datelist]))[:-1]
+    nb_rows = int(86400 / time_interval.total_seconds())
+    beg_ = int(maintenance_starting_hour * 3600 / time_interval.total_seconds())
+    end_ = int(maintenance_ending_hour * 3600 / time_interval.total_seconds())
+    for day_id, this_day in enumerate(datelist):
+        if this_day.weekday() >= 5:
+            continue
+        proba = daily_proba_per_month_maintenance[this_day.month - 1]
+        max_maint = max_daily_number_per_month_maintenance[this_day.month - 1]
+        in_maint = space_prng.choice([False, True], p=[1. - proba, proba], size=len(line_to_maintenance))
+        n_gen = in_maint.sum()
+        if n_gen > max_maint:
+            not_chosen = space_prng.choice(n_gen, replace=False, size=n_gen - max_maint)
+            in_maint[np.where(in_maint)[0][not_chosen]] = False
+        maintenance_me = np.zeros((nb_rows, idx_line_maintenance.sum()))
+        maintenance_me[beg_:end_, in_maint] = 1.
+        n_max = res[(day_id * nb_rows):((day_id + 1) * nb_rows)].shape[0]
+        res[(day_id * nb_rows):((day_id + 1) * nb_rows), idx_line_maintenance] = maintenance_me[:n_max]
+    return res
+
+
+class TestMaintenance2D(unittest.TestCase):
+    def test_same_as_ref(self):
+        rng = np.random.default_rng(0)
+        for _ in range(100):
+            nb_ts = rng.integers(1, 50)
+            maintenance = (rng.random((nb_ts, 4)) < rng.random()).astype(float)
+            maintenance_time = GridValue.get_maintenance_time_2d(maintenance)
+            maintenance_duration = GridValue.get_maintenance_duration_2d(maintenance)
+            hazard_duration = GridValue.get_hazard_duration_2d(maintenance)
+            assert maintenance_time.shape == maintenance.shape
+            assert maintenance_duration.shape == maintenance.shape
+            assert hazard_duration.shape == maintenance.shape
+            for line_id in range(maintenance.shape[1]):
+                time_ref, duration_ref, hazard_ref = _ref_maintenance_time_duration(maintenance[:, line_id])
+                assert np.array_equal(maintenance_time[:, line_id], time_ref)
+                assert np.array_equal(maintenance_duration[:, line_id], duration_ref)
+                assert np.array_equal(hazard_duration[:, line_id], hazard_ref)
+                assert np.array_equal(GridValue.get_maintenance_time_1d(maintenance[:, line_id]), time_ref)
+                assert np.array_equal(GridValue.get_maintenance_duration_1d(maintenance[:, line_id]), duration_ref)
+                assert np.array_equal(GridValue.get_hazard_duration_1d(maintenance[:, line_id]), hazard_ref)
+
+    def test_maintenance_first_step(self):
+        maintenance = np.array([1, 1, 0, 0, 1, 0])
+        assert np.array_equal(GridValue.get_maintenance_time_1d(maintenance),
+                              np.array([0, 0, 2, 1, 0, -1]))
+        assert np.array_equal(GridValue.get_maintenance_duration_1d(maintenance),
+                              np.array([2, 1, 1, 1, 1, 0]))
+        assert np.array_equal(GridValue.get_hazard_duration_1d(maintenance),
+                              np.array([2, 1, 0, 0, 1, 0]))
+
+    def test_no_maintenance(self):
+        maintenance = np.zeros((10, 3))
+        maintenance[2:4, 1] = 1.
+        assert np.all(GridValue.get_maintenance_time_2d(maintenance)[:, [0, 2]] == -1)
+        assert np.all(GridValue.get_maintenance_duration_2d(maintenance)[:, [0, 2]] == 0)
+        assert np.all(GridValue.get_hazard_duration_2d(maintenance)[:, [0, 2]] == 0)
+        assert np.array_equal(GridValue.get_maintenance_time_2d(maintenance)[:, 1],
+                              np.array([2, 1, 0, 0, -1, -1, -1, -1, -1, -1]))
+
+
+class TestGenerateMaintenance(unittest.TestCase):
+    def setUp(self) -> None:
+        self.name_line = [f"line_{i}" for i in range(10)]
+        self.line_to_maintenance = {"line_1", "line_4", "line_5", "line_8"}
+        self.generate = GridStateFromFileWithForecastsWithMaintenance._generate_matenance_static
+        return super().setUp()
+
+    def _aux_compare(self, n_, start_datetime, probas, max_daily, seed):
+        args = (self.name_line, n_, self.line_to_maintenance, timedelta(minutes=5), start_datetime,
+                9, 17, probas, max_daily)
+        prng = np.random.RandomState(seed)
+        prng_ref = np.random.RandomState(seed)
+        res = self.generate(*args, prng)
+        res_ref = _ref_generate_maintenance(*args, prng_ref)
+        assert np.array_equal(res, res_ref)
+        # the random generator is in the same state afterwards
+        assert prng.random_sample() == prng_ref.random_sample()
+        return res
+
+    def test_same_as_day_by_day(self):
+        for seed in range(5):
+            # low probability: the maximum number of maintenance is rarely reached
+            res = self._aux_compare(8065, datetime(2019, 1, 1), [0.05] * 12, [2] * 12, seed)
+            assert res.sum() > 0
+            # high probability: the maximum number of maintenance is often reached
+            res = self._aux_compare(8065, datetime(2019, 1, 1), [0.7] * 12, [2] * 12, seed)
+            assert np.all(res.sum(axis=1) <= 2)
+
+    def test_incomplete_days(self):
+        probas = np.linspace(0.1, 0.9, 12).tolist()
+        max_daily = [1, 2, 3, 4] * 3
+        self._aux_compare(20000, datetime(2019, 11, 28, 23, 55), probas, max_daily, 0)
+        self._aux_compare(2, datetime(2019, 11, 28, 23, 55), probas, max_daily, 0)
+        self._aux_compare(500, datetime(2019, 11, 29, 12, 0), probas, max_daily, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,202 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import re
+import shutil
+import tempfile
+import warnings
+import unittest
+import numpy as np
+import pandas as pd
+
+import grid2op
+from grid2op.tests.helper_path_test import *
+from grid2op.Chronics import MultifolderWithCache
+from grid2op.Chronics.multifolderWithCache import _aux_cache_entry, _aux_save_in_cache, _aux_load_from_cache
+from grid2op.Exceptions import ChronicsError
+
+
+class _DataForTest(object):
+    def __init__(self, value):
+        self.value = np.full(3, fill_value=value)
+
+
+class TestMultifolderWithCacheDisk(unittest.TestCase):
+    def setUp(self) -> None:
+        self.tmp_dir = tempfile.mkdtemp()
+        # the environment is copied because some test modify the data
+        self.env_path = os.path.join(self.tmp_dir, "rte_case5_example")
+        shutil.copytree(os.path.join(PATH_DATA, "rte_case5_example"), self.env_path)
+        self.cache_dir = os.path.join(self.tmp_dir, "cache")
+        self.filter = lambda x: re.match(".*(01|04|05)$", x) is not None
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        shutil.rmtree(self.tmp_dir, ignore_errors=True)
+        return super().tearDown()
+
+    def _aux_make_env(self, **kwargs):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make(self.env_path,
+                               test=True,
+                               chronics_class=MultifolderWithCache,
+                               data_feeding_kwargs=kwargs)
+        env.chronics_handler.set_filter(self.filter)
+        env.chronics_handler.reset()
+        return env
+
+    def _aux_get_obs(self, env, nb_step=5):
+        res = []
+        env.seed(0)
+        for _ in range(3):
+            obs = env.reset()
+            res.append(obs.to_vect())
+            for _ in range(nb_step):
+                obs, *_ = env.step(env.action_space())
+                res.append(obs.to_vect())
+        return np.array(res)
+
+    def _aux_entries(self):
+        """entries of the cache for the scenarios kept by the filter (the first scenario is also
+        stored when the environment is created)"""
+        return sorted([el for el in os.listdir(self.cache_dir) 
+                       if not el.startswith(".") and self.filter(el.split("_")[0])])
+
+    def test_same_results(self):
+        env_ref = self._aux_make_env()
+        obs_ref = self._aux_get_obs(env_ref)
+        env_ref.close()
+
+        env = self._aux_make_env(cache_dir=self.cache_dir)
+        assert len(self._aux_entries()) == 3
+        data = env.chronics_handler.real_data.data
+        assert isinstance(data.load_p, np.memmap)
+        obs = self._aux_get_obs(env)
+        assert np.array_equal(obs, obs_ref)
+        env.close()
+
+        # the cache is re used
+        mtimes = [os.stat(os.path.join(self.cache_dir, el)).st_mtime_ns for el in self._aux_entries()]
+        env = self._aux_make_env(cache_dir=self.cache_dir)
+        assert [os.stat(os.path.join(self.cache_dir, el)).st_mtime_ns for el in self._aux_entries()] == mtimes
+        obs = self._aux_get_obs(env)
+        assert np.array_equal(obs, obs_ref)
+        env.close()
+
+    def test_parallel(self):
+        env_ref = self._aux_make_env()
+        obs_ref = self._aux_get_obs(env_ref)
+        env_ref.close()
+
+        env = self._aux_make_env(nb_process=2)
+        obs = self._aux_get_obs(env)
+        assert np.array_equal(obs, obs_ref)
+        env.close()
+
+        env = self._aux_make_env(nb_process=2, cache_dir=self.cache_dir)
+        assert len(self._aux_entries()) == 3
+        assert isinstance(env.chronics_handler.real_data.data.load_p, np.memmap)
+        obs = self._aux_get_obs(env)
+        assert np.array_equal(obs, obs_ref)
+        env.close()
+
+    def test_invalidate(self):
+        env = self._aux_make_env(cache_dir=self.cache_dir)
+        entries = self._aux_entries()
+        env.close()
+
+        # modify the data of scenario "04"
+        load_p_path = os.path.join(self.env_path, "chronics", "04", "load_p.csv.bz2")
+        load_p = pd.read_csv(load_p_path, sep=";")
+        load_p.iloc[:, 0] *= 1.01
+        load_p.to_csv(load_p_path, sep=";", index=False)
+
+        env_ref = self._aux_make_env()
+        env_ref.set_id(1)  # scenario 04 (second one in the filter)
+        obs_ref = env_ref.reset()
+        env_ref.close()
+
+        env = self._aux_make_env(cache_dir=self.cache_dir)
+        new_entries = self._aux_entries()
+        assert len(new_entries) == 3
+        assert len(set(new_entries) - set(entries)) == 1
+        assert [el for el in new_entries if el not in entries][0].startswith("04_")
+        env.set_id(1)
+        obs = env.reset()
+        assert env.chronics_handler.get_name() == "04"
+        assert np.allclose(obs.load_p, obs_ref.load_p)
+        env.close()
+
+    def test_seeds_kept(self):
+        os.makedirs(self.cache_dir)
+        path = os.path.join(self.env_path, "chronics", "01")
+        entries = []
+        for seed in [1, 2]:
+            prefix, content_dir, entry = _aux_cache_entry(self.cache_dir, path, ("key", ), seed)
+            _aux_save_in_cache(_DataForTest(seed), self.cache_dir, prefix, content_dir, entry)
+            entries.append(entry)
+        # saving the data of a seed does not remove the data of the other seeds
+        assert entries[0] != entries[1]
+        for seed, entry in zip([1, 2], entries):
+            data = _aux_load_from_cache(self.cache_dir, entry)
+            assert np.all(data.value == seed)
+
+        # the data of all the seeds are removed when the content (or the config) changes
+        prefix, content_dir, entry = _aux_cache_entry(self.cache_dir, path, ("other key", ), 1)
+        _aux_save_in_cache(_DataForTest(3), self.cache_dir, prefix, content_dir, entry)
+        assert _aux_load_from_cache(self.cache_dir, entries[0]) is None
+        assert _aux_load_from_cache(self.cache_dir, entries[1]) is None
+        assert np.all(_aux_load_from_cache(self.cache_dir, entry).value == 3)
+
+    def test_no_seed_if_not_used(self):
+        env = self._aux_make_env(cache_dir=self.cache_dir)
+        for seed in [0, 1]:
+            env.seed(seed)
+            env.chronics_handler.reset()
+        # the data of GridStateFromFile do not depend on the seed
+        for el in self._aux_entries():
+            assert os.listdir(os.path.join(self.cache_dir, el)) == ["data"]
+        env.close()
+
+    def test_missing_entry(self):
+        env_ref = self._aux_make_env()
+        obs_ref = self._aux_get_obs(env_ref)
+        env_ref.close()
+
+        env = self._aux_make_env(cache_dir=self.cache_dir)
+        env.close()
+        # an entry is (partially) removed, for example by another process
+        for el in self._aux_entries():
+            os.remove(os.path.join(self.cache_dir, el, "data", "data.pickle"))
+        env = self._aux_make_env(cache_dir=self.cache_dir)
+        obs = self._aux_get_obs(env)
+        assert np.array_equal(obs, obs_ref)
+        env.close()
+
+    def test_copy(self):
+        env = self._aux_make_env(cache_dir=self.cache_dir, nb_process=2)
+        env_cpy = env.copy()
+        assert env_cpy.chronics_handler.real_data.cache_dir == env.chronics_handler.real_data.cache_dir
+        assert env_cpy.chronics_handler.real_data.nb_process == 2
+        env_cpy.close()
+        env.close()
+
+    def test_wrong_nb_process(self):
+        with self.assertRaises(ChronicsError):
+            with warnings.catch_warnings():
+                warnings.filterwarnings("ignore")
+                grid2op.make(self.env_path,
+                             test=True,
+                             chronics_class=MultifolderWithCache,
+                             data_feeding_kwargs={"nb_process": 0})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,128 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Environment import SingleEnvMultiProcess, MultiEnvMultiProcess
+from grid2op.Observation import CompleteObservation
+
+
+class TestMultiProcessSharedMemory(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("rte_case5_example", test=True)
+        self.nb_env = 2
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_make(self, use_shared_memory, obs_as_class=True):
+        self.env.seed(0)
+        return SingleEnvMultiProcess(self.env,
+                                     self.nb_env,
+                                     obs_as_class=obs_as_class,
+                                     use_shared_memory=use_shared_memory)
+
+    def _aux_run(self, multi_env):
+        res = [multi_env.reset()]
+        for _ in range(3):
+            obs, reward, done, info = multi_env.step([self.env.action_space() for _ in range(self.nb_env)])
+            assert reward.shape == (self.nb_env,)
+            assert done.shape == (self.nb_env,)
+            assert len(info) == self.nb_env
+            assert isinstance(info[0], dict)
+            res.append(obs)
+        return res
+
+    def test_same_as_pipe(self):
+        multi_env_pipe = self._aux_make(use_shared_memory=False)
+        res_pipe = self._aux_run(multi_env_pipe)
+        multi_env_pipe.close()
+        multi_env_shm = self._aux_make(use_shared_memory=True)
+        res_shm = self._aux_run(multi_env_shm)
+        multi_env_shm.close()
+        for obs_pipe, obs_shm in zip(res_pipe, res_shm):
+            assert len(obs_pipe) == len(obs_shm)
+            for ob_pipe, ob_shm in zip(obs_pipe, obs_shm):
+                assert isinstance(ob_shm, CompleteObservation)
+                assert np.array_equal(ob_pipe.to_vect(), ob_shm.to_vect())
+
+    def test_obs_as_vect(self):
+        multi_env = self._aux_make(use_shared_memory=True, obs_as_class=False)
+        obs = multi_env.reset()
+        assert obs.shape == (self.nb_env, self.env.observation_space.size())
+        assert not obs.flags.writeable
+        with self.assertRaises(ValueError):
+            obs[0, 0] = 1.
+        obs_cpy = obs.copy()
+        # the data are not overwritten before NB_SLOT_SHARED_MEMORY other calls
+        obs1, *_ = multi_env.step([self.env.action_space() for _ in range(self.nb_env)])
+        assert np.array_equal(obs, obs_cpy)
+        assert not np.array_equal(obs1, obs_cpy)
+        multi_env.close()
+
+    def test_default_pipe(self):
+        multi_env = SingleEnvMultiProcess(self.env, self.nb_env)
+        assert multi_env._transport is None
+        multi_env.close()
+
+    def test_get_obs_no_slot(self):
+        multi_env = self._aux_make(use_shared_memory=True, obs_as_class=False)
+        obs = multi_env.reset()
+        obs_cpy = obs.copy()
+        # get_obs does not use a slot of the shared memory
+        for _ in range(type(multi_env).NB_SLOT_SHARED_MEMORY):
+            obs_get = multi_env.get_obs()
+            assert np.array_equal(obs_get[0].to_vect(), obs_cpy[0])
+        obs1, *_ = multi_env.step([self.env.action_space() for _ in range(self.nb_env)])
+        assert np.array_equal(obs, obs_cpy)
+        multi_env.close()
+
+    def test_simulate(self):
+        res = []
+        for use_shared_memory in [False, True]:
+            multi_env = self._aux_make(use_shared_memory=use_shared_memory)
+            multi_env.reset()
+            actions = [self.env.action_space() for _ in range(self.nb_env)]
+            sim_obs, sim_r, sim_d, sim_i = multi_env.simulate(actions)
+            obs, *_ = multi_env.step(actions)
+            obs_get = multi_env.get_obs()
+            for ob_get, ob in zip(obs_get, obs):
+                assert np.array_equal(ob_get.to_vect(), ob.to_vect())
+            multi_env.close()
+            res.append((sim_obs, sim_r, sim_d))
+        (sim_obs_pipe, sim_r_pipe, sim_d_pipe), (sim_obs_shm, sim_r_shm, sim_d_shm) = res
+        for sim_ob_pipe, sim_ob_shm in zip(sim_obs_pipe, sim_obs_shm):
+            assert isinstance(sim_ob_shm, CompleteObservation)
+            assert np.array_equal(sim_ob_pipe.to_vect(), sim_ob_shm.to_vect())
+        assert np.allclose(sim_r_pipe, sim_r_shm)
+        assert np.array_equal(sim_d_pipe, sim_d_shm)
+
+    def test_different_envs(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env14 = grid2op.make("l2rpn_case14_sandbox", test=True)
+        multi_env = MultiEnvMultiProcess([self.env, env14], [1, 1], obs_as_class=False, use_shared_memory=True)
+        obs = multi_env.reset()
+        assert len(obs) == 2
+        assert obs[0].shape == (self.env.observation_space.size(),)
+        assert obs[1].shape == (env14.observation_space.size(),)
+        obs, reward, done, info = multi_env.step([self.env.action_space(), env14.action_space()])
+        assert obs[1].shape == (env14.observation_space.size(),)
+        multi_env.close()
+        env14.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,125 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import copy
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Parameters import Parameters
+
+
+def _ref_connectivity_matrix(obs):
+    """the connectivity matrix, computed "naively" (as in grid2op < 1.9.5)"""
+    res = np.zeros((obs.dim_topo, obs.dim_topo))
+    beg_ = 0
+    for nb_obj in obs.sub_info:
+        for obj1 in range(nb_obj):
+            for obj2 in range(nb_obj):
+                bus1 = obs.topo_vect[beg_ + obj1]
+                bus2 = obs.topo_vect[beg_ + obj2]
+                if bus1 != -1 and bus1 == bus2:
+                    res[beg_ + obj1, beg_ + obj2] = 1.
+        beg_ += nb_obj
+    for l_id in range(obs.n_line):
+        if obs.line_status[l_id]:
+            res[obs.line_or_pos_topo_vect[l_id], obs.line_ex_pos_topo_vect[l_id]] = 1.
+            res[obs.line_ex_pos_topo_vect[l_id], obs.line_or_pos_topo_vect[l_id]] = 1.
+    return res
+
+
+class TestObsGraphCache(unittest.TestCase):
+    def setUp(self) -> None:
+        param = Parameters()
+        param.NO_OVERFLOW_DISCONNECTION = True
+        param.MAX_SUB_CHANGED = 99
+        param.MAX_LINE_STATUS_CHANGED = 99
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True, param=param)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_actions(self):
+        res = [
+            {"set_bus": {"substations_id": [(1, [1, 1, 2, 2, 1, 2])]}},
+            {"set_line_status": [(3, -1)]},
+            {"set_bus": {"substations_id": [(1, [1, 1, 1, 1, 1, 1]), (5, [1, 1, 2, 2, 1, 2, 2])]}},
+            {"set_line_status": [(3, 1)]},
+            {},
+        ]
+        return [self.env.action_space(el) for el in res]
+
+    def test_connectivity_matrix(self):
+        for act in self._aux_actions():
+            obs, reward, done, info = self.env.step(act)
+            assert not done
+            ref_ = _ref_connectivity_matrix(obs)
+            assert np.array_equal(obs.connectivity_matrix(), ref_)
+            assert np.array_equal(obs.connectivity_matrix(as_csr_matrix=True).toarray(), ref_)
+            # cached
+            assert obs.connectivity_matrix(as_csr_matrix=True) is obs.connectivity_matrix(as_csr_matrix=True)
+
+    def test_connectivity_matrix_incremental(self):
+        """the observation is modified inplace, only the modified substations are updated"""
+        obs = self.obs.copy()
+        obs.connectivity_matrix()
+        for act in self._aux_actions():
+            sim_obs, *_ = self.obs.simulate(act, time_step=0)
+            sim_obs._copy_into(obs)
+            assert np.array_equal(obs.connectivity_matrix(), _ref_connectivity_matrix(obs))
+
+        # inplace modification of the topology
+        obs.topo_vect[obs.load_pos_topo_vect[0]] = 2
+        assert np.array_equal(obs.connectivity_matrix(), _ref_connectivity_matrix(obs))
+        obs.topo_vect[obs.line_or_pos_topo_vect[5]] = -1
+        obs.topo_vect[obs.line_ex_pos_topo_vect[5]] = -1
+        obs.line_status[5] = False
+        assert np.array_equal(obs.connectivity_matrix(), _ref_connectivity_matrix(obs))
+
+    def test_bus_matrices(self):
+        mat = self.obs.bus_connectivity_matrix()
+        assert self.obs.bus_connectivity_matrix() is mat
+        mat2, (lor_bus, lex_bus) = self.obs.bus_connectivity_matrix(return_lines_index=True)
+        assert mat2 is mat
+        assert np.all(mat[lor_bus, lex_bus] == 1.)
+
+        obs, *_ = self.env.step(self._aux_actions()[0])
+        mat_new = obs.bus_connectivity_matrix()
+        assert mat_new.shape[0] == mat.shape[0] + 1
+
+        flow_mat, (load_bus, gen_bus, stor_bus, lor_bus, lex_bus) = obs.flow_bus_matrix()
+        assert flow_mat.shape == mat_new.shape
+        # kirchhoff law at each bus
+        assert np.abs(flow_mat.sum(axis=1)).max() <= 1e-3
+
+    def test_energy_graph(self):
+        graph = self.obs.get_energy_graph()
+        assert self.obs.get_energy_graph() is graph
+        obs, *_ = self.env.step(self._aux_actions()[0])
+        graph_new = obs.get_energy_graph()
+        assert len(graph_new.nodes) == len(graph.nodes) + 1
+        # the graph is frozen, it can be shared by the (shallow) copies, until they are updated
+        obs_cpy = copy.copy(obs)
+        assert obs_cpy.get_energy_graph() is graph_new
+        obs_cpy.update(self.env)
+        assert obs_cpy.get_energy_graph() is not graph_new
+        obs_cpy = obs.copy()
+        assert obs_cpy.get_energy_graph() is not graph_new
+        assert len(obs_cpy.get_energy_graph().edges) == len(graph_new.edges)
+
+
+if __name__ == "__main__":
+    unittest.main()
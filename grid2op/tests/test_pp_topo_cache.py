@@ -0,0 +1,119 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Backend import PandaPowerBackend
+from grid2op.Exceptions import BackendError
+
+
+class TestPPTopoCache(unittest.TestCase):
+    def _aux_make(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make("l2rpn_case14_sandbox", test=True, backend=PandaPowerBackend())
+        env.seed(0)
+        env.set_id(0)
+        env.reset()
+        return env
+
+    def setUp(self) -> None:
+        self.env = self._aux_make()
+        self.env_ref = self._aux_make()
+        self.env_ref.backend.set_topo_cache_size(0)
+        self.actions = [self.env.action_space({"set_line_status": [(3, -1)]}),
+                        self.env.action_space({"set_bus": {"substations_id": [(5, [1, 1, 2, 2, 1, 2, 2])]}}),
+                        self.env.action_space({"set_line_status": [(3, 1)]}),
+                        self.env.action_space({"set_bus": {"substations_id": [(5, [1, 1, 1, 1, 1, 1, 1])]}}),
+                        ]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        self.env_ref.close()
+        return super().tearDown()
+
+    def _aux_compare(self, obs, obs_ref):
+        for attr_nm in ["p_or", "q_or", "v_or", "a_or", "theta_or", "gen_p", "gen_q", "gen_v",
+                        "load_v", "rho", "topo_vect"]:
+            assert np.allclose(getattr(obs, attr_nm), getattr(obs_ref, attr_nm), atol=1e-4), f"error for {attr_nm}"
+
+    def test_same_results(self):
+        misses_ref = self.env_ref.backend.topo_cache_misses
+        for _ in range(2):
+            for act in self.actions:
+                for act_ in [act, self.env.action_space()]:
+                    obs, reward, done, info = self.env.step(act_)
+                    obs_ref, reward_ref, done_ref, info_ref = self.env_ref.step(act_)
+                    assert not done
+                    assert not done_ref
+                    self._aux_compare(obs, obs_ref)
+        assert self.env.backend.topo_cache_hits > 0
+        assert self.env_ref.backend.topo_cache_hits == 0
+        assert self.env_ref.backend.topo_cache_misses == misses_ref
+
+    def test_counters(self):
+        backend = self.env.backend
+        backend.clear_topo_cache()
+        self.env.step(self.env.action_space())
+        assert backend.topo_cache_misses == 1
+        for _ in range(3):
+            self.env.step(self.env.action_space())
+        assert backend.topo_cache_hits == 3
+        assert backend.topo_cache_misses == 1
+
+        self.env.step(self.actions[0])
+        assert backend.topo_cache_misses == 2
+        self.env.step(self.actions[2])
+        assert backend.topo_cache_hits == 4
+        assert backend.topo_cache_misses == 2
+
+    def test_reset(self):
+        for act in self.actions:
+            self.env.step(act)
+            self.env_ref.step(act)
+        obs = self.env.reset()
+        obs_ref = self.env_ref.reset()
+        self._aux_compare(obs, obs_ref)
+        obs, *_ = self.env.step(self.env.action_space())
+        obs_ref, *_ = self.env_ref.step(self.env.action_space())
+        self._aux_compare(obs, obs_ref)
+
+    def test_divergence(self):
+        # load 0 alone on bus 2
+        obs, reward, done, info = self.env.step(
+            self.env.action_space({"set_bus": {"loads_id": [(0, 2)]}})
+        )
+        assert done
+        obs = self.env.reset()
+        obs_ref = self.env_ref.reset()
+        self._aux_compare(obs, obs_ref)
+
+    def test_cache_size(self):
+        backend = self.env.backend
+        backend.set_topo_cache_size(2)
+        for act in self.actions:
+            self.env.step(act)
+        assert len(backend._topo_cache) == 2
+        backend.set_topo_cache_size(1)
+        assert len(backend._topo_cache) == 1
+        with self.assertRaises(BackendError):
+            backend.set_topo_cache_size(-1)
+
+        # the size is kept, not the content
+        backend_cpy = backend.copy()
+        assert backend_cpy._topo_cache_size == 1
+        assert len(backend_cpy._topo_cache) == 0
+        assert backend_cpy.topo_cache_hits == 0
+
+
+if __name__ == "__main__":
+    unittest.main()
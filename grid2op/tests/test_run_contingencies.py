@@ -0,0 +1,96 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Backend import PandaPowerBackend
+from grid2op.Exceptions import BackendError
+
+
+class PPNoLODF(PandaPowerBackend):
+    def get_lodf(self):
+        return None
+
+
+class RunContingenciesTester(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True)
+        self.env.seed(0)
+        self.obs = self.env.reset()
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_ac_same_as_simulate(self):
+        line_ids = [0, 5, 10]
+        rho, flows, computed_ac, converged = self.env.backend.run_contingencies(line_ids, dc_screen=False)
+        assert rho.shape == (3, self.env.n_line)
+        assert flows.shape == (3, self.env.n_line)
+        assert computed_ac.all()
+        assert converged.all()
+        for cont_id, l_id in enumerate(line_ids):
+            sim_obs, *_ = self.obs.simulate(self.env.action_space({"set_line_status": [(l_id, -1)]}),
+                                            time_step=0)
+            assert np.allclose(sim_obs.rho, rho[cont_id], atol=1e-5)
+            assert flows[cont_id, l_id] == 0.
+
+    def test_backend_not_modified(self):
+        flows_before = 1. * self.env.backend.get_line_flow()
+        status_before = 1 * self.env.backend.get_line_status()
+        self.env.backend.run_contingencies()
+        assert np.array_equal(self.env.backend.get_line_flow(), flows_before)
+        assert np.array_equal(self.env.backend.get_line_status(), status_before)
+        obs, reward, done, info = self.env.step(self.env.action_space())
+        assert not done
+
+    def test_dc_screen(self):
+        rho_ac, *_ = self.env.backend.run_contingencies(dc_screen=False)
+        rho, flows, computed_ac, converged = self.env.backend.run_contingencies(screen_threshold=1.)
+        assert (~computed_ac).any()
+        # the critical ones are computed exactly
+        assert np.allclose(rho[computed_ac & converged], rho_ac[computed_ac & converged], atol=1e-5)
+        # the other ones are approximated (the dc approximation is rough on this small grid)
+        assert np.allclose(rho[~computed_ac], rho_ac[~computed_ac], atol=0.3)
+        assert (rho[~computed_ac] < 1.).all()
+        
+        # with an infinite threshold, only the bridges are computed with an ac powerflow
+        rho, flows, computed_ac, converged = self.env.backend.run_contingencies(screen_threshold=np.inf)
+        assert computed_ac.sum() < 3
+
+    def test_disconnected_line(self):
+        obs, *_ = self.env.step(self.env.action_space({"set_line_status": [(3, -1)]}))
+        rho, flows, computed_ac, converged = self.env.backend.run_contingencies([3, 4])
+        assert not computed_ac[0]
+        assert converged[0]
+        assert np.allclose(rho[0], obs.rho, atol=1e-5)
+
+    def test_no_lodf(self):
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            env = grid2op.make("l2rpn_case14_sandbox", test=True, backend=PPNoLODF())
+        env.reset()
+        rho, flows, computed_ac, converged = env.backend.run_contingencies([0, 1])
+        assert computed_ac.all()
+        env.close()
+
+    def test_wrong_ids(self):
+        with self.assertRaises(BackendError):
+            self.env.backend.run_contingencies([self.env.n_line])
+        with self.assertRaises(BackendError):
+            self.env.backend.run_contingencies([-1])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.tests.helper_path_test import *
+from grid2op.Agent import PowerLineSwitch
+from grid2op.Exceptions import NoForecastAvailable
+
+
+class SimulateBatchTester(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make(os.path.join(PATH_DATA_TEST, "5bus_example_forecasts"), test=True)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+        self.acts = [self.env.action_space(),
+                     self.env.action_space({"set_line_status": [(0, -1)]}),
+                     self.env.action_space({"set_line_status": [(1, -1)]}),
+                     self.env.action_space({"set_bus": {"lines_or_id": [(0, 2)]}}),
+                     # ambiguous action
+                     self.env.action_space({"set_line_status": [(0, -1)], "change_line_status": [0]}),
+                     ]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def _aux_check_same(self, time_steps):
+        rho, reward, done, has_error = self.obs.simulate_batch(self.acts, time_step=time_steps)
+        assert rho.shape == (len(self.acts), type(self.env).n_line)
+        for act_id, act in enumerate(self.acts):
+            ts = time_steps if isinstance(time_steps, int) else time_steps[act_id]
+            sim_obs, sim_r, sim_d, sim_i = self.obs.simulate(act, time_step=ts)
+            assert np.allclose(rho[act_id], sim_obs.rho), f"error for action {act_id}"
+            assert np.allclose(reward[act_id], sim_r), f"error for action {act_id}"
+            assert done[act_id] == sim_d, f"error for action {act_id}"
+            assert has_error[act_id] == (len(sim_i["exception"]) > 0), f"error for action {act_id}"
+        return has_error
+
+    def test_same_as_simulate(self):
+        has_error = self._aux_check_same(1)
+        assert has_error[-1]  # action is ambiguous
+        assert not has_error[0]
+
+    def test_different_time_steps(self):
+        self._aux_check_same([1, 2, 1, 3, 2])
+
+    def test_empty(self):
+        rho, reward, done, has_error = self.obs.simulate_batch([])
+        assert rho.shape == (0, type(self.env).n_line)
+        assert reward.shape == (0,)
+        assert done.shape == (0,)
+        assert has_error.shape == (0,)
+
+    def test_errors(self):
+        with self.assertRaises(NoForecastAvailable):
+            self.obs.simulate_batch(self.acts, time_step=[1, 2])
+        with self.assertRaises(NoForecastAvailable):
+            self.obs.simulate_batch(self.acts, time_step=1000)
+
+    def test_count_simulate(self):
+        param = self.env.parameters
+        param.MAX_SIMULATE_PER_STEP = 3
+        self.env.change_parameters(param)
+        obs = self.env.reset()
+        obs.simulate_batch(self.acts[:3])
+        with self.assertRaises(Exception):
+            obs.simulate_batch(self.acts[:1])
+
+    def test_greedy_agent(self):
+        agent = PowerLineSwitch(self.env.action_space)
+        act = agent.act(self.obs, 0., False)
+        tested = agent._get_tested_action(self.obs)
+        rewards = [self.obs.simulate(el)[1] for el in tested]
+        assert np.allclose(agent.resulting_rewards, rewards)
+        assert act == tested[int(np.argmax(rewards))]
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,93 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.tests.helper_path_test import *
+from grid2op.Exceptions import EnvError
+
+
+class SimulateObsPoolTester(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make(os.path.join(PATH_DATA_TEST, "5bus_example_forecasts"), test=True)
+        self.env.seed(0)
+        self.env.set_id(0)
+        self.obs = self.env.reset()
+        self.acts = [self.env.action_space(),
+                     self.env.action_space({"set_line_status": [(0, -1)]}),
+                     self.env.action_space({"set_line_status": [(1, -1)]})]
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_same_results(self):
+        res_ref = [self.obs.simulate(act)[0].copy() for act in self.acts]
+        self.env.observation_space.set_simulate_pool_size(1)
+        for act, obs_ref in zip(self.acts, res_ref):
+            sim_obs, *_ = self.obs.simulate(act)
+            assert sim_obs == obs_ref
+            assert np.array_equal(sim_obs.to_vect(), obs_ref.to_vect())
+
+    def test_obs_reused(self):
+        self.env.observation_space.set_simulate_pool_size(2)
+        sim_obs0, *_ = self.obs.simulate(self.acts[0])
+        sim_obs0_cpy = sim_obs0.copy()
+        sim_obs1, *_ = self.obs.simulate(self.acts[1])
+        assert sim_obs1 is not sim_obs0
+        assert sim_obs0 == sim_obs0_cpy  # not overwritten yet
+        sim_obs2, *_ = self.obs.simulate(self.acts[2])
+        assert sim_obs2 is sim_obs0
+        assert sim_obs0_cpy != sim_obs2
+        assert sim_obs0_cpy.line_status[1]
+        assert not sim_obs2.line_status[1]
+
+        # deactivate the pool
+        self.env.observation_space.set_simulate_pool_size(0)
+        sim_obs3, *_ = self.obs.simulate(self.acts[0])
+        sim_obs4, *_ = self.obs.simulate(self.acts[0])
+        assert sim_obs3 is not sim_obs4
+        assert sim_obs3 is not sim_obs0
+        assert sim_obs3 is not sim_obs1
+
+    def test_chain(self):
+        sim_obs_ref1, *_ = self.obs.simulate(self.acts[1])
+        sim_obs_ref2, *_ = sim_obs_ref1.simulate(self.acts[0])
+        sim_obs_ref3, *_ = sim_obs_ref2.simulate(self.acts[0])
+        self.env.observation_space.set_simulate_pool_size(1)
+        sim_obs1, *_ = self.obs.simulate(self.acts[1])
+        sim_obs2, *_ = sim_obs1.simulate(self.acts[0])
+        assert sim_obs2 is sim_obs1
+        assert sim_obs2 == sim_obs_ref2
+        sim_obs3, *_ = sim_obs2.simulate(self.acts[0])
+        assert sim_obs3 == sim_obs_ref3
+        assert (self.obs.load_p + 3. == sim_obs3.load_p).all()
+
+    def test_env_copy(self):
+        self.env.observation_space.set_simulate_pool_size(1)
+        env_cpy = self.env.copy()
+        obs = env_cpy.reset()
+        sim_obs0, *_ = obs.simulate(self.acts[0])
+        sim_obs1, *_ = obs.simulate(self.acts[1])
+        assert sim_obs0 is sim_obs1
+        env_cpy.close()
+
+    def test_wrong_size(self):
+        with self.assertRaises(EnvError):
+            self.env.observation_space.set_simulate_pool_size(-1)
+
+
+if __name__ == "__main__":
+    unittest.main()
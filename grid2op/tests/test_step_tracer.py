@@ -0,0 +1,165 @@
+# Copyright (c) 2023, RTE (https://www.rte-france.com)
+# See AUTHORS.txt
+# This Source Code Form is subject to the terms of the Mozilla Public License, version 2.0.
+# If a copy of the Mozilla Public License, version 2.0 was not distributed with this file,
+# you can obtain one at http://mozilla.org/MPL/2.0/.
+# SPDX-License-Identifier: MPL-2.0
+# This file is part of Grid2Op, Grid2Op a testbed platform to model sequential decision making in power systems.
+
+import os
+import json
+import tempfile
+import warnings
+import unittest
+import numpy as np
+
+import grid2op
+from grid2op.Environment import BaseTracer, HistogramTracer
+from grid2op.Exceptions import EnvError
+from grid2op.Runner import Runner
+
+
+class TestStepTracer(unittest.TestCase):
+    def setUp(self) -> None:
+        with warnings.catch_warnings():
+            warnings.filterwarnings("ignore")
+            self.env = grid2op.make("l2rpn_case14_sandbox", test=True)
+        self.env.seed(0)
+        self.env.set_id(0)
+        return super().setUp()
+
+    def tearDown(self) -> None:
+        self.env.close()
+        return super().tearDown()
+
+    def test_default_noop(self):
+        assert type(self.env.tracer) is BaseTracer
+        obs = self.env.reset()
+        self.env.step(self.env.action_space())
+        assert self.env.tracer.get_stats() is None
+        with self.assertRaises(EnvError):
+            self.env.set_tracer("tracer")
+        params = self.env.get_params_for_runner()
+        assert params["tracer"] is None
+
+    def test_phases_recorded(self):
+        tracer = HistogramTracer()
+        self.env.set_tracer(tracer)
+        obs = self.env.reset()
+        nb_step = 5
+        for _ in range(nb_step):
+            obs, reward, done, info = self.env.step(self.env.action_space())
+        obs.simulate(self.env.action_space())
+        stats = tracer.get_stats()
+        phases = stats["phases"]
+        for phase in ["total", "rules", "update_actions", "redispatching", "opponent",
+                      "apply_action", "powerflow", "observation", "reward"]:
+            assert phases[f"step.{phase}"]["count"] == nb_step, f"error for {phase}"
+            assert sum(phases[f"step.{phase}"]["histogram"]) == nb_step
+        assert phases["reset.total"]["count"] == 1
+        assert phases["reset.reset_grid"]["count"] == 1
+        assert phases["simulate.total"]["count"] == 1
+        assert phases["simulate.powerflow"]["count"] == 1
+        assert phases["step.powerflow"]["total"] <= phases["step.total"]["total"]
+        assert len(stats["bin_edges"]) == len(phases["step.total"]["histogram"])
+        # stats can be serialized
+        json.dumps(stats)
+
+        # percentile are in the proper range
+        p50 = tracer.percentile("step", "total", 50)
+        p99 = tracer.percentile("step", "total", 99)
+        assert p50 <= p99 <= phases["step.total"]["max"]
+        assert tracer.percentile("step", "unknown", 50) is None
+        assert HistogramTracer.percentile_from_stats(stats, "step.total", 99) == p99
+
+        tracer.reset_stats()
+        assert not tracer.get_stats()["phases"]
+
+        # tracer can be removed
+        self.env.set_tracer(None)
+        self.env.step(self.env.action_space())
+        assert not tracer.get_stats()["phases"]
+
+    def test_copy_env(self):
+        tracer = HistogramTracer()
+        self.env.set_tracer(tracer)
+        env_cpy = self.env.copy()
+        assert env_cpy.tracer is tracer
+        env_cpy.close()
+
+    def test_histogram(self):
+        tracer = HistogramTracer(min_duration=1e-3, max_duration=1., nb_bins_per_decade=1)
+        assert tracer.nb_bins == 5
+        tracer.record("step", "total", 0., 1e-4)  # underflow
+        tracer.record("step", "total", 0., 5e-3)
+        tracer.record("step", "total", 0., 5e-2)
+        tracer.record("step", "total", 0., 10.)  # overflow
+        stats = tracer.get_stats()
+        assert stats["phases"]["step.total"]["histogram"] == [1, 1, 1, 0, 1]
+        assert stats["phases"]["step.total"]["max"] == 10.
+        assert np.isinf(stats["bin_edges"][-1])
+
+        merged = HistogramTracer.merge_stats([stats, None, stats])
+        assert merged["phases"]["step.total"]["histogram"] == [2, 2, 2, 0, 2]
+        assert merged["phases"]["step.total"]["count"] == 8
+        assert stats["phases"]["step.total"]["count"] == 4  # not modified
+        assert HistogramTracer.merge_stats([None]) is None
+        with self.assertRaises(EnvError):
+            HistogramTracer.merge_stats([stats, HistogramTracer().get_stats()])
+
+        with self.assertRaises(EnvError):
+            HistogramTracer(min_duration=1., max_duration=1e-3)
+
+    def test_chrome_trace(self):
+        tracer = HistogramTracer()
+        with self.assertRaises(EnvError):
+            tracer.to_chrome_trace()
+        tracer = HistogramTracer(chrome_trace=True, max_nb_events=10)
+        self.env.set_tracer(tracer)
+        self.env.reset()
+        for _ in range(5):
+            self.env.step(self.env.action_space())
+        with tempfile.TemporaryDirectory() as path:
+            path_trace = os.path.join(path, "trace.json")
+            res = tracer.to_chrome_trace(path_trace)
+            with open(path_trace, "r", encoding="utf-8") as f:
+                res_disk = json.load(f)
+        assert len(res["traceEvents"]) == 10
+        assert res_disk == res
+        assert res["traceEvents"][0]["ph"] == "X"
+
+    def test_runner(self):
+        runner = Runner(**self.env.get_params_for_runner())
+        runner.run(nb_episode=1, max_iter=5)
+        assert runner.tracer_stats == [None]
+
+        self.env.set_tracer(HistogramTracer())
+        runner = Runner(**self.env.get_params_for_runner())
+        with tempfile.TemporaryDirectory() as path:
+            res = runner.run(nb_episode=2, max_iter=5, path_save=path,
+                             add_detailed_output=True)
+            with open(os.path.join(path, res[0][1], "episode_times.json"), "r", encoding="utf-8") as f:
+                episode_times = json.load(f)
+        assert len(runner.tracer_stats) == 2
+        for stats, (*_, nb_ts, max_ts, ep_data) in zip(runner.tracer_stats, res):
+            # stats are reset at each episode
+            assert stats["phases"]["step.total"]["count"] == nb_ts
+            assert stats["phases"]["reset.total"]["count"] == 1
+            assert ep_data.tracer_stats is stats
+        assert episode_times["Tracer"]["phases"]["step.total"]["count"] == 5
+        merged = HistogramTracer.merge_stats(runner.tracer_stats)
+        assert merged["phases"]["step.total"]["count"] == 10
+        # the tracer of the environment is not modified by the runner
+        assert not self.env.tracer.get_stats()["phases"]
+
+    def test_runner_parallel(self):
+        self.env.set_tracer(HistogramTracer())
+        runner = Runner(**self.env.get_params_for_runner())
+        runner.run(nb_episode=2, max_iter=5, nb_process=2)
+        assert len(runner.tracer_stats) == 2
+        for stats in runner.tracer_stats:
+            assert stats["phases"]["step.total"]["count"] == 5
+
+
+if __name__ == "__main__":
+    unittest.main()
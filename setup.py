@@ -107,7 +107,8 @@ setup(description='An gymnasium compatible environment to model sequential decis
               'grid2op.main=grid2op.command_line:main',
               'grid2op.download=grid2op.command_line:download',
               'grid2op.replay=grid2op.command_line:replay',
-              'grid2op.testinstall=grid2op.command_line:testinstall'
+              'grid2op.testinstall=grid2op.command_line:testinstall',
+              'grid2op.convert_chronics=grid2op.command_line:convert_chronics'
           ]
       },
       test_suite='setup.my_test_suite'